@@ -26,13 +26,62 @@ Usage:
 - Serves as a neutral utility layer that introduces no architectural coupling.
 """
 
+import os
+import threading
+import time
 import uuid
 
+_lock = threading.Lock()
+_last_ms = 0
+_counter = 0
+
 
 def new_id() -> str:
     """
     Generate a new unique identifier.
 
     Domain-agnostic utility.
+    Identifiers are time-ordered (UUIDv7), so consecutive ids sort together and
+    inserts land at the end of primary key indexes.
+    """
+    return str(new_time_ordered_uuid())
+
+
+def new_random_id() -> str:
+    """
+    Generate a new unique identifier with no ordering (UUIDv4).
     """
     return str(uuid.uuid4())
+
+
+def new_time_ordered_uuid() -> uuid.UUID:
+    """
+    Generate a UUIDv7 (RFC 9562): 48-bit Unix milliseconds, then random bits.
+
+    The 12-bit `rand_a` field is used as a counter within one millisecond, so
+    ids from this process are strictly increasing even when generated faster than
+    the clock ticks.
+    """
+    global _last_ms, _counter
+
+    with _lock:
+        now_ms = time.time_ns() // 1_000_000
+        if now_ms > _last_ms:
+            _last_ms = now_ms
+            _counter = int.from_bytes(os.urandom(2), "big") & 0x7FF  # leave headroom
+        else:
+            _counter += 1
+            if _counter > 0xFFF:
+                _last_ms += 1
+                _counter = 0
+        timestamp_ms, counter = _last_ms, _counter
+
+    rand_b = int.from_bytes(os.urandom(8), "big") & ((1 << 62) - 1)
+    value = (
+        (timestamp_ms & ((1 << 48) - 1)) << 80
+        | 0x7 << 76
+        | counter << 64
+        | 0b10 << 62
+        | rand_b
+    )
+    return uuid.UUID(int=value)
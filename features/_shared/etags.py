@@ -0,0 +1,77 @@
+"""
+Ring: Application (Shared Contracts)
+
+Responsibility:
+Builds and compares the entity tags (RFC 9110 §8.8.3) of every endpoint that
+supports conditional GET.
+
+Design intent:
+- A single resource is tagged with its change version, so a client's
+  If-None-Match can be checked against the version alone, without loading the
+  resource.
+- A collection is tagged with a hash of its members' validators, so it changes
+  whenever any member does.
+- If-None-Match uses weak comparison: weak prefixes and quotes are stripped
+  before tags are compared.
+
+This module contains:
+- version_etag, collection_etag: the tag of a resource or a collection.
+- parse_if_none_match, if_none_match_versions, if_none_match_any, etag_matches:
+  readers of an If-None-Match header.
+
+Dependency constraints:
+- Must not import from any feature.
+- Must not depend on infrastructure or frameworks; headers are passed in as
+  strings.
+
+Stability:
+- Stable.
+- Changes only when the tagging scheme changes.
+
+Usage:
+- Used by the accounts and digests routers.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Iterable
+
+
+def version_etag(version: int) -> str:
+    return f'"{version}"'
+
+
+def collection_etag(validators: Iterable[str]) -> str:
+    digest = hashlib.sha256()
+    for validator in validators:
+        digest.update(validator.encode("utf-8"))
+        digest.update(b"\x00")
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def parse_if_none_match(header: str | None) -> frozenset[str]:
+    """
+    Opaque tags listed in an If-None-Match header, without quotes or weak prefixes
+    (If-None-Match uses weak comparison).
+    """
+    if not header:
+        return frozenset()
+    tags = (tag.strip() for tag in header.split(","))
+    return frozenset(tag.removeprefix("W/").strip('"') for tag in tags if tag)
+
+
+def if_none_match_versions(header: str | None) -> frozenset[int]:
+    return frozenset(int(tag) for tag in parse_if_none_match(header) if tag.isdigit())
+
+
+def if_none_match_any(header: str | None) -> bool:
+    """
+    True for If-None-Match: *, which matches any current version of the resource.
+    """
+    return "*" in parse_if_none_match(header)
+
+
+def etag_matches(header: str | None, etag: str) -> bool:
+    tags = parse_if_none_match(header)
+    return "*" in tags or etag.strip('"') in tags
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC
-from typing import Any
+from typing import Any, Protocol
 
 
 class IOPorts(ABC):
@@ -27,3 +27,35 @@ class IOPorts(ABC):
 
         if not hasattr(cls, "Out") or not isinstance(getattr(cls, "Out"), type):
             raise TypeError(f"{cls.__name__} must define a nested class 'Out'")
+
+
+class ExecutableUseCase(Protocol):
+    """
+    Any use case, seen only as something to execute.
+
+    Every input port (an IOPorts `In`) satisfies it. Wrappers that add behaviour
+    around any use case (retries, profiling, allocation sampling) accept and
+    return it.
+    """
+
+    def execute(self, *args: Any, **kwargs: Any) -> Any:
+        raise NotImplementedError
+
+
+class UnitOfWork(Protocol):
+    """
+    The transaction of one use case execution.
+
+    Repositories built on a unit of work register their changes with it instead of
+    writing them; nothing is written until the use case calls `commit`, which
+    applies every registered change in one flush.
+    """
+
+    def commit(self) -> None:
+        raise NotImplementedError
+
+    def rollback(self) -> None:
+        """
+        Discard every registered change.
+        """
+        raise NotImplementedError
@@ -37,6 +37,7 @@ Usage:
 
 from __future__ import annotations
 
+from collections.abc import Collection
 from typing import TYPE_CHECKING, Protocol
 
 from core.entities.account import Account
@@ -55,7 +56,18 @@ class AccountGetterPort(IOPorts):
         The interactor implements this.
         """
 
-        def execute(self, *, account_id: str) -> "AccountResponse":
+        def execute(
+            self,
+            *,
+            account_id: str,
+            known_versions: Collection[int] = (),
+            any_version_known: bool = False,
+        ) -> "AccountReadResult":
+            """
+            Read an account, skipping the load entirely if its current change
+            version is one of `known_versions`, or if `any_version_known` (the
+            caller holds some version, as with If-None-Match: *).
+            """
             raise NotImplementedError
 
     class Out(Protocol):
@@ -99,10 +111,34 @@ class AccountRepoPort(Protocol):
     def get(self, account_id: AccountId) -> Account | None:
         raise NotImplementedError
 
+    def get_many(self, account_ids: Collection[AccountId]) -> dict[AccountId, Account]:
+        """
+        The accounts that exist among `account_ids`, loaded together rather than
+        one lookup per id.
+        """
+        raise NotImplementedError
+
     def save(self, account: Account) -> None:
+        """
+        Insert or update the account, bumping its change version.
+        """
+        raise NotImplementedError
+
+    def version(self, account_id: AccountId) -> int | None:
+        """
+        Current change version of the account (1 at creation, +1 per save), or None
+        if it does not exist. Must be cheaper than `get`.
+        """
+        raise NotImplementedError
+
+    def get_versioned(self, account_id: AccountId) -> tuple[int, Account] | None:
+        """
+        The account's committed state and the change version of exactly that
+        state, read together, or None if it does not exist.
+        """
         raise NotImplementedError
 
 
 if TYPE_CHECKING:
     # Import only for typing; avoids runtime coupling / import cycles.
-    from features.accounts.schemas import AccountResponse
+    from features.accounts.schemas import AccountReadResult, AccountResponse
@@ -10,6 +10,8 @@ Design intent:
 This file is pure delivery mechanism. It contains no business logic and no
 application policy. Its only role is to translate protocol-level concepts
 (HTTP routes, request bodies, dependency injection) into calls to use cases.
+Account reads carry a strong ETag (the account's change version) and answer a
+matching If-None-Match with 304 Not Modified.
 
 This module contains:
 - FastAPI route definitions for account creation and retrieval.
@@ -35,32 +37,55 @@ Usage:
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Response
 
 from features._shared.custom_types import Provider
+from features._shared.etags import (
+    if_none_match_any,
+    if_none_match_versions,
+    version_etag,
+)
+from features.accounts.ports import AccountCreatorPort, AccountGetterPort
 from features.accounts.schemas import AccountResponse, CreateAccountRequest
-from features.accounts.use_cases import AccountCreator, AccountGetter
 
 
 def build_account_routers(
     *,
-    account_creator: Provider[AccountCreator],
-    account_getter: Provider[AccountGetter],
+    account_creator: Provider[AccountCreatorPort.In],
+    account_getter: Provider[AccountGetterPort.In],
 ) -> APIRouter:
     router = APIRouter(prefix="/accounts", tags=["accounts"])
 
     @router.post("", response_model=AccountResponse)
     def create_account_endpoint(
         req: CreateAccountRequest,
-        creator: Annotated[AccountCreator, Depends(account_creator)],
+        creator: Annotated[AccountCreatorPort.In, Depends(account_creator)],
     ) -> AccountResponse:
         return creator.execute(initial_balance_pence=req.initial_balance_pence)
 
-    @router.get("/{account_id}", response_model=AccountResponse)
+    @router.get(
+        "/{account_id}",
+        response_model=AccountResponse,
+        responses={
+            304: {"description": "The client's copy (If-None-Match) is current"}
+        },
+    )
     def get_account_endpoint(
         account_id: str,
-        getter: Annotated[AccountGetter, Depends(account_getter)],
-    ) -> AccountResponse:
-        return getter.execute(account_id=account_id)
+        getter: Annotated[AccountGetterPort.In, Depends(account_getter)],
+        response: Response,
+        if_none_match: Annotated[str | None, Header()] = None,
+    ) -> AccountResponse | Response:
+        result = getter.execute(
+            account_id=account_id,
+            known_versions=if_none_match_versions(if_none_match),
+            any_version_known=if_none_match_any(if_none_match),
+        )
+        etag = version_etag(result.version)
+        if result.account is None:
+            return Response(status_code=304, headers={"ETag": etag})
+
+        response.headers["ETag"] = etag
+        return result.account
 
     return router
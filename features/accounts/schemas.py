@@ -12,6 +12,7 @@ They separate protocol-level validation and formatting from domain and applicati
 This module contains:
 - Request schemas for creating and fetching accounts.
 - Response schemas for returning account data to clients.
+- AccountReadResult: the outcome of a conditional account read.
 
 Dependency constraints:
 - Must not import from any other feature!
@@ -32,6 +33,8 @@ Usage:
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+
 from pydantic import BaseModel, Field
 
 
@@ -58,3 +61,14 @@ class AccountResponse(BaseModel):
 
     id: str
     balance_pence: int
+
+
+@dataclass(frozen=True, slots=True)
+class AccountReadResult:
+    """
+    A conditional account read: `account` is None when the caller already holds
+    the current version.
+    """
+
+    version: int
+    account: AccountResponse | None
@@ -32,19 +32,23 @@ Usage:
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+import time
+from collections.abc import Collection
+from typing import TYPE_CHECKING, NoReturn
 
 from core.entities.account import Account
 from core.utils.id import new_id
 from core.values.custom_types import AccountId
 from core.values.errors import InvalidAmountError as DomainInvalidAmountError
 from core.values.objects import Money
+from features._shared.ports import UnitOfWork
 from features.accounts.errors import AccountNotFoundError, AccountValidationError
 from features.accounts.ports import (
     AccountCreatorPort,
     AccountGetterPort,
     AccountRepoPort,
 )
+from features.accounts.schemas import AccountReadResult
 
 if TYPE_CHECKING:
     from features.accounts.schemas import AccountResponse
@@ -62,22 +66,52 @@ class AccountGetter(AccountGetterPort.In):
         self._presenter = presenter
         self._logger = logger
 
-    def execute(self, *, account_id: str) -> AccountResponse:
+    def execute(
+        self,
+        *,
+        account_id: str,
+        known_versions: Collection[int] = (),
+        any_version_known: bool = False,
+    ) -> AccountReadResult:
         self._logger.info("account_get_started account_id=%s", account_id)
 
-        account = self._load_account_or_raise(account_id=account_id)
+        if known_versions or any_version_known:
+            version = self._current_version_or_raise(account_id=account_id)
+            if any_version_known or version in known_versions:
+                self._logger.info(
+                    "account_get_not_modified account_id=%s version=%s",
+                    account_id,
+                    version,
+                )
+                return AccountReadResult(version=version, account=None)
+
+        # The version is read with the account, never separately: the ETag must
+        # label exactly the balance that is returned.
+        version, account = self._load_account_or_raise(account_id=account_id)
 
         self._log_succeeded(account)
 
-        return self._presenter.present(account)
+        return AccountReadResult(
+            version=version, account=self._presenter.present(account)
+        )
+
+    def _current_version_or_raise(self, *, account_id: str) -> int:
+        version = self._repo.version(AccountId(account_id))
+        if version is None:
+            self._raise_not_found(account_id)
 
-    def _load_account_or_raise(self, *, account_id: str) -> Account:
-        account = self._repo.get(AccountId(account_id))
-        if account is None:
-            self._logger.info("account_get_not_found account_id=%s", account_id)
-            raise AccountNotFoundError(f"Account not found: {account_id}")
+        return version
 
-        return account
+    def _load_account_or_raise(self, *, account_id: str) -> tuple[int, Account]:
+        versioned = self._repo.get_versioned(AccountId(account_id))
+        if versioned is None:
+            self._raise_not_found(account_id)
+
+        return versioned
+
+    def _raise_not_found(self, account_id: str) -> NoReturn:
+        self._logger.info("account_get_not_found account_id=%s", account_id)
+        raise AccountNotFoundError(f"Account not found: {account_id}")
 
     def _log_succeeded(self, account: Account) -> None:
         self._logger.info(
@@ -91,10 +125,12 @@ class AccountCreator(AccountCreatorPort.In):
     def __init__(
         self,
         *,
+        uow: UnitOfWork,
         repo: AccountRepoPort,
         presenter: AccountCreatorPort.Out,
         logger: logging.Logger,
     ) -> None:
+        self._uow = uow
         self._repo = repo
         self._presenter = presenter
         self._logger = logger
@@ -109,7 +145,11 @@ class AccountCreator(AccountCreatorPort.In):
 
         self._repo.save(account)
 
-        self._log_succeeded(account)
+        started = time.perf_counter()
+        self._uow.commit()
+        commit_ms = (time.perf_counter() - started) * 1000
+
+        self._log_succeeded(account, commit_ms=commit_ms)
 
         return self._presenter.present(account)
 
@@ -127,9 +167,10 @@ class AccountCreator(AccountCreatorPort.In):
             )
             raise AccountValidationError(str(exc)) from exc
 
-    def _log_succeeded(self, account: Account) -> None:
+    def _log_succeeded(self, account: Account, *, commit_ms: float) -> None:
         self._logger.info(
-            "account_create_succeeded account_id=%s balance_pence=%s",
+            "account_create_succeeded account_id=%s balance_pence=%s commit_ms=%.2f",
             str(account.id),
             account.balance.pence,
+            commit_ms,
         )
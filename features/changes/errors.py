@@ -0,0 +1,36 @@
+"""
+Ring: Application (Use Case / Feature Errors)
+
+Responsibility:
+Defines application-level errors specific to the Change Feed feature.
+
+Design intent:
+These errors sit between the domain and delivery layers.
+They describe why a page of changes could not be served, without introducing
+protocol or framework concerns.
+
+This module contains:
+- ChangeFeedBusyError: raised when a reader would wait but too many already are.
+
+Dependency constraints:
+- Must not import from any other feature!
+- Must not depend on infrastructure implementations or frameworks directly!
+- Must not contain persistence, HTTP, or serialization logic.
+- May depend on shared application contracts in features/_shared.
+
+Stability:
+- Highly stable.
+- Part of the feature’s public error contract.
+
+Usage:
+- Raised by the change feed interactor.
+- Caught and translated by delivery layers into protocol-specific errors (e.g. HTTP responses).
+"""
+
+from __future__ import annotations
+
+from features._shared.errors import ApplicationError
+
+
+class ChangeFeedBusyError(ApplicationError):
+    """Raised when a caught-up reader cannot wait because too many already are."""
@@ -0,0 +1,90 @@
+"""
+Ring: Application (Use Case Boundaries / Ports)
+
+Responsibility:
+Defines the port interfaces for the Change Feed feature.
+These ports isolate reading the feed and waiting for new changes from how the feed
+is stored and how commits are signalled.
+
+Design intent:
+- Primary ports (In/Out) define the use case boundary for reading a page.
+- The repository port reads entries strictly after a sequence number.
+- The notifier port lets a reader block until something may have changed. It only
+  has to be a hint: waits may end early, and the reader always queries again.
+
+This module contains:
+- ChangeFeedReaderPort: primary In/Out ports for reading a page of changes.
+- ChangeFeedRepoPort: secondary port for reading feed entries.
+- ChangeNotifierPort: secondary port for waiting on new commits.
+
+Dependency constraints:
+- Must not import from any other feature!
+- Must not depend on infrastructure implementations or frameworks directly!
+- Must not contain persistence, HTTP, or serialization logic.
+- May depend on this feature’s own schemas.
+- May depend on shared application contracts in features/_shared.
+
+Stability:
+- Highly stable.
+- Ports are the contracts that outer layers adapt to; they should change rarely.
+
+Usage:
+- Implemented by the change feed interactor (In) and presenter (Out).
+- Implemented by infrastructure adapters for the repository and notifier ports.
+"""
+
+from __future__ import annotations
+
+from typing import Protocol
+
+from features._shared.ports import IOPorts
+from features.changes.schemas import ChangeRecord, ChangesResponse
+
+
+class ChangeFeedReaderPort(IOPorts):
+    """
+    Use case: read the changes after a sequence number, waiting for some if needed.
+    """
+
+    class In(Protocol):
+        def execute(self, *, after: int, limit: int, wait: float) -> ChangesResponse:
+            raise NotImplementedError
+
+    class Out(Protocol):
+        def present(
+            self, *, after: int, changes: list[ChangeRecord], has_more: bool
+        ) -> ChangesResponse:
+            raise NotImplementedError
+
+
+class ChangeFeedRepoPort(Protocol):
+    """
+    Read port for the change feed.
+    Implemented by infrastructure adapters.
+    """
+
+    def read(self, *, after: int, limit: int) -> list[ChangeRecord]:
+        """
+        Up to `limit` entries with a sequence greater than `after`, in sequence order.
+        """
+        raise NotImplementedError
+
+
+class ChangeNotifierPort(Protocol):
+    """
+    Signals that new changes may have been committed.
+    """
+
+    def mark(self) -> int:
+        """
+        Current position of the notifier; take it before reading the feed.
+        """
+        raise NotImplementedError
+
+    def wait(self, mark: int, *, timeout: float) -> bool:
+        """
+        Block until a commit after `mark`, `timeout` seconds, or an earlier
+        implementation-defined recheck, whichever comes first. Returns False at
+        once, without waiting, if too many readers are waiting already.
+        """
+        raise NotImplementedError
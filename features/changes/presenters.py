@@ -0,0 +1,61 @@
+"""
+Ring: Interface Adapters (Presenters)
+
+Responsibility:
+Defines presenters for the Change Feed feature.
+Presenters convert feed entries into response DTOs.
+
+Design intent:
+Presenters isolate representation concerns from the change feed use case, so the
+storage-facing ChangeRecord never leaks into the HTTP contract.
+The resume position is computed here, once, so every consumer gets the same rule.
+
+This module contains:
+- ChangeFeedReaderPresenter: mapping from feed entries to ChangesResponse.
+
+Dependency constraints:
+- Must not import from any other feature!
+- Must not depend on infrastructure implementations or frameworks directly!
+- Must not contain domain or application business rules.
+- May depend on this feature’s own ports and schemas.
+
+Stability:
+- Moderately stable.
+- Changes when response representations change.
+
+Usage:
+- Called by the change feed interactor to produce output DTOs.
+"""
+
+from __future__ import annotations
+
+from features.changes.ports import ChangeFeedReaderPort
+from features.changes.schemas import ChangeRecord, ChangeResponse, ChangesResponse
+
+
+class ChangeFeedReaderPresenter(ChangeFeedReaderPort.Out):
+    """
+    Presenter for the read-changes use case.
+    """
+
+    def present(
+        self, *, after: int, changes: list[ChangeRecord], has_more: bool
+    ) -> ChangesResponse:
+        return ChangesResponse(
+            changes=[
+                ChangeResponse(
+                    seq=change.seq,
+                    kind=change.kind,
+                    occurred_at=change.occurred_at,
+                    account_id=change.account_id,
+                    balance_pence=change.balance_pence,
+                    transfer_id=change.transfer_id,
+                    from_account_id=change.from_account_id,
+                    to_account_id=change.to_account_id,
+                    amount_pence=change.amount_pence,
+                )
+                for change in changes
+            ],
+            next_after=changes[-1].seq if changes else after,
+            has_more=has_more,
+        )
@@ -0,0 +1,60 @@
+"""
+Ring: Delivery (Controllers, Frameworks & Drivers / HTTP)
+
+Responsibility:
+Defines the HTTP routing layer for the Change Feed feature.
+This module exposes the sequence-numbered feed of committed changes to downstream
+consumers.
+
+Design intent:
+This file is delivery mechanism only. A consumer loops on
+GET /changes?after=<next_after>&wait=<seconds>: it receives full pages while
+behind, and while caught up the request is held open until a change commits or
+the wait runs out.
+The endpoint is synchronous, so a held request occupies one worker thread, but
+no database connection, while it waits. The number of held requests is bounded
+(CHANGES_MAX_WAITERS); beyond it a request that would wait gets 503 with
+Retry-After.
+
+This module contains:
+- FastAPI route definitions for reading the change feed.
+
+Dependency constraints:
+- Must not import from any other feature!
+- Must not contain domain or application business rules.
+- Must not perform persistence or infrastructure work directly.
+- May depend on the Application layer (use cases, ports, schemas).
+- May depend on shared application contracts in features/_shared.
+- May depend on framework code (FastAPI, dependency injection).
+
+Stability:
+- Highly volatile.
+- Changes when the API surface, routing, or framework configuration changes.
+
+Usage:
+- Loaded by the application root to register HTTP endpoints.
+"""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query
+
+from features._shared.custom_types import Provider
+from features.changes.ports import ChangeFeedReaderPort
+from features.changes.schemas import ChangesResponse, ReadChangesRequest
+
+
+def build_change_routers(
+    *,
+    change_feed_reader: Provider[ChangeFeedReaderPort.In],
+) -> APIRouter:
+    router = APIRouter(prefix="/changes", tags=["changes"])
+
+    @router.get("", response_model=ChangesResponse)
+    def read_changes_endpoint(
+        req: Annotated[ReadChangesRequest, Query()],
+        reader: Annotated[ChangeFeedReaderPort.In, Depends(change_feed_reader)],
+    ) -> ChangesResponse:
+        return reader.execute(after=req.after, limit=req.limit, wait=req.wait)
+
+    return router
@@ -0,0 +1,108 @@
+"""
+Ring: Delivery (Interface Adapters / HTTP Boundary)
+
+Responsibility:
+Defines the schemas for the Change Feed feature.
+These describe entries of the sequence-numbered feed of committed changes and the
+pages in which consumers read it.
+
+Design intent:
+Every committed account creation and transfer has a sequence number that only
+grows. A consumer stores the `next_after` of the last page it processed and asks
+for the changes after it; a crashed consumer resumes from whatever it stored.
+Entries are flat records with the fields of their kind set and the others null,
+so consumers can switch on `kind` without nested decoding.
+
+This module contains:
+- ChangeKind: what an entry records.
+- ChangeRecord: one entry as read from storage.
+- ReadChangesRequest: HTTP query schema for reading a page.
+- ChangeResponse / ChangesResponse: HTTP shapes for an entry and a page.
+
+Dependency constraints:
+- Must not import from any other feature!
+- Must not depend on infrastructure implementations or frameworks directly!
+- Must not contain persistence or serialization logic.
+- May depend on shared application contracts in features/_shared.
+
+Stability:
+- Less stable than the application and domain layers.
+- Changes when the public API contract changes.
+
+Usage:
+- Produced by presenters and returned by the change feed use case.
+- Used by HTTP controllers to validate requests and serialise pages.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+
+from pydantic import BaseModel, Field
+
+MAX_PAGE_SIZE = 1000
+MAX_WAIT_SECONDS = 30.0
+
+
+class ChangeKind(str, Enum):
+    ACCOUNT_CREATED = "account_created"
+    TRANSFER_CREATED = "transfer_created"
+
+
+@dataclass(frozen=True, slots=True)
+class ChangeRecord:
+    """
+    One feed entry. Account fields are set for account_created, transfer fields
+    for transfer_created.
+    """
+
+    seq: int
+    kind: ChangeKind
+    occurred_at: datetime
+    account_id: str | None = None
+    balance_pence: int | None = None
+    transfer_id: str | None = None
+    from_account_id: str | None = None
+    to_account_id: str | None = None
+    amount_pence: int | None = None
+
+
+class ReadChangesRequest(BaseModel):
+    """
+    HTTP query schema for reading the change feed.
+
+    `wait` is how long to block, in seconds, if there are no changes after `after`
+    yet; 0 returns at once.
+    """
+
+    after: int = Field(default=0, ge=0)
+    limit: int = Field(default=100, ge=1, le=MAX_PAGE_SIZE)
+    wait: float = Field(default=0.0, ge=0.0, le=MAX_WAIT_SECONDS)
+
+
+class ChangeResponse(BaseModel):
+    seq: int
+    kind: ChangeKind
+    occurred_at: datetime
+    account_id: str | None
+    balance_pence: int | None
+    transfer_id: str | None
+    from_account_id: str | None
+    to_account_id: str | None
+    amount_pence: int | None
+
+
+class ChangesResponse(BaseModel):
+    """
+    HTTP response schema for one page of the change feed.
+
+    `next_after` is the position to resume from: the last entry's sequence, or the
+    requested `after` if the page is empty. `has_more` is true if further changes
+    were already available when the page was read.
+    """
+
+    changes: list[ChangeResponse]
+    next_after: int
+    has_more: bool
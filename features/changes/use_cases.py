@@ -0,0 +1,81 @@
+"""
+Ring: Application (Use Case / Interactors)
+
+Responsibility:
+Implements the change feed use case: return the committed changes after a
+sequence number, blocking for up to `wait` seconds while there are none.
+
+Design intent:
+- A consumer catching up is never made to wait: if any changes exist it gets up to
+  a full page at once, and `has_more` tells it to ask again immediately.
+- A consumer that is up to date waits on the notifier instead of polling the
+  database in a loop. The notifier mark is taken before each query, so a commit
+  between the query and the wait ends the wait at once.
+- The notifier bounds how many readers wait at once. A reader it refuses fails
+  with ChangeFeedBusyError instead of querying in a loop; it may retry later
+  from the same `after`.
+- The page is read one entry past `limit` to learn whether more are available.
+
+This module contains:
+- ChangeFeedReader: the interactor implementing ChangeFeedReaderPort.In.
+
+Dependency constraints:
+- Must not import from any other feature!
+- Must not depend on infrastructure implementations or frameworks directly!
+- Must not contain persistence, HTTP, or serialization logic.
+- May depend on this feature’s own ports and schemas.
+- May depend on shared application contracts in features/_shared.
+
+Stability:
+- Less stable than the domain, more stable than infrastructure.
+- Changes when feed paging or waiting policy changes.
+
+Usage:
+- Invoked by the HTTP controller for GET /changes.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+
+from features.changes.errors import ChangeFeedBusyError
+from features.changes.ports import (
+    ChangeFeedReaderPort,
+    ChangeFeedRepoPort,
+    ChangeNotifierPort,
+)
+from features.changes.schemas import ChangesResponse
+
+
+class ChangeFeedReader(ChangeFeedReaderPort.In):
+    def __init__(
+        self,
+        *,
+        repo: ChangeFeedRepoPort,
+        notifier: ChangeNotifierPort,
+        presenter: ChangeFeedReaderPort.Out,
+        logger: logging.Logger,
+    ) -> None:
+        self._repo = repo
+        self._notifier = notifier
+        self._presenter = presenter
+        self._logger = logger
+
+    def execute(self, *, after: int, limit: int, wait: float) -> ChangesResponse:
+        deadline = time.monotonic() + wait
+        while True:
+            mark = self._notifier.mark()
+            changes = self._repo.read(after=after, limit=limit + 1)
+            remaining = deadline - time.monotonic()
+            if changes or remaining <= 0:
+                break
+            if not self._notifier.wait(mark, timeout=remaining):
+                raise ChangeFeedBusyError("Too many change feed readers are waiting")
+
+        self._logger.info(
+            "changes_read after=%s returned=%s", after, min(len(changes), limit)
+        )
+        return self._presenter.present(
+            after=after, changes=changes[:limit], has_more=len(changes) > limit
+        )
@@ -0,0 +1,99 @@
+"""
+Ring: Application (Use Case Boundaries / Ports)
+
+Responsibility:
+Defines the port interfaces for the State Digest feature.
+These ports isolate digest reading and store comparison from how digests are
+stored and maintained.
+
+Design intent:
+- Primary ports (In/Out) define the use case boundary for reading a tree node and
+  for comparing two stores.
+- The secondary repository port exposes the tree only through prefix-addressed
+  nodes, so comparison works the same for a local database or a remote peer.
+
+This module contains:
+- DigestReaderPort: primary In/Out ports for reading a tree node.
+- DigestComparerPort: primary In/Out ports for comparing two stores.
+- StateDigestRepoPort: secondary port for reading tree nodes.
+
+Dependency constraints:
+- Must not import from any other feature!
+- Must not depend on infrastructure implementations or frameworks directly!
+- Must not contain persistence, HTTP, or serialization logic.
+- May depend on this feature’s own schemas.
+- May depend on shared application contracts in features/_shared.
+
+Stability:
+- Highly stable.
+- Ports are the contracts that outer layers adapt to; they should change rarely.
+
+Usage:
+- Implemented by digest interactors (In) and presenters (Out).
+- Implemented by infrastructure adapters for the repository port.
+"""
+
+from __future__ import annotations
+
+from typing import Protocol
+
+from features._shared.ports import IOPorts
+from features.digests.schemas import (
+    BucketDifference,
+    DigestComparisonResponse,
+    DigestNode,
+    DigestScope,
+    DigestTreeResponse,
+)
+
+
+class DigestReaderPort(IOPorts):
+    """
+    Use case: read one node of a state digest tree with its children.
+    """
+
+    class In(Protocol):
+        def execute(self, *, scope: DigestScope, prefix: str) -> DigestTreeResponse:
+            raise NotImplementedError
+
+    class Out(Protocol):
+        def present(
+            self, *, scope: DigestScope, node: DigestNode, children: list[DigestNode]
+        ) -> DigestTreeResponse:
+            raise NotImplementedError
+
+
+class DigestComparerPort(IOPorts):
+    """
+    Use case: find the ranges in which two stores disagree.
+    """
+
+    class In(Protocol):
+        def execute(self, *, scope: DigestScope) -> DigestComparisonResponse:
+            raise NotImplementedError
+
+    class Out(Protocol):
+        def present(
+            self,
+            *,
+            scope: DigestScope,
+            nodes_compared: int,
+            differences: list[BucketDifference],
+        ) -> DigestComparisonResponse:
+            raise NotImplementedError
+
+
+class StateDigestRepoPort(Protocol):
+    """
+    Read port for state digest trees.
+    Implemented by infrastructure adapters.
+    """
+
+    def node(self, scope: DigestScope, prefix: str) -> DigestNode:
+        raise NotImplementedError
+
+    def children(self, scope: DigestScope, prefix: str) -> list[DigestNode]:
+        """
+        Direct children of the node at `prefix`; empty for a leaf.
+        """
+        raise NotImplementedError
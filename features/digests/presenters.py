@@ -0,0 +1,84 @@
+"""
+Ring: Interface Adapters (Presenters)
+
+Responsibility:
+Defines presenters for the State Digest feature.
+Presenters convert digest tree nodes and comparison results into response DTOs.
+
+Design intent:
+Presenters isolate representation concerns from the digest use cases, so the
+storage-facing DigestNode never leaks into the HTTP contract.
+
+This module contains:
+- DigestReaderPresenter: mapping from tree nodes to DigestTreeResponse.
+- DigestComparerPresenter: mapping from differences to DigestComparisonResponse.
+
+Dependency constraints:
+- Must not import from any other feature!
+- Must not depend on infrastructure implementations or frameworks directly!
+- Must not contain domain or application business rules.
+- May depend on this feature’s own ports and schemas.
+
+Stability:
+- Moderately stable.
+- Changes when response representations change.
+
+Usage:
+- Called by the digest interactors to produce output DTOs.
+"""
+
+from __future__ import annotations
+
+from features.digests.ports import DigestComparerPort, DigestReaderPort
+from features.digests.schemas import (
+    BucketDifference,
+    DigestComparisonResponse,
+    DigestNode,
+    DigestNodeResponse,
+    DigestScope,
+    DigestTreeResponse,
+)
+
+
+def _node_response(node: DigestNode) -> DigestNodeResponse:
+    return DigestNodeResponse(
+        prefix=node.prefix,
+        digest=node.digest,
+        row_count=node.row_count,
+        is_leaf=node.is_leaf,
+    )
+
+
+class DigestReaderPresenter(DigestReaderPort.Out):
+    """
+    Presenter for the read-digest use case.
+    """
+
+    def present(
+        self, *, scope: DigestScope, node: DigestNode, children: list[DigestNode]
+    ) -> DigestTreeResponse:
+        return DigestTreeResponse(
+            scope=scope,
+            node=_node_response(node),
+            children=[_node_response(child) for child in children],
+        )
+
+
+class DigestComparerPresenter(DigestComparerPort.Out):
+    """
+    Presenter for the compare-digests use case.
+    """
+
+    def present(
+        self,
+        *,
+        scope: DigestScope,
+        nodes_compared: int,
+        differences: list[BucketDifference],
+    ) -> DigestComparisonResponse:
+        return DigestComparisonResponse(
+            scope=scope,
+            matches=not differences,
+            nodes_compared=nodes_compared,
+            differences=differences,
+        )
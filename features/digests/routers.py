@@ -0,0 +1,74 @@
+"""
+Ring: Delivery (Controllers, Frameworks & Drivers / HTTP)
+
+Responsibility:
+Defines the HTTP routing layer for the State Digest feature.
+This module exposes the digest tree so that another store (or an operator) can
+compare it node by node.
+
+Design intent:
+This file is delivery mechanism only. A peer first fetches the root, then requests
+only the prefixes whose digests differ from its own.
+Responses carry a strong ETag derived from the node and child digests, so a peer
+polling an unchanged node gets 304 Not Modified without a body.
+
+This module contains:
+- FastAPI route definitions for reading digest tree nodes.
+
+Dependency constraints:
+- Must not import from any other feature!
+- Must not contain domain or application business rules.
+- Must not perform persistence or infrastructure work directly.
+- May depend on the Application layer (use cases, ports, schemas).
+- May depend on shared application contracts in features/_shared.
+- May depend on framework code (FastAPI, dependency injection).
+
+Stability:
+- Highly volatile.
+- Changes when the API surface, routing, or framework configuration changes.
+
+Usage:
+- Loaded by the application root to register HTTP endpoints.
+"""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Header, Response
+
+from features._shared.custom_types import Provider
+from features._shared.etags import collection_etag, etag_matches
+from features.digests.ports import DigestReaderPort
+from features.digests.schemas import DigestScope, DigestTreeResponse
+
+
+def build_digest_routers(
+    *,
+    digest_reader: Provider[DigestReaderPort.In],
+) -> APIRouter:
+    router = APIRouter(prefix="/digests", tags=["digests"])
+
+    @router.get(
+        "/{scope}",
+        response_model=DigestTreeResponse,
+        responses={
+            304: {"description": "The client's copy (If-None-Match) is current"}
+        },
+    )
+    def get_digest_endpoint(
+        scope: DigestScope,
+        reader: Annotated[DigestReaderPort.In, Depends(digest_reader)],
+        response: Response,
+        prefix: str = "",
+        if_none_match: Annotated[str | None, Header()] = None,
+    ) -> DigestTreeResponse | Response:
+        tree = reader.execute(scope=scope, prefix=prefix)
+        etag = collection_etag(
+            f"{node.prefix}={node.digest}" for node in [tree.node, *tree.children]
+        )
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+
+        response.headers["ETag"] = etag
+        return tree
+
+    return router
@@ -0,0 +1,92 @@
+"""
+Ring: Delivery (Interface Adapters / HTTP Boundary)
+
+Responsibility:
+Defines the schemas for the State Digest feature.
+These describe nodes of the range-hash tree and the result of comparing two stores.
+
+Design intent:
+Tree nodes are identified by key prefixes: the root is the empty prefix and each
+child narrows the range. Exchanging a node's digest is enough to tell whether the
+whole range it covers agrees between two stores.
+
+This module contains:
+- DigestScope: which table a tree covers.
+- DigestNode: one tree node as read from storage.
+- DigestNodeResponse / DigestTreeResponse: HTTP shapes for a node and its children.
+- BucketDifference / DigestComparisonResponse: the outcome of comparing two stores.
+
+Dependency constraints:
+- Must not import from any other feature!
+- Must not depend on infrastructure implementations or frameworks directly!
+- Must not contain persistence or serialization logic.
+- May depend on shared application contracts in features/_shared.
+
+Stability:
+- Less stable than the application and domain layers.
+- Changes when the public API contract changes.
+
+Usage:
+- Produced by presenters and returned by the digest use cases.
+- Used by HTTP controllers and the comparison CLI.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import Enum
+
+from pydantic import BaseModel
+
+
+class DigestScope(str, Enum):
+    ACCOUNTS = "accounts"
+    TRANSFERS = "transfers"
+
+
+@dataclass(frozen=True, slots=True)
+class DigestNode:
+    """
+    A node of the hash tree: the combined digest of every row under `prefix`.
+    """
+
+    prefix: str
+    digest: str
+    row_count: int
+    is_leaf: bool
+
+
+class DigestNodeResponse(BaseModel):
+    prefix: str
+    digest: str
+    row_count: int
+    is_leaf: bool
+
+
+class DigestTreeResponse(BaseModel):
+    """
+    HTTP response schema for one tree node and its direct children.
+    """
+
+    scope: DigestScope
+    node: DigestNodeResponse
+    children: list[DigestNodeResponse]
+
+
+class BucketDifference(BaseModel):
+    prefix: str
+    left_digest: str | None
+    right_digest: str | None
+    left_rows: int
+    right_rows: int
+
+
+class DigestComparisonResponse(BaseModel):
+    """
+    Result of comparing one scope across two stores.
+    """
+
+    scope: DigestScope
+    matches: bool
+    nodes_compared: int
+    differences: list[BucketDifference]
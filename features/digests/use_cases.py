@@ -0,0 +1,142 @@
+"""
+Ring: Application (Use Case / Interactors)
+
+Responsibility:
+Implements the state digest use cases: reading a node of the hash tree, and
+comparing two stores by descending only into ranges whose digests differ.
+
+Design intent:
+- Comparison starts at the root. Equal digests prove that the whole range agrees,
+  so matching subtrees are never expanded.
+- A node present on only one side is a difference in its own right; there is
+  nothing on the other side to descend into.
+- The cost of a comparison grows with the number of differing leaves, not with
+  the size of the stores.
+
+This module contains:
+- DigestReader: the interactor implementing DigestReaderPort.In.
+- DigestComparer: the interactor implementing DigestComparerPort.In.
+
+Dependency constraints:
+- Must not import from any other feature!
+- Must not depend on infrastructure implementations or frameworks directly!
+- Must not contain persistence, HTTP, or serialization logic.
+- May depend on this feature’s own ports and schemas.
+- May depend on shared application contracts in features/_shared.
+
+Stability:
+- Less stable than the domain, more stable than infrastructure.
+- Changes when comparison policy changes.
+
+Usage:
+- DigestReader is invoked by the HTTP controller so peers can walk this store.
+- DigestComparer is invoked by the comparison CLI with one repository per store.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from features.digests.ports import (
+    DigestComparerPort,
+    DigestReaderPort,
+    StateDigestRepoPort,
+)
+from features.digests.schemas import (
+    BucketDifference,
+    DigestComparisonResponse,
+    DigestNode,
+    DigestScope,
+    DigestTreeResponse,
+)
+
+
+class DigestReader(DigestReaderPort.In):
+    def __init__(
+        self,
+        *,
+        repo: StateDigestRepoPort,
+        presenter: DigestReaderPort.Out,
+        logger: logging.Logger,
+    ) -> None:
+        self._repo = repo
+        self._presenter = presenter
+        self._logger = logger
+
+    def execute(self, *, scope: DigestScope, prefix: str) -> DigestTreeResponse:
+        self._logger.info("digest_read scope=%s prefix=%s", scope.value, prefix)
+        return self._presenter.present(
+            scope=scope,
+            node=self._repo.node(scope, prefix),
+            children=self._repo.children(scope, prefix),
+        )
+
+
+class DigestComparer(DigestComparerPort.In):
+    def __init__(
+        self,
+        *,
+        left: StateDigestRepoPort,
+        right: StateDigestRepoPort,
+        presenter: DigestComparerPort.Out,
+        logger: logging.Logger,
+    ) -> None:
+        self._left = left
+        self._right = right
+        self._presenter = presenter
+        self._logger = logger
+
+    def execute(self, *, scope: DigestScope) -> DigestComparisonResponse:
+        self._logger.info("digest_compare_started scope=%s", scope.value)
+
+        differences: list[BucketDifference] = []
+        compared = 0
+        pending = [(self._left.node(scope, ""), self._right.node(scope, ""))]
+        while pending:
+            left, right = pending.pop()
+            compared += 1
+            if left.digest == right.digest and left.row_count == right.row_count:
+                continue
+
+            if left.is_leaf or right.is_leaf:
+                differences.append(_difference(left, right))
+                continue
+
+            pending.extend(self._differing_children(scope, left.prefix, differences))
+
+        differences.sort(key=lambda difference: difference.prefix)
+        self._logger.info(
+            "digest_compare_succeeded scope=%s nodes_compared=%s differences=%s",
+            scope.value,
+            compared,
+            len(differences),
+        )
+        return self._presenter.present(
+            scope=scope, nodes_compared=compared, differences=differences
+        )
+
+    def _differing_children(
+        self, scope: DigestScope, prefix: str, differences: list[BucketDifference]
+    ) -> list[tuple[DigestNode, DigestNode]]:
+        left = {node.prefix: node for node in self._left.children(scope, prefix)}
+        right = {node.prefix: node for node in self._right.children(scope, prefix)}
+
+        pairs: list[tuple[DigestNode, DigestNode]] = []
+        for child in sorted(left.keys() | right.keys()):
+            if child in left and child in right:
+                pairs.append((left[child], right[child]))
+            else:
+                differences.append(_difference(left.get(child), right.get(child)))
+        return pairs
+
+
+def _difference(left: DigestNode | None, right: DigestNode | None) -> BucketDifference:
+    present = left if left is not None else right
+    assert present is not None
+    return BucketDifference(
+        prefix=present.prefix,
+        left_digest=None if left is None else left.digest,
+        right_digest=None if right is None else right.digest,
+        left_rows=0 if left is None else left.row_count,
+        right_rows=0 if right is None else right.row_count,
+    )
@@ -0,0 +1,38 @@
+"""
+Ring: Application (Use Case / Feature Errors)
+
+Responsibility:
+Defines application-level errors specific to the Ledger Import feature.
+These represent failures that stop an import as a whole, as opposed to individual
+invalid rows, which are rejected and reported without aborting the run.
+
+Design intent:
+These errors translate source and configuration problems into concepts meaningful
+at the application boundary, without introducing file-system or framework concerns.
+
+This module contains:
+- ImportSourceError: the import source cannot be read or has an unsupported shape.
+
+Dependency constraints:
+- Must not import from any other feature!
+- Must not depend on infrastructure implementations or frameworks directly!
+- Must not contain persistence, HTTP, or serialization logic.
+- May depend on the Domain layer (core/).
+- May depend on shared application contracts in features/_shared.
+
+Stability:
+- Highly stable.
+- Part of the feature’s public error contract.
+
+Usage:
+- Raised by the import use case and by source adapters.
+- Caught by delivery layers (e.g. the CLI) and reported to the operator.
+"""
+
+from __future__ import annotations
+
+from features._shared.errors import ApplicationError
+
+
+class ImportSourceError(ApplicationError):
+    """Raised when an import source cannot be read or has an unsupported format."""
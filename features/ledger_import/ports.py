@@ -0,0 +1,126 @@
+"""
+Ring: Application (Use Case Boundaries / Ports)
+
+Responsibility:
+Defines the port interfaces for the Ledger Import feature.
+These ports isolate the import use case from the file formats it reads, the
+database it writes to, and the way progress is reported to an operator.
+
+Design intent:
+- Primary ports (In/Out) define the use case boundary: what the import offers and
+  how progress, rejected rows, and the final summary are emitted.
+- Secondary ports define what the use case needs from outside: a chunked source
+  of raw rows and a store that commits entities together with the checkpoint.
+- Committing a chunk and its checkpoint atomically is what makes resumption exact:
+  an interrupted import never re-inserts or skips rows.
+
+This module contains:
+- LedgerImporterPort: primary In/Out ports for importing ledger rows.
+- ImportSourcePort: secondary port for reading raw rows in chunks from an offset.
+- LedgerImportStorePort: secondary port for bulk inserts and checkpoints.
+
+Dependency constraints:
+- Must not import from any other feature!
+- Must not depend on infrastructure implementations or frameworks directly!
+- Must not contain persistence, HTTP, or serialization logic.
+- May depend on the Domain layer (core/).
+- May depend on this feature’s own errors and schemas.
+- May depend on shared application contracts in features/_shared.
+
+Stability:
+- Highly stable.
+- Ports are the contracts that outer layers adapt to; they should change rarely.
+
+Usage:
+- Implemented by the import interactor (In) and console presenter (Out).
+- Implemented by infrastructure adapters for the source and store ports.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from typing import Protocol
+
+from core.entities.transfer import Transfer
+from features._shared.ports import IOPorts
+from features.ledger_import.schemas import (
+    ImportCheckpoint,
+    ImportChunk,
+    ImportedAccount,
+    ImportKind,
+    ImportProgress,
+    ImportSummary,
+)
+
+
+class LedgerImporterPort(IOPorts):
+    """
+    Use case: bulk-load accounts or transfers from a file.
+    """
+
+    class In(Protocol):
+        """
+        Input boundary for importing a ledger file.
+        The interactor implements this.
+        """
+
+        def execute(
+            self, *, kind: ImportKind, source: str, batch_size: int
+        ) -> ImportSummary:
+            raise NotImplementedError
+
+    class Out(Protocol):
+        """
+        Output boundary for reporting import progress.
+        The presenter implements this.
+        """
+
+        def present_rejected(self, *, row_number: int | None, reason: str) -> None:
+            raise NotImplementedError
+
+        def present_progress(self, progress: ImportProgress) -> None:
+            raise NotImplementedError
+
+        def present(self, progress: ImportProgress) -> ImportSummary:
+            raise NotImplementedError
+
+
+class ImportSourcePort(Protocol):
+    """
+    Source port for raw ledger rows.
+    Implemented by infrastructure adapters (e.g. CSV/NDJSON files).
+    """
+
+    def read_chunks(
+        self, *, source: str, offset: int, first_row: int, chunk_size: int
+    ) -> Iterator[ImportChunk]:
+        """
+        Lazily yield chunks of at most `chunk_size` rows starting at `offset`.
+        """
+        raise NotImplementedError
+
+
+class LedgerImportStorePort(Protocol):
+    """
+    Persistence port for bulk imports.
+    Implemented by infrastructure adapters.
+    """
+
+    def load_checkpoint(self, job_id: str) -> ImportCheckpoint:
+        raise NotImplementedError
+
+    def commit_chunk(
+        self,
+        *,
+        job_id: str,
+        accounts: Sequence[ImportedAccount],
+        transfers: Sequence[Transfer],
+        checkpoint: ImportCheckpoint,
+    ) -> list[str]:
+        """
+        Insert the entities and advance the checkpoint in one transaction.
+
+        Returns the ids that were skipped because they already exist, or because
+        the store cannot represent them.
+        """
+        raise NotImplementedError
@@ -0,0 +1,83 @@
+"""
+Ring: Interface Adapters (Presenters)
+
+Responsibility:
+Defines presenters for the Ledger Import feature.
+Presenters turn import progress into operator-facing output and the final
+ImportSummary DTO.
+
+Design intent:
+Presenters isolate formatting concerns from the import use case. The use case only
+maintains counters; the presenter decides how often and in what shape progress is
+reported, and derives throughput from its own clock.
+
+This module contains:
+- ImportConsolePresenter: line-oriented progress and rejected-row reporting.
+
+Dependency constraints:
+- Must not import from any other feature!
+- Must not depend on infrastructure implementations or frameworks directly!
+- Must not contain domain or application business rules.
+- May depend on this feature’s own ports and schemas.
+
+Stability:
+- Moderately stable.
+- Changes when report formats change, even if import logic does not.
+
+Usage:
+- Called by the import use case as it processes chunks.
+- Wired by the CLI with writers for progress and rejected rows.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+
+from features.ledger_import.ports import LedgerImporterPort
+from features.ledger_import.schemas import ImportProgress, ImportSummary
+
+
+class ImportConsolePresenter(LedgerImporterPort.Out):
+    """
+    Presenter for the import use case.
+
+    Writes one progress line per committed chunk and one line per rejected row.
+    """
+
+    def __init__(
+        self,
+        *,
+        write_progress: Callable[[str], None],
+        write_rejected: Callable[[str], None],
+    ) -> None:
+        self._write_progress = write_progress
+        self._write_rejected = write_rejected
+        self._started = time.monotonic()
+
+    def present_rejected(self, *, row_number: int | None, reason: str) -> None:
+        row = "-" if row_number is None else str(row_number)
+        self._write_rejected(f"import_rejected row={row} reason={reason}")
+
+    def present_progress(self, progress: ImportProgress) -> None:
+        self._write_progress(
+            f"import_progress kind={progress.kind.value} chunks={progress.chunks} "
+            f"rows_read={progress.rows_read} imported={progress.imported} "
+            f"rejected={progress.rejected} rows_per_sec={self._rate(progress):.0f}"
+        )
+
+    def present(self, progress: ImportProgress) -> ImportSummary:
+        return ImportSummary(
+            kind=progress.kind,
+            source=progress.source,
+            resumed_from_row=progress.resumed_from_row,
+            rows_read=progress.rows_read,
+            imported=progress.imported,
+            rejected=progress.rejected,
+            rows_per_sec=round(self._rate(progress), 1),
+            rejected_reasons=dict(progress.rejected_reasons),
+        )
+
+    def _rate(self, progress: ImportProgress) -> float:
+        elapsed = max(time.monotonic() - self._started, 1e-9)
+        return (progress.rows_read - progress.resumed_from_row) / elapsed
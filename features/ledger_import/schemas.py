@@ -0,0 +1,129 @@
+"""
+Ring: Delivery (Interface Adapters / CLI Boundary)
+
+Responsibility:
+Defines the data shapes exchanged by the Ledger Import feature.
+These describe what an import reads, how far it has progressed, and the summary
+it reports once finished.
+
+Design intent:
+These models represent the contract between the import use case, its source and
+storage ports, and the command-line delivery mechanism. Chunk and checkpoint
+shapes are plain immutable records; the final summary is a Pydantic model so it
+can be serialised by any delivery layer.
+
+This module contains:
+- ImportKind: which ledger table an import targets.
+- RawRow / ImportChunk: unvalidated rows read from a source, with their resume offset.
+- ImportedAccount: a validated account together with its opening balance.
+- ImportCheckpoint: the durable position of an import within its source.
+- ImportProgress: running counters for an import.
+- ImportSummary: the final outcome of an import.
+
+Dependency constraints:
+- Must not import from any other feature!
+- Must not depend on infrastructure implementations or frameworks directly!
+- Must not contain persistence or serialization logic.
+- May depend on the Domain layer (core/).
+- May depend on shared application contracts in features/_shared.
+
+Stability:
+- Less stable than the application and domain layers.
+- Changes when the import contract changes.
+
+Usage:
+- Produced by source adapters and the import use case.
+- Consumed by presenters and the CLI.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from enum import Enum
+
+from pydantic import BaseModel
+
+from core.entities.account import Account
+from core.values.objects import Money
+
+
+class ImportKind(str, Enum):
+    ACCOUNTS = "accounts"
+    TRANSFERS = "transfers"
+
+
+@dataclass(frozen=True, slots=True)
+class RawRow:
+    """
+    One unvalidated source record and its 1-based position in the source.
+
+    `error` is set when the record could not even be parsed into fields.
+    """
+
+    number: int
+    fields: dict[str, str]
+    error: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class ImportChunk:
+    """
+    A batch of raw rows and the source offset immediately after the batch.
+    """
+
+    rows: list[RawRow]
+    end_offset: int
+
+
+@dataclass(frozen=True, slots=True)
+class ImportedAccount:
+    """
+    A validated account row.
+
+    Legacy ledgers supply the balance before their imported transfer history as
+    the opening balance; when absent it equals the current balance.
+    """
+
+    account: Account
+    opening_balance: Money
+
+
+@dataclass(frozen=True, slots=True)
+class ImportCheckpoint:
+    """
+    Durable import position: source byte offset and rows consumed so far.
+    """
+
+    offset: int = 0
+    rows_read: int = 0
+
+
+@dataclass(slots=True)
+class ImportProgress:
+    """
+    Running counters for an import, including rows consumed before a resume.
+    """
+
+    kind: ImportKind
+    source: str
+    resumed_from_row: int
+    rows_read: int = 0
+    imported: int = 0
+    rejected: int = 0
+    chunks: int = 0
+    rejected_reasons: dict[str, int] = field(default_factory=dict)
+
+
+class ImportSummary(BaseModel):
+    """
+    Final report of an import run.
+    """
+
+    kind: ImportKind
+    source: str
+    resumed_from_row: int
+    rows_read: int
+    imported: int
+    rejected: int
+    rows_per_sec: float
+    rejected_reasons: dict[str, int]
@@ -0,0 +1,234 @@
+"""
+Ring: Application (Use Case / Interactors)
+
+Responsibility:
+Implements the ledger import use case.
+This interactor streams raw rows from a source in chunks, validates each row by
+constructing the corresponding domain entity, and commits every chunk of valid
+entities together with a checkpoint so that an interrupted run resumes exactly
+where it stopped.
+
+Design intent:
+- Validation is delegated to the domain: a row is valid if and only if it builds
+  an Account or Transfer entity (and therefore valid Money).
+- Invalid rows never abort an import; they are rejected, counted by reason, and
+  reported through the presenter.
+- Historical transfers are recorded as facts only. They are not re-applied to
+  balances, because imported account balances are already the result of them.
+
+This module contains:
+- LedgerImporter: the interactor implementing LedgerImporterPort.In.
+
+Dependency constraints:
+- Must not import from any other feature!
+- Must not depend on infrastructure implementations or frameworks directly!
+- Must not contain persistence, file-format, or serialization logic.
+- May depend on the Domain layer (core/).
+- May depend on this feature’s own ports, errors, and schemas.
+- May depend on shared application contracts in features/_shared.
+
+Stability:
+- Less stable than the domain, more stable than infrastructure.
+- Changes when import behaviour changes, not when file formats or storage change.
+
+Usage:
+- Invoked by delivery mechanisms (e.g. the import CLI command).
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timezone
+
+from core.entities.account import Account
+from core.entities.transfer import Transfer
+from core.values.custom_types import AccountId, TransferId
+from core.values.errors import DomainError
+from core.values.objects import Money
+from features.ledger_import.ports import (
+    ImportSourcePort,
+    LedgerImporterPort,
+    LedgerImportStorePort,
+)
+from features.ledger_import.schemas import (
+    ImportCheckpoint,
+    ImportChunk,
+    ImportedAccount,
+    ImportKind,
+    ImportProgress,
+    ImportSummary,
+    RawRow,
+)
+
+
+class _RowRejected(Exception):
+    """Internal signal: a row cannot be converted into a domain entity."""
+
+    def __init__(self, reason: str, detail: str) -> None:
+        super().__init__(detail)
+        self.reason = reason
+
+
+class LedgerImporter(LedgerImporterPort.In):
+    def __init__(
+        self,
+        *,
+        source: ImportSourcePort,
+        store: LedgerImportStorePort,
+        presenter: LedgerImporterPort.Out,
+        logger: logging.Logger,
+    ) -> None:
+        self._source = source
+        self._store = store
+        self._presenter = presenter
+        self._logger = logger
+
+    def execute(
+        self, *, kind: ImportKind, source: str, batch_size: int
+    ) -> ImportSummary:
+        job_id = f"{kind.value}:{source}"
+        checkpoint = self._store.load_checkpoint(job_id)
+        self._logger.info(
+            "ledger_import_started job_id=%s batch_size=%s resume_offset=%s resume_row=%s",
+            job_id,
+            batch_size,
+            checkpoint.offset,
+            checkpoint.rows_read,
+        )
+
+        progress = ImportProgress(
+            kind=kind,
+            source=source,
+            resumed_from_row=checkpoint.rows_read,
+            rows_read=checkpoint.rows_read,
+        )
+
+        chunks = self._source.read_chunks(
+            source=source,
+            offset=checkpoint.offset,
+            first_row=checkpoint.rows_read + 1,
+            chunk_size=batch_size,
+        )
+        for chunk in chunks:
+            self._import_chunk(job_id=job_id, kind=kind, chunk=chunk, progress=progress)
+            self._presenter.present_progress(progress)
+
+        self._logger.info(
+            "ledger_import_succeeded job_id=%s rows_read=%s imported=%s rejected=%s",
+            job_id,
+            progress.rows_read,
+            progress.imported,
+            progress.rejected,
+        )
+        return self._presenter.present(progress)
+
+    def _import_chunk(
+        self,
+        *,
+        job_id: str,
+        kind: ImportKind,
+        chunk: ImportChunk,
+        progress: ImportProgress,
+    ) -> None:
+        accounts: list[ImportedAccount] = []
+        transfers: list[Transfer] = []
+        for row in chunk.rows:
+            try:
+                if kind is ImportKind.ACCOUNTS:
+                    accounts.append(_to_account(row))
+                else:
+                    transfers.append(_to_transfer(row))
+            except _RowRejected as exc:
+                _count_rejected(progress, reason=exc.reason)
+                self._presenter.present_rejected(row_number=row.number, reason=str(exc))
+
+        progress.rows_read += len(chunk.rows)
+        duplicates = self._store.commit_chunk(
+            job_id=job_id,
+            accounts=accounts,
+            transfers=transfers,
+            checkpoint=ImportCheckpoint(
+                offset=chunk.end_offset, rows_read=progress.rows_read
+            ),
+        )
+
+        for entity_id in duplicates:
+            _count_rejected(progress, reason="duplicate_id")
+            self._presenter.present_rejected(
+                row_number=None, reason=f"Duplicate or unstorable id: {entity_id}"
+            )
+
+        progress.imported += len(accounts) + len(transfers) - len(duplicates)
+        progress.chunks += 1
+
+
+def _count_rejected(progress: ImportProgress, *, reason: str) -> None:
+    progress.rejected += 1
+    progress.rejected_reasons[reason] = progress.rejected_reasons.get(reason, 0) + 1
+
+
+def _to_account(row: RawRow) -> ImportedAccount:
+    _require_parsed(row)
+    try:
+        account = Account(
+            id=AccountId(_required(row, "id")),
+            balance=Money(_integer(row, "balance_pence")),
+        )
+        opening = (
+            Money(_integer(row, "opening_balance_pence"))
+            if row.fields.get("opening_balance_pence", "").strip()
+            else account.balance
+        )
+        return ImportedAccount(account=account, opening_balance=opening)
+    except DomainError as exc:
+        raise _RowRejected(type(exc).__name__, f"Row {row.number}: {exc}") from exc
+
+
+def _to_transfer(row: RawRow) -> Transfer:
+    _require_parsed(row)
+    try:
+        return Transfer(
+            id=TransferId(_required(row, "id")),
+            from_account_id=AccountId(_required(row, "from_account_id")),
+            to_account_id=AccountId(_required(row, "to_account_id")),
+            amount=Money(_integer(row, "amount_pence")),
+            created_at=_timestamp(row, "created_at"),
+        )
+    except DomainError as exc:
+        raise _RowRejected(type(exc).__name__, f"Row {row.number}: {exc}") from exc
+
+
+def _require_parsed(row: RawRow) -> None:
+    if row.error is not None:
+        raise _RowRejected("malformed_row", f"Row {row.number}: {row.error}")
+
+
+def _required(row: RawRow, name: str) -> str:
+    value = row.fields.get(name, "").strip()
+    if not value:
+        raise _RowRejected("missing_field", f"Row {row.number}: missing '{name}'")
+    return value
+
+
+def _integer(row: RawRow, name: str) -> int:
+    value = _required(row, name)
+    try:
+        return int(value)
+    except ValueError as exc:
+        raise _RowRejected(
+            "invalid_integer", f"Row {row.number}: '{name}' is not an integer"
+        ) from exc
+
+
+def _timestamp(row: RawRow, name: str) -> datetime:
+    value = _required(row, name)
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError as exc:
+        raise _RowRejected(
+            "invalid_timestamp", f"Row {row.number}: '{name}' is not ISO-8601"
+        ) from exc
+
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
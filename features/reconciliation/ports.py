@@ -0,0 +1,95 @@
+"""
+Ring: Application (Use Case Boundaries / Ports)
+
+Responsibility:
+Defines the port interfaces for the Reconciliation feature.
+These ports isolate the reconciliation use case from how the ledger is scanned and
+how discrepancies are reported.
+
+Design intent:
+- Primary ports (In/Out) define the use case boundary: run a reconciliation and
+  emit per-range results plus a final summary.
+- The secondary scan port splits the account id space and reconciles one range at
+  a time. Implementations must be picklable so ranges can be fanned out to worker
+  processes, each opening its own read-only connection.
+
+This module contains:
+- LedgerReconcilerPort: primary In/Out ports for reconciling balances.
+- LedgerScanPort: secondary port for partitioning and scanning the ledger.
+
+Dependency constraints:
+- Must not import from any other feature!
+- Must not depend on infrastructure implementations or frameworks directly!
+- Must not contain persistence, HTTP, or serialization logic.
+- May depend on this feature’s own schemas.
+- May depend on shared application contracts in features/_shared.
+
+Stability:
+- Highly stable.
+- Ports are the contracts that outer layers adapt to; they should change rarely.
+
+Usage:
+- Implemented by the reconciliation interactor (In) and console presenter (Out).
+- Implemented by infrastructure adapters for the scan port.
+"""
+
+from __future__ import annotations
+
+from typing import Protocol
+
+from features._shared.ports import IOPorts
+from features.reconciliation.schemas import (
+    AccountIdRange,
+    RangeReconciliation,
+    ReconciliationSummary,
+)
+
+
+class LedgerReconcilerPort(IOPorts):
+    """
+    Use case: prove stored balances agree with opening balances and transfers.
+    """
+
+    class In(Protocol):
+        """
+        Input boundary for reconciling the ledger.
+        The interactor implements this.
+        """
+
+        def execute(self, *, partitions: int) -> ReconciliationSummary:
+            raise NotImplementedError
+
+    class Out(Protocol):
+        """
+        Output boundary for reporting reconciliation results.
+        The presenter implements this.
+        """
+
+        def present_range(self, result: RangeReconciliation) -> None:
+            raise NotImplementedError
+
+        def present(
+            self,
+            *,
+            partitions: int,
+            accounts_checked: int,
+            discrepancy_count: int,
+            reported_discrepancies: int,
+        ) -> ReconciliationSummary:
+            raise NotImplementedError
+
+
+class LedgerScanPort(Protocol):
+    """
+    Read-only ledger scanning port.
+    Implemented by infrastructure adapters.
+    """
+
+    def partition(self, count: int) -> list[AccountIdRange]:
+        """
+        Split the account id space into at most `count` ranges of similar size.
+        """
+        raise NotImplementedError
+
+    def reconcile(self, id_range: AccountIdRange) -> RangeReconciliation:
+        raise NotImplementedError
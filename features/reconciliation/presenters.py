@@ -0,0 +1,93 @@
+"""
+Ring: Interface Adapters (Presenters)
+
+Responsibility:
+Defines presenters for the Reconciliation feature.
+Presenters turn per-range results into a discrepancy report and build the final
+ReconciliationSummary DTO.
+
+Design intent:
+The report is written incrementally, one NDJSON line per discrepancy, so it can be
+consumed or diffed with standard tools while the job is still running.
+
+This module contains:
+- ReconciliationReportPresenter: NDJSON discrepancy lines plus a summary DTO.
+
+Dependency constraints:
+- Must not import from any other feature!
+- Must not depend on infrastructure implementations or frameworks directly!
+- Must not contain domain or application business rules.
+- May depend on this feature’s own ports and schemas.
+
+Stability:
+- Moderately stable.
+- Changes when the report format changes.
+
+Usage:
+- Called by the reconciliation use case as ranges complete.
+- Wired by the CLI with writers for discrepancy and progress lines.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from collections.abc import Callable
+
+from features.reconciliation.ports import LedgerReconcilerPort
+from features.reconciliation.schemas import RangeReconciliation, ReconciliationSummary
+
+
+class ReconciliationReportPresenter(LedgerReconcilerPort.Out):
+    """
+    Presenter for the reconciliation use case.
+    """
+
+    def __init__(
+        self,
+        *,
+        write_discrepancy: Callable[[str], None],
+        write_progress: Callable[[str], None],
+    ) -> None:
+        self._write_discrepancy = write_discrepancy
+        self._write_progress = write_progress
+        self._started = time.monotonic()
+        self._ranges_done = 0
+
+    def present_range(self, result: RangeReconciliation) -> None:
+        self._ranges_done += 1
+        for discrepancy in result.discrepancies:
+            self._write_discrepancy(
+                json.dumps(
+                    {
+                        "account_id": discrepancy.account_id,
+                        "balance_pence": discrepancy.balance_pence,
+                        "expected_pence": discrepancy.expected_pence,
+                        "difference_pence": discrepancy.difference_pence,
+                    }
+                )
+            )
+
+        omitted = result.discrepancy_count - len(result.discrepancies)
+        self._write_progress(
+            f"reconciliation_range_done ranges_done={self._ranges_done} "
+            f"low={result.id_range.low} high={result.id_range.high} "
+            f"accounts_checked={result.accounts_checked} "
+            f"discrepancies={result.discrepancy_count} omitted={omitted}"
+        )
+
+    def present(
+        self,
+        *,
+        partitions: int,
+        accounts_checked: int,
+        discrepancy_count: int,
+        reported_discrepancies: int,
+    ) -> ReconciliationSummary:
+        return ReconciliationSummary(
+            partitions=partitions,
+            accounts_checked=accounts_checked,
+            discrepancy_count=discrepancy_count,
+            reported_discrepancies=reported_discrepancies,
+            elapsed_sec=round(time.monotonic() - self._started, 3),
+        )
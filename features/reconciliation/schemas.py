@@ -0,0 +1,87 @@
+"""
+Ring: Delivery (Interface Adapters / CLI Boundary)
+
+Responsibility:
+Defines the data shapes exchanged by the Reconciliation feature.
+These describe how the account id space is partitioned, what each partition scan
+returns, and the final report.
+
+Design intent:
+Partition and result records are plain immutable dataclasses because they cross
+process boundaries and must pickle cheaply. The final summary is a Pydantic model
+so any delivery layer can serialise it.
+
+This module contains:
+- AccountIdRange: a half-open range of account ids scanned by one worker.
+- BalanceDiscrepancy: an account whose stored balance disagrees with its history.
+- RangeReconciliation: the outcome of scanning one range.
+- ReconciliationSummary: the final report.
+
+Dependency constraints:
+- Must not import from any other feature!
+- Must not depend on infrastructure implementations or frameworks directly!
+- Must not contain persistence or serialization logic.
+- May depend on shared application contracts in features/_shared.
+
+Stability:
+- Less stable than the application and domain layers.
+- Changes when the report contract changes.
+
+Usage:
+- Produced by ledger scanners and the reconciliation use case.
+- Consumed by presenters and the CLI.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from pydantic import BaseModel
+
+
+@dataclass(frozen=True, slots=True)
+class AccountIdRange:
+    """
+    Half-open range [low, high) of account ids; None means unbounded.
+    """
+
+    low: str | None
+    high: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class BalanceDiscrepancy:
+    account_id: str
+    balance_pence: int
+    expected_pence: int
+
+    @property
+    def difference_pence(self) -> int:
+        return self.balance_pence - self.expected_pence
+
+
+@dataclass(frozen=True, slots=True)
+class RangeReconciliation:
+    """
+    Result of reconciling one id range.
+
+    `discrepancies` holds at most the scanner's per-range cap; `discrepancy_count`
+    is always the full count.
+    """
+
+    id_range: AccountIdRange
+    accounts_checked: int
+    discrepancy_count: int
+    discrepancies: list[BalanceDiscrepancy]
+
+
+class ReconciliationSummary(BaseModel):
+    """
+    Final report of a reconciliation run.
+    """
+
+    partitions: int
+    accounts_checked: int
+    discrepancy_count: int
+    reported_discrepancies: int
+    elapsed_sec: float
@@ -0,0 +1,96 @@
+"""
+Ring: Application (Use Case / Interactors)
+
+Responsibility:
+Implements the ledger reconciliation use case.
+This interactor checks, for every account, that
+
+    balance = opening balance + incoming transfers - outgoing transfers
+
+by splitting the account id space into ranges and reconciling the ranges in
+parallel.
+
+Design intent:
+- The interactor owns the fan-out/fan-in policy only; aggregation happens inside
+  the scan port, next to the data, so workers return discrepancies rather than
+  rows.
+- Parallelism is injected as a standard `concurrent.futures.Executor`: a process
+  pool in production, a thread or inline executor for small stores.
+- Results are presented as each range completes, so a long run reports early and
+  memory is bounded by the number of in-flight ranges.
+
+This module contains:
+- LedgerReconciler: the interactor implementing LedgerReconcilerPort.In.
+
+Dependency constraints:
+- Must not import from any other feature!
+- Must not depend on infrastructure implementations or frameworks directly!
+- Must not contain persistence, HTTP, or serialization logic.
+- May depend on this feature’s own ports and schemas.
+- May depend on shared application contracts in features/_shared.
+
+Stability:
+- Less stable than the domain, more stable than infrastructure.
+- Changes when reconciliation policy changes.
+
+Usage:
+- Invoked by delivery mechanisms (e.g. the reconciliation CLI command).
+"""
+
+from __future__ import annotations
+
+import logging
+from concurrent.futures import Executor, as_completed
+
+from features.reconciliation.ports import LedgerReconcilerPort, LedgerScanPort
+from features.reconciliation.schemas import ReconciliationSummary
+
+
+class LedgerReconciler(LedgerReconcilerPort.In):
+    def __init__(
+        self,
+        *,
+        scanner: LedgerScanPort,
+        executor: Executor,
+        presenter: LedgerReconcilerPort.Out,
+        logger: logging.Logger,
+    ) -> None:
+        self._scanner = scanner
+        self._executor = executor
+        self._presenter = presenter
+        self._logger = logger
+
+    def execute(self, *, partitions: int) -> ReconciliationSummary:
+        ranges = self._scanner.partition(partitions)
+        self._logger.info(
+            "reconciliation_started requested_partitions=%s partitions=%s",
+            partitions,
+            len(ranges),
+        )
+
+        accounts_checked = 0
+        discrepancy_count = 0
+        reported = 0
+
+        futures = [
+            self._executor.submit(self._scanner.reconcile, id_range)
+            for id_range in ranges
+        ]
+        for future in as_completed(futures):
+            result = future.result()
+            accounts_checked += result.accounts_checked
+            discrepancy_count += result.discrepancy_count
+            reported += len(result.discrepancies)
+            self._presenter.present_range(result)
+
+        self._logger.info(
+            "reconciliation_succeeded accounts_checked=%s discrepancy_count=%s",
+            accounts_checked,
+            discrepancy_count,
+        )
+        return self._presenter.present(
+            partitions=len(ranges),
+            accounts_checked=accounts_checked,
+            discrepancy_count=discrepancy_count,
+            reported_discrepancies=reported,
+        )
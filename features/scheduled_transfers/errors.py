@@ -0,0 +1,41 @@
+"""
+Ring: Application (Use Case / Feature Errors)
+
+Responsibility:
+Defines application-level errors specific to the Scheduled Transfers feature.
+
+Design intent:
+Only errors raised while scheduling or reading a scheduled transfer live here.
+A transfer that is rejected when it comes due is not an error to anyone's
+request: it is recorded as the scheduled transfer's `failed` status instead.
+
+This module contains:
+- ScheduledTransferNotFoundError: raised when a scheduled transfer does not exist.
+- ScheduledTransferValidationError: raised when a schedule request is invalid.
+
+Dependency constraints:
+- Must not import from any other feature!
+- Must not depend on infrastructure implementations or frameworks directly!
+- Must not contain persistence, HTTP, or serialization logic.
+- May depend on shared application contracts in features/_shared.
+
+Stability:
+- Highly stable.
+- Part of the feature’s public error contract.
+
+Usage:
+- Raised by scheduled transfer use case interactors.
+- Caught by delivery layers and translated into protocol-specific responses.
+"""
+
+from __future__ import annotations
+
+from features._shared.errors import ApplicationError
+
+
+class ScheduledTransferNotFoundError(ApplicationError):
+    """Raised when a requested scheduled transfer does not exist."""
+
+
+class ScheduledTransferValidationError(ApplicationError):
+    """Raised when a transfer cannot be scheduled as requested."""
@@ -0,0 +1,150 @@
+"""
+Ring: Application (Use Case Boundaries / Ports)
+
+Responsibility:
+Defines the port interfaces for the Scheduled Transfers feature.
+These ports isolate scheduling, reading and executing scheduled transfers from
+how they are stored, timed and carried out.
+
+Design intent:
+- Primary ports (In/Out) define the boundaries of scheduling a transfer, reading
+  one, and executing one that has come due.
+- The repository port stores scheduled transfers; it commits with the caller's
+  unit of work.
+- The scheduler port hands a committed scheduled transfer to whatever fires it
+  at its due time.
+- The transfer port is how an executed scheduled transfer becomes a real
+  transfer. It is satisfied by the Transfers feature's creator, wired in the
+  composition root, so this feature never imports it.
+
+This module contains:
+- ScheduledTransferCreatorPort: primary In/Out ports for scheduling a transfer.
+- ScheduledTransferGetterPort: primary In/Out ports for reading one.
+- ScheduledTransferExecutorPort: primary In/Out ports for executing one.
+- ScheduledTransferRepoPort: secondary port for storage.
+- TransferSchedulerPort: secondary port for timing.
+- TransferPort: secondary port for carrying out the transfer.
+
+Dependency constraints:
+- Must not import from any other feature!
+- Must not depend on infrastructure implementations or frameworks directly!
+- Must not contain persistence, HTTP, or serialization logic.
+- May depend on this feature’s own schemas.
+- May depend on shared application contracts in features/_shared.
+
+Stability:
+- Highly stable.
+- Ports are the contracts that outer layers adapt to; they should change rarely.
+
+Usage:
+- Implemented by scheduled transfer interactors (In) and presenters (Out).
+- Implemented by infrastructure adapters for the secondary ports.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Protocol
+
+from features._shared.ports import IOPorts
+from features.scheduled_transfers.schemas import (
+    ScheduledTransfer,
+    ScheduledTransferResponse,
+)
+
+
+class ScheduledTransferCreatorPort(IOPorts):
+    """
+    Use case: schedule a transfer for a future due time.
+    """
+
+    class In(Protocol):
+        def execute(
+            self,
+            *,
+            from_account_id: str,
+            to_account_id: str,
+            amount_pence: int,
+            due_at: datetime,
+        ) -> ScheduledTransferResponse:
+            raise NotImplementedError
+
+    class Out(Protocol):
+        def present(self, scheduled: ScheduledTransfer) -> ScheduledTransferResponse:
+            raise NotImplementedError
+
+
+class ScheduledTransferGetterPort(IOPorts):
+    """
+    Use case: read a scheduled transfer and its outcome.
+    """
+
+    class In(Protocol):
+        def execute(self, *, scheduled_transfer_id: str) -> ScheduledTransferResponse:
+            raise NotImplementedError
+
+    class Out(Protocol):
+        def present(self, scheduled: ScheduledTransfer) -> ScheduledTransferResponse:
+            raise NotImplementedError
+
+
+class ScheduledTransferExecutorPort(IOPorts):
+    """
+    Use case: execute a scheduled transfer that has come due.
+    """
+
+    class In(Protocol):
+        def execute(
+            self, *, scheduled_transfer_id: str
+        ) -> ScheduledTransferResponse | None:
+            """
+            None if there is no such scheduled transfer or it is no longer pending.
+            """
+            raise NotImplementedError
+
+    class Out(Protocol):
+        def present(self, scheduled: ScheduledTransfer) -> ScheduledTransferResponse:
+            raise NotImplementedError
+
+
+class ScheduledTransferRepoPort(Protocol):
+    """
+    Persistence port for scheduled transfers.
+    Implemented by infrastructure adapters.
+    """
+
+    def get(self, scheduled_transfer_id: str) -> ScheduledTransfer | None:
+        raise NotImplementedError
+
+    def save(self, scheduled: ScheduledTransfer) -> None:
+        """
+        Insert or replace; written when the unit of work commits.
+        """
+        raise NotImplementedError
+
+
+class TransferSchedulerPort(Protocol):
+    """
+    Fires committed scheduled transfers at their due time.
+    """
+
+    def schedule(self, scheduled_transfer_id: str, due_at: datetime) -> None:
+        raise NotImplementedError
+
+
+class TransferPort(Protocol):
+    """
+    Carries out a transfer in the caller's unit of work and commits it.
+
+    Raises an ApplicationError if the transfer is rejected.
+    """
+
+    def execute(
+        self,
+        *,
+        from_account_id: str,
+        to_account_id: str,
+        amount_pence: int,
+        transfer_id: str | None = None,
+    ) -> Any:
+        raise NotImplementedError
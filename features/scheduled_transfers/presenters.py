@@ -0,0 +1,58 @@
+"""
+Ring: Interface Adapters (Presenters)
+
+Responsibility:
+Defines the presenter for the Scheduled Transfers feature.
+It converts stored scheduled transfers into response DTOs.
+
+Design intent:
+One presenter serves every scheduled transfer use case: scheduling, reading and
+executing all report the same representation.
+
+This module contains:
+- ScheduledTransferPresenter: mapping from ScheduledTransfer to
+  ScheduledTransferResponse.
+
+Dependency constraints:
+- Must not import from any other feature!
+- Must not depend on infrastructure implementations or frameworks directly!
+- Must not contain domain or application business rules.
+- May depend on this feature’s own ports and schemas.
+
+Stability:
+- Moderately stable.
+- Changes when response representations change.
+
+Usage:
+- Called by the scheduled transfer interactors to produce output DTOs.
+"""
+
+from __future__ import annotations
+
+from features.scheduled_transfers.ports import (
+    ScheduledTransferCreatorPort,
+    ScheduledTransferExecutorPort,
+    ScheduledTransferGetterPort,
+)
+from features.scheduled_transfers.schemas import (
+    ScheduledTransfer,
+    ScheduledTransferResponse,
+)
+
+
+class ScheduledTransferPresenter(
+    ScheduledTransferCreatorPort.Out,
+    ScheduledTransferGetterPort.Out,
+    ScheduledTransferExecutorPort.Out,
+):
+    def present(self, scheduled: ScheduledTransfer) -> ScheduledTransferResponse:
+        return ScheduledTransferResponse(
+            id=scheduled.id,
+            from_account_id=scheduled.from_account_id,
+            to_account_id=scheduled.to_account_id,
+            amount_pence=scheduled.amount_pence,
+            due_at=scheduled.due_at,
+            status=scheduled.status,
+            completed_at=scheduled.completed_at,
+            failure_reason=scheduled.failure_reason,
+        )
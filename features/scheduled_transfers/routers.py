@@ -0,0 +1,77 @@
+"""
+Ring: Delivery (Controllers, Frameworks & Drivers / HTTP)
+
+Responsibility:
+Defines the HTTP routing layer for the Scheduled Transfers feature.
+This module exposes scheduling a transfer and following its outcome.
+
+Design intent:
+This file is delivery mechanism only. POST returns as soon as the scheduled
+transfer is stored; clients poll GET for its status, or follow the change feed,
+where the executed transfer appears under the same id.
+
+This module contains:
+- FastAPI route definitions for scheduled transfers.
+
+Dependency constraints:
+- Must not import from any other feature!
+- Must not contain domain or application business rules.
+- Must not perform persistence or infrastructure work directly.
+- May depend on the Application layer (use cases, ports, schemas).
+- May depend on shared application contracts in features/_shared.
+- May depend on framework code (FastAPI, dependency injection).
+
+Stability:
+- Highly volatile.
+- Changes when the API surface, routing, or framework configuration changes.
+
+Usage:
+- Loaded by the application root to register HTTP endpoints.
+"""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+
+from features._shared.custom_types import Provider
+from features.scheduled_transfers.ports import (
+    ScheduledTransferCreatorPort,
+    ScheduledTransferGetterPort,
+)
+from features.scheduled_transfers.schemas import (
+    ScheduledTransferResponse,
+    ScheduleTransferRequest,
+)
+
+
+def build_scheduled_transfer_routers(
+    *,
+    scheduled_transfer_creator: Provider[ScheduledTransferCreatorPort.In],
+    scheduled_transfer_getter: Provider[ScheduledTransferGetterPort.In],
+) -> APIRouter:
+    router = APIRouter(prefix="/scheduled-transfers", tags=["scheduled-transfers"])
+
+    @router.post("", response_model=ScheduledTransferResponse)
+    def schedule_transfer_endpoint(
+        req: ScheduleTransferRequest,
+        creator: Annotated[
+            ScheduledTransferCreatorPort.In, Depends(scheduled_transfer_creator)
+        ],
+    ) -> ScheduledTransferResponse:
+        return creator.execute(
+            from_account_id=req.from_account_id,
+            to_account_id=req.to_account_id,
+            amount_pence=req.amount_pence,
+            due_at=req.due_at,
+        )
+
+    @router.get("/{scheduled_transfer_id}", response_model=ScheduledTransferResponse)
+    def get_scheduled_transfer_endpoint(
+        scheduled_transfer_id: str,
+        getter: Annotated[
+            ScheduledTransferGetterPort.In, Depends(scheduled_transfer_getter)
+        ],
+    ) -> ScheduledTransferResponse:
+        return getter.execute(scheduled_transfer_id=scheduled_transfer_id)
+
+    return router
@@ -0,0 +1,90 @@
+"""
+Ring: Delivery (Interface Adapters / HTTP Boundary)
+
+Responsibility:
+Defines the schemas for the Scheduled Transfers feature.
+These describe a transfer requested now but executed at a future due time, and
+its outcome once the scheduler has run it.
+
+Design intent:
+A scheduled transfer is an instruction, not a fact. It is stored as `pending`
+and becomes `executed` in the same transaction that stores its transfer, or
+`failed` (with the reason) if the transfer was rejected when it came due. The
+executed transfer has the scheduled transfer's id, so it can be looked up in
+the transfer history.
+
+This module contains:
+- ScheduledTransferStatus: the lifecycle of a scheduled transfer.
+- ScheduledTransfer: one scheduled transfer as stored.
+- ScheduleTransferRequest: HTTP request schema for scheduling a transfer.
+- ScheduledTransferResponse: HTTP response schema for a scheduled transfer.
+
+Dependency constraints:
+- Must not import from any other feature!
+- Must not depend on infrastructure implementations or frameworks directly!
+- Must not contain persistence or serialization logic.
+- May depend on shared application contracts in features/_shared.
+
+Stability:
+- Less stable than the application and domain layers.
+- Changes when the public API contract changes.
+
+Usage:
+- Used by HTTP controllers to validate requests and serialise responses.
+- ScheduledTransfer is read and written through ScheduledTransferRepoPort.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+
+from pydantic import BaseModel, Field
+
+
+class ScheduledTransferStatus(str, Enum):
+    PENDING = "pending"
+    EXECUTED = "executed"
+    FAILED = "failed"
+
+
+@dataclass(frozen=True, slots=True)
+class ScheduledTransfer:
+    """
+    `completed_at` and `failure_reason` are set once the transfer has been run.
+    """
+
+    id: str
+    from_account_id: str
+    to_account_id: str
+    amount_pence: int
+    due_at: datetime
+    status: ScheduledTransferStatus
+    completed_at: datetime | None = None
+    failure_reason: str | None = None
+
+
+class ScheduleTransferRequest(BaseModel):
+    """
+    HTTP request schema for scheduling a transfer.
+
+    A `due_at` without a timezone is taken as UTC. A `due_at` in the past is
+    executed as soon as possible.
+    """
+
+    from_account_id: str
+    to_account_id: str
+    amount_pence: int = Field(ge=1)
+    due_at: datetime
+
+
+class ScheduledTransferResponse(BaseModel):
+    id: str
+    from_account_id: str
+    to_account_id: str
+    amount_pence: int
+    due_at: datetime
+    status: ScheduledTransferStatus
+    completed_at: datetime | None
+    failure_reason: str | None
@@ -0,0 +1,234 @@
+"""
+Ring: Application (Use Case / Interactors)
+
+Responsibility:
+Implements the scheduled transfer use cases: scheduling a transfer, reading it,
+and executing it once it has come due.
+
+Design intent:
+- Scheduling only validates what can be known now and stores the instruction.
+  Whether the accounts exist and hold enough money is decided when the transfer
+  is due, exactly as for an immediate transfer.
+- The scheduler is told about a scheduled transfer only after it has committed,
+  so it never fires an id that a rollback has taken back.
+- Executing marks the scheduled transfer `executed` and then hands the transfer
+  to the transfer port, which commits both in one unit of work. The transfer
+  reuses the scheduled transfer's id, so a second execution of the same
+  scheduled transfer (a retry, a duplicate timer) cannot store a second transfer.
+- A transfer rejected by the transfer port is rolled back and the scheduled
+  transfer is recorded as `failed` with the reason, in a new commit.
+
+This module contains:
+- ScheduledTransferCreator: the interactor implementing ScheduledTransferCreatorPort.In.
+- ScheduledTransferGetter: the interactor implementing ScheduledTransferGetterPort.In.
+- ScheduledTransferExecutor: the interactor implementing
+  ScheduledTransferExecutorPort.In.
+
+Dependency constraints:
+- Must not import from any other feature!
+- Must not depend on infrastructure implementations or frameworks directly!
+- Must not contain persistence, HTTP, or serialization logic.
+- May depend on the Domain layer (core/).
+- May depend on this feature’s own ports, errors, and schemas.
+- May depend on shared application contracts in features/_shared.
+
+Stability:
+- Less stable than the domain, more stable than infrastructure.
+- Changes when scheduling behaviour changes.
+
+Usage:
+- ScheduledTransferCreator and ScheduledTransferGetter are invoked by HTTP
+  controllers.
+- ScheduledTransferExecutor is invoked by the scheduler when a transfer is due.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import replace
+from datetime import datetime, timezone
+
+from core.utils.id import new_id
+from core.utils.time import utc_now
+from features._shared.errors import ApplicationError
+from features._shared.ports import UnitOfWork
+from features.scheduled_transfers.errors import (
+    ScheduledTransferNotFoundError,
+    ScheduledTransferValidationError,
+)
+from features.scheduled_transfers.ports import (
+    ScheduledTransferCreatorPort,
+    ScheduledTransferExecutorPort,
+    ScheduledTransferGetterPort,
+    ScheduledTransferRepoPort,
+    TransferPort,
+    TransferSchedulerPort,
+)
+from features.scheduled_transfers.schemas import (
+    ScheduledTransfer,
+    ScheduledTransferResponse,
+    ScheduledTransferStatus,
+)
+
+
+class ScheduledTransferCreator(ScheduledTransferCreatorPort.In):
+    def __init__(
+        self,
+        *,
+        uow: UnitOfWork,
+        repo: ScheduledTransferRepoPort,
+        scheduler: TransferSchedulerPort,
+        presenter: ScheduledTransferCreatorPort.Out,
+        logger: logging.Logger,
+    ) -> None:
+        self._uow = uow
+        self._repo = repo
+        self._scheduler = scheduler
+        self._presenter = presenter
+        self._logger = logger
+
+    def execute(
+        self,
+        *,
+        from_account_id: str,
+        to_account_id: str,
+        amount_pence: int,
+        due_at: datetime,
+    ) -> ScheduledTransferResponse:
+        self._logger.info(
+            "scheduled_transfer_create_started from_account_id=%s to_account_id=%s amount_pence=%s due_at=%s",
+            from_account_id,
+            to_account_id,
+            amount_pence,
+            due_at,
+        )
+
+        if from_account_id == to_account_id:
+            self._logger.info(
+                "scheduled_transfer_create_failed_validation account_id=%s",
+                from_account_id,
+            )
+            raise ScheduledTransferValidationError(
+                "Cannot schedule a transfer to the same account"
+            )
+
+        scheduled = ScheduledTransfer(
+            id=new_id(),
+            from_account_id=from_account_id,
+            to_account_id=to_account_id,
+            amount_pence=amount_pence,
+            due_at=_as_utc(due_at),
+            status=ScheduledTransferStatus.PENDING,
+        )
+        self._repo.save(scheduled)
+        self._uow.commit()
+        self._scheduler.schedule(scheduled.id, scheduled.due_at)
+
+        self._logger.info(
+            "scheduled_transfer_create_succeeded scheduled_transfer_id=%s due_at=%s",
+            scheduled.id,
+            scheduled.due_at.isoformat(),
+        )
+        return self._presenter.present(scheduled)
+
+
+class ScheduledTransferGetter(ScheduledTransferGetterPort.In):
+    def __init__(
+        self,
+        *,
+        repo: ScheduledTransferRepoPort,
+        presenter: ScheduledTransferGetterPort.Out,
+        logger: logging.Logger,
+    ) -> None:
+        self._repo = repo
+        self._presenter = presenter
+        self._logger = logger
+
+    def execute(self, *, scheduled_transfer_id: str) -> ScheduledTransferResponse:
+        scheduled = self._repo.get(scheduled_transfer_id)
+        if scheduled is None:
+            self._logger.info(
+                "scheduled_transfer_get_not_found scheduled_transfer_id=%s",
+                scheduled_transfer_id,
+            )
+            raise ScheduledTransferNotFoundError(
+                f"Scheduled transfer not found: {scheduled_transfer_id}"
+            )
+        return self._presenter.present(scheduled)
+
+
+class ScheduledTransferExecutor(ScheduledTransferExecutorPort.In):
+    def __init__(
+        self,
+        *,
+        uow: UnitOfWork,
+        repo: ScheduledTransferRepoPort,
+        transfers: TransferPort,
+        presenter: ScheduledTransferExecutorPort.Out,
+        logger: logging.Logger,
+    ) -> None:
+        self._uow = uow
+        self._repo = repo
+        self._transfers = transfers
+        self._presenter = presenter
+        self._logger = logger
+
+    def execute(
+        self, *, scheduled_transfer_id: str
+    ) -> ScheduledTransferResponse | None:
+        scheduled = self._repo.get(scheduled_transfer_id)
+        if scheduled is None or scheduled.status != ScheduledTransferStatus.PENDING:
+            self._logger.info(
+                "scheduled_transfer_execute_skipped scheduled_transfer_id=%s status=%s",
+                scheduled_transfer_id,
+                None if scheduled is None else scheduled.status.value,
+            )
+            return None
+
+        now = utc_now()
+        executed = replace(
+            scheduled, status=ScheduledTransferStatus.EXECUTED, completed_at=now
+        )
+        self._repo.save(executed)
+        try:
+            self._transfers.execute(
+                from_account_id=scheduled.from_account_id,
+                to_account_id=scheduled.to_account_id,
+                amount_pence=scheduled.amount_pence,
+                transfer_id=scheduled.id,
+            )
+        except ApplicationError as exc:
+            self._uow.rollback()
+            return self._fail(scheduled, completed_at=now, reason=str(exc))
+
+        self._logger.info(
+            "scheduled_transfer_execute_succeeded scheduled_transfer_id=%s lag_ms=%.1f",
+            scheduled.id,
+            (now - scheduled.due_at).total_seconds() * 1000,
+        )
+        return self._presenter.present(executed)
+
+    def _fail(
+        self, scheduled: ScheduledTransfer, *, completed_at: datetime, reason: str
+    ) -> ScheduledTransferResponse:
+        failed = replace(
+            scheduled,
+            status=ScheduledTransferStatus.FAILED,
+            completed_at=completed_at,
+            failure_reason=reason,
+        )
+        self._repo.save(failed)
+        self._uow.commit()
+
+        self._logger.info(
+            "scheduled_transfer_execute_failed scheduled_transfer_id=%s reason=%s",
+            scheduled.id,
+            reason,
+        )
+        return self._presenter.present(failed)
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
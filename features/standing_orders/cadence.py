@@ -0,0 +1,69 @@
+"""
+Ring: Application (Use Case Support / Recurrence)
+
+Responsibility:
+Defines how often a standing order runs and when its occurrences fall.
+
+Design intent:
+- Occurrences are computed from the order's first run (its anchor) and an
+  occurrence number, never by adding a period to the previous run. A monthly
+  order anchored on the 31st therefore runs on the 30th in April and on the
+  31st again in May, instead of drifting to the 30th for good.
+- A month without the anchor's day uses its last day.
+- An order that falls behind (the executor did not run for several periods) is
+  advanced to its first occurrence after the run, so missed periods are not all
+  paid at once.
+
+This module contains:
+- Cadence: the supported recurrence periods.
+- occurrence_at: the time of an order's nth occurrence.
+- next_occurrence: the number of the first occurrence after a given time.
+
+Dependency constraints:
+- Must not import from any other feature!
+- Must not depend on infrastructure implementations or frameworks directly!
+- May depend only on the standard library.
+
+Stability:
+- Moderately stable.
+- Changing occurrence rules moves the next run of every stored order.
+
+Usage:
+- Used by the standing order interactors to set and advance next-run times.
+"""
+
+from __future__ import annotations
+
+import calendar
+from datetime import datetime, timedelta
+from enum import Enum
+
+
+class Cadence(str, Enum):
+    DAILY = "daily"
+    WEEKLY = "weekly"
+    MONTHLY = "monthly"
+
+
+def occurrence_at(anchor: datetime, cadence: Cadence, occurrence: int) -> datetime:
+    if cadence is Cadence.DAILY:
+        return anchor + timedelta(days=occurrence)
+    if cadence is Cadence.WEEKLY:
+        return anchor + timedelta(weeks=occurrence)
+
+    month_index = anchor.month - 1 + occurrence
+    year, month = anchor.year + month_index // 12, month_index % 12 + 1
+    day = min(anchor.day, calendar.monthrange(year, month)[1])
+    return anchor.replace(year=year, month=month, day=day)
+
+
+def next_occurrence(
+    anchor: datetime, cadence: Cadence, occurrence: int, *, after: datetime
+) -> int:
+    """
+    The first occurrence later than both `occurrence` and `after`.
+    """
+    occurrence += 1
+    while occurrence_at(anchor, cadence, occurrence) <= after:
+        occurrence += 1
+    return occurrence
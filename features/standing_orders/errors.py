@@ -0,0 +1,48 @@
+"""
+Ring: Application (Use Case / Feature Errors)
+
+Responsibility:
+Defines application-level errors specific to the Standing Orders feature.
+
+Design intent:
+A run that is rejected (an account is missing, funds are insufficient) is not
+an error: it is recorded as the order's last outcome and the order moves on to
+its next occurrence. Errors here are about requests, and about an executor
+that lost its claim on a chunk.
+
+This module contains:
+- StandingOrderNotFoundError: raised when a standing order does not exist.
+- StandingOrderValidationError: raised when a standing order request is invalid.
+- StandingOrderLeaseLostError: raised when a chunk's lease was taken over by
+  another executor before the chunk committed.
+
+Dependency constraints:
+- Must not import from any other feature!
+- Must not depend on infrastructure implementations or frameworks directly!
+- Must not contain persistence, HTTP, or serialization logic.
+- May depend on shared application contracts in features/_shared.
+
+Stability:
+- Highly stable.
+- Part of the feature’s public error contract.
+
+Usage:
+- Raised by standing order use case interactors.
+- Caught by delivery layers and translated into protocol-specific responses.
+"""
+
+from __future__ import annotations
+
+from features._shared.errors import ApplicationError
+
+
+class StandingOrderNotFoundError(ApplicationError):
+    """Raised when a requested standing order does not exist."""
+
+
+class StandingOrderValidationError(ApplicationError):
+    """Raised when a standing order cannot be created as requested."""
+
+
+class StandingOrderLeaseLostError(ApplicationError):
+    """Raised when a claimed chunk is no longer leased to its executor."""
@@ -0,0 +1,146 @@
+"""
+Ring: Application (Use Case Boundaries / Ports)
+
+Responsibility:
+Defines the port interfaces for the Standing Orders feature.
+These ports isolate creating, reading and executing standing orders from how
+they are stored and how due orders are shared out between executors.
+
+Design intent:
+- Primary ports (In/Out) define the boundaries of creating an order, reading
+  one, and executing a claimed chunk of due orders.
+- The claims port hands out chunks of due orders under a lease, in its own
+  short transaction, so that concurrent executors never receive the same order
+  while its lease is live.
+- The repository port works in the caller's unit of work. Completing a chunk's
+  runs only updates orders still leased under the chunk's token, and reports
+  how many it updated, so an executor whose lease was taken over can tell and
+  roll back.
+
+This module contains:
+- StandingOrderCreatorPort: primary In/Out ports for creating a standing order.
+- StandingOrderGetterPort: primary In/Out ports for reading one.
+- StandingOrderChunkExecutorPort: primary In/Out ports for executing a chunk.
+- StandingOrderRepoPort: secondary port for storage.
+- StandingOrderClaimsPort: secondary port for leasing chunks of due orders.
+
+Dependency constraints:
+- Must not import from any other feature!
+- Must not depend on infrastructure implementations or frameworks directly!
+- Must not contain persistence, HTTP, or serialization logic.
+- May depend on this feature’s own schemas.
+- May depend on shared application contracts in features/_shared.
+
+Stability:
+- Highly stable.
+- Ports are the contracts that outer layers adapt to; they should change rarely.
+
+Usage:
+- Implemented by standing order interactors (In) and presenters (Out).
+- Implemented by infrastructure adapters for the secondary ports.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+from typing import Protocol
+
+from features._shared.ports import IOPorts
+from features.standing_orders.cadence import Cadence
+from features.standing_orders.schemas import (
+    StandingOrder,
+    StandingOrderChunkResult,
+    StandingOrderClaim,
+    StandingOrderResponse,
+)
+
+
+class StandingOrderCreatorPort(IOPorts):
+    """
+    Use case: define a recurring transfer.
+    """
+
+    class In(Protocol):
+        def execute(
+            self,
+            *,
+            from_account_id: str,
+            to_account_id: str,
+            amount_pence: int,
+            cadence: Cadence,
+            first_run_at: datetime,
+        ) -> StandingOrderResponse:
+            raise NotImplementedError
+
+    class Out(Protocol):
+        def present(self, order: StandingOrder) -> StandingOrderResponse:
+            raise NotImplementedError
+
+
+class StandingOrderGetterPort(IOPorts):
+    """
+    Use case: read a standing order and the outcome of its last run.
+    """
+
+    class In(Protocol):
+        def execute(self, *, standing_order_id: str) -> StandingOrderResponse:
+            raise NotImplementedError
+
+    class Out(Protocol):
+        def present(self, order: StandingOrder) -> StandingOrderResponse:
+            raise NotImplementedError
+
+
+class StandingOrderChunkExecutorPort(IOPorts):
+    """
+    Use case: run every order of a claimed chunk and commit them together.
+    """
+
+    class In(Protocol):
+        def execute(self, *, claim: StandingOrderClaim) -> StandingOrderChunkResult:
+            raise NotImplementedError
+
+    class Out(Protocol):
+        def present(
+            self, *, claimed: int, executed: int, failed: int
+        ) -> StandingOrderChunkResult:
+            raise NotImplementedError
+
+
+class StandingOrderRepoPort(Protocol):
+    """
+    Persistence port for standing orders.
+    Implemented by infrastructure adapters.
+    """
+
+    def get(self, standing_order_id: str) -> StandingOrder | None:
+        raise NotImplementedError
+
+    def save(self, order: StandingOrder) -> None:
+        """
+        Insert a new order; written when the unit of work commits.
+        """
+        raise NotImplementedError
+
+    def complete_runs(self, *, token: str, orders: Sequence[StandingOrder]) -> int:
+        """
+        Store the advanced orders and release their lease, but only for orders
+        still leased under `token`. Returns how many were updated.
+        """
+        raise NotImplementedError
+
+
+class StandingOrderClaimsPort(Protocol):
+    """
+    Leases chunks of due standing orders to executors.
+    """
+
+    def claim_due(
+        self, *, now: datetime, limit: int, lease_for: timedelta
+    ) -> StandingOrderClaim:
+        """
+        Lease up to `limit` orders due at `now` and not leased to anyone else, in
+        next-run order. The lease is committed before this returns.
+        """
+        raise NotImplementedError
@@ -0,0 +1,65 @@
+"""
+Ring: Interface Adapters (Presenters)
+
+Responsibility:
+Defines presenters for the Standing Orders feature.
+
+Design intent:
+Presenters isolate representation concerns from the standing order use cases,
+so the stored anchor and occurrence number never leak into the HTTP contract.
+
+This module contains:
+- StandingOrderPresenter: mapping from StandingOrder to StandingOrderResponse.
+- StandingOrderChunkPresenter: the result of running a chunk.
+
+Dependency constraints:
+- Must not import from any other feature!
+- Must not depend on infrastructure implementations or frameworks directly!
+- Must not contain domain or application business rules.
+- May depend on this feature’s own ports and schemas.
+
+Stability:
+- Moderately stable.
+- Changes when response representations change.
+
+Usage:
+- Called by the standing order interactors to produce output DTOs.
+"""
+
+from __future__ import annotations
+
+from features.standing_orders.ports import (
+    StandingOrderChunkExecutorPort,
+    StandingOrderCreatorPort,
+    StandingOrderGetterPort,
+)
+from features.standing_orders.schemas import (
+    StandingOrder,
+    StandingOrderChunkResult,
+    StandingOrderResponse,
+)
+
+
+class StandingOrderPresenter(StandingOrderCreatorPort.Out, StandingOrderGetterPort.Out):
+    def present(self, order: StandingOrder) -> StandingOrderResponse:
+        return StandingOrderResponse(
+            id=order.id,
+            from_account_id=order.from_account_id,
+            to_account_id=order.to_account_id,
+            amount_pence=order.amount_pence,
+            cadence=order.cadence,
+            next_run_at=order.next_run_at,
+            runs=order.runs,
+            last_run_at=order.last_run_at,
+            last_outcome=order.last_outcome,
+            last_failure_reason=order.last_failure_reason,
+        )
+
+
+class StandingOrderChunkPresenter(StandingOrderChunkExecutorPort.Out):
+    def present(
+        self, *, claimed: int, executed: int, failed: int
+    ) -> StandingOrderChunkResult:
+        return StandingOrderChunkResult(
+            claimed=claimed, executed=executed, failed=failed
+        )
@@ -0,0 +1,75 @@
+"""
+Ring: Delivery (Controllers, Frameworks & Drivers / HTTP)
+
+Responsibility:
+Defines the HTTP routing layer for the Standing Orders feature.
+This module exposes creating a standing order and reading its state.
+
+Design intent:
+This file is delivery mechanism only. Standing orders are executed by the
+standing order runner, not by any HTTP request.
+
+This module contains:
+- FastAPI route definitions for standing orders.
+
+Dependency constraints:
+- Must not import from any other feature!
+- Must not contain domain or application business rules.
+- Must not perform persistence or infrastructure work directly.
+- May depend on the Application layer (use cases, ports, schemas).
+- May depend on shared application contracts in features/_shared.
+- May depend on framework code (FastAPI, dependency injection).
+
+Stability:
+- Highly volatile.
+- Changes when the API surface, routing, or framework configuration changes.
+
+Usage:
+- Loaded by the application root to register HTTP endpoints.
+"""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+
+from features._shared.custom_types import Provider
+from features.standing_orders.ports import (
+    StandingOrderCreatorPort,
+    StandingOrderGetterPort,
+)
+from features.standing_orders.schemas import (
+    CreateStandingOrderRequest,
+    StandingOrderResponse,
+)
+
+
+def build_standing_order_routers(
+    *,
+    standing_order_creator: Provider[StandingOrderCreatorPort.In],
+    standing_order_getter: Provider[StandingOrderGetterPort.In],
+) -> APIRouter:
+    router = APIRouter(prefix="/standing-orders", tags=["standing-orders"])
+
+    @router.post("", response_model=StandingOrderResponse)
+    def create_standing_order_endpoint(
+        req: CreateStandingOrderRequest,
+        creator: Annotated[
+            StandingOrderCreatorPort.In, Depends(standing_order_creator)
+        ],
+    ) -> StandingOrderResponse:
+        return creator.execute(
+            from_account_id=req.from_account_id,
+            to_account_id=req.to_account_id,
+            amount_pence=req.amount_pence,
+            cadence=req.cadence,
+            first_run_at=req.first_run_at,
+        )
+
+    @router.get("/{standing_order_id}", response_model=StandingOrderResponse)
+    def get_standing_order_endpoint(
+        standing_order_id: str,
+        getter: Annotated[StandingOrderGetterPort.In, Depends(standing_order_getter)],
+    ) -> StandingOrderResponse:
+        return getter.execute(standing_order_id=standing_order_id)
+
+    return router
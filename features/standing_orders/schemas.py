@@ -0,0 +1,112 @@
+"""
+Ring: Delivery (Interface Adapters / HTTP Boundary)
+
+Responsibility:
+Defines the schemas for the Standing Orders feature.
+These describe recurring transfer definitions, the chunks of due orders an
+executor claims, and the outcome of running a chunk.
+
+Design intent:
+- A standing order is a definition, not a fact. It keeps its next run time and
+  the outcome of its last run; the transfers it makes are ordinary transfers.
+- A claim is a lease: the orders in it are reserved for one executor until
+  `lease_expires_at`, under a token that only that executor knows.
+
+This module contains:
+- RunOutcome: the outcome of one run of an order.
+- StandingOrder: one standing order as stored.
+- StandingOrderClaim: a leased chunk of due orders.
+- StandingOrderChunkResult: the outcome of running one claimed chunk.
+- CreateStandingOrderRequest / StandingOrderResponse: HTTP request and response
+  schemas.
+
+Dependency constraints:
+- Must not import from any other feature!
+- Must not depend on infrastructure implementations or frameworks directly!
+- Must not contain persistence or serialization logic.
+- May depend on this feature’s own cadence definitions.
+
+Stability:
+- Less stable than the application and domain layers.
+- Changes when the public API contract changes.
+
+Usage:
+- Used by HTTP controllers to validate requests and serialise responses.
+- StandingOrder and StandingOrderClaim are exchanged with the storage ports.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+
+from pydantic import BaseModel, Field
+
+from features.standing_orders.cadence import Cadence
+
+
+class RunOutcome(str, Enum):
+    EXECUTED = "executed"
+    FAILED = "failed"
+
+
+@dataclass(frozen=True, slots=True)
+class StandingOrder:
+    """
+    `next_run_at` is occurrence number `occurrence` counted from `anchor_at`.
+    """
+
+    id: str
+    from_account_id: str
+    to_account_id: str
+    amount_pence: int
+    cadence: Cadence
+    anchor_at: datetime
+    occurrence: int
+    next_run_at: datetime
+    runs: int = 0
+    last_run_at: datetime | None = None
+    last_outcome: RunOutcome | None = None
+    last_failure_reason: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class StandingOrderClaim:
+    token: str
+    lease_expires_at: datetime
+    orders: list[StandingOrder]
+
+
+@dataclass(frozen=True, slots=True)
+class StandingOrderChunkResult:
+    claimed: int
+    executed: int
+    failed: int
+
+
+class CreateStandingOrderRequest(BaseModel):
+    """
+    HTTP request schema for creating a standing order.
+
+    `first_run_at` without a timezone is taken as UTC.
+    """
+
+    from_account_id: str
+    to_account_id: str
+    amount_pence: int = Field(ge=1)
+    cadence: Cadence
+    first_run_at: datetime
+
+
+class StandingOrderResponse(BaseModel):
+    id: str
+    from_account_id: str
+    to_account_id: str
+    amount_pence: int
+    cadence: Cadence
+    next_run_at: datetime
+    runs: int
+    last_run_at: datetime | None
+    last_outcome: RunOutcome | None
+    last_failure_reason: str | None
@@ -0,0 +1,332 @@
+"""
+Ring: Application (Use Case / Interactors)
+
+Responsibility:
+Implements the standing order use cases: defining a recurring transfer, reading
+it, and executing a claimed chunk of due orders.
+
+Design intent:
+- A chunk is executed in one unit of work: all accounts it touches are loaded
+  in one set-based read, every order is applied in memory in next-run order
+  (so two orders from one account see each other's debits), and the transfers,
+  balances and advanced next-run times are committed together. A chunk of a
+  thousand orders costs a handful of statements and one commit, not a thousand
+  transactions.
+- An order whose transfer is rejected (missing account, insufficient funds,
+  invalid amount) still advances, with the rejection recorded as its last
+  outcome; the rest of the chunk is unaffected.
+- The advanced orders are written only if the chunk is still leased to this
+  executor. If another executor has taken it over (the lease expired), the whole
+  chunk is rolled back, so no order can run twice for the same occurrence.
+- Velocity limits (TransferLimitsPort), when configured, apply to standing
+  orders as to any other transfer. Each order is counted against the limits of
+  its source account once it has been applied in memory; an order that would
+  exceed a limit is rejected like an overdrawn one. Every count is released
+  again if the chunk is not committed, so a retried or lost chunk is counted
+  once at most.
+
+This module contains:
+- StandingOrderCreator: the interactor implementing StandingOrderCreatorPort.In.
+- StandingOrderGetter: the interactor implementing StandingOrderGetterPort.In.
+- StandingOrderChunkExecutor: the interactor implementing
+  StandingOrderChunkExecutorPort.In.
+
+Dependency constraints:
+- Must not depend on infrastructure implementations or frameworks directly!
+- Must not contain persistence, HTTP, or serialization logic.
+- May depend on the Domain layer (core/).
+- May depend on this feature’s own ports, errors, and schemas, and on the
+  account and transfer persistence ports it writes through.
+- May depend on shared application contracts in features/_shared.
+
+Stability:
+- Less stable than the domain, more stable than infrastructure.
+- Changes when standing order behaviour changes.
+
+Usage:
+- StandingOrderCreator and StandingOrderGetter are invoked by HTTP controllers.
+- StandingOrderChunkExecutor is invoked by the standing order runner
+  (root/cli/run_standing_orders) for each chunk it claims.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import replace
+from datetime import datetime, timezone
+
+from core.entities.account import Account
+from core.entities.transfer import Transfer
+from core.services.transfer import apply_transfer
+from core.utils.id import new_id
+from core.utils.time import utc_now
+from core.values.custom_types import AccountId, TransferId
+from core.values.errors import DomainError
+from core.values.objects import Money
+from features._shared.ports import UnitOfWork
+from features.accounts.ports import AccountRepoPort
+from features.standing_orders.cadence import Cadence, next_occurrence, occurrence_at
+from features.standing_orders.errors import (
+    StandingOrderLeaseLostError,
+    StandingOrderNotFoundError,
+    StandingOrderValidationError,
+)
+from features.standing_orders.ports import (
+    StandingOrderChunkExecutorPort,
+    StandingOrderCreatorPort,
+    StandingOrderGetterPort,
+    StandingOrderRepoPort,
+)
+from features.standing_orders.schemas import (
+    RunOutcome,
+    StandingOrder,
+    StandingOrderChunkResult,
+    StandingOrderClaim,
+    StandingOrderResponse,
+)
+from features.transfers.ports import TransferLimitsPort, TransferRepoPort
+
+
+class StandingOrderCreator(StandingOrderCreatorPort.In):
+    def __init__(
+        self,
+        *,
+        uow: UnitOfWork,
+        repo: StandingOrderRepoPort,
+        presenter: StandingOrderCreatorPort.Out,
+        logger: logging.Logger,
+    ) -> None:
+        self._uow = uow
+        self._repo = repo
+        self._presenter = presenter
+        self._logger = logger
+
+    def execute(
+        self,
+        *,
+        from_account_id: str,
+        to_account_id: str,
+        amount_pence: int,
+        cadence: Cadence,
+        first_run_at: datetime,
+    ) -> StandingOrderResponse:
+        self._logger.info(
+            "standing_order_create_started from_account_id=%s to_account_id=%s amount_pence=%s cadence=%s first_run_at=%s",
+            from_account_id,
+            to_account_id,
+            amount_pence,
+            cadence.value,
+            first_run_at,
+        )
+
+        if from_account_id == to_account_id:
+            self._logger.info(
+                "standing_order_create_failed_validation account_id=%s",
+                from_account_id,
+            )
+            raise StandingOrderValidationError(
+                "Cannot create a standing order to the same account"
+            )
+
+        anchor = _as_utc(first_run_at)
+        order = StandingOrder(
+            id=new_id(),
+            from_account_id=from_account_id,
+            to_account_id=to_account_id,
+            amount_pence=amount_pence,
+            cadence=cadence,
+            anchor_at=anchor,
+            occurrence=0,
+            next_run_at=anchor,
+        )
+        self._repo.save(order)
+        self._uow.commit()
+
+        self._logger.info(
+            "standing_order_create_succeeded standing_order_id=%s", order.id
+        )
+        return self._presenter.present(order)
+
+
+class StandingOrderGetter(StandingOrderGetterPort.In):
+    def __init__(
+        self,
+        *,
+        repo: StandingOrderRepoPort,
+        presenter: StandingOrderGetterPort.Out,
+        logger: logging.Logger,
+    ) -> None:
+        self._repo = repo
+        self._presenter = presenter
+        self._logger = logger
+
+    def execute(self, *, standing_order_id: str) -> StandingOrderResponse:
+        order = self._repo.get(standing_order_id)
+        if order is None:
+            self._logger.info(
+                "standing_order_get_not_found standing_order_id=%s", standing_order_id
+            )
+            raise StandingOrderNotFoundError(
+                f"Standing order not found: {standing_order_id}"
+            )
+        return self._presenter.present(order)
+
+
+class StandingOrderChunkExecutor(StandingOrderChunkExecutorPort.In):
+    def __init__(
+        self,
+        *,
+        uow: UnitOfWork,
+        orders: StandingOrderRepoPort,
+        accounts: AccountRepoPort,
+        transfers: TransferRepoPort,
+        presenter: StandingOrderChunkExecutorPort.Out,
+        logger: logging.Logger,
+        limits: TransferLimitsPort | None = None,
+    ) -> None:
+        self._uow = uow
+        self._orders = orders
+        self._accounts = accounts
+        self._transfers = transfers
+        self._presenter = presenter
+        self._logger = logger
+        self._limits = limits
+
+    def execute(self, *, claim: StandingOrderClaim) -> StandingOrderChunkResult:
+        reserved: list[Transfer] = []
+        try:
+            return self._execute(claim, reserved=reserved)
+        except BaseException:
+            for transfer in reserved:
+                self._release_limits(transfer)
+            raise
+
+    def _execute(
+        self, claim: StandingOrderClaim, *, reserved: list[Transfer]
+    ) -> StandingOrderChunkResult:
+        now = utc_now()
+        accounts = self._accounts.get_many(
+            {AccountId(o.from_account_id) for o in claim.orders}
+            | {AccountId(o.to_account_id) for o in claim.orders}
+        )
+
+        changed: set[AccountId] = set()
+        advanced: list[StandingOrder] = []
+        for order in claim.orders:
+            failure = self._run(
+                order, accounts=accounts, changed=changed, reserved=reserved, now=now
+            )
+            advanced.append(_advance(order, now=now, failure=failure))
+
+        for account_id in sorted(changed):
+            self._accounts.save(accounts[account_id])
+
+        updated = self._orders.complete_runs(token=claim.token, orders=advanced)
+        if updated != len(advanced):
+            self._logger.info(
+                "standing_order_chunk_lease_lost token=%s claimed=%s still_leased=%s",
+                claim.token,
+                len(advanced),
+                updated,
+            )
+            raise StandingOrderLeaseLostError(
+                f"Lease {claim.token} lost for {len(advanced) - updated} orders"
+            )
+        self._uow.commit()
+
+        failed = sum(o.last_outcome is RunOutcome.FAILED for o in advanced)
+        self._logger.info(
+            "standing_order_chunk_succeeded token=%s claimed=%s executed=%s failed=%s",
+            claim.token,
+            len(advanced),
+            len(advanced) - failed,
+            failed,
+        )
+        return self._presenter.present(
+            claimed=len(advanced), executed=len(advanced) - failed, failed=failed
+        )
+
+    def _run(
+        self,
+        order: StandingOrder,
+        *,
+        accounts: dict[AccountId, Account],
+        changed: set[AccountId],
+        reserved: list[Transfer],
+        now: datetime,
+    ) -> str | None:
+        """
+        Apply one order to the in-memory accounts; returns why it was rejected.
+        """
+        from_id, to_id = AccountId(order.from_account_id), AccountId(
+            order.to_account_id
+        )
+        for account_id in (from_id, to_id):
+            if account_id not in accounts:
+                return f"Account not found: {account_id}"
+
+        try:
+            applied = apply_transfer(
+                from_account=accounts[from_id],
+                to_account=accounts[to_id],
+                transfer=Transfer(
+                    id=TransferId(new_id()),
+                    from_account_id=from_id,
+                    to_account_id=to_id,
+                    amount=Money(order.amount_pence),
+                    created_at=now,
+                ),
+            )
+        except DomainError as exc:
+            return str(exc)
+
+        exceeded = self._reserve_limits(applied.transfer)
+        if exceeded is not None:
+            return f"Velocity limit exceeded: {exceeded}"
+        reserved.append(applied.transfer)
+
+        accounts[from_id] = applied.updated_from_account
+        accounts[to_id] = applied.updated_to_account
+        changed.update((from_id, to_id))
+        self._transfers.save(applied.transfer)
+        return None
+
+    def _reserve_limits(self, transfer: Transfer) -> str | None:
+        if self._limits is None:
+            return None
+        return self._limits.reserve(
+            account_id=str(transfer.from_account_id),
+            amount_pence=transfer.amount.pence,
+            at=transfer.created_at,
+        )
+
+    def _release_limits(self, transfer: Transfer) -> None:
+        if self._limits is not None:
+            self._limits.release(
+                account_id=str(transfer.from_account_id),
+                amount_pence=transfer.amount.pence,
+                at=transfer.created_at,
+            )
+
+
+def _advance(
+    order: StandingOrder, *, now: datetime, failure: str | None
+) -> StandingOrder:
+    occurrence = next_occurrence(
+        order.anchor_at, order.cadence, order.occurrence, after=now
+    )
+    return replace(
+        order,
+        occurrence=occurrence,
+        next_run_at=occurrence_at(order.anchor_at, order.cadence, occurrence),
+        runs=order.runs + 1,
+        last_run_at=now,
+        last_outcome=RunOutcome.EXECUTED if failure is None else RunOutcome.FAILED,
+        last_failure_reason=failure,
+    )
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
@@ -0,0 +1,78 @@
+"""
+Ring: Application (Use Case Support / Pagination Cursors)
+
+Responsibility:
+Defines the resumable position used when reading transfers in a stable order.
+A cursor identifies the last transfer a consumer has seen so that a later read can
+continue strictly after it, e.g. when an export connection drops part way through.
+
+Design intent:
+- Transfers are read in (created_at, id) order, which is total and stable because
+  transfer ids are unique and transfers are immutable facts.
+- The cursor is opaque to clients: it is encoded as a URL-safe token so its
+  internal shape can change without breaking the external contract.
+- Decoding failures are reported as application validation errors, never as
+  low-level parsing exceptions.
+
+This module contains:
+- TransferCursor: the (created_at, id) position with encode/decode helpers.
+
+Dependency constraints:
+- Must not import from any other feature!
+- Must not depend on infrastructure implementations or frameworks directly!
+- May depend on the Domain layer (core/).
+- May depend on this feature’s own errors.
+
+Stability:
+- Moderately stable.
+- Changing the encoding invalidates cursors held by clients.
+
+Usage:
+- Produced by export presenters for every emitted transfer.
+- Decoded by the export use case and passed to repository ports as a read position.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from core.entities.transfer import Transfer
+from core.values.custom_types import TransferId
+from features.transfers.errors import TransferValidationError
+
+_SEPARATOR = "|"
+
+
+@dataclass(frozen=True, slots=True)
+class TransferCursor:
+    """
+    Position of a transfer in (created_at, id) order.
+    """
+
+    created_at: datetime
+    transfer_id: TransferId
+
+    @classmethod
+    def after_transfer(cls, transfer: Transfer) -> TransferCursor:
+        return cls(created_at=transfer.created_at, transfer_id=transfer.id)
+
+    def encode(self) -> str:
+        raw = f"{self.created_at.isoformat()}{_SEPARATOR}{self.transfer_id}"
+        return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+    @classmethod
+    def decode(cls, token: str) -> TransferCursor:
+        try:
+            raw = base64.urlsafe_b64decode(token.encode("ascii")).decode("utf-8")
+            created_at_raw, transfer_id = raw.split(_SEPARATOR, 1)
+            created_at = datetime.fromisoformat(created_at_raw)
+        except (ValueError, UnicodeError, binascii.Error) as exc:
+            raise TransferValidationError(f"Invalid cursor: {token}") from exc
+
+        if created_at.tzinfo is None:
+            created_at = created_at.replace(tzinfo=timezone.utc)
+
+        return cls(created_at=created_at, transfer_id=TransferId(transfer_id))
@@ -15,6 +15,7 @@ This module contains:
 - TransferAccountNotFoundError: a referenced account does not exist.
 - TransferValidationError: transfer request is invalid for the application.
 - TransferInsufficientFundsError: source account cannot cover the transfer.
+- TransferLimitExceededError: the transfer would exceed a velocity limit.
 
 Dependency constraints:
 - Must not import from any other feature!
@@ -49,3 +50,7 @@ class TransferValidationError(ApplicationError):
 
 class TransferInsufficientFundsError(ApplicationError):
     """Raised when the source account lacks sufficient funds for the transfer."""
+
+
+class TransferLimitExceededError(ApplicationError):
+    """Raised when the transfer would exceed a velocity limit of the source account."""
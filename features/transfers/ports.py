@@ -16,7 +16,9 @@ Design intent:
 
 This module contains:
 - TransferCreatorPort: primary In/Out ports for creating a transfer.
-- TransferRepoPort: secondary persistence port for saving transfer facts.
+- TransferExporterPort: primary In/Out ports for streaming transfer history.
+- TransferRepoPort: secondary persistence port for saving and streaming transfer facts.
+- TransferLimitsPort: secondary port for per-account velocity limits.
 
 Dependency constraints:
 - Must not import from any other feature!
@@ -38,8 +40,11 @@ Usage:
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from datetime import datetime
 from typing import TYPE_CHECKING, Protocol
 
+from core.values.custom_types import AccountId
 from core.values.objects import AppliedTransfer
 from features._shared.ports import IOPorts
 
@@ -61,7 +66,12 @@ class TransferCreatorPort(IOPorts):
             from_account_id: str,
             to_account_id: str,
             amount_pence: int,
+            transfer_id: str | None = None,
         ) -> "TransferResponse":
+            """
+            `transfer_id` is generated when None. A caller that supplies one makes
+            the transfer idempotent: the same id can only ever be stored once.
+            """
             raise NotImplementedError
 
     class Out(Protocol):
@@ -74,6 +84,40 @@ class TransferCreatorPort(IOPorts):
             raise NotImplementedError
 
 
+class TransferExporterPort(IOPorts):
+    """
+    Use case: stream the transfer history matching a filter.
+    """
+
+    class In(Protocol):
+        """
+        Input boundary for exporting transfers.
+        The service implements this.
+        """
+
+        def execute(
+            self,
+            *,
+            export_format: "ExportFormat",
+            account_id: str | None,
+            since: datetime | None,
+            until: datetime | None,
+            after: str | None,
+        ) -> "TransferExportStream":
+            raise NotImplementedError
+
+    class Out(Protocol):
+        """
+        Output boundary for serialising exported transfers.
+        One presenter exists per export format.
+        """
+
+        media_type: str
+
+        def present(self, transfers: Iterator["Transfer"]) -> Iterator[str]:
+            raise NotImplementedError
+
+
 class TransferRepoPort(Protocol):
     """
     Persistence port for transfers (facts).
@@ -83,8 +127,50 @@ class TransferRepoPort(Protocol):
     def save(self, transfer: "Transfer") -> None:
         raise NotImplementedError
 
+    def stream(
+        self,
+        *,
+        account_id: AccountId | None,
+        since: datetime | None,
+        until: datetime | None,
+        after: "TransferCursor | None",
+    ) -> Iterator["Transfer"]:
+        """
+        Lazily yield matching transfers in (created_at, id) order.
+
+        Implementations must not materialise the full result set.
+        """
+        raise NotImplementedError
+
+
+class TransferLimitsPort(Protocol):
+    """
+    Velocity limits on the transfers out of an account, e.g. an amount per day or a
+    number of transfers per minute. Implemented by infrastructure counters.
+    """
+
+    def reserve(
+        self, *, account_id: str, amount_pence: int, at: datetime
+    ) -> str | None:
+        """
+        Count a transfer out of `account_id` against every limit. If that would
+        exceed a limit, count nothing and return a description of the limit instead.
+        """
+        raise NotImplementedError
+
+    def release(self, *, account_id: str, amount_pence: int, at: datetime) -> None:
+        """
+        Undo a reservation whose transfer was not committed.
+        """
+        raise NotImplementedError
+
 
 if TYPE_CHECKING:
     # Import only for typing; avoids runtime coupling / import cycles.
     from core.entities.transfer import Transfer
-    from features.transfers.schemas import TransferResponse
+    from features.transfers.cursors import TransferCursor
+    from features.transfers.schemas import (
+        ExportFormat,
+        TransferExportStream,
+        TransferResponse,
+    )
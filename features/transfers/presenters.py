@@ -12,6 +12,8 @@ result is shaped for external consumption without leaking domain objects outward
 
 This module contains:
 - TransferCreatorPresenter: mapping from AppliedTransfer to TransferResponse.
+- TransferNdjsonExportPresenter: streaming NDJSON encoding of exported transfers.
+- TransferCsvExportPresenter: streaming CSV encoding of exported transfers.
 
 Dependency constraints:
 - Must not import from any other feature!
@@ -33,9 +35,28 @@ Usage:
 
 from __future__ import annotations
 
+import csv
+import io
+from collections.abc import Iterator
+
+from core.entities.transfer import Transfer
 from core.values.objects import AppliedTransfer
-from features.transfers.ports import TransferCreatorPort
-from features.transfers.schemas import TransferResponse
+from features.transfers.cursors import TransferCursor
+from features.transfers.ports import TransferCreatorPort, TransferExporterPort
+from features.transfers.schemas import TransferExportRow, TransferResponse
+
+# Rows are grouped into chunks so the delivery layer writes (and, for sync
+# iterators, hops threads) once per chunk rather than once per row.
+EXPORT_CHUNK_ROWS = 500
+
+_CSV_COLUMNS = (
+    "id",
+    "from_account_id",
+    "to_account_id",
+    "amount_pence",
+    "created_at",
+    "cursor",
+)
 
 
 class TransferCreatorPresenter(TransferCreatorPort.Out):
@@ -55,3 +76,73 @@ class TransferCreatorPresenter(TransferCreatorPort.Out):
             from_balance_pence=applied.updated_from_account.balance.pence,
             to_balance_pence=applied.updated_to_account.balance.pence,
         )
+
+
+def _to_export_row(transfer: Transfer) -> TransferExportRow:
+    return TransferExportRow(
+        id=str(transfer.id),
+        from_account_id=str(transfer.from_account_id),
+        to_account_id=str(transfer.to_account_id),
+        amount_pence=transfer.amount.pence,
+        created_at=transfer.created_at,
+        cursor=TransferCursor.after_transfer(transfer).encode(),
+    )
+
+
+class TransferNdjsonExportPresenter(TransferExporterPort.Out):
+    """
+    Presenter for the export use case producing newline-delimited JSON.
+    """
+
+    media_type = "application/x-ndjson"
+
+    def present(self, transfers: Iterator[Transfer]) -> Iterator[str]:
+        lines: list[str] = []
+        for transfer in transfers:
+            lines.append(_to_export_row(transfer).model_dump_json())
+            if len(lines) >= EXPORT_CHUNK_ROWS:
+                yield "\n".join(lines) + "\n"
+                lines.clear()
+
+        if lines:
+            yield "\n".join(lines) + "\n"
+
+
+class TransferCsvExportPresenter(TransferExporterPort.Out):
+    """
+    Presenter for the export use case producing CSV with a header row.
+    """
+
+    media_type = "text/csv"
+
+    def present(self, transfers: Iterator[Transfer]) -> Iterator[str]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow(_CSV_COLUMNS)
+
+        rows = 0
+        for transfer in transfers:
+            row = _to_export_row(transfer)
+            writer.writerow(
+                (
+                    row.id,
+                    row.from_account_id,
+                    row.to_account_id,
+                    row.amount_pence,
+                    row.created_at.isoformat(),
+                    row.cursor,
+                )
+            )
+            rows += 1
+            if rows >= EXPORT_CHUNK_ROWS:
+                yield self._drain(buffer)
+                rows = 0
+
+        yield self._drain(buffer)
+
+    @staticmethod
+    def _drain(buffer: io.StringIO) -> str:
+        chunk = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+        return chunk
@@ -12,8 +12,8 @@ perform persistence. It translates protocol-level concepts (routes, request bodi
 dependency injection) into calls to application use cases.
 
 This module contains:
-- FastAPI route definitions for creating transfers.
-- Dependency wiring between HTTP endpoints and the TransferCreator interactor.
+- FastAPI route definitions for creating and exporting transfers.
+- Dependency wiring between HTTP endpoints and the transfer interactors.
 
 Dependency constraints:
 - Must not import from any other feature!
@@ -35,23 +35,29 @@ Usage:
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
 
 from features._shared.custom_types import Provider
-from features.transfers.schemas import CreateTransferRequest, TransferResponse
-from features.transfers.use_cases import TransferCreator
+from features.transfers.ports import TransferCreatorPort, TransferExporterPort
+from features.transfers.schemas import (
+    CreateTransferRequest,
+    ExportTransfersRequest,
+    TransferResponse,
+)
 
 
 def build_transfer_routers(
     *,
-    transfer_creator: Provider[TransferCreator],
+    transfer_creator: Provider[TransferCreatorPort.In],
+    transfer_exporter: Provider[TransferExporterPort.In],
 ) -> APIRouter:
     router = APIRouter(prefix="/transfers", tags=["transfers"])
 
     @router.post("", response_model=TransferResponse)
     def create_transfer_endpoint(
         req: CreateTransferRequest,
-        creator: Annotated[TransferCreator, Depends(transfer_creator)],
+        creator: Annotated[TransferCreatorPort.In, Depends(transfer_creator)],
     ) -> TransferResponse:
         return creator.execute(
             from_account_id=req.from_account_id,
@@ -59,4 +65,18 @@ def build_transfer_routers(
             amount_pence=req.amount_pence,
         )
 
+    @router.get("/export")
+    def export_transfers_endpoint(
+        req: Annotated[ExportTransfersRequest, Query()],
+        exporter: Annotated[TransferExporterPort.In, Depends(transfer_exporter)],
+    ) -> StreamingResponse:
+        export = exporter.execute(
+            export_format=req.format,
+            account_id=req.account_id,
+            since=req.since,
+            until=req.until,
+            after=req.after,
+        )
+        return StreamingResponse(export.chunks, media_type=export.media_type)
+
     return router
@@ -14,6 +14,9 @@ payloads, without embedding business rules or persistence concerns.
 This module contains:
 - CreateTransferRequest: request DTO for creating a transfer.
 - TransferResponse: response DTO describing the transfer and resulting balances.
+- ExportTransfersRequest: query DTO for streaming transfer history.
+- TransferExportRow: one exported transfer, including its resume cursor.
+- TransferExportStream: the lazily produced export body and its media type.
 
 Dependency constraints:
 - Must not import from any other feature!
@@ -35,7 +38,10 @@ Usage:
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from dataclasses import dataclass
 from datetime import datetime
+from enum import Enum
 
 from pydantic import BaseModel, Field
 
@@ -62,3 +68,46 @@ class TransferResponse(BaseModel):
     created_at: datetime
     from_balance_pence: int
     to_balance_pence: int
+
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+class ExportTransfersRequest(BaseModel):
+    """
+    HTTP query schema for exporting transfers.
+
+    `after` is an opaque cursor taken from a previously exported row; the export
+    resumes strictly after that row.
+    """
+
+    format: ExportFormat = ExportFormat.NDJSON
+    account_id: str | None = None
+    since: datetime | None = None
+    until: datetime | None = None
+    after: str | None = None
+
+
+class TransferExportRow(BaseModel):
+    """
+    Export schema for a single transfer fact.
+    """
+
+    id: str
+    from_account_id: str
+    to_account_id: str
+    amount_pence: int
+    created_at: datetime
+    cursor: str
+
+
+@dataclass(frozen=True, slots=True)
+class TransferExportStream:
+    """
+    Export result: an iterator of encoded chunks, consumed by the delivery layer.
+    """
+
+    media_type: str
+    chunks: Iterator[str]
@@ -2,19 +2,29 @@
 Ring: Application (Use Case / Interactors)
 
 Responsibility:
-Implements the transfer creation use case.
-This interactor coordinates loading required accounts, constructing a transfer
-fact, applying the transfer via domain services, persisting resulting state, and
-presenting the result.
+Implements the transfer use cases.
+The creation interactor coordinates loading required accounts, constructing a
+transfer fact, applying the transfer via domain services, persisting resulting
+state, and presenting the result.
+The export interactor streams stored transfer facts to a presenter without ever
+materialising the full history.
 
 Design intent:
 The interactor owns orchestration and application policy:
 - It coordinates multiple repositories and domain operations.
 - It translates domain errors into transfer-specific application errors.
 - It delegates formatting to a presenter and persistence to repositories.
+- It commits its unit of work itself, once every change is registered, and logs
+  how long the commit took.
+- Velocity limits, when configured, are checked after the transfer has been
+  applied in memory and before anything is persisted. The transfer is counted
+  against the limits at that point, and the count is released again if the
+  commit does not happen, so every attempt of a retried transaction is counted
+  once at most.
 
 This module contains:
 - TransferCreator: the interactor implementing TransferCreatorPort.In.
+- TransferExporter: the interactor implementing TransferExporterPort.In.
 
 Dependency constraints:
 - Must not import from any other feature!
@@ -37,6 +47,9 @@ Usage:
 from __future__ import annotations
 
 import logging
+import time
+from collections.abc import Callable, Iterator, Mapping
+from datetime import datetime, timezone
 
 from core.entities.account import Account
 from core.entities.transfer import Transfer
@@ -50,29 +63,45 @@ from core.values.errors import (
     SameAccountTransferError as DomainSameAccountTransferError,
 )
 from core.values.objects import AppliedTransfer, Money
+from features._shared.ports import UnitOfWork
 from features.accounts.ports import AccountRepoPort
+from features.transfers.cursors import TransferCursor
 from features.transfers.errors import (
     TransferAccountNotFoundError,
     TransferInsufficientFundsError,
+    TransferLimitExceededError,
     TransferValidationError,
 )
-from features.transfers.ports import TransferCreatorPort, TransferRepoPort
-from features.transfers.schemas import TransferResponse
+from features.transfers.ports import (
+    TransferCreatorPort,
+    TransferExporterPort,
+    TransferLimitsPort,
+    TransferRepoPort,
+)
+from features.transfers.schemas import (
+    ExportFormat,
+    TransferExportStream,
+    TransferResponse,
+)
 
 
 class TransferCreator(TransferCreatorPort.In):
     def __init__(
         self,
         *,
+        uow: UnitOfWork,
         account_repo: AccountRepoPort,
         transfer_repo: TransferRepoPort,
         presenter: TransferCreatorPort.Out,
         logger: logging.Logger,
+        limits: TransferLimitsPort | None = None,
     ) -> None:
+        self._uow = uow
         self._account_repo = account_repo
         self._transfer_repo = transfer_repo
         self._presenter = presenter
         self._logger = logger
+        self._limits = limits
 
     def execute(
         self,
@@ -80,6 +109,7 @@ class TransferCreator(TransferCreatorPort.In):
         from_account_id: str,
         to_account_id: str,
         amount_pence: int,
+        transfer_id: str | None = None,
     ) -> TransferResponse:
         self._logger.info(
             "transfer_create_started from_account_id=%s to_account_id=%s amount_pence=%s",
@@ -94,6 +124,7 @@ class TransferCreator(TransferCreatorPort.In):
         )
 
         new_transfer = self._create_transfer(
+            transfer_id=transfer_id,
             from_account=from_account,
             to_account=to_account,
             amount_pence=amount_pence,
@@ -105,9 +136,15 @@ class TransferCreator(TransferCreatorPort.In):
             transfer=new_transfer,
         )
 
-        self._persist(applied_transfer)
+        self._reserve_limits(applied_transfer.transfer)
+        try:
+            self._persist(applied_transfer)
+            commit_ms = self._commit()
+        except BaseException:
+            self._release_limits(applied_transfer.transfer)
+            raise
 
-        self._log_succeeded(applied_transfer)
+        self._log_succeeded(applied_transfer, commit_ms=commit_ms)
 
         return self._presenter.present(applied_transfer)
 
@@ -117,7 +154,12 @@ class TransferCreator(TransferCreatorPort.In):
         from_account_id: str,
         to_account_id: str,
     ) -> tuple[Account, Account]:
-        from_account = self._account_repo.get(AccountId(from_account_id))
+        # One batched load: backends that lock per account batch (e.g. per shard)
+        # take those locks in a consistent order.
+        accounts = self._account_repo.get_many(
+            [AccountId(from_account_id), AccountId(to_account_id)]
+        )
+        from_account = accounts.get(AccountId(from_account_id))
         if from_account is None:
             self._logger.info(
                 "transfer_create_failed_missing_account account_id=%s role=from",
@@ -125,7 +167,7 @@ class TransferCreator(TransferCreatorPort.In):
             )
             raise TransferAccountNotFoundError(f"Account not found: {from_account_id}")
 
-        to_account = self._account_repo.get(AccountId(to_account_id))
+        to_account = accounts.get(AccountId(to_account_id))
         if to_account is None:
             self._logger.info(
                 "transfer_create_failed_missing_account account_id=%s role=to",
@@ -138,13 +180,14 @@ class TransferCreator(TransferCreatorPort.In):
     def _create_transfer(
         self,
         *,
+        transfer_id: str | None,
         from_account: Account,
         to_account: Account,
         amount_pence: int,
     ) -> Transfer:
         try:
             return Transfer(
-                id=TransferId(new_id()),
+                id=TransferId(new_id() if transfer_id is None else transfer_id),
                 from_account_id=from_account.id,
                 to_account_id=to_account.id,
                 amount=Money(amount_pence),
@@ -182,18 +225,156 @@ class TransferCreator(TransferCreatorPort.In):
             )
             raise TransferInsufficientFundsError(str(exc)) from exc
 
+    def _reserve_limits(self, transfer: Transfer) -> None:
+        if self._limits is None:
+            return
+
+        exceeded = self._limits.reserve(
+            account_id=str(transfer.from_account_id),
+            amount_pence=transfer.amount.pence,
+            at=transfer.created_at,
+        )
+        if exceeded is not None:
+            self._logger.info(
+                "transfer_create_failed_limit_exceeded from_account_id=%s amount_pence=%s limit=%s",
+                str(transfer.from_account_id),
+                transfer.amount.pence,
+                exceeded,
+            )
+            raise TransferLimitExceededError(f"Velocity limit exceeded: {exceeded}")
+
+    def _release_limits(self, transfer: Transfer) -> None:
+        if self._limits is not None:
+            self._limits.release(
+                account_id=str(transfer.from_account_id),
+                amount_pence=transfer.amount.pence,
+                at=transfer.created_at,
+            )
+
     def _persist(self, applied: AppliedTransfer) -> None:
         self._account_repo.save(applied.updated_from_account)
         self._account_repo.save(applied.updated_to_account)
         self._transfer_repo.save(applied.transfer)
 
-    def _log_succeeded(self, applied: AppliedTransfer) -> None:
+    def _commit(self) -> float:
+        """
+        Commit the unit of work; returns the commit latency in milliseconds.
+        """
+        started = time.perf_counter()
+        self._uow.commit()
+        return (time.perf_counter() - started) * 1000
+
+    def _log_succeeded(self, applied: AppliedTransfer, *, commit_ms: float) -> None:
         self._logger.info(
-            "transfer_create_succeeded transfer_id=%s from_account_id=%s to_account_id=%s amount_pence=%s from_balance_pence=%s to_balance_pence=%s",
+            "transfer_create_succeeded transfer_id=%s from_account_id=%s to_account_id=%s amount_pence=%s from_balance_pence=%s to_balance_pence=%s commit_ms=%.2f",
             str(applied.transfer.id),
             str(applied.transfer.from_account_id),
             str(applied.transfer.to_account_id),
             applied.transfer.amount.pence,
             applied.updated_from_account.balance.pence,
             applied.updated_to_account.balance.pence,
+            commit_ms,
         )
+
+
+class TransferExporter(TransferExporterPort.In):
+    def __init__(
+        self,
+        *,
+        transfer_repo: TransferRepoPort,
+        presenters: Mapping[ExportFormat, TransferExporterPort.Out],
+        logger: logging.Logger,
+        is_valid_id: Callable[[str], bool],
+    ) -> None:
+        """
+        `is_valid_id` tells whether the store can hold an id at all. An account id
+        or cursor it rejects is invalid input, not a filter that matches nothing.
+        """
+        self._transfer_repo = transfer_repo
+        self._presenters = presenters
+        self._logger = logger
+        self._is_valid_id = is_valid_id
+
+    def execute(
+        self,
+        *,
+        export_format: ExportFormat,
+        account_id: str | None,
+        since: datetime | None,
+        until: datetime | None,
+        after: str | None,
+    ) -> TransferExportStream:
+        self._logger.info(
+            "transfer_export_started format=%s account_id=%s since=%s until=%s after=%s",
+            export_format.value,
+            account_id,
+            since,
+            until,
+            after,
+        )
+
+        presenter = self._presenters[export_format]
+        since, until = self._validate_window(since=since, until=until)
+        cursor = self._validate_position(account_id=account_id, after=after)
+
+        transfers = self._transfer_repo.stream(
+            account_id=None if account_id is None else AccountId(account_id),
+            since=since,
+            until=until,
+            after=cursor,
+        )
+
+        return TransferExportStream(
+            media_type=presenter.media_type,
+            chunks=presenter.present(self._counted(transfers, export_format)),
+        )
+
+    def _validate_window(
+        self, *, since: datetime | None, until: datetime | None
+    ) -> tuple[datetime | None, datetime | None]:
+        since = None if since is None else _as_utc(since)
+        until = None if until is None else _as_utc(until)
+
+        if since is not None and until is not None and since > until:
+            self._logger.info(
+                "transfer_export_failed_validation since=%s until=%s", since, until
+            )
+            raise TransferValidationError("'since' must not be after 'until'")
+
+        return since, until
+
+    def _validate_position(
+        self, *, account_id: str | None, after: str | None
+    ) -> TransferCursor | None:
+        if account_id is not None and not self._is_valid_id(account_id):
+            self._logger.info(
+                "transfer_export_failed_validation account_id=%s", account_id
+            )
+            raise TransferValidationError(f"Invalid account id: {account_id}")
+
+        cursor = None if after is None else TransferCursor.decode(after)
+        if cursor is not None and not self._is_valid_id(cursor.transfer_id):
+            self._logger.info("transfer_export_failed_validation after=%s", after)
+            raise TransferValidationError(f"Invalid cursor: {after}")
+        return cursor
+
+    def _counted(
+        self, transfers: Iterator[Transfer], export_format: ExportFormat
+    ) -> Iterator[Transfer]:
+        """
+        Pass transfers through while counting them, logging once the stream ends.
+        """
+        rows = 0
+        for transfer in transfers:
+            rows += 1
+            yield transfer
+
+        self._logger.info(
+            "transfer_export_succeeded format=%s rows=%s", export_format.value, rows
+        )
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
@@ -0,0 +1,186 @@
+"""
+Ring: Infrastructure (Admission Control)
+
+Responsibility:
+Defines an adaptive concurrency limiter. It bounds how many requests may run at
+once and how many may wait, and it adjusts the bound to observed latency.
+
+Design intent:
+- Overload must be rejected at the door, before a request does any database work.
+  A request that cannot start within `max_wait` fails fast instead of queueing
+  until its client has given up.
+- The limit follows AIMD (additive increase, multiplicative decrease), as in TCP
+  congestion control:
+  - A request that completes within `target_latency` while every slot is in use
+    raises the limit by 1/limit. That adds roughly one slot per limit's worth of
+    such completions. Fast completions below the limit show nothing about
+    whether more concurrency would be served as fast, so they leave it alone;
+    otherwise a lightly loaded limiter would climb to `max_limit` and admit a
+    burst it never tested.
+  - The limit never exceeds `max_limit`, the configured maximum concurrency.
+  - A slower or failed request multiplies the limit by `backoff`, at most once per
+    `target_latency` interval, so one burst of slow completions counts as a single
+    congestion signal.
+- Waiters are admitted in FIFO order.
+- The limiter is confined to one asyncio event loop and needs no locks.
+
+This module contains:
+- AdmissionRejectedError: raised when a request is shed.
+- AdmissionStats: a point-in-time view of the limiter, for metrics.
+- AdaptiveConcurrencyLimiter: the limiter.
+
+Dependency constraints:
+- Must not import from the Domain layer (core/).
+- Must not import from the Application layer (features/*).
+- May depend only on the standard library.
+
+Stability:
+- Moderately stable.
+- Changes when the admission policy changes.
+
+Usage:
+- Used by the admission control middleware in root/admission.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections import deque
+from dataclasses import dataclass
+
+
+class AdmissionRejectedError(Exception):
+    """
+    The request was shed; `retry_after` is a suggested delay in whole seconds.
+    """
+
+    def __init__(self, reason: str, *, retry_after: int) -> None:
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+@dataclass(frozen=True, slots=True)
+class AdmissionStats:
+    limit: float
+    in_flight: int
+    queue_depth: int
+    admitted: int
+    rejected_queue_full: int
+    rejected_wait_timeout: int
+    latency_ms: float
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD-adjusted concurrency limit with a bounded FIFO wait queue.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial_limit: int,
+        min_limit: int = 1,
+        max_limit: int,
+        max_queue: int,
+        max_wait: float,
+        target_latency: float,
+        backoff: float = 0.9,
+    ) -> None:
+        self._limit = float(initial_limit)
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._max_queue = max_queue
+        self._max_wait = max_wait
+        self._target_latency = target_latency
+        self._backoff = backoff
+
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._last_decrease = 0.0
+        self._latency = target_latency / 2  # exponentially weighted moving average
+
+        self._admitted = 0
+        self._rejected_queue_full = 0
+        self._rejected_wait_timeout = 0
+
+    async def acquire(self) -> None:
+        """
+        Wait for a slot; raises AdmissionRejectedError if none is available in time.
+        """
+        if self._in_flight < int(self._limit) and not self._waiters:
+            self._admit()
+            return
+
+        if len(self._waiters) >= self._max_queue:
+            self._rejected_queue_full += 1
+            raise AdmissionRejectedError("queue_full", retry_after=self._retry_after())
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), timeout=self._max_wait)
+        except asyncio.TimeoutError:
+            if waiter.done():
+                return  # admitted as the timeout fired; the slot is ours
+            waiter.cancel()
+            self._waiters.remove(waiter)
+            self._rejected_wait_timeout += 1
+            raise AdmissionRejectedError(
+                "wait_timeout", retry_after=self._retry_after()
+            ) from None
+        except asyncio.CancelledError:
+            if waiter.done():
+                self._free()  # admitted but abandoned; not a latency sample
+            else:
+                waiter.cancel()
+                self._waiters.remove(waiter)
+            raise
+
+    def release(self, *, latency: float, failed: bool) -> None:
+        """
+        Free a slot and feed the request's latency (seconds) into the limit.
+        """
+        self._latency += 0.2 * (latency - self._latency)
+
+        now = time.monotonic()
+        if failed or latency > self._target_latency:
+            if now - self._last_decrease >= self._target_latency:
+                self._limit = max(self._min_limit, self._limit * self._backoff)
+                self._last_decrease = now
+        elif self._in_flight >= int(self._limit):
+            self._limit = min(self._max_limit, self._limit + 1 / self._limit)
+
+        self._free()
+
+    def _free(self) -> None:
+        self._in_flight -= 1
+        while self._waiters and self._in_flight < int(self._limit):
+            waiter = self._waiters.popleft()
+            if not waiter.cancelled():
+                self._admit()
+                waiter.set_result(None)
+
+    def stats(self) -> AdmissionStats:
+        return AdmissionStats(
+            limit=round(self._limit, 2),
+            in_flight=self._in_flight,
+            queue_depth=len(self._waiters),
+            admitted=self._admitted,
+            rejected_queue_full=self._rejected_queue_full,
+            rejected_wait_timeout=self._rejected_wait_timeout,
+            latency_ms=round(self._latency * 1000, 2),
+        )
+
+    def _admit(self) -> None:
+        self._in_flight += 1
+        self._admitted += 1
+
+    def _retry_after(self) -> int:
+        """
+        Time for the current queue to drain at the observed latency.
+        """
+        backlog = self._in_flight + len(self._waiters) + 1
+        return max(1, math.ceil(self._latency * backlog / max(self._limit, 1)))
@@ -0,0 +1,74 @@
+"""
+Ring: Infrastructure (Persistence / Repository Decorators)
+
+Responsibility:
+Implements an AccountRepoPort decorator that coalesces concurrent loads of the
+same account into one load from the wrapped repository.
+
+Design intent:
+The decorator wraps whichever repository a request was given (SQL or in-memory
+ledger) and shares a process-wide SingleFlight group across requests. When many
+clients poll a popular account, one request's repository performs the load and
+the requests that arrive while it is in flight reuse its result. Entities are
+immutable values detached from any session, so sharing them across requests is
+safe. Saves and multi-account loads are never coalesced.
+The shared load reads the account together with its version (`get_versioned`),
+so a request that joins it receives a version that labels exactly the balance
+it receives. A version read by the request itself could be newer than a load
+that had already started. `get` goes through the same shared load.
+
+This module contains:
+- CoalescingAccountRepo: the AccountRepoPort decorator.
+
+Dependency constraints:
+- Must not be imported by application use case code directly (wired through DI).
+- Must depend on application ports (features/accounts/ports) to implement them.
+- May depend on the Domain layer (core/) for entities and value types.
+- May depend on infrastructure tooling (infra/concurrency).
+
+Stability:
+- Moderately stable.
+
+Usage:
+- Wired in root/di around the repository used by AccountGetter.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Collection
+
+from core.entities.account import Account
+from core.values.custom_types import AccountId
+from features.accounts.ports import AccountRepoPort
+from infra.concurrency.singleflight import SingleFlight
+
+
+class CoalescingAccountRepo(AccountRepoPort):
+    """
+    AccountRepo whose concurrent `get`s of one id share a single load.
+    """
+
+    def __init__(
+        self,
+        *,
+        inner: AccountRepoPort,
+        loads: SingleFlight[AccountId, tuple[int, Account] | None],
+    ) -> None:
+        self._inner = inner
+        self._loads = loads
+
+    def get(self, account_id: AccountId) -> Account | None:
+        versioned = self.get_versioned(account_id)
+        return None if versioned is None else versioned[1]
+
+    def get_many(self, account_ids: Collection[AccountId]) -> dict[AccountId, Account]:
+        return self._inner.get_many(account_ids)
+
+    def save(self, account: Account) -> None:
+        self._inner.save(account)
+
+    def version(self, account_id: AccountId) -> int | None:
+        return self._inner.version(account_id)
+
+    def get_versioned(self, account_id: AccountId) -> tuple[int, Account] | None:
+        return self._loads.do(account_id, lambda: self._inner.get_versioned(account_id))
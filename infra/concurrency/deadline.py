@@ -0,0 +1,94 @@
+"""
+Ring: Infrastructure (Concurrency)
+
+Responsibility:
+Carries the deadline of the request being served to the code that serves it, so
+that work can be bounded by the time the client is still willing to wait.
+
+Design intent:
+- The deadline lives in a context variable. It is set once, where the request
+  enters, and is seen by everything that runs on the request's behalf. That
+  includes sync endpoints and dependencies, which Starlette runs in a worker
+  thread with a copy of the request's context. Nothing has to pass it down.
+- Deadlines are points on the monotonic clock, so wall-clock adjustments never
+  shorten or extend them.
+- Work checks the deadline before it starts (check_deadline) and is given the
+  time that remains (Deadline.remaining) as its own timeout. Work that is
+  already running is not interrupted from here; the database enforces the
+  remaining time on its own statements (infra/db/session).
+
+This module contains:
+- DeadlineExceededError: raised when work would start after its deadline.
+- Deadline: a point in time by which a request must be answered.
+- deadline_scope: sets the current deadline for the duration of a block.
+- current_deadline: the current deadline, or None.
+- check_deadline: raises DeadlineExceededError if the current deadline has passed.
+
+Dependency constraints:
+- Must not import from the Domain layer (core/).
+- Must not import from the Application layer (features/*).
+- May depend only on the standard library.
+
+Stability:
+- Stable.
+
+Usage:
+- Set per request by root/deadlines.
+- Checked before sessions are opened (infra/db/session) and before each write
+  attempt (root/di/transactions), and applied to database connections as
+  statement and lock timeouts.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+
+class DeadlineExceededError(RuntimeError):
+    """
+    The request's deadline passed before the work could start.
+    """
+
+
+@dataclass(frozen=True, slots=True)
+class Deadline:
+    expires_at: float  # time.monotonic()
+    budget: float  # seconds, as granted when the request arrived
+
+    @classmethod
+    def after(cls, seconds: float) -> Deadline:
+        return cls(expires_at=time.monotonic() + seconds, budget=seconds)
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+
+_current: ContextVar[Deadline | None] = ContextVar("request_deadline", default=None)
+
+
+@contextmanager
+def deadline_scope(deadline: Deadline | None) -> Iterator[None]:
+    token = _current.set(deadline)
+    try:
+        yield
+    finally:
+        _current.reset(token)
+
+
+def current_deadline() -> Deadline | None:
+    return _current.get()
+
+
+def check_deadline(stage: str) -> None:
+    deadline = _current.get()
+    if deadline is not None and deadline.expired():
+        raise DeadlineExceededError(
+            f"Request deadline of {deadline.budget:g}s exceeded before {stage}"
+        )
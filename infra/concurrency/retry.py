@@ -0,0 +1,149 @@
+"""
+Ring: Infrastructure (Concurrency)
+
+Responsibility:
+Defines retries of transient failures with capped exponential backoff and full
+jitter, bounded by both an attempt count and a time budget.
+
+Design intent:
+- Which errors are transient is not decided here. A classifier maps an exception
+  to a reason label, or to None for errors that must propagate at once.
+- Delays are drawn uniformly from [0, min(max_delay, base_delay * 2**retry)] ("full
+  jitter"). Writers that collided once then spread out instead of colliding
+  again in lockstep.
+- A retry that could not start before the budget runs out is not attempted. The
+  last error is re-raised and counted as a give-up. A caller with its own
+  deadline (e.g. the request's) passes it in, and the earlier of the two applies.
+- Counters are kept per reason, so contention (retries that then succeed) can be
+  told apart from failure (give-ups).
+
+This module contains:
+- RetryPolicy: attempt, delay, and time limits.
+- RetryStats: a point-in-time view of the counters.
+- TransientErrorRetrier: runs an operation under a policy.
+
+Dependency constraints:
+- Must not import from the Domain layer (core/).
+- Must not import from the Application layer (features/*).
+- May depend only on the standard library.
+
+Stability:
+- Stable.
+
+Usage:
+- Used by root/di/transactions to re-run write transactions on conflicts.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import TypeVar
+
+T = TypeVar("T")
+
+Classifier = Callable[[BaseException], str | None]
+RetryListener = Callable[[str, int, float], None]  # reason, failed attempt, delay
+
+
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    max_attempts: int = 5
+    base_delay: float = 0.005
+    max_delay: float = 0.2
+    budget: float = 2.0
+
+
+@dataclass(frozen=True, slots=True)
+class RetryStats:
+    operations: int
+    retries: int
+    recovered: int
+    give_ups: int
+    retries_by_reason: dict[str, int] = field(default_factory=dict)
+    give_ups_by_reason: dict[str, int] = field(default_factory=dict)
+
+
+class TransientErrorRetrier:
+    """
+    Re-runs an operation while it fails with errors the classifier calls transient.
+    """
+
+    def __init__(
+        self,
+        *,
+        policy: RetryPolicy,
+        classify: Classifier,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._policy = policy
+        self._classify = classify
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._operations = 0
+        self._recovered = 0
+        self._retries: Counter[str] = Counter()
+        self._give_ups: Counter[str] = Counter()
+
+    def run(
+        self,
+        operation: Callable[[], T],
+        *,
+        on_retry: RetryListener | None = None,
+        deadline: float | None = None,
+    ) -> T:
+        """
+        `deadline` is a time.monotonic() value after which no retry starts.
+        """
+        policy = self._policy
+        budget_deadline = time.monotonic() + policy.budget
+        if deadline is None or deadline > budget_deadline:
+            deadline = budget_deadline
+        with self._lock:
+            self._operations += 1
+
+        attempt = 1
+        while True:
+            try:
+                result = operation()
+            except Exception as exc:
+                reason = self._classify(exc)
+                if reason is None:
+                    raise
+                delay = random.uniform(
+                    0, min(policy.max_delay, policy.base_delay * 2 ** (attempt - 1))
+                )
+                if (
+                    attempt >= policy.max_attempts
+                    or time.monotonic() + delay >= deadline
+                ):
+                    with self._lock:
+                        self._give_ups[reason] += 1
+                    raise
+                with self._lock:
+                    self._retries[reason] += 1
+                if on_retry is not None:
+                    on_retry(reason, attempt, delay)
+                self._sleep(delay)
+                attempt += 1
+                continue
+
+            if attempt > 1:
+                with self._lock:
+                    self._recovered += 1
+            return result
+
+    def stats(self) -> RetryStats:
+        with self._lock:
+            return RetryStats(
+                operations=self._operations,
+                retries=sum(self._retries.values()),
+                recovered=self._recovered,
+                give_ups=sum(self._give_ups.values()),
+                retries_by_reason=dict(self._retries),
+                give_ups_by_reason=dict(self._give_ups),
+            )
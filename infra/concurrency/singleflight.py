@@ -0,0 +1,116 @@
+"""
+Ring: Infrastructure (Concurrency)
+
+Responsibility:
+Defines request coalescing ("singleflight"). Concurrent calls for the same key
+share one in-flight execution and all receive its result or its exception.
+
+Design intent:
+- Only loads that are in flight at the same time are coalesced. Nothing is
+  cached after a load completes, so callers never see a result older than one
+  that was already being read when they arrived.
+- Threaded callers (FastAPI's thread pool) use `do`; coroutines use `do_async`.
+  The two share counters but not in-flight calls, because a thread cannot await
+  an asyncio future and a coroutine must not block on a thread event.
+- `coalesced` counts callers that were served by another caller's load, i.e.
+  loads avoided.
+
+This module contains:
+- SingleFlightStats: a point-in-time view of the counters.
+- SingleFlight: the coalescing group.
+
+Dependency constraints:
+- Must not import from the Domain layer (core/).
+- Must not import from the Application layer (features/*).
+- May depend only on the standard library.
+
+Stability:
+- Stable.
+
+Usage:
+- Used by CoalescingAccountRepo for account loads.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass(frozen=True, slots=True)
+class SingleFlightStats:
+    loads: int
+    coalesced: int
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight(Generic[K, V]):
+    """
+    Coalesces concurrent loads of the same key.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[K, _Call] = {}
+        self._tasks: dict[K, asyncio.Future[V]] = {}
+        self._loads = 0
+        self._coalesced = 0
+
+    def do(self, key: K, load: Callable[[], V]) -> V:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+                self._loads += 1
+            else:
+                self._coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = load()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    async def do_async(self, key: K, load: Callable[[], Awaitable[V]]) -> V:
+        task = self._tasks.get(key)
+        if task is not None:
+            with self._lock:
+                self._coalesced += 1
+            return await asyncio.shield(task)
+
+        task = asyncio.ensure_future(load())
+        self._tasks[key] = task
+        with self._lock:
+            self._loads += 1
+        task.add_done_callback(lambda _: self._tasks.pop(key, None))
+        return await asyncio.shield(task)
+
+    def stats(self) -> SingleFlightStats:
+        with self._lock:
+            return SingleFlightStats(loads=self._loads, coalesced=self._coalesced)
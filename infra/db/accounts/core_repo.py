@@ -0,0 +1,108 @@
+"""
+Ring: Infrastructure (Persistence / Repositories)
+
+Responsibility:
+Implements the Account repository with SQLAlchemy Core: the same behaviour as
+AccountRepo, on the hot path, without ORM instances.
+
+Design intent:
+- Every statement is built once, at import, with bind parameters. Executing the
+  same statement object reuses SQLAlchemy's compiled form from the engine's
+  compiled cache instead of building and caching a new statement per call.
+- Only the columns an Account needs are selected, and rows are mapped straight to
+  entities (infra/db/accounts/mapper.from_row). No ORM instance is created or
+  entered into the session's identity map.
+- Staged accounts are read from the unit of work and saves are registered with
+  it, exactly as in AccountRepo. CoreSqlUnitOfWork writes them with Core too.
+- Column types still apply the configured id and timestamp storage.
+
+This module contains:
+- CoreAccountRepo: a SQLAlchemy Core implementation of AccountRepoPort.
+
+Dependency constraints:
+- Must not be imported by application use case code directly (wired through DI).
+- Must depend on application ports (features/accounts/ports) to implement them.
+- May depend on the Domain layer (core/) for entities and value types.
+- May depend on infrastructure tooling (SQLAlchemy, sessions, table metadata).
+
+Stability:
+- Highly volatile.
+- Changes with the accounts table and with AccountRepo, whose behaviour it must
+  match.
+
+Usage:
+- Wired in root/di instead of AccountRepo when SQL_REPOSITORIES=core.
+- Compared with AccountRepo by root/cli/benchmark_repos.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Collection
+
+from sqlalchemy import bindparam, select
+
+from core.entities.account import Account
+from core.values.custom_types import AccountId
+from features.accounts.ports import AccountRepoPort
+from infra.db.accounts.mapper import from_row
+from infra.db.accounts.model import AccountModel
+from infra.db.types import is_storable_id
+from infra.db.unit_of_work import SqlUnitOfWork
+
+_accounts = AccountModel.__table__
+
+_GET = select(_accounts.c.id, _accounts.c.balance_pence).where(
+    _accounts.c.id == bindparam("id")
+)
+_GET_MANY = select(_accounts.c.id, _accounts.c.balance_pence).where(
+    _accounts.c.id.in_(bindparam("ids", expanding=True))
+)
+_VERSION = select(_accounts.c.version).where(_accounts.c.id == bindparam("id"))
+_GET_VERSIONED = select(
+    _accounts.c.id, _accounts.c.balance_pence, _accounts.c.version
+).where(_accounts.c.id == bindparam("id"))
+
+
+class CoreAccountRepo(AccountRepoPort):
+    def __init__(self, *, uow: SqlUnitOfWork) -> None:
+        self._uow = uow
+
+    def get(self, account_id: AccountId) -> Account | None:
+        staged = self._uow.staged_account(str(account_id))
+        if staged is not None:
+            return staged
+        if not is_storable_id(account_id):
+            return None
+
+        row = self._uow.session.execute(_GET, {"id": str(account_id)}).first()
+        return None if row is None else from_row(row)
+
+    def get_many(self, account_ids: Collection[AccountId]) -> dict[AccountId, Account]:
+        found: dict[AccountId, Account] = {}
+        missing: list[str] = []
+        for account_id in account_ids:
+            staged = self._uow.staged_account(str(account_id))
+            if staged is not None:
+                found[account_id] = staged
+            elif is_storable_id(account_id):
+                missing.append(str(account_id))
+
+        if missing:
+            for row in self._uow.session.execute(_GET_MANY, {"ids": sorted(missing)}):
+                account = from_row(row)
+                found[account.id] = account
+        return found
+
+    def save(self, account: Account) -> None:
+        self._uow.register_account(account)
+
+    def version(self, account_id: AccountId) -> int | None:
+        if not is_storable_id(account_id):
+            return None
+        return self._uow.session.execute(_VERSION, {"id": str(account_id)}).scalar()
+
+    def get_versioned(self, account_id: AccountId) -> tuple[int, Account] | None:
+        if not is_storable_id(account_id):
+            return None
+        row = self._uow.session.execute(_GET_VERSIONED, {"id": str(account_id)}).first()
+        return None if row is None else (row.version, from_row(row))
@@ -14,7 +14,9 @@ All structural impedance between SQLAlchemy models and domain entities is isolat
 
 This module contains:
 - to_entity: conversion from AccountModel (ORM) to Account (domain entity).
+- from_row: conversion from a Core (id, balance_pence) row to Account.
 - to_model: conversion from Account (domain entity) to AccountModel (ORM).
+- to_row: conversion from Account (domain entity) to a column mapping for bulk inserts.
 
 Dependency constraints:
 - Must not import from the application layer (features/*).
@@ -33,6 +35,9 @@ Usage:
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+from typing import Any
+
 from core.entities.account import Account
 from core.values.custom_types import AccountId
 from core.values.objects import Money
@@ -49,11 +54,37 @@ def to_entity(model: AccountModel) -> Account:
     )
 
 
+def from_row(row: Sequence[Any]) -> Account:
+    """
+    Convert an (id, balance_pence) row selected with Core into a domain Account.
+    """
+    return Account(id=AccountId(row[0]), balance=Money(row[1]))
+
+
 def to_model(entity: Account) -> AccountModel:
     """
     Convert a domain Account entity into an AccountModel ORM row.
+
+    Only used for new rows, so the current balance is also the opening balance.
     """
     return AccountModel(
         id=str(entity.id),
         balance_pence=entity.balance.pence,
+        opening_balance_pence=entity.balance.pence,
+        version=1,
     )
+
+
+def to_row(entity: Account, *, opening_balance: Money | None = None) -> dict[str, Any]:
+    """
+    Convert a domain Account entity into a column mapping for bulk inserts.
+
+    The opening balance defaults to the current balance, as for new accounts.
+    """
+    opening = entity.balance if opening_balance is None else opening_balance
+    return {
+        "id": str(entity.id),
+        "balance_pence": entity.balance.pence,
+        "opening_balance_pence": opening.pence,
+        "version": 1,
+    }
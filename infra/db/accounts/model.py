@@ -12,6 +12,12 @@ It exists only to describe how account data is stored and retrieved.
 It must not contain business rules or domain behaviour.
 It adapts the database to the domain, never the other way around.
 
+The `slot` column couples this model to sharding: its insert default hashes the
+id with infra/sharding/placement, so the model depends on the shard placement. The
+slot of an id never changes (see placement), so the stored value stays valid
+whatever the shard map becomes, and in an unsharded database it is simply
+unused.
+
 This module contains:
 - AccountModel: the ORM mapping for the accounts table.
 
@@ -32,10 +38,17 @@ Usage:
 
 from __future__ import annotations
 
-from sqlalchemy import Integer, String
+from sqlalchemy import Integer
+from sqlalchemy.engine.default import DefaultExecutionContext
 from sqlalchemy.orm import Mapped, mapped_column
 
 from infra.db.session import ORMBase
+from infra.db.types import IdentifierType
+from infra.sharding.placement import slot_of
+
+
+def _slot_of_row(context: DefaultExecutionContext) -> int:
+    return slot_of(context.get_current_parameters()["id"])
 
 
 class AccountModel(ORMBase):
@@ -45,5 +58,20 @@ class AccountModel(ORMBase):
 
     __tablename__ = "accounts"
 
-    id: Mapped[str] = mapped_column(String, primary_key=True)
+    id: Mapped[str] = mapped_column(IdentifierType, primary_key=True)
     balance_pence: Mapped[int] = mapped_column(Integer, nullable=False)
+    # Balance at the time the row was first written; with the transfer history it
+    # must reproduce balance_pence (see the reconciliation job).
+    opening_balance_pence: Mapped[int] = mapped_column(Integer, nullable=False)
+    # Change version: 1 when created, incremented by every save. Exposed to clients
+    # as the account's ETag.
+    version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=1, server_default="1"
+    )
+    # Shard slot of the id (infra/sharding/placement), filled in on insert, so
+    # that moving a slot between shards finds its accounts through the index.
+    # Only the sharded backend reads it, but every backend shares this model, so
+    # unsharded databases carry and index it too.
+    slot: Mapped[int] = mapped_column(
+        Integer, nullable=False, index=True, default=_slot_of_row
+    )
@@ -33,14 +33,17 @@ Usage:
 
 from __future__ import annotations
 
+from collections.abc import Collection
+
 from sqlalchemy import select
-from sqlalchemy.orm import Session
 
 from core.entities.account import Account
 from core.values.custom_types import AccountId
 from features.accounts.ports import AccountRepoPort
-from infra.db.accounts.mapper import to_entity, to_model
+from infra.db.accounts.mapper import to_entity
 from infra.db.accounts.model import AccountModel
+from infra.db.types import is_storable_id
+from infra.db.unit_of_work import SqlUnitOfWork
 
 
 class AccountRepo(AccountRepoPort):
@@ -48,28 +51,64 @@ class AccountRepo(AccountRepoPort):
     SQLAlchemy-backed AccountRepo.
 
     This implementation is intentionally simple:
-    - `get` and `save` operate within a provided Session.
-    - Transaction scoping is managed by infra/db/session.session_scope().
+    - `get` reads through the unit of work's session; `save` registers the account
+      with the unit of work.
+    - Nothing is written until the use case commits the unit of work, which also
+      folds the change into the state digest and, for a new account, the change
+      feed (see infra/db/unit_of_work).
     """
 
-    def __init__(self, *, session: Session) -> None:
-        self._session = session
+    def __init__(self, *, uow: SqlUnitOfWork) -> None:
+        self._uow = uow
 
     def get(self, account_id: AccountId) -> Account | None:
+        staged = self._uow.staged_account(str(account_id))
+        if staged is not None:
+            return staged
+        if not is_storable_id(account_id):
+            return None
+
         stmt = select(AccountModel).where(AccountModel.id == str(account_id))
-        model = self._session.execute(stmt).scalar_one_or_none()
+        model = self._uow.session.execute(stmt).scalar_one_or_none()
         return None if model is None else to_entity(model)
 
-    def save(self, account: Account) -> None:
+    def get_many(self, account_ids: Collection[AccountId]) -> dict[AccountId, Account]:
         """
-        Upsert semantics for the demo.
+        Staged accounts, then one IN query for the rest.
+        """
+        found: dict[AccountId, Account] = {}
+        missing: list[str] = []
+        for account_id in account_ids:
+            staged = self._uow.staged_account(str(account_id))
+            if staged is not None:
+                found[account_id] = staged
+            elif is_storable_id(account_id):
+                missing.append(str(account_id))
+
+        if missing:
+            stmt = select(AccountModel).where(AccountModel.id.in_(sorted(missing)))
+            for model in self._uow.session.scalars(stmt):
+                account = to_entity(model)
+                found[account.id] = account
+        return found
 
-        If the row exists, update the balance.
-        If it does not, insert it.
+    def save(self, account: Account) -> None:
         """
-        existing = self._session.get(AccountModel, str(account.id))
-        if existing is None:
-            self._session.add(to_model(account))
-            return
+        Upsert semantics for the demo: the row is inserted or updated at commit.
+        """
+        self._uow.register_account(account)
+
+    def version(self, account_id: AccountId) -> int | None:
+        if not is_storable_id(account_id):
+            return None
+
+        stmt = select(AccountModel.version).where(AccountModel.id == str(account_id))
+        return self._uow.session.execute(stmt).scalar_one_or_none()
 
-        existing.balance_pence = account.balance.pence
+    def get_versioned(self, account_id: AccountId) -> tuple[int, Account] | None:
+        if not is_storable_id(account_id):
+            return None
+
+        stmt = select(AccountModel).where(AccountModel.id == str(account_id))
+        model = self._uow.session.execute(stmt).scalar_one_or_none()
+        return None if model is None else (model.version, to_entity(model))
@@ -0,0 +1,114 @@
+"""
+Ring: Infrastructure (Database / Change Feed)
+
+Responsibility:
+Appends committed changes to the change feed.
+Every account creation and every transfer is written to the changes table in the
+same transaction as the row itself.
+
+Design intent:
+- A consumer resumes from the last sequence it processed, so sequences must become
+  visible in increasing order: a change must never commit with a lower sequence
+  than one a reader has already seen.
+  - SQLite runs one writer at a time, so sequence order is commit order.
+  - On PostgreSQL sequence values are taken at insert time, and concurrent
+    transactions could commit out of order. Appending transactions therefore take
+    a transaction-scoped advisory lock first, which serializes them from the
+    append until commit.
+- Entries are written with one executemany insert per transaction, after the rows
+  they describe.
+- Readers blocked in a long poll are woken after commit (see
+  infra/db/changes/notifier), never before: a woken reader must find the rows.
+
+This module contains:
+- ACCOUNT_CREATED / TRANSFER_CREATED: change kinds.
+- append_bulk: append the accounts created and transfers made by a transaction.
+
+Dependency constraints:
+- Must not import from the application layer (features/*).
+- May depend on the Domain layer (core/) for entities.
+- May depend on infrastructure tooling (SQLAlchemy, ORM models).
+
+Stability:
+- Volatile.
+- Changes when the feed record layout or supported backends change.
+
+Usage:
+- Called by the SQL unit of work at commit, and by the bulk import store.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+from sqlalchemy import event, insert, text
+from sqlalchemy.orm import Session
+
+from core.entities.account import Account
+from core.entities.transfer import Transfer
+from core.utils.time import utc_now
+from infra.db.changes.model import ChangeModel
+from infra.db.changes.notifier import change_notifier
+from infra.db.types import to_epoch_micros
+
+ACCOUNT_CREATED = "account_created"
+TRANSFER_CREATED = "transfer_created"
+
+_PENDING_KEY = "change_feed_pending"
+
+# Arbitrary constant identifying the feed's advisory lock.
+_POSTGRES_LOCK_KEY = 0x6C65646765720001
+
+
+def append_bulk(
+    session: Session, *, accounts: Iterable[Account], transfers: Iterable[Transfer]
+) -> None:
+    """
+    Append accounts, then transfers, with one executemany insert.
+    """
+    rows = [_account_row(a) for a in accounts] + [_transfer_row(t) for t in transfers]
+    if rows:
+        _lock(session)
+        session.execute(insert(ChangeModel), rows)
+
+
+def _account_row(account: Account) -> dict[str, Any]:
+    return {
+        "kind": ACCOUNT_CREATED,
+        "occurred_at_us": to_epoch_micros(utc_now()),
+        "account_id": str(account.id),
+        "balance_pence": account.balance.pence,
+    }
+
+
+def _transfer_row(transfer: Transfer) -> dict[str, Any]:
+    return {
+        "kind": TRANSFER_CREATED,
+        "occurred_at_us": to_epoch_micros(transfer.created_at),
+        "transfer_id": str(transfer.id),
+        "from_account_id": str(transfer.from_account_id),
+        "to_account_id": str(transfer.to_account_id),
+        "amount_pence": transfer.amount.pence,
+    }
+
+
+def _lock(session: Session) -> None:
+    if session.info.get(_PENDING_KEY):
+        return
+    if session.get_bind().dialect.name == "postgresql":
+        session.execute(
+            text("SELECT pg_advisory_xact_lock(:key)"), {"key": _POSTGRES_LOCK_KEY}
+        )
+    session.info[_PENDING_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _notify_readers(session: Session) -> None:
+    if session.info.pop(_PENDING_KEY, False):
+        change_notifier.notify()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
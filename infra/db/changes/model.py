@@ -0,0 +1,66 @@
+"""
+Ring: Infrastructure (Database / ORM Models)
+
+Responsibility:
+Defines the persistence model for the change feed.
+Each row is one committed change (an account creation or a transfer) under a
+monotonically increasing sequence number.
+
+Design intent:
+This is a pure infrastructure concern.
+Feed rows are written in the same transaction as the rows they describe, so a
+change is in the feed if and only if it committed.
+The sequence is an autoincrement key that is never reused (SQLite AUTOINCREMENT),
+so a consumer's last seen sequence is a valid resume position forever.
+The time of a change is always stored as epoch microseconds, whatever
+TIMESTAMP_STORAGE says, so the feed needs no timestamp migration.
+
+This module contains:
+- ChangeModel: the ORM mapping for the changes table.
+
+Dependency constraints:
+- Must not import from the application layer (features/*).
+- May depend on infrastructure tooling (SQLAlchemy, DB session, etc.).
+
+Stability:
+- Highly volatile.
+- Changes when the feed record layout changes.
+
+Usage:
+- Written through infra/db/changes/feed by repositories and the bulk import store.
+- Read by the change feed repository.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import BigInteger, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from infra.db.session import ORMBase
+from infra.db.types import IdentifierType
+
+
+class ChangeModel(ORMBase):
+    """
+    ORM model for change feed entries.
+    """
+
+    __tablename__ = "changes"
+    __table_args__ = {"sqlite_autoincrement": True}
+
+    # SQLite only auto-assigns INTEGER primary keys.
+    seq: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    )
+    kind: Mapped[str] = mapped_column(String(32), nullable=False)
+    occurred_at_us: Mapped[int] = mapped_column(BigInteger, nullable=False)
+
+    account_id: Mapped[str | None] = mapped_column(IdentifierType, nullable=True)
+    balance_pence: Mapped[int | None] = mapped_column(Integer, nullable=True)
+
+    transfer_id: Mapped[str | None] = mapped_column(IdentifierType, nullable=True)
+    from_account_id: Mapped[str | None] = mapped_column(IdentifierType, nullable=True)
+    to_account_id: Mapped[str | None] = mapped_column(IdentifierType, nullable=True)
+    amount_pence: Mapped[int | None] = mapped_column(Integer, nullable=True)
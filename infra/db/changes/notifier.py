@@ -0,0 +1,82 @@
+"""
+Ring: Infrastructure (Database / Change Feed)
+
+Responsibility:
+Wakes long-polling change feed readers when new changes commit.
+
+Design intent:
+- A counter is bumped after every commit that appended to the feed. A reader takes
+  a `mark` before querying and then waits for the counter to move past it, so a
+  commit that lands between the query and the wait is never missed.
+- At most `max_waiters` readers wait at once. Each waiting reader holds a worker
+  thread, so unbounded waits would let idle consumers take every thread from
+  the rest of the API. A reader that finds no room is refused at once.
+- Only commits made in this process are signalled. Writers in other processes (the
+  import CLI, other API replicas) are picked up because a wait never blocks for
+  longer than POLL_INTERVAL before letting the reader query again.
+
+This module contains:
+- POLL_INTERVAL: the longest a reader sleeps without querying.
+- MAX_WAITERS: how many readers may wait at once (CHANGES_MAX_WAITERS).
+- ChangeNotifier: the commit counter and its condition variable.
+- change_notifier: the process-wide notifier.
+
+Dependency constraints:
+- Must not import from the Domain layer (core/).
+- Must depend on application ports (features/changes/ports) to implement them.
+- May depend on the standard library.
+
+Stability:
+- Stable.
+
+Usage:
+- Signalled by infra/db/changes/feed after commits.
+- Waited on by the ChangeFeedReader use case.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+
+from features.changes.ports import ChangeNotifierPort
+
+POLL_INTERVAL = 1.0
+MAX_WAITERS = int(os.environ.get("CHANGES_MAX_WAITERS", "16"))
+
+
+class ChangeNotifier(ChangeNotifierPort):
+    def __init__(
+        self, *, poll_interval: float = POLL_INTERVAL, max_waiters: int = MAX_WAITERS
+    ) -> None:
+        self._poll_interval = poll_interval
+        self._max_waiters = max_waiters
+        self._condition = threading.Condition()
+        self._commits = 0
+        self._waiters = 0
+
+    def mark(self) -> int:
+        with self._condition:
+            return self._commits
+
+    def wait(self, mark: int, *, timeout: float) -> bool:
+        with self._condition:
+            if self._waiters >= self._max_waiters:
+                return False
+            self._waiters += 1
+            try:
+                self._condition.wait_for(
+                    lambda: self._commits != mark,
+                    timeout=min(timeout, self._poll_interval),
+                )
+            finally:
+                self._waiters -= 1
+        return True
+
+    def notify(self) -> None:
+        with self._condition:
+            self._commits += 1
+            self._condition.notify_all()
+
+
+change_notifier = ChangeNotifier()
@@ -0,0 +1,74 @@
+"""
+Ring: Infrastructure (Persistence / Repositories)
+
+Responsibility:
+Implements the change feed repository using SQLAlchemy.
+This module provides a concrete persistence adapter for the ChangeFeedRepoPort
+defined by the application layer.
+
+Design intent:
+- Each read runs in its own short session from the given factory. A long-polling
+  reader then holds no connection while it waits, and each query sees a fresh
+  snapshot. A request-scoped session would keep re-reading its first snapshot
+  under SQLite WAL.
+- Reads are a primary key range scan; no other index is needed.
+
+This module contains:
+- ChangeFeedRepo: a SQLAlchemy-backed implementation of ChangeFeedRepoPort.
+
+Dependency constraints:
+- Must not be imported by application use case code directly (wired through DI).
+- Must depend on application ports (features/changes/ports) to implement them.
+- May depend on infrastructure tooling (SQLAlchemy, sessions, ORM models).
+
+Stability:
+- Highly volatile.
+- Changes when the feed storage layout changes.
+
+Usage:
+- Instantiated by the change feed dependency wiring with the read-only session
+  factory.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session, sessionmaker
+
+from features.changes.ports import ChangeFeedRepoPort
+from features.changes.schemas import ChangeKind, ChangeRecord
+from infra.db.changes.model import ChangeModel
+from infra.db.types import from_epoch_micros
+
+
+class ChangeFeedRepo(ChangeFeedRepoPort):
+    """
+    SQLAlchemy-backed ChangeFeedRepo.
+    """
+
+    def __init__(self, *, session_factory: sessionmaker[Session]) -> None:
+        self._session_factory = session_factory
+
+    def read(self, *, after: int, limit: int) -> list[ChangeRecord]:
+        stmt = (
+            select(ChangeModel)
+            .where(ChangeModel.seq > after)
+            .order_by(ChangeModel.seq)
+            .limit(limit)
+        )
+        with self._session_factory() as session:
+            return [_to_record(model) for model in session.scalars(stmt)]
+
+
+def _to_record(model: ChangeModel) -> ChangeRecord:
+    return ChangeRecord(
+        seq=model.seq,
+        kind=ChangeKind(model.kind),
+        occurred_at=from_epoch_micros(model.occurred_at_us),
+        account_id=model.account_id,
+        balance_pence=model.balance_pence,
+        transfer_id=model.transfer_id,
+        from_account_id=model.from_account_id,
+        to_account_id=model.to_account_id,
+        amount_pence=model.amount_pence,
+    )
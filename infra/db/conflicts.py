@@ -0,0 +1,107 @@
+"""
+Ring: Infrastructure (Database / Error Classification)
+
+Responsibility:
+Decides which database errors are transient conflicts between concurrent
+transactions, and so worth retrying, per backend.
+
+Design intent:
+- Only errors that say "another transaction got in the way" are transient. After
+  them a fresh attempt of the same transaction can succeed:
+  - SQLite: the database (or a table) is locked by another connection.
+  - PostgreSQL: serialization failure (40001), deadlock (40P01), lock not
+    available (55P03).
+  - MySQL: deadlock (1213), lock wait timeout (1205).
+- A unique violation is transient only when the failed statement inserted into
+  a table listed in RACE_TABLES. Those hold derived rows that two transactions
+  may create at once, e.g. the first write to a state digest bucket, and a
+  second attempt finds the row and updates it. Any other duplicate key is a
+  real error and is raised at once. Write use cases generate their ids
+  server-side, so it should never happen.
+- Lost connections are not retried: a commit that failed that way may still have
+  been applied.
+
+This module contains:
+- RACE_TABLES: tables whose unique violations are retried.
+- classify_db_error: map an exception to a retry reason, or None.
+
+Dependency constraints:
+- Must not import from the Domain layer (core/).
+- Must not import from the Application layer (features/*).
+- May depend on infrastructure tooling (SQLAlchemy).
+
+Stability:
+- Volatile.
+- Changes when supported backends change.
+
+Usage:
+- Used as the classifier of the write transaction retrier in root/di/transactions.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any
+
+from sqlalchemy.exc import DBAPIError, IntegrityError
+
+RACE_TABLES = frozenset({"state_digests"})
+
+_SQLITE_BUSY = ("database is locked", "database table is locked")
+
+_SQLSTATE_REASONS = {
+    "40001": "serialization_failure",
+    "40P01": "deadlock",
+    "55P03": "lock_not_available",
+}
+_SQLSTATE_UNIQUE = "23505"
+
+_MYSQL_REASONS = {1213: "deadlock", 1205: "lock_not_available"}
+_MYSQL_DUPLICATE = 1062
+
+_INSERT_INTO = re.compile(r"\s*INSERT\s+INTO\s+[`\"]?(\w+)", re.IGNORECASE)
+
+
+def classify_db_error(exc: BaseException) -> str | None:
+    if not isinstance(exc, DBAPIError) or exc.connection_invalidated:
+        return None
+    if _is_unique_violation(exc):
+        return "unique_race" if _inserted_table(exc.statement) in RACE_TABLES else None
+    return _conflict_reason(exc.orig)
+
+
+def _is_unique_violation(exc: DBAPIError) -> bool:
+    original = exc.orig
+    return (
+        _sqlstate(original) == _SQLSTATE_UNIQUE
+        or _mysql_code(original) == _MYSQL_DUPLICATE
+        or (
+            isinstance(exc, IntegrityError)
+            and str(original).lower().startswith("unique constraint failed")
+        )
+    )
+
+
+def _conflict_reason(original: Any) -> str | None:
+    sqlstate = _sqlstate(original)
+    if sqlstate is not None and sqlstate in _SQLSTATE_REASONS:
+        return _SQLSTATE_REASONS[sqlstate]
+    code = _mysql_code(original)
+    if code is not None and code in _MYSQL_REASONS:
+        return _MYSQL_REASONS[code]
+    message = str(original).lower()
+    return "sqlite_busy" if any(marker in message for marker in _SQLITE_BUSY) else None
+
+
+def _sqlstate(original: Any) -> str | None:
+    return getattr(original, "sqlstate", None) or getattr(original, "pgcode", None)
+
+
+def _mysql_code(original: Any) -> int | None:
+    args = getattr(original, "args", ())
+    return args[0] if args and isinstance(args[0], int) else None
+
+
+def _inserted_table(statement: str | None) -> str | None:
+    match = _INSERT_INTO.match(statement or "")
+    return match.group(1).lower() if match else None
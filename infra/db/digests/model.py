@@ -0,0 +1,48 @@
+"""
+Ring: Infrastructure (Database / ORM Models)
+
+Responsibility:
+Defines the persistence model for state digest buckets.
+Each row holds the combined hash and row count of one leaf range of a table:
+an account-id prefix, or one stripe of a transfer creation hour.
+
+Design intent:
+This is a pure infrastructure concern.
+Leaf digests are maintained in the same transaction as the rows they cover, so a
+committed store always carries a digest that matches its data.
+
+This module contains:
+- StateDigestModel: the ORM mapping for the state_digests table.
+
+Dependency constraints:
+- Must not import from the application layer (features/*).
+- May depend on infrastructure tooling (SQLAlchemy, DB session, etc.).
+
+Stability:
+- Highly volatile.
+- Changes when the digest scheme changes.
+
+Usage:
+- Written by repositories on every save and by the digest rebuild command.
+- Read by the state digest repository to build hash trees.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import BigInteger, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from infra.db.session import ORMBase
+
+
+class StateDigestModel(ORMBase):
+    """
+    ORM model for state digest leaf buckets.
+    """
+
+    __tablename__ = "state_digests"
+
+    scope: Mapped[str] = mapped_column(String, primary_key=True)
+    bucket: Mapped[str] = mapped_column(String, primary_key=True)
+    digest: Mapped[str] = mapped_column(String(64), nullable=False)
+    row_count: Mapped[int] = mapped_column(BigInteger, nullable=False)
@@ -0,0 +1,94 @@
+"""
+Ring: Infrastructure (Persistence / Repositories)
+
+Responsibility:
+Implements the state digest repository using SQLAlchemy.
+This module derives tree nodes from the leaf buckets maintained by
+infra/db/digests/tracking.
+
+Design intent:
+Only leaves are stored. A node at any level is the modular sum of the leaves under
+its prefix, read with a single prefix range query, so interior nodes never go
+stale and cost nothing to maintain.
+
+This module contains:
+- StateDigestRepo: a SQLAlchemy-backed implementation of StateDigestRepoPort.
+
+Dependency constraints:
+- Must not be imported by application use case code directly (wired through DI).
+- Must depend on application ports (features/digests/ports) to implement them.
+- May depend on infrastructure tooling (SQLAlchemy, sessions, ORM models).
+
+Stability:
+- Highly volatile.
+- Changes when the digest storage layout changes.
+
+Usage:
+- Instantiated per request for the digest endpoint, or per store by the
+  comparison CLI.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from features.digests.ports import StateDigestRepoPort
+from features.digests.schemas import DigestNode, DigestScope
+from infra.db.digests.model import StateDigestModel
+from infra.db.digests.tracking import LEVELS, combine
+
+
+class StateDigestRepo(StateDigestRepoPort):
+    """
+    SQLAlchemy-backed StateDigestRepo.
+    """
+
+    def __init__(self, *, session: Session) -> None:
+        self._session = session
+
+    def node(self, scope: DigestScope, prefix: str) -> DigestNode:
+        leaves = self._leaves(scope, prefix)
+        return DigestNode(
+            prefix=prefix,
+            digest=combine(digest for digest, _ in leaves.values()),
+            row_count=sum(count for _, count in leaves.values()),
+            is_leaf=len(prefix) >= LEVELS[scope.value][-1],
+        )
+
+    def children(self, scope: DigestScope, prefix: str) -> list[DigestNode]:
+        levels = LEVELS[scope.value]
+        width = next((level for level in levels if level > len(prefix)), None)
+        if width is None:
+            return []
+
+        groups: dict[str, list[tuple[str, int]]] = {}
+        for bucket, leaf in self._leaves(scope, prefix).items():
+            groups.setdefault(bucket[:width], []).append(leaf)
+
+        return [
+            DigestNode(
+                prefix=child,
+                digest=combine(digest for digest, _ in leaves),
+                row_count=sum(count for _, count in leaves),
+                is_leaf=width == levels[-1],
+            )
+            for child, leaves in sorted(groups.items())
+        ]
+
+    def _leaves(self, scope: DigestScope, prefix: str) -> dict[str, tuple[str, int]]:
+        stmt = select(
+            StateDigestModel.bucket,
+            StateDigestModel.digest,
+            StateDigestModel.row_count,
+        ).where(StateDigestModel.scope == scope.value)
+        if prefix:
+            stmt = stmt.where(
+                StateDigestModel.bucket.startswith(prefix, autoescape=True)
+            )
+
+        return {
+            bucket: (digest, row_count)
+            for bucket, digest, row_count in self._session.execute(stmt)
+            if row_count
+        }
@@ -0,0 +1,210 @@
+"""
+Ring: Infrastructure (Database / State Digests)
+
+Responsibility:
+Defines the state digest scheme and keeps leaf digests up to date.
+Rows are hashed from their domain entities, assigned to a leaf bucket, and folded
+into that bucket's digest whenever they are written.
+
+Design intent:
+- A bucket digest is the sum, modulo 2**256, of SHA-256 hashes of its rows. The sum
+  does not depend on order and can be updated in place: an update subtracts the
+  old row hash and adds the new one, so digests never need recomputing on save.
+- Transfer buckets are UTC creation hours, i.e. contiguous time ranges. Account
+  buckets are prefixes of a hash of the id rather than of the id itself: ids are
+  time-ordered, so raw id prefixes would pile every recent account into one leaf.
+- Parent nodes of the tree are sums of their leaves, so any level can be derived
+  from the leaves alone.
+- Every transfer committed in one hour lands in the same leaf, so that leaf's
+  row would be locked by every concurrent transfer. Each transfer leaf is
+  therefore stored as TRANSFER_STRIPES rows ("<hour>/<stripe>"), and a transfer
+  is folded into the stripe its hash selects. Reads sum every row under a
+  prefix, so stripes are never seen as tree nodes, and rows stored before
+  striping still count.
+- Pending bucket rows are cached in `session.info` because sessions run without
+  autoflush; two saves touching one bucket must hit the same row.
+- Buckets are locked and updated in sorted order, so concurrent transactions that
+  touch the same buckets always acquire their row locks in the same order.
+
+This module contains:
+- ACCOUNTS / TRANSFERS: scope names and their tree level widths.
+- record_accounts / record_transfers: incremental updates used by the unit of work.
+- apply_bucket_changes: batched updates used by bulk writers.
+- rebuild_digests: full recomputation for stores written outside the repositories.
+
+Dependency constraints:
+- Must not import from the application layer (features/*).
+- May depend on the Domain layer (core/) for entities.
+- May depend on infrastructure tooling (SQLAlchemy, ORM models).
+
+Stability:
+- Volatile.
+- Changing the hashing or bucketing scheme requires a rebuild on every store.
+
+Usage:
+- Called by the SQL unit of work at commit, and by the bulk import store.
+- Called by the state digest CLI to rebuild digests.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Iterable
+from datetime import timezone
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from core.entities.account import Account
+from core.entities.transfer import Transfer
+from infra.db.accounts import mapper as account_mapper
+from infra.db.accounts.model import AccountModel
+from infra.db.digests.model import StateDigestModel
+from infra.db.transfers import mapper as transfer_mapper
+from infra.db.transfers.model import TransferModel
+
+ACCOUNTS = "accounts"
+TRANSFERS = "transfers"
+
+TRANSFER_STRIPES = 16
+
+# Prefix lengths of each tree level below the root; the last level is the leaves.
+LEVELS: dict[str, tuple[int, ...]] = {
+    ACCOUNTS: (1, 2, 3),
+    TRANSFERS: (4, 7, 10, 13),  # year, month, day, hour
+}
+
+MODULUS = 1 << 256
+EMPTY_DIGEST = "0" * 64
+
+_PENDING_KEY = "state_digest_rows"
+_REBUILD_BATCH = 5000
+
+BucketChanges = dict[str, tuple[int, int]]
+
+
+def account_bucket(account_id: str) -> str:
+    digest = hashlib.sha256(account_id.encode("utf-8")).hexdigest()
+    return digest[: LEVELS[ACCOUNTS][-1]]
+
+
+def transfer_bucket(transfer: Transfer) -> str:
+    return transfer.created_at.astimezone(timezone.utc).strftime("%Y-%m-%dT%H")
+
+
+def account_hash(account: Account) -> int:
+    return _hash(str(account.id), str(account.balance.pence))
+
+
+def transfer_hash(transfer: Transfer) -> int:
+    return _hash(
+        str(transfer.id),
+        str(transfer.from_account_id),
+        str(transfer.to_account_id),
+        str(transfer.amount.pence),
+        transfer.created_at.astimezone(timezone.utc).isoformat(),
+    )
+
+
+def combine(digests: Iterable[str]) -> str:
+    total = sum(int(digest, 16) for digest in digests) % MODULUS
+    return f"{total:064x}"
+
+
+def record_accounts(
+    session: Session, changes: Iterable[tuple[Account | None, Account]]
+) -> None:
+    """
+    Fold account inserts (old is None) and updates, as (old, new) pairs, into their
+    bucket digests.
+    """
+    buckets: BucketChanges = {}
+    for old, new in changes:
+        delta = account_hash(new) - (0 if old is None else account_hash(old))
+        _accumulate(buckets, account_bucket(str(new.id)), delta, int(old is None))
+    apply_bucket_changes(session, ACCOUNTS, buckets)
+
+
+def record_transfers(session: Session, transfers: Iterable[Transfer]) -> None:
+    buckets: BucketChanges = {}
+    accumulate_transfers(buckets, transfers)
+    apply_bucket_changes(session, TRANSFERS, buckets)
+
+
+def accumulate_accounts(changes: BucketChanges, accounts: Iterable[Account]) -> None:
+    for account in accounts:
+        _accumulate(changes, account_bucket(str(account.id)), account_hash(account))
+
+
+def accumulate_transfers(changes: BucketChanges, transfers: Iterable[Transfer]) -> None:
+    for transfer in transfers:
+        row_hash = transfer_hash(transfer)
+        stripe = row_hash % TRANSFER_STRIPES
+        _accumulate(changes, f"{transfer_bucket(transfer)}/{stripe:02d}", row_hash)
+
+
+def apply_bucket_changes(session: Session, scope: str, changes: BucketChanges) -> None:
+    """
+    Apply pre-aggregated (hash delta, row count delta) pairs, one per bucket.
+    """
+    for bucket, (delta, count) in sorted(changes.items()):
+        _apply(session, scope, bucket, delta, count)
+
+
+def rebuild_digests(session: Session) -> None:
+    """
+    Recompute every digest from the stored rows, replacing existing buckets.
+    """
+    accounts: BucketChanges = {}
+    account_rows = session.scalars(
+        select(AccountModel).execution_options(yield_per=_REBUILD_BATCH)
+    )
+    accumulate_accounts(accounts, (account_mapper.to_entity(m) for m in account_rows))
+
+    transfers: BucketChanges = {}
+    transfer_rows = session.scalars(
+        select(TransferModel).execution_options(yield_per=_REBUILD_BATCH)
+    )
+    accumulate_transfers(
+        transfers, (transfer_mapper.to_entity(m) for m in transfer_rows)
+    )
+
+    session.execute(delete(StateDigestModel))
+    session.info.pop(_PENDING_KEY, None)
+    apply_bucket_changes(session, ACCOUNTS, accounts)
+    apply_bucket_changes(session, TRANSFERS, transfers)
+
+
+def _hash(*fields: str) -> int:
+    payload = "\x1f".join(fields).encode("utf-8")
+    return int.from_bytes(hashlib.sha256(payload).digest(), "big")
+
+
+def _accumulate(
+    changes: BucketChanges, bucket: str, delta: int, count: int = 1
+) -> None:
+    total, rows = changes.get(bucket, (0, 0))
+    changes[bucket] = ((total + delta) % MODULUS, rows + count)
+
+
+def _apply(session: Session, scope: str, bucket: str, delta: int, count: int) -> None:
+    pending: dict[tuple[str, str], StateDigestModel] = session.info.setdefault(
+        _PENDING_KEY, {}
+    )
+    key = (scope, bucket)
+    row = pending.get(key)
+    if row is None or row not in session:  # rolled-back inserts are expunged
+        row = session.execute(
+            select(StateDigestModel)
+            .where(StateDigestModel.scope == scope, StateDigestModel.bucket == bucket)
+            .with_for_update()
+        ).scalar_one_or_none()
+    if row is None:
+        row = StateDigestModel(
+            scope=scope, bucket=bucket, digest=EMPTY_DIGEST, row_count=0
+        )
+        session.add(row)
+    pending[key] = row
+
+    row.digest = f"{(int(row.digest, 16) + delta) % MODULUS:064x}"
+    row.row_count += count
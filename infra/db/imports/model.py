@@ -0,0 +1,46 @@
+"""
+Ring: Infrastructure (Database / ORM Models)
+
+Responsibility:
+Defines the persistence model for bulk import checkpoints.
+Each row records how far an import job has progressed through its source file.
+
+Design intent:
+This is a pure infrastructure concern.
+Checkpoints live in the same database as the imported rows so that a chunk of rows
+and the checkpoint that covers it are committed in one transaction.
+
+This module contains:
+- ImportCheckpointModel: the ORM mapping for the import_checkpoints table.
+
+Dependency constraints:
+- Must not import from the application layer (features/*).
+- May depend on infrastructure tooling (SQLAlchemy, DB session, etc.).
+
+Stability:
+- Highly volatile.
+- Changes when the checkpoint format changes.
+
+Usage:
+- Used by the import store to load and advance checkpoints.
+- Never imported by domain or application code.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import BigInteger, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from infra.db.session import ORMBase
+
+
+class ImportCheckpointModel(ORMBase):
+    """
+    ORM model for import checkpoints.
+    """
+
+    __tablename__ = "import_checkpoints"
+
+    job_id: Mapped[str] = mapped_column(String, primary_key=True)
+    offset: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    rows_read: Mapped[int] = mapped_column(BigInteger, nullable=False)
@@ -0,0 +1,240 @@
+"""
+Ring: Infrastructure (Persistence / Repositories)
+
+Responsibility:
+Implements the bulk import store using SQLAlchemy.
+This module provides a concrete persistence adapter for the LedgerImportStorePort
+defined by the application layer.
+
+Design intent:
+- Each chunk is one transaction: the executemany insert of all entities and the
+  checkpoint update commit or roll back together.
+- Inserts bypass the ORM unit of work and go through bulk `insert()` with plain
+  column mappings, avoiding per-row object construction.
+- If a chunk collides with existing ids it is retried row by row under savepoints,
+  so only the duplicates are skipped and the rest of the chunk still lands.
+- State digests are folded in per chunk, one update per touched bucket, for the
+  rows that were actually inserted. The same rows are appended to the change feed
+  with one executemany insert.
+
+This module contains:
+- LedgerImportStore: a SQLAlchemy-backed implementation of LedgerImportStorePort.
+
+Dependency constraints:
+- Must not be imported by application use case code directly (wired through DI).
+- Must depend on application ports (features/ledger_import/ports) to implement them.
+- May depend on the Domain layer (core/) for entities and value types.
+- May depend on infrastructure tooling (SQLAlchemy, sessions, ORM models).
+
+Stability:
+- Highly volatile.
+- Changes when persistence technology, schema, or bulk loading strategy changes.
+
+Usage:
+- Instantiated by the import CLI command with a session factory.
+- Used by the LedgerImporter through the LedgerImportStorePort interface.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, sessionmaker
+
+from core.entities.transfer import Transfer
+from features.ledger_import.ports import LedgerImportStorePort
+from features.ledger_import.schemas import ImportCheckpoint, ImportedAccount
+from infra.db.accounts import mapper as account_mapper
+from infra.db.accounts.model import AccountModel
+from infra.db.changes import feed
+from infra.db.digests import tracking
+from infra.db.imports.model import ImportCheckpointModel
+from infra.db.transfers import mapper as transfer_mapper
+from infra.db.transfers.model import TransferModel
+from infra.db.types import is_storable_id
+
+
+class LedgerImportStore(LedgerImportStorePort):
+    """
+    SQLAlchemy-backed store for chunked bulk imports.
+
+    Owns its transactions: unlike request-scoped repositories it opens one session
+    per chunk from the given factory.
+    """
+
+    def __init__(self, *, session_factory: sessionmaker[Session]) -> None:
+        self._session_factory = session_factory
+
+    def load_checkpoint(self, job_id: str) -> ImportCheckpoint:
+        with self._session_factory() as session:
+            model = session.get(ImportCheckpointModel, job_id)
+            if model is None:
+                return ImportCheckpoint()
+            return ImportCheckpoint(offset=model.offset, rows_read=model.rows_read)
+
+    def commit_chunk(
+        self,
+        *,
+        job_id: str,
+        accounts: Sequence[ImportedAccount],
+        transfers: Sequence[Transfer],
+        checkpoint: ImportCheckpoint,
+    ) -> list[str]:
+        accounts, transfers, unstorable = _split_unstorable(accounts, transfers)
+        try:
+            self._commit_batch(
+                job_id=job_id,
+                accounts=accounts,
+                transfers=transfers,
+                checkpoint=checkpoint,
+            )
+            return unstorable
+        except IntegrityError:
+            return unstorable + self._commit_row_by_row(
+                job_id=job_id,
+                accounts=accounts,
+                transfers=transfers,
+                checkpoint=checkpoint,
+            )
+
+    def _commit_batch(
+        self,
+        *,
+        job_id: str,
+        accounts: Sequence[ImportedAccount],
+        transfers: Sequence[Transfer],
+        checkpoint: ImportCheckpoint,
+    ) -> None:
+        """
+        One executemany insert per table; raises IntegrityError on any duplicate.
+        """
+        with self._session_factory() as session, session.begin():
+            for model, rows in self._batches(accounts=accounts, transfers=transfers):
+                if rows:
+                    session.execute(insert(model), rows)
+            self._record_digests(session, accounts=accounts, transfers=transfers)
+            feed.append_bulk(
+                session, accounts=(a.account for a in accounts), transfers=transfers
+            )
+            self._advance(session, job_id=job_id, checkpoint=checkpoint)
+
+    def _commit_row_by_row(
+        self,
+        *,
+        job_id: str,
+        accounts: Sequence[ImportedAccount],
+        transfers: Sequence[Transfer],
+        checkpoint: ImportCheckpoint,
+    ) -> list[str]:
+        duplicates: list[str] = []
+        inserted_accounts: list[ImportedAccount] = []
+        inserted_transfers: list[Transfer] = []
+
+        with self._session_factory() as session, session.begin():
+            for account in accounts:
+                row = account_mapper.to_row(
+                    account.account, opening_balance=account.opening_balance
+                )
+                if self._insert_one(session, AccountModel, row):
+                    inserted_accounts.append(account)
+                else:
+                    duplicates.append(str(account.account.id))
+
+            for transfer in transfers:
+                if self._insert_one(
+                    session, TransferModel, transfer_mapper.to_row(transfer)
+                ):
+                    inserted_transfers.append(transfer)
+                else:
+                    duplicates.append(str(transfer.id))
+
+            self._record_digests(
+                session, accounts=inserted_accounts, transfers=inserted_transfers
+            )
+            feed.append_bulk(
+                session,
+                accounts=(a.account for a in inserted_accounts),
+                transfers=inserted_transfers,
+            )
+            self._advance(session, job_id=job_id, checkpoint=checkpoint)
+        return duplicates
+
+    @staticmethod
+    def _insert_one(session: Session, model: type[Any], row: dict[str, Any]) -> bool:
+        try:
+            with session.begin_nested():
+                session.execute(insert(model), [row])
+        except IntegrityError:
+            return False
+        return True
+
+    @staticmethod
+    def _batches(
+        *, accounts: Sequence[ImportedAccount], transfers: Sequence[Transfer]
+    ) -> list[tuple[type[Any], list[dict[str, Any]]]]:
+        return [
+            (
+                AccountModel,
+                [
+                    account_mapper.to_row(a.account, opening_balance=a.opening_balance)
+                    for a in accounts
+                ],
+            ),
+            (TransferModel, [transfer_mapper.to_row(t) for t in transfers]),
+        ]
+
+    @staticmethod
+    def _record_digests(
+        session: Session,
+        *,
+        accounts: Sequence[ImportedAccount],
+        transfers: Sequence[Transfer],
+    ) -> None:
+        account_changes: tracking.BucketChanges = {}
+        tracking.accumulate_accounts(account_changes, (a.account for a in accounts))
+        tracking.apply_bucket_changes(session, tracking.ACCOUNTS, account_changes)
+
+        transfer_changes: tracking.BucketChanges = {}
+        tracking.accumulate_transfers(transfer_changes, transfers)
+        tracking.apply_bucket_changes(session, tracking.TRANSFERS, transfer_changes)
+
+    @staticmethod
+    def _advance(
+        session: Session, *, job_id: str, checkpoint: ImportCheckpoint
+    ) -> None:
+        session.merge(
+            ImportCheckpointModel(
+                job_id=job_id,
+                offset=checkpoint.offset,
+                rows_read=checkpoint.rows_read,
+            )
+        )
+
+
+def _storable_account(account: ImportedAccount) -> bool:
+    return is_storable_id(account.account.id)
+
+
+def _storable_transfer(transfer: Transfer) -> bool:
+    return all(
+        is_storable_id(value)
+        for value in (transfer.id, transfer.from_account_id, transfer.to_account_id)
+    )
+
+
+def _split_unstorable(
+    accounts: Sequence[ImportedAccount], transfers: Sequence[Transfer]
+) -> tuple[list[ImportedAccount], list[Transfer], list[str]]:
+    """
+    The storable accounts and transfers, and the ids of those that are not.
+    """
+    unstorable = [str(a.account.id) for a in accounts if not _storable_account(a)]
+    unstorable += [str(t.id) for t in transfers if not _storable_transfer(t)]
+    return (
+        [a for a in accounts if _storable_account(a)],
+        [t for t in transfers if _storable_transfer(t)],
+        unstorable,
+    )
@@ -0,0 +1,49 @@
+"""
+Ring: Infrastructure (Database / ORM Models)
+
+Responsibility:
+Defines the persistence model for the database's instance id: a random id
+written once, when a process first asks for it after the tables are created.
+
+Design intent:
+This is a pure infrastructure concern.
+State kept outside the database (such as the shared balance table in
+infra/shm) is stamped with the id. A database that is dropped and created
+again gets a new id, so that state is recognised as belonging to another
+database. A database restored from a backup keeps the id it was backed up with.
+
+This module contains:
+- DatabaseInstanceModel: the ORM mapping for the database_instance table.
+
+Dependency constraints:
+- Must not import from the application layer (features/*).
+- May depend on infrastructure tooling (SQLAlchemy, DB session, etc.).
+
+Stability:
+- Stable.
+
+Usage:
+- Used by infra/db/instance/repo.
+- Never imported by domain or application code.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from infra.db.session import ORMBase
+
+# The table holds a single row, with this key.
+INSTANCE_ROW = 1
+
+
+class DatabaseInstanceModel(ORMBase):
+    """
+    ORM model for the database's instance id.
+    """
+
+    __tablename__ = "database_instance"
+
+    row: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    instance_id: Mapped[str] = mapped_column(String(32), nullable=False)
@@ -0,0 +1,56 @@
+"""
+Ring: Infrastructure (Persistence / Repositories)
+
+Responsibility:
+Reads the database's instance id, writing a new one if the database has none.
+
+Design intent:
+Several processes may start against a new database at once. Each tries to
+insert the id, and those that lose the race read the winner's.
+
+This module contains:
+- database_instance_id: the database's instance id, created on first use.
+
+Dependency constraints:
+- Must not import from the Domain layer (core/).
+- Must not import from the Application layer (features/*).
+- May depend on infrastructure tooling (SQLAlchemy, sessions, ORM models).
+
+Stability:
+- Stable.
+
+Usage:
+- Called at startup by root/shared_balances_setup.
+"""
+
+from __future__ import annotations
+
+import uuid
+
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, sessionmaker
+
+from infra.db.instance.model import INSTANCE_ROW, DatabaseInstanceModel
+
+_SELECT = select(DatabaseInstanceModel.instance_id).where(
+    DatabaseInstanceModel.row == INSTANCE_ROW
+)
+
+
+def database_instance_id(session_factory: sessionmaker[Session]) -> str:
+    """
+    32 hex digits identifying this database since its tables were created.
+    """
+    with session_factory() as session:
+        existing = session.scalar(_SELECT)
+        if existing is not None:
+            return existing
+        session.add(
+            DatabaseInstanceModel(row=INSTANCE_ROW, instance_id=uuid.uuid4().hex)
+        )
+        try:
+            session.commit()
+        except IntegrityError:
+            session.rollback()  # another process created it first
+        return session.scalar(_SELECT)  # type: ignore[return-value]
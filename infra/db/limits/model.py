@@ -0,0 +1,57 @@
+"""
+Ring: Infrastructure (Database / ORM Models)
+
+Responsibility:
+Defines the persistence model for velocity limit rollups: the per-bucket totals of
+the in-memory velocity counters (infra/limits/velocity), kept so that a restarted
+process can rebuild its counters without summing the transfers table.
+
+Design intent:
+This is a pure infrastructure concern.
+- One row is one bucket of one limit for one account. Rows are rewritten as a
+  whole for each account whose counters changed since the previous flush.
+- `flushed_at_us` is the time of the flush that wrote the row. The latest one is
+  the position from which transfers must be replayed after a restart.
+- Times are stored as epoch seconds and microseconds whatever TIMESTAMP_STORAGE
+  says, like the change feed, so the rollups need no timestamp migration.
+- Buckets older than the longest window are pruned by every flush; the index on
+  `bucket_start_s` serves both pruning and the startup load.
+
+This module contains:
+- VelocityRollupModel: the ORM mapping for the velocity_rollups table.
+
+Dependency constraints:
+- Must not import from the application layer (features/*).
+- May depend on infrastructure tooling (SQLAlchemy, DB session, etc.).
+
+Stability:
+- Highly volatile.
+- Changes when the counters' bucket layout changes.
+
+Usage:
+- Written and read by infra/limits/velocity.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import BigInteger, Index, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from infra.db.session import ORMBase
+from infra.db.types import IdentifierType
+
+
+class VelocityRollupModel(ORMBase):
+    """
+    ORM model for velocity limit bucket totals.
+    """
+
+    __tablename__ = "velocity_rollups"
+    __table_args__ = (Index("ix_velocity_rollups_bucket_start", "bucket_start_s"),)
+
+    account_id: Mapped[str] = mapped_column(IdentifierType, primary_key=True)
+    limit_name: Mapped[str] = mapped_column(String(32), primary_key=True)
+    bucket_start_s: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+
+    total: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    flushed_at_us: Mapped[int] = mapped_column(BigInteger, nullable=False)
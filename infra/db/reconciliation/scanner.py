@@ -0,0 +1,163 @@
+"""
+Ring: Infrastructure (Persistence / Read-only Scanners)
+
+Responsibility:
+Implements the ledger scan port with set-based SQL over the accounts and
+transfers tables.
+
+Design intent:
+- Aggregation runs in the database: each range is reconciled with one grouped
+  query that sums credits and debits per account and returns only the accounts
+  whose stored balance disagrees. Workers never materialise transfer rows.
+- The scanner is a small picklable value holding only the database URL. Each worker
+  process lazily opens its own read-only engine, so no connection is ever shared
+  across a fork.
+- Per-range memory is bounded by `max_discrepancies`; beyond that only a count is
+  kept.
+- Partition boundaries come from `ntile()` over the primary key, so ranges hold
+  similar numbers of accounts whatever the id distribution.
+
+This module contains:
+- SqlLedgerScanner: a SQLAlchemy Core implementation of LedgerScanPort.
+
+Dependency constraints:
+- Must not be imported by application use case code directly (wired through DI).
+- Must depend on application ports (features/reconciliation/ports) to implement them.
+- May depend on infrastructure tooling (SQLAlchemy, ORM models).
+
+Stability:
+- Highly volatile.
+- Changes when schema or scanning strategy changes.
+
+Usage:
+- Instantiated by the reconciliation CLI command and shipped to worker processes.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import ColumnElement, Engine, and_, func, select, true
+
+from features.reconciliation.ports import LedgerScanPort
+from features.reconciliation.schemas import (
+    AccountIdRange,
+    BalanceDiscrepancy,
+    RangeReconciliation,
+)
+from infra.db.accounts.model import AccountModel
+from infra.db.session import create_read_only_engine
+from infra.db.transfers.model import TransferModel
+
+# One read-only engine per database URL per process.
+_ENGINES: dict[str, Engine] = {}
+
+_FETCH_SIZE = 1000
+
+
+def _engine(url: str) -> Engine:
+    engine = _ENGINES.get(url)
+    if engine is None:
+        engine = _ENGINES[url] = create_read_only_engine(url)
+    return engine
+
+
+def _in_range(column: Any, id_range: AccountIdRange) -> ColumnElement[bool]:
+    conditions: list[ColumnElement[bool]] = []
+    if id_range.low is not None:
+        conditions.append(column >= id_range.low)
+    if id_range.high is not None:
+        conditions.append(column < id_range.high)
+    return and_(true(), *conditions)
+
+
+@dataclass(frozen=True, slots=True)
+class SqlLedgerScanner(LedgerScanPort):
+    """
+    Read-only, process-safe ledger scanner.
+    """
+
+    database_url: str
+    max_discrepancies: int = 1000
+
+    def partition(self, count: int) -> list[AccountIdRange]:
+        bucket = func.ntile(max(count, 1)).over(order_by=AccountModel.id)
+        numbered = select(AccountModel.id, bucket.label("bucket")).subquery()
+        stmt = (
+            select(func.min(numbered.c.id))
+            .group_by(numbered.c.bucket)
+            .order_by(numbered.c.bucket)
+        )
+
+        with _engine(self.database_url).connect() as conn:
+            starts = list(conn.execute(stmt).scalars())
+
+        if not starts:
+            return [AccountIdRange(low=None, high=None)]
+
+        bounds: list[str | None] = [None, *starts[1:], None]
+        return [
+            AccountIdRange(low=bounds[i], high=bounds[i + 1])
+            for i in range(len(starts))
+        ]
+
+    def reconcile(self, id_range: AccountIdRange) -> RangeReconciliation:
+        accounts = AccountModel.__table__
+        transfers = TransferModel.__table__
+
+        credits = (
+            select(
+                transfers.c.to_account_id.label("account_id"),
+                func.sum(transfers.c.amount_pence).label("total"),
+            )
+            .where(_in_range(transfers.c.to_account_id, id_range))
+            .group_by(transfers.c.to_account_id)
+            .subquery()
+        )
+        debits = (
+            select(
+                transfers.c.from_account_id.label("account_id"),
+                func.sum(transfers.c.amount_pence).label("total"),
+            )
+            .where(_in_range(transfers.c.from_account_id, id_range))
+            .group_by(transfers.c.from_account_id)
+            .subquery()
+        )
+        expected = (
+            accounts.c.opening_balance_pence
+            + func.coalesce(credits.c.total, 0)
+            - func.coalesce(debits.c.total, 0)
+        )
+        mismatches = (
+            select(accounts.c.id, accounts.c.balance_pence, expected.label("expected"))
+            .outerjoin(credits, credits.c.account_id == accounts.c.id)
+            .outerjoin(debits, debits.c.account_id == accounts.c.id)
+            .where(_in_range(accounts.c.id, id_range))
+            .where(accounts.c.balance_pence != expected)
+            .order_by(accounts.c.id)
+        )
+        checked = select(func.count()).where(_in_range(accounts.c.id, id_range))
+
+        discrepancies: list[BalanceDiscrepancy] = []
+        discrepancy_count = 0
+        with _engine(self.database_url).connect() as conn:
+            accounts_checked = conn.execute(checked.select_from(accounts)).scalar_one()
+            rows = conn.execution_options(yield_per=_FETCH_SIZE).execute(mismatches)
+            for account_id, balance_pence, expected_pence in rows:
+                discrepancy_count += 1
+                if len(discrepancies) < self.max_discrepancies:
+                    discrepancies.append(
+                        BalanceDiscrepancy(
+                            account_id=str(account_id),
+                            balance_pence=int(balance_pence),
+                            expected_pence=int(expected_pence),
+                        )
+                    )
+
+        return RangeReconciliation(
+            id_range=id_range,
+            accounts_checked=accounts_checked,
+            discrepancy_count=discrepancy_count,
+            discrepancies=discrepancies,
+        )
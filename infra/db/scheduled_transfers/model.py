@@ -0,0 +1,68 @@
+"""
+Ring: Infrastructure (Database / ORM Models)
+
+Responsibility:
+Defines the persistence model for scheduled transfers.
+
+Design intent:
+This is a pure infrastructure concern.
+- The scheduler only ever asks for pending rows due before a time, in due order,
+  so the one secondary index is (status, due_at, id). Executed and failed rows
+  stay in the table as history but are skipped by that index's leading column.
+- `lease_token` identifies the worker that has claimed a pending row for
+  execution, until `lease_expires_at`. The lease columns are checked on the rows
+  being claimed and are not indexed. They are left as they are once the row is
+  executed or failed; only pending rows are ever claimed.
+- Times use the configured TimestampType like every other timestamp column.
+
+This module contains:
+- ScheduledTransferModel: the ORM mapping for the scheduled_transfers table.
+
+Dependency constraints:
+- Must not import from the application layer (features/*).
+- May depend on infrastructure tooling (SQLAlchemy, DB session, etc.).
+
+Stability:
+- Highly volatile.
+- Changes when the database schema or persistence technology changes.
+
+Usage:
+- Used by infra/db/scheduled_transfers/repo.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from infra.db.session import ORMBase
+from infra.db.types import IdentifierType, TimestampType
+
+
+class ScheduledTransferModel(ORMBase):
+    """
+    ORM model for scheduled transfers.
+    """
+
+    __tablename__ = "scheduled_transfers"
+    __table_args__ = (
+        Index("ix_scheduled_transfers_status_due_at_id", "status", "due_at", "id"),
+    )
+
+    id: Mapped[str] = mapped_column(IdentifierType, primary_key=True)
+
+    from_account_id: Mapped[str] = mapped_column(IdentifierType, nullable=False)
+    to_account_id: Mapped[str] = mapped_column(IdentifierType, nullable=False)
+    amount_pence: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    due_at: Mapped[datetime] = mapped_column(TimestampType, nullable=False)
+    status: Mapped[str] = mapped_column(String(16), nullable=False)
+    completed_at: Mapped[datetime | None] = mapped_column(TimestampType, nullable=True)
+    failure_reason: Mapped[str | None] = mapped_column(String(255), nullable=True)
+
+    lease_token: Mapped[str | None] = mapped_column(String(36), nullable=True)
+    lease_expires_at: Mapped[datetime | None] = mapped_column(
+        TimestampType, nullable=True
+    )
@@ -0,0 +1,213 @@
+"""
+Ring: Infrastructure (Persistence / Repositories)
+
+Responsibility:
+Implements the scheduled transfer repository using SQLAlchemy, the query the
+scheduler uses to find pending scheduled transfers that are coming due, and the
+claim a worker takes on due transfers before executing them.
+
+Design intent:
+- ScheduledTransferRepo works in the caller's unit of work: `save` registers the
+  row with it, and it is written when the use case commits. An execution
+  therefore commits the status change together with the transfer it made.
+- PendingScheduledTransfers runs each page in its own short session, like the
+  change feed reader. It is a keyset scan over (status, due_at, id), so loading
+  the next window of due transfers costs an index range read however many
+  scheduled transfers are stored.
+- Every worker process runs its own dispatcher and loads the same pending rows.
+  ScheduledTransferClaims therefore leases a due batch before it is executed:
+  one UPDATE sets a fresh token and expiry on the rows that are still pending and
+  not leased, and only the rows carrying that token are returned. Concurrent
+  claims on the same rows serialise on their row locks, and the second finds
+  them leased, so each due transfer is executed by one worker. A row whose
+  execution gives up, or whose worker dies, stays pending and is claimed again
+  at a later window load once its lease has expired.
+
+This module contains:
+- ScheduledTransferRepo: a SQLAlchemy-backed ScheduledTransferRepoPort.
+- PendingScheduledTransfers: pages of pending (id, due_at) pairs in due order.
+- ScheduledTransferClaims: leases due scheduled transfers to one worker.
+
+Dependency constraints:
+- Must not be imported by application use case code directly (wired through DI).
+- Must depend on application ports (features/scheduled_transfers/ports) to
+  implement them.
+- May depend on infrastructure tooling (SQLAlchemy, sessions, ORM models).
+
+Stability:
+- Highly volatile.
+- Changes when the scheduled transfer storage layout changes.
+
+Usage:
+- ScheduledTransferRepo is built per unit of work in root/di.
+- PendingScheduledTransfers is used by root/scheduler_setup to fill the
+  scheduler, and ScheduledTransferClaims to claim each batch it fires.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.orm import Session, sessionmaker
+
+from core.utils.id import new_id
+from features.scheduled_transfers.ports import ScheduledTransferRepoPort
+from features.scheduled_transfers.schemas import (
+    ScheduledTransfer,
+    ScheduledTransferStatus,
+)
+from infra.db.scheduled_transfers.model import ScheduledTransferModel
+from infra.db.types import is_storable_id
+from infra.db.unit_of_work import SqlUnitOfWork
+
+PENDING_PAGE_SIZE = 1000
+
+_PENDING = ScheduledTransferStatus.PENDING.value
+_TABLE_NAME = ScheduledTransferModel.__tablename__
+
+
+class ScheduledTransferRepo(ScheduledTransferRepoPort):
+    """
+    SQLAlchemy-backed ScheduledTransferRepo.
+    """
+
+    def __init__(self, *, uow: SqlUnitOfWork) -> None:
+        self._uow = uow
+
+    def get(self, scheduled_transfer_id: str) -> ScheduledTransfer | None:
+        staged = self._uow.staged_row(_TABLE_NAME, scheduled_transfer_id)
+        if staged is not None:
+            return _to_record(staged)
+        if not is_storable_id(scheduled_transfer_id):
+            return None
+
+        stmt = select(ScheduledTransferModel).where(
+            ScheduledTransferModel.id == scheduled_transfer_id
+        )
+        model = self._uow.session.execute(stmt).scalar_one_or_none()
+        return None if model is None else _to_record(model)
+
+    def save(self, scheduled: ScheduledTransfer) -> None:
+        """
+        Inserted or updated when the unit of work commits.
+        """
+        self._uow.register_row(_to_model(scheduled))
+
+
+class PendingScheduledTransfers:
+    def __init__(self, *, session_factory: sessionmaker[Session]) -> None:
+        self._session_factory = session_factory
+
+    def due_before(self, until: datetime) -> Iterator[tuple[str, datetime]]:
+        """
+        Yield (id, due_at) of every pending scheduled transfer due before `until`,
+        in (due_at, id) order, one page per query.
+        """
+        after: tuple[datetime, str] | None = None
+        while True:
+            stmt = (
+                select(ScheduledTransferModel.id, ScheduledTransferModel.due_at)
+                .where(
+                    ScheduledTransferModel.status == _PENDING,
+                    ScheduledTransferModel.due_at < until,
+                )
+                .order_by(ScheduledTransferModel.due_at, ScheduledTransferModel.id)
+                .limit(PENDING_PAGE_SIZE)
+            )
+            if after is not None:
+                stmt = stmt.where(
+                    or_(
+                        ScheduledTransferModel.due_at > after[0],
+                        and_(
+                            ScheduledTransferModel.due_at == after[0],
+                            ScheduledTransferModel.id > after[1],
+                        ),
+                    )
+                )
+            with self._session_factory() as session:
+                page = [(key, _as_utc(due_at)) for key, due_at in session.execute(stmt)]
+
+            yield from page
+            if len(page) < PENDING_PAGE_SIZE:
+                return
+            after = (page[-1][1], page[-1][0])
+
+
+class ScheduledTransferClaims:
+    def __init__(self, *, session_factory: sessionmaker[Session]) -> None:
+        self._session_factory = session_factory
+
+    def claim(
+        self, ids: Sequence[str], *, now: datetime, lease_for: timedelta
+    ) -> list[str]:
+        """
+        The ids, in their given order, that this call has leased until
+        `now + lease_for`. Ids that are no longer pending, or are leased by
+        another worker, are left out.
+        """
+        if not ids:
+            return []
+        token = new_id()
+        with self._session_factory() as session:
+            session.execute(
+                update(ScheduledTransferModel)
+                .where(
+                    ScheduledTransferModel.id.in_(ids),
+                    ScheduledTransferModel.status == _PENDING,
+                    or_(
+                        ScheduledTransferModel.lease_expires_at.is_(None),
+                        ScheduledTransferModel.lease_expires_at < now,
+                    ),
+                )
+                .values(lease_token=token, lease_expires_at=now + lease_for)
+                .execution_options(synchronize_session=False)
+            )
+            claimed = set(
+                session.scalars(
+                    select(ScheduledTransferModel.id).where(
+                        ScheduledTransferModel.lease_token == token
+                    )
+                )
+            )
+            session.commit()
+        return [key for key in ids if key in claimed]
+
+
+def _to_record(model: ScheduledTransferModel) -> ScheduledTransfer:
+    completed_at = model.completed_at
+    return ScheduledTransfer(
+        id=model.id,
+        from_account_id=model.from_account_id,
+        to_account_id=model.to_account_id,
+        amount_pence=model.amount_pence,
+        due_at=_as_utc(model.due_at),
+        status=ScheduledTransferStatus(model.status),
+        completed_at=None if completed_at is None else _as_utc(completed_at),
+        failure_reason=model.failure_reason,
+    )
+
+
+def _to_model(scheduled: ScheduledTransfer) -> ScheduledTransferModel:
+    return ScheduledTransferModel(
+        id=scheduled.id,
+        from_account_id=scheduled.from_account_id,
+        to_account_id=scheduled.to_account_id,
+        amount_pence=scheduled.amount_pence,
+        due_at=scheduled.due_at,
+        status=scheduled.status.value,
+        completed_at=scheduled.completed_at,
+        failure_reason=(
+            None if scheduled.failure_reason is None else scheduled.failure_reason[:255]
+        ),
+    )
+
+
+def _as_utc(value: datetime) -> datetime:
+    """
+    SQLite returns naive datetimes; stored values are always UTC.
+    """
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
@@ -13,17 +13,49 @@ It centralises all SQLAlchemy configuration and session handling so that:
 - Application code never manages transactions.
 - Delivery code only requests a session, without knowing how it is built.
 
+Reads and writes use separate engines and pools. Read-only requests take their
+connections from a read engine whose connections refuse writes. That engine points
+at READ_DATABASE_URL when a replica is configured, and otherwise at the primary.
+Read requests therefore never wait for a connection held by a writer, and never
+commit. A file-backed SQLite primary runs in WAL mode, so a second engine over
+the same file can read while the writer holds its lock. An in-memory SQLite
+database exists only inside its single shared connection, so there the read
+sessions share the primary engine.
+
+pysqlite only opens a transaction at the first INSERT or UPDATE, so by default the
+SELECTs before it see whatever is committed at that moment. Two transfers reading
+the same balance would then both write back their own result, and one update
+would be lost. File-backed SQLite engines therefore issue BEGIN themselves when a
+session starts, so every read is part of the transaction. The primary engine uses
+BEGIN IMMEDIATE: SQLite allows one writer at a time anyway, and taking the write
+lock up front makes writers queue on the driver's busy timeout. A deferred
+transaction would instead fail with "database is locked" as soon as it tried to
+write after a concurrent commit. Lock timeouts that still occur are re-run by the
+write retrier (see infra/db/conflicts).
+
+A request with a deadline (infra/concurrency/deadline) must not wait on the
+database beyond it. No session is opened once the deadline has passed. A
+connection checked out while one is set is bounded by the time that remains. On
+SQLite, that time becomes the busy timeout, and a progress handler interrupts
+any statement still running when the deadline passes. On PostgreSQL, it becomes
+the statement and lock timeouts. The connection's defaults are restored the next
+time it is checked out without a deadline.
+
 This module contains:
 - ORMBase: the declarative base class for all ORM models.
-- Engine configuration for the database.
+- Engine configuration for the database, and a write engine factory for other
+  databases (shards).
 - Session factory (SessionLocal).
 - Table creation bootstrap function.
 - Session provider with transaction scoping.
+- Read engine, ReadSessionLocal and a read-only session provider.
+- Read-only engine factory for jobs that must never write.
 
 Dependency constraints:
 - Must not import from the Domain layer (core/).
 - Must not import from the Application layer (features/*).
-- May depend only on infrastructure libraries and tooling (SQLAlchemy, DB drivers).
+- May depend only on infrastructure libraries and tooling (SQLAlchemy, DB drivers)
+  and on the request deadline (infra/concurrency/deadline).
 - Must not contain business rules or application policy.
 
 Stability:
@@ -39,11 +71,15 @@ Usage:
 
 from __future__ import annotations
 
+import os
 from collections.abc import Generator
+from typing import Any
 
-from sqlalchemy import create_engine
+from sqlalchemy import Connection, Engine, create_engine, event
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import ConnectionPoolEntry, StaticPool
+
+from infra.concurrency.deadline import check_deadline, current_deadline
 
 
 class ORMBase(DeclarativeBase):
@@ -52,16 +88,104 @@ class ORMBase(DeclarativeBase):
     """
 
 
-# In-memory SQLite
-DATABASE_URL = "sqlite+pysqlite:///:memory:"
+# In-memory SQLite unless a database is configured (e.g. for CLI jobs that must
+# share state with the API process).
+DATABASE_URL = os.environ.get("DATABASE_URL", "sqlite+pysqlite:///:memory:")
 
-engine = create_engine(
-    DATABASE_URL,
-    echo=False,
-    future=True,
-    connect_args={"check_same_thread": False},
-    poolclass=StaticPool,  # critical for in-memory DB persistence
-)
+# Replica (or second connection pool over the primary) serving read-only requests.
+READ_DATABASE_URL = os.environ.get("READ_DATABASE_URL", DATABASE_URL)
+
+
+def _is_in_memory(url: str) -> bool:
+    return url.startswith("sqlite") and ":memory:" in url
+
+
+def _engine_options(url: str) -> dict[str, Any]:
+    if not url.startswith("sqlite"):
+        return {}
+
+    options: dict[str, Any] = {"connect_args": {"check_same_thread": False}}
+    if _is_in_memory(url):
+        options["poolclass"] = StaticPool  # critical for in-memory DB persistence
+    return options
+
+
+# pysqlite's default busy timeout (its `timeout` argument, 5 seconds).
+_SQLITE_BUSY_TIMEOUT_MS = 5000
+# SQLite virtual machine instructions between deadline checks of a running statement.
+_SQLITE_PROGRESS_INTERVAL = 10_000
+
+
+def _bound_by_deadline(any_engine: Engine) -> None:
+    dialect = any_engine.dialect.name
+    if dialect not in ("sqlite", "postgresql"):
+        return
+
+    @event.listens_for(any_engine, "checkout")
+    def _apply_deadline(
+        dbapi_connection: Any, connection_record: ConnectionPoolEntry, _: Any
+    ) -> None:
+        deadline = current_deadline()
+        bound = connection_record.info.get("deadline_bound", False)
+        if deadline is None and not bound:
+            return
+
+        cursor = dbapi_connection.cursor()
+        try:
+            if deadline is None:
+                if dialect == "sqlite":
+                    cursor.execute(f"PRAGMA busy_timeout = {_SQLITE_BUSY_TIMEOUT_MS}")
+                    dbapi_connection.set_progress_handler(None, 0)
+                else:
+                    cursor.execute("RESET statement_timeout")
+                    cursor.execute("RESET lock_timeout")
+                connection_record.info["deadline_bound"] = False
+                return
+
+            remaining_ms = max(1, int(deadline.remaining() * 1000))
+            if dialect == "sqlite":
+                cursor.execute(f"PRAGMA busy_timeout = {remaining_ms}")
+                dbapi_connection.set_progress_handler(
+                    deadline.expired, _SQLITE_PROGRESS_INTERVAL
+                )
+            else:
+                cursor.execute(f"SET statement_timeout = {remaining_ms}")
+                cursor.execute(f"SET lock_timeout = {remaining_ms}")
+            connection_record.info["deadline_bound"] = True
+        finally:
+            cursor.close()
+
+
+def _begin_explicitly(sqlite_engine: Engine, *, statement: str = "BEGIN") -> None:
+    @event.listens_for(sqlite_engine, "connect")
+    def _disable_implicit_transactions(dbapi_connection: Any, _: Any) -> None:
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(sqlite_engine, "begin")
+    def _begin(connection: Connection) -> None:
+        connection.exec_driver_sql(statement)
+
+
+def create_write_engine(url: str) -> Engine:
+    """
+    Build an engine for writers: WAL mode and BEGIN IMMEDIATE on a SQLite file.
+    """
+    write_engine = create_engine(url, echo=False, future=True, **_engine_options(url))
+    _bound_by_deadline(write_engine)
+
+    if write_engine.dialect.name == "sqlite" and not _is_in_memory(url):
+
+        @event.listens_for(write_engine, "connect")
+        def _write_ahead_log(dbapi_connection: Any, _: Any) -> None:
+            # Persistent per database file: readers no longer block on the writer.
+            dbapi_connection.execute("PRAGMA journal_mode = WAL")
+
+        _begin_explicitly(write_engine, statement="BEGIN IMMEDIATE")
+
+    return write_engine
+
+
+engine = create_write_engine(DATABASE_URL)
 
 SessionLocal = sessionmaker(
     bind=engine,
@@ -71,6 +195,54 @@ SessionLocal = sessionmaker(
 )
 
 
+def create_read_only_engine(url: str) -> Engine:
+    """
+    Build a separate engine whose connections refuse writes.
+
+    SQLite enforces this per connection (`PRAGMA query_only`); other backends
+    start every transaction with `SET TRANSACTION READ ONLY`.
+    """
+    read_only_engine = create_engine(
+        url, echo=False, future=True, **_engine_options(url)
+    )
+    _bound_by_deadline(read_only_engine)
+
+    if read_only_engine.dialect.name == "sqlite":
+
+        @event.listens_for(read_only_engine, "connect")
+        def _query_only(dbapi_connection: Any, _: Any) -> None:
+            dbapi_connection.execute("PRAGMA query_only = ON")
+
+        if not _is_in_memory(url):
+            _begin_explicitly(read_only_engine)
+
+    else:
+
+        @event.listens_for(read_only_engine, "begin")
+        def _read_only_transaction(connection: Connection) -> None:
+            connection.exec_driver_sql("SET TRANSACTION READ ONLY")
+
+    return read_only_engine
+
+
+def create_read_engine(url: str, write_engine: Engine) -> Engine:
+    """
+    The read-only engine for `url`, or `write_engine` if `url` is an in-memory
+    SQLite database, which exists only inside the write engine's one connection.
+    """
+    return write_engine if _is_in_memory(url) else create_read_only_engine(url)
+
+
+read_engine = create_read_engine(READ_DATABASE_URL, engine)
+
+ReadSessionLocal = sessionmaker(
+    bind=read_engine,
+    autoflush=False,
+    autocommit=False,
+    future=True,
+)
+
+
 def create_all_db_tables() -> None:
     """
     Create all database tables.
@@ -83,6 +255,7 @@ def get_session() -> Generator[Session, None, None]:
     """
     FastAPI dependency: provides a transactional session per request.
     """
+    check_deadline("opening a session")
     session = SessionLocal()
     try:
         yield session
@@ -92,3 +265,18 @@ def get_session() -> Generator[Session, None, None]:
         raise
     finally:
         session.close()
+
+
+def get_read_session() -> Generator[Session, None, None]:
+    """
+    FastAPI dependency: provides a read-only session per request.
+
+    Never commits; whatever transaction the reads opened is rolled back on close.
+    """
+    check_deadline("opening a session")
+    session = ReadSessionLocal()
+    try:
+        yield session
+    finally:
+        session.rollback()
+        session.close()
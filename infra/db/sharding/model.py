@@ -0,0 +1,85 @@
+"""
+Ring: Infrastructure (Database / ORM Models)
+
+Responsibility:
+Defines the persistence models of the sharded backend: the shard map, each
+shard's slot ownership, and each shard's log of cross-shard commits.
+
+Design intent:
+This is a pure infrastructure concern.
+- shard_map lives in the directory database (DATABASE_URL). It is where every
+  process looks up which shard holds a slot, and it may briefly be stale in a
+  process that has not refreshed it.
+- shard_slots lives on every shard and is authoritative: a shard only serves
+  accounts of slots it owns. A write transaction reads the row of every slot it
+  touches, so a slot cannot move away while the transaction is open. A slot
+  being moved is "moving": readable, but every write to it is refused until the
+  move completes.
+- cross_shard_commits lives on the shard that debited a cross-shard transfer.
+  A row is written in the same local transaction as the debit and the transfer,
+  and records that the transfer committed. The row is deleted once the credit
+  on the other shard is known to have committed. Rows that remain are the
+  recovery log.
+- Every shard has the full schema, so these tables also exist, empty, wherever
+  they are not used.
+
+This module contains:
+- ShardMapModel: the ORM mapping for the shard_map table.
+- ShardSlotModel: the ORM mapping for the shard_slots table.
+- CrossShardCommitModel: the ORM mapping for the cross_shard_commits table.
+
+Dependency constraints:
+- Must not import from the application layer (features/*).
+- May depend on infrastructure tooling (SQLAlchemy, DB session, etc.).
+
+Stability:
+- Highly volatile.
+- Changes when the sharding protocol changes.
+
+Usage:
+- Used by infra/sharding.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import BigInteger, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from infra.db.session import ORMBase
+from infra.db.types import IdentifierType
+
+SLOT_OWNED = "owned"
+SLOT_MOVING = "moving"
+
+
+class ShardMapModel(ORMBase):
+    """
+    ORM model for the slot-to-shard assignment.
+    """
+
+    __tablename__ = "shard_map"
+
+    slot: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    shard: Mapped[int] = mapped_column(Integer, nullable=False)
+
+
+class ShardSlotModel(ORMBase):
+    """
+    ORM model for a slot owned by this shard.
+    """
+
+    __tablename__ = "shard_slots"
+
+    slot: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    state: Mapped[str] = mapped_column(String(8), nullable=False)
+
+
+class CrossShardCommitModel(ORMBase):
+    """
+    ORM model for a committed cross-shard transfer whose credit may be outstanding.
+    """
+
+    __tablename__ = "cross_shard_commits"
+
+    transfer_id: Mapped[str] = mapped_column(IdentifierType, primary_key=True)
+    committed_at_us: Mapped[int] = mapped_column(BigInteger, nullable=False)
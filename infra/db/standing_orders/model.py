@@ -0,0 +1,69 @@
+"""
+Ring: Infrastructure (Database / ORM Models)
+
+Responsibility:
+Defines the persistence model for standing orders.
+
+Design intent:
+This is a pure infrastructure concern.
+- Executors find due orders through the (next_run_at, id) index, in next-run
+  order. The lease columns are checked on the rows that index returns; they are
+  not indexed, because at any moment only the chunks being executed carry a live
+  lease.
+- `lease_token` identifies the executor holding the row until
+  `lease_expires_at`. Both are cleared when the executor commits the row's run.
+
+This module contains:
+- StandingOrderModel: the ORM mapping for the standing_orders table.
+
+Dependency constraints:
+- Must not import from the application layer (features/*).
+- May depend on infrastructure tooling (SQLAlchemy, DB session, etc.).
+
+Stability:
+- Highly volatile.
+- Changes when the database schema or persistence technology changes.
+
+Usage:
+- Used by infra/db/standing_orders/repo.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from infra.db.session import ORMBase
+from infra.db.types import IdentifierType, TimestampType
+
+
+class StandingOrderModel(ORMBase):
+    """
+    ORM model for standing orders.
+    """
+
+    __tablename__ = "standing_orders"
+    __table_args__ = (Index("ix_standing_orders_next_run_at_id", "next_run_at", "id"),)
+
+    id: Mapped[str] = mapped_column(IdentifierType, primary_key=True)
+
+    from_account_id: Mapped[str] = mapped_column(IdentifierType, nullable=False)
+    to_account_id: Mapped[str] = mapped_column(IdentifierType, nullable=False)
+    amount_pence: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    cadence: Mapped[str] = mapped_column(String(16), nullable=False)
+    anchor_at: Mapped[datetime] = mapped_column(TimestampType, nullable=False)
+    occurrence: Mapped[int] = mapped_column(Integer, nullable=False)
+    next_run_at: Mapped[datetime] = mapped_column(TimestampType, nullable=False)
+
+    runs: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    last_run_at: Mapped[datetime | None] = mapped_column(TimestampType, nullable=True)
+    last_outcome: Mapped[str | None] = mapped_column(String(16), nullable=True)
+    last_failure_reason: Mapped[str | None] = mapped_column(String(255), nullable=True)
+
+    lease_token: Mapped[str | None] = mapped_column(String(36), nullable=True)
+    lease_expires_at: Mapped[datetime | None] = mapped_column(
+        TimestampType, nullable=True
+    )
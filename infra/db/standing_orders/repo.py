@@ -0,0 +1,235 @@
+"""
+Ring: Infrastructure (Persistence / Repositories)
+
+Responsibility:
+Implements the standing order repository and chunk claims using SQLAlchemy.
+
+Design intent:
+- StandingOrderRepo works in the caller's unit of work. `complete_runs` first
+  locks the chunk's rows that are still leased under its token (SELECT ... FOR
+  UPDATE where supported, the write transaction's lock on SQLite), then updates
+  exactly those rows in one executemany. A takeover cannot slip in between the
+  check and the update.
+- StandingOrderClaims runs each claim in its own short write transaction, so the
+  lease is visible to every other executor before the chunk is worked on. Due
+  rows are read through the (next_run_at, id) index. FOR UPDATE SKIP LOCKED
+  makes concurrent claimers on PostgreSQL and MySQL pass over each other's rows
+  instead of queueing behind them; SQLite serialises claims on its write lock.
+  The lease is set with a conditional UPDATE and the claimed rows are read back
+  by token, so a backend without row locks still never gives a live lease to
+  two executors.
+
+This module contains:
+- StandingOrderRepo: a SQLAlchemy-backed StandingOrderRepoPort.
+- StandingOrderClaims: a SQLAlchemy-backed StandingOrderClaimsPort.
+
+Dependency constraints:
+- Must not be imported by application use case code directly (wired through DI).
+- Must depend on application ports (features/standing_orders/ports) to
+  implement them.
+- May depend on infrastructure tooling (SQLAlchemy, sessions, ORM models).
+
+Stability:
+- Highly volatile.
+- Changes when the standing order storage layout changes.
+
+Usage:
+- StandingOrderRepo is built per unit of work in root/di and root/cli.
+- StandingOrderClaims is built by root/cli/run_standing_orders.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import bindparam, or_, select, update
+from sqlalchemy.orm import Session, sessionmaker
+
+from core.utils.id import new_id
+from features.standing_orders.cadence import Cadence
+from features.standing_orders.ports import (
+    StandingOrderClaimsPort,
+    StandingOrderRepoPort,
+)
+from features.standing_orders.schemas import (
+    RunOutcome,
+    StandingOrder,
+    StandingOrderClaim,
+)
+from infra.db.standing_orders.model import StandingOrderModel
+from infra.db.types import is_storable_id
+from infra.db.unit_of_work import SqlUnitOfWork
+
+_TABLE_NAME = StandingOrderModel.__tablename__
+
+
+class StandingOrderRepo(StandingOrderRepoPort):
+    """
+    SQLAlchemy-backed StandingOrderRepo.
+    """
+
+    def __init__(self, *, uow: SqlUnitOfWork) -> None:
+        self._uow = uow
+
+    def get(self, standing_order_id: str) -> StandingOrder | None:
+        staged = self._uow.staged_row(_TABLE_NAME, standing_order_id)
+        if staged is not None:
+            return _to_order(staged)
+        if not is_storable_id(standing_order_id):
+            return None
+
+        stmt = select(StandingOrderModel).where(
+            StandingOrderModel.id == standing_order_id
+        )
+        model = self._uow.session.execute(stmt).scalar_one_or_none()
+        return None if model is None else _to_order(model)
+
+    def save(self, order: StandingOrder) -> None:
+        """
+        Inserted or updated when the unit of work commits.
+        """
+        self._uow.register_row(_to_model(order))
+
+    def complete_runs(self, *, token: str, orders: Sequence[StandingOrder]) -> int:
+        session = self._uow.session
+        held = set(
+            session.scalars(
+                select(StandingOrderModel.id)
+                .where(
+                    StandingOrderModel.id.in_([o.id for o in orders]),
+                    StandingOrderModel.lease_token == token,
+                )
+                .with_for_update()
+            )
+        )
+        params = [_run_params(o) for o in orders if o.id in held]
+        if params:
+            stmt = (
+                update(StandingOrderModel)
+                .where(StandingOrderModel.id == bindparam("b_id"))
+                .values(
+                    occurrence=bindparam("b_occurrence"),
+                    next_run_at=bindparam("b_next_run_at"),
+                    runs=bindparam("b_runs"),
+                    last_run_at=bindparam("b_last_run_at"),
+                    last_outcome=bindparam("b_last_outcome"),
+                    last_failure_reason=bindparam("b_last_failure_reason"),
+                    lease_token=None,
+                    lease_expires_at=None,
+                )
+            )
+            session.connection().execute(stmt, params)
+        return len(params)
+
+
+class StandingOrderClaims(StandingOrderClaimsPort):
+    """
+    SQLAlchemy-backed StandingOrderClaims.
+    """
+
+    def __init__(self, *, session_factory: sessionmaker[Session]) -> None:
+        self._session_factory = session_factory
+
+    def claim_due(
+        self, *, now: datetime, limit: int, lease_for: timedelta
+    ) -> StandingOrderClaim:
+        token = new_id()
+        expires_at = now + lease_for
+        claimable = (
+            StandingOrderModel.next_run_at <= now,
+            or_(
+                StandingOrderModel.lease_expires_at.is_(None),
+                StandingOrderModel.lease_expires_at < now,
+            ),
+        )
+
+        with self._session_factory() as session:
+            due = session.scalars(
+                select(StandingOrderModel.id)
+                .where(*claimable)
+                .order_by(StandingOrderModel.next_run_at, StandingOrderModel.id)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            ).all()
+
+            models: Sequence[StandingOrderModel] = []
+            if due:
+                session.execute(
+                    update(StandingOrderModel)
+                    .where(StandingOrderModel.id.in_(due), *claimable)
+                    .values(lease_token=token, lease_expires_at=expires_at)
+                    .execution_options(synchronize_session=False)
+                )
+                models = session.scalars(
+                    select(StandingOrderModel)
+                    .where(StandingOrderModel.lease_token == token)
+                    .order_by(StandingOrderModel.next_run_at, StandingOrderModel.id)
+                ).all()
+            orders = [_to_order(model) for model in models]
+            session.commit()
+
+        return StandingOrderClaim(
+            token=token, lease_expires_at=expires_at, orders=orders
+        )
+
+
+def _run_params(order: StandingOrder) -> dict[str, object]:
+    return {
+        "b_id": order.id,
+        "b_occurrence": order.occurrence,
+        "b_next_run_at": order.next_run_at,
+        "b_runs": order.runs,
+        "b_last_run_at": order.last_run_at,
+        "b_last_outcome": (
+            None if order.last_outcome is None else order.last_outcome.value
+        ),
+        "b_last_failure_reason": (
+            None
+            if order.last_failure_reason is None
+            else order.last_failure_reason[:255]
+        ),
+    }
+
+
+def _to_order(model: StandingOrderModel) -> StandingOrder:
+    last_run_at = model.last_run_at
+    return StandingOrder(
+        id=model.id,
+        from_account_id=model.from_account_id,
+        to_account_id=model.to_account_id,
+        amount_pence=model.amount_pence,
+        cadence=Cadence(model.cadence),
+        anchor_at=_as_utc(model.anchor_at),
+        occurrence=model.occurrence,
+        next_run_at=_as_utc(model.next_run_at),
+        runs=model.runs,
+        last_run_at=None if last_run_at is None else _as_utc(last_run_at),
+        last_outcome=(
+            None if model.last_outcome is None else RunOutcome(model.last_outcome)
+        ),
+        last_failure_reason=model.last_failure_reason,
+    )
+
+
+def _to_model(order: StandingOrder) -> StandingOrderModel:
+    return StandingOrderModel(
+        id=order.id,
+        from_account_id=order.from_account_id,
+        to_account_id=order.to_account_id,
+        amount_pence=order.amount_pence,
+        cadence=order.cadence.value,
+        anchor_at=order.anchor_at,
+        occurrence=order.occurrence,
+        next_run_at=order.next_run_at,
+        runs=order.runs,
+    )
+
+
+def _as_utc(value: datetime) -> datetime:
+    """
+    SQLite returns naive datetimes; stored values are always UTC.
+    """
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
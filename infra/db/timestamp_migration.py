@@ -0,0 +1,167 @@
+"""
+Ring: Infrastructure (Persistence / Schema Migrations)
+
+Responsibility:
+Converts the stored representation of every TimestampType column between native
+timestamps and integer epoch microseconds (see TIMESTAMP_STORAGE in
+infra/db/types).
+
+Design intent:
+The migration works on raw column values, independently of the storage mode the
+current process is configured with, so it can run before the application is
+switched over.
+- The columns are found from the models' column types, not listed by hand, so a
+  new TimestampType column on a migrated model is converted with the rest. A new
+  model with TimestampType columns must be added to _MODELS.
+- SQLite stores values with dynamic types. Rows are converted in place in batches
+  keyed by rowid, and each batch commits on its own. Only rows still in the
+  source representation are selected (NULLs never are), so an interrupted run
+  simply resumes.
+- PostgreSQL changes each column's type with a single `ALTER TABLE ... USING`,
+  one transaction per column; a re-run skips columns already converted.
+
+This module contains:
+- TIMESTAMP_COLUMNS: the (table, column) pairs stored with TimestampType.
+- migrate_timestamps: convert every timestamp column to the given storage mode.
+
+Dependency constraints:
+- Must not import from the Domain layer (core/).
+- Must not import from the Application layer (features/*).
+- May depend on infrastructure tooling (SQLAlchemy, column types, ORM models).
+
+Stability:
+- Highly volatile.
+- Changes when a model gains timestamp columns or supported backends change.
+
+Usage:
+- Called by the root/cli/migrate_timestamps command.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import Connection, Engine, text
+
+from infra.db.scheduled_transfers.model import ScheduledTransferModel
+from infra.db.standing_orders.model import StandingOrderModel
+from infra.db.transfers.model import TransferModel
+from infra.db.types import TimestampType, from_epoch_micros, to_epoch_micros
+
+MIGRATION_BATCH_SIZE = 5_000
+
+_MODELS = (TransferModel, ScheduledTransferModel, StandingOrderModel)
+
+TIMESTAMP_COLUMNS = tuple(
+    (model.__tablename__, column.name)
+    for model in _MODELS
+    for column in model.__table__.columns
+    if isinstance(column.type, TimestampType)
+)
+
+# SQLAlchemy's storage format for SQLite DATETIME columns (naive UTC).
+_SQLITE_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+
+_POSTGRES_ALTER = {
+    "epoch_us": (
+        "ALTER TABLE {table} ALTER COLUMN {column} TYPE BIGINT "
+        "USING (EXTRACT(EPOCH FROM {column}) * 1000000)::BIGINT"
+    ),
+    "datetime": (
+        "ALTER TABLE {table} ALTER COLUMN {column} TYPE TIMESTAMP WITH TIME ZONE "
+        "USING to_timestamp({column} / 1000000.0)"
+    ),
+}
+
+# information_schema.columns.data_type of a column already in each mode.
+_POSTGRES_DATA_TYPE = {"epoch_us": "bigint", "datetime": "timestamp with time zone"}
+
+
+def migrate_timestamps(
+    engine: Engine, *, target: str, batch_size: int = MIGRATION_BATCH_SIZE
+) -> dict[str, int]:
+    """
+    Convert every stored TimestampType value to `target` ("epoch_us" or
+    "datetime"). Returns the number of rows converted per "table.column".
+    """
+    if target not in _POSTGRES_ALTER:
+        raise ValueError(f"Unknown timestamp storage: {target!r}")
+
+    if engine.dialect.name == "sqlite":
+        migrate = _migrate_sqlite
+    elif engine.dialect.name == "postgresql":
+        migrate = _migrate_postgres
+    else:
+        raise RuntimeError(
+            f"Timestamp migration is not supported on {engine.dialect.name}"
+        )
+
+    return {
+        f"{table}.{column}": migrate(
+            engine, table=table, column=column, target=target, batch_size=batch_size
+        )
+        for table, column in TIMESTAMP_COLUMNS
+    }
+
+
+def _migrate_postgres(
+    engine: Engine, *, table: str, column: str, target: str, batch_size: int
+) -> int:
+    with engine.begin() as connection:
+        if (
+            _postgres_data_type(connection, table, column)
+            == _POSTGRES_DATA_TYPE[target]
+        ):
+            return 0
+        alter = _POSTGRES_ALTER[target].format(table=table, column=column)
+        return connection.execute(text(alter)).rowcount or 0
+
+
+def _postgres_data_type(connection: Connection, table: str, column: str) -> str | None:
+    return connection.execute(
+        text(
+            "SELECT data_type FROM information_schema.columns "
+            "WHERE table_name = :table AND column_name = :column"
+        ),
+        {"table": table, "column": column},
+    ).scalar_one_or_none()
+
+
+def _migrate_sqlite(
+    engine: Engine, *, table: str, column: str, target: str, batch_size: int
+) -> int:
+    source_type = "text" if target == "epoch_us" else "integer"
+    select_batch = text(
+        f"SELECT rowid, {column} FROM {table} "
+        f"WHERE rowid > :after AND typeof({column}) = :source_type "
+        "ORDER BY rowid LIMIT :limit"
+    )
+    update_row = text(f"UPDATE {table} SET {column} = :value WHERE rowid = :row_id")
+
+    converted = 0
+    after = 0
+    while True:
+        with engine.begin() as connection:
+            rows = connection.execute(
+                select_batch,
+                {"after": after, "source_type": source_type, "limit": batch_size},
+            ).all()
+            if not rows:
+                return converted
+
+            connection.execute(
+                update_row,
+                [
+                    {"row_id": row_id, "value": _convert(value, target=target)}
+                    for row_id, value in rows
+                ],
+            )
+
+        converted += len(rows)
+        after = rows[-1][0]
+
+
+def _convert(value: str | int, *, target: str) -> str | int:
+    if target == "epoch_us":
+        return to_epoch_micros(datetime.fromisoformat(str(value)))
+    return from_epoch_micros(int(value)).strftime(_SQLITE_DATETIME_FORMAT)
@@ -0,0 +1,136 @@
+"""
+Ring: Infrastructure (Persistence / Repositories)
+
+Responsibility:
+Implements the Transfer repository with SQLAlchemy Core: the same behaviour as
+TransferRepo, without ORM instances.
+
+Design intent:
+- A stream's statement depends only on which filters are present. There are
+  sixteen combinations. Each is built once, with bind parameters, on first
+  use, and reused afterwards, so its compiled form stays in the engine's
+  compiled cache.
+- Rows are mapped straight to entities (infra/db/transfers/mapper.from_row) while
+  streaming in STREAM_BATCH_SIZE batches, with no identity map to maintain.
+- Saves are registered with the unit of work, exactly as in TransferRepo.
+  CoreSqlUnitOfWork inserts them as plain rows in one executemany.
+
+This module contains:
+- CoreTransferRepo: a SQLAlchemy Core implementation of TransferRepoPort.
+
+Dependency constraints:
+- Must not be imported by application use case code directly (wired through DI).
+- Must depend on application ports (features/transfers/ports) to implement them.
+- May depend on the Domain layer (core/) for entities and value types.
+- May depend on infrastructure tooling (SQLAlchemy, sessions, table metadata).
+
+Stability:
+- Highly volatile.
+- Changes with the transfers table and with TransferRepo, whose behaviour it must
+  match.
+
+Usage:
+- Wired in root/di instead of TransferRepo when SQL_REPOSITORIES=core.
+- Compared with TransferRepo by root/cli/benchmark_repos.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import datetime
+from functools import cache
+from typing import Any
+
+from sqlalchemy import Select, and_, bindparam, or_, select
+
+from core.entities.transfer import Transfer
+from core.values.custom_types import AccountId
+from features.transfers.cursors import TransferCursor
+from features.transfers.ports import TransferRepoPort
+from infra.db.transfers.mapper import from_row
+from infra.db.transfers.model import TransferModel
+from infra.db.transfers.repo import STREAM_BATCH_SIZE
+from infra.db.types import is_storable_id
+from infra.db.unit_of_work import SqlUnitOfWork
+
+_transfers = TransferModel.__table__
+
+
+class CoreTransferRepo(TransferRepoPort):
+    def __init__(self, *, uow: SqlUnitOfWork) -> None:
+        self._uow = uow
+
+    def save(self, transfer: Transfer) -> None:
+        self._uow.register_transfer(transfer)
+
+    def stream(
+        self,
+        *,
+        account_id: AccountId | None,
+        since: datetime | None,
+        until: datetime | None,
+        after: TransferCursor | None,
+    ) -> Iterator[Transfer]:
+        if account_id is not None and not is_storable_id(account_id):
+            return
+        if after is not None and not is_storable_id(after.transfer_id):
+            return
+
+        params: dict[str, Any] = {}
+        if account_id is not None:
+            params["account_id"] = str(account_id)
+        if since is not None:
+            params["since"] = since
+        if until is not None:
+            params["until"] = until
+        if after is not None:
+            params["after_created_at"] = after.created_at
+            params["after_id"] = str(after.transfer_id)
+
+        stmt = _stream_statement(
+            account_id is not None,
+            since is not None,
+            until is not None,
+            after is not None,
+        )
+        result = self._uow.session.execute(
+            stmt, params, execution_options={"yield_per": STREAM_BATCH_SIZE}
+        )
+        try:
+            for row in result:
+                yield from_row(row)
+        finally:
+            result.close()
+
+
+@cache
+def _stream_statement(
+    by_account: bool, since: bool, until: bool, after: bool
+) -> Select[Any]:
+    c = _transfers.c
+    stmt = select(
+        c.id, c.from_account_id, c.to_account_id, c.amount_pence, c.created_at
+    ).order_by(c.created_at, c.id)
+
+    if by_account:
+        stmt = stmt.where(
+            or_(
+                c.from_account_id == bindparam("account_id"),
+                c.to_account_id == bindparam("account_id"),
+            )
+        )
+    if since:
+        stmt = stmt.where(c.created_at >= bindparam("since"))
+    if until:
+        stmt = stmt.where(c.created_at < bindparam("until"))
+    if after:
+        stmt = stmt.where(
+            or_(
+                c.created_at > bindparam("after_created_at"),
+                and_(
+                    c.created_at == bindparam("after_created_at"),
+                    c.id > bindparam("after_id"),
+                ),
+            )
+        )
+    return stmt
@@ -10,10 +10,15 @@ Design intent:
 This is a classic data mapper.
 It isolates all impedance between SQLAlchemy models and domain entities so that
 the domain remains completely free of ORM concerns and persistence structure.
+Storage encodings (binary ids, epoch-microsecond timestamps) are applied by the
+column types in infra/db/types, so this mapper always sees ids as strings and
+timestamps as datetimes, whatever the configured storage mode.
 
 This module contains:
 - to_entity: conversion from TransferModel (ORM) to Transfer (domain entity).
+- from_row: conversion from a Core row, in column order, to Transfer.
 - to_model: conversion from Transfer (domain entity) to TransferModel (ORM).
+- to_row: conversion from Transfer (domain entity) to a column mapping for bulk inserts.
 
 Dependency constraints:
 - Must not import from the application layer (features/*).
@@ -32,6 +37,10 @@ Usage:
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+from datetime import datetime, timezone
+from typing import Any
+
 from core.entities.transfer import Transfer
 from core.values.custom_types import AccountId, TransferId
 from core.values.objects import Money
@@ -47,7 +56,21 @@ def to_entity(model: TransferModel) -> Transfer:
         from_account_id=AccountId(model.from_account_id),
         to_account_id=AccountId(model.to_account_id),
         amount=Money(model.amount_pence),
-        created_at=model.created_at,
+        created_at=_as_utc(model.created_at),
+    )
+
+
+def from_row(row: Sequence[Any]) -> Transfer:
+    """
+    Convert an (id, from_account_id, to_account_id, amount_pence, created_at) row
+    selected with Core into a domain Transfer entity.
+    """
+    return Transfer(
+        id=TransferId(row[0]),
+        from_account_id=AccountId(row[1]),
+        to_account_id=AccountId(row[2]),
+        amount=Money(row[3]),
+        created_at=_as_utc(row[4]),
     )
 
 
@@ -62,3 +85,24 @@ def to_model(entity: Transfer) -> TransferModel:
         amount_pence=entity.amount.pence,
         created_at=entity.created_at,
     )
+
+
+def to_row(entity: Transfer) -> dict[str, Any]:
+    """
+    Convert a domain Transfer entity into a column mapping for bulk inserts.
+    """
+    return {
+        "id": str(entity.id),
+        "from_account_id": str(entity.from_account_id),
+        "to_account_id": str(entity.to_account_id),
+        "amount_pence": entity.amount.pence,
+        "created_at": entity.created_at,
+    }
+
+
+def _as_utc(value: datetime) -> datetime:
+    """
+    Some backends (e.g. SQLite) drop the offset on native timestamps; stored values
+    are UTC.
+    """
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
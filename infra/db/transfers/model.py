@@ -34,10 +34,11 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import DateTime, Integer, String
+from sqlalchemy import Index, Integer
 from sqlalchemy.orm import Mapped, mapped_column
 
 from infra.db.session import ORMBase
+from infra.db.types import IdentifierType, TimestampType
 
 
 class TransferModel(ORMBase):
@@ -46,13 +47,17 @@ class TransferModel(ORMBase):
     """
 
     __tablename__ = "transfers"
+    __table_args__ = (
+        # Support keyset scans in (created_at, id) order, globally and per account.
+        Index("ix_transfers_created_at_id", "created_at", "id"),
+        Index("ix_transfers_from_account_created_at", "from_account_id", "created_at"),
+        Index("ix_transfers_to_account_created_at", "to_account_id", "created_at"),
+    )
 
-    id: Mapped[str] = mapped_column(String, primary_key=True)
+    id: Mapped[str] = mapped_column(IdentifierType, primary_key=True)
 
-    from_account_id: Mapped[str] = mapped_column(String, nullable=False)
-    to_account_id: Mapped[str] = mapped_column(String, nullable=False)
+    from_account_id: Mapped[str] = mapped_column(IdentifierType, nullable=False)
+    to_account_id: Mapped[str] = mapped_column(IdentifierType, nullable=False)
 
     amount_pence: Mapped[int] = mapped_column(Integer, nullable=False)
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), nullable=False
-    )
+    created_at: Mapped[datetime] = mapped_column(TimestampType, nullable=False)
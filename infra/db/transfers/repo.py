@@ -33,11 +33,23 @@ Usage:
 
 from __future__ import annotations
 
-from sqlalchemy.orm import Session
+from collections.abc import Iterator
+from datetime import datetime
+
+from sqlalchemy import and_, or_, select
 
 from core.entities.transfer import Transfer
+from core.values.custom_types import AccountId
+from features.transfers.cursors import TransferCursor
 from features.transfers.ports import TransferRepoPort
-from infra.db.transfers.mapper import to_model
+from infra.db.transfers.mapper import to_entity
+from infra.db.transfers.model import TransferModel
+from infra.db.types import is_storable_id
+from infra.db.unit_of_work import SqlUnitOfWork
+
+# Rows fetched per round trip while streaming; bounds memory independently of
+# the size of the result set.
+STREAM_BATCH_SIZE = 1000
 
 
 class TransferRepo(TransferRepoPort):
@@ -45,10 +57,68 @@ class TransferRepo(TransferRepoPort):
     SQLAlchemy-backed TransferRepo.
 
     Persistence adapter for Transfer facts.
+    Saves are registered with the unit of work and inserted when the use case
+    commits it, together with their state digest and change feed entries.
     """
 
-    def __init__(self, *, session: Session) -> None:
-        self._session = session
+    def __init__(self, *, uow: SqlUnitOfWork) -> None:
+        self._uow = uow
 
     def save(self, transfer: Transfer) -> None:
-        self._session.add(to_model(transfer))
+        self._uow.register_transfer(transfer)
+
+    def stream(
+        self,
+        *,
+        account_id: AccountId | None,
+        since: datetime | None,
+        until: datetime | None,
+        after: TransferCursor | None,
+    ) -> Iterator[Transfer]:
+        """
+        Keyset-ordered scan using a server-side cursor.
+
+        `yield_per` fetches STREAM_BATCH_SIZE rows at a time and enables
+        `stream_results`, so drivers that support it keep the result set on the
+        server. ORM instances are only weakly referenced by the identity map and
+        are released once mapped to domain entities.
+        """
+        if account_id is not None and not is_storable_id(account_id):
+            return
+        if after is not None and not is_storable_id(after.transfer_id):
+            return
+
+        stmt = select(TransferModel).order_by(
+            TransferModel.created_at, TransferModel.id
+        )
+
+        if account_id is not None:
+            stmt = stmt.where(
+                or_(
+                    TransferModel.from_account_id == str(account_id),
+                    TransferModel.to_account_id == str(account_id),
+                )
+            )
+        if since is not None:
+            stmt = stmt.where(TransferModel.created_at >= since)
+        if until is not None:
+            stmt = stmt.where(TransferModel.created_at < until)
+        if after is not None:
+            stmt = stmt.where(
+                or_(
+                    TransferModel.created_at > after.created_at,
+                    and_(
+                        TransferModel.created_at == after.created_at,
+                        TransferModel.id > str(after.transfer_id),
+                    ),
+                )
+            )
+
+        result = self._uow.session.scalars(
+            stmt.execution_options(yield_per=STREAM_BATCH_SIZE)
+        )
+        try:
+            for model in result:
+                yield to_entity(model)
+        finally:
+            result.close()
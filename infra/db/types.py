@@ -0,0 +1,143 @@
+"""
+Ring: Infrastructure (Database / Column Types)
+
+Responsibility:
+Defines custom column types shared by the ORM models.
+
+Design intent:
+Identifiers are strings everywhere outside infrastructure (AccountId, TransferId).
+How they are stored is a storage decision, selected by the ID_STORAGE environment
+variable:
+- "string" (default): the canonical text form, as before.
+- "binary": the 16 raw bytes of the UUID. Keys are less than half the size and
+  still sort in the same order as their text form, so range scans and keyset
+  cursors keep working.
+Timestamps are timezone-aware UTC datetimes outside infrastructure. TIMESTAMP_STORAGE
+selects how they are stored:
+- "datetime" (default): the backend's native timestamp type, as before.
+- "epoch_us": 64-bit integer microseconds since the Unix epoch. Range scans and
+  sorts on time become integer comparisons, and SQLite rows no longer carry a
+  26-character ISO string per timestamp.
+The conversion lives in the column type, not in each query. Literal comparisons,
+range filters and bulk inserts are then converted exactly like ORM loads.
+
+This module contains:
+- ID_STORAGE: the configured identifier storage mode.
+- IdentifierType: the identifier column type.
+- is_storable_id: whether a value can be bound as an identifier.
+- TIMESTAMP_STORAGE: the configured timestamp storage mode.
+- TimestampType: the UTC timestamp column type.
+- to_epoch_micros / from_epoch_micros: the epoch_us conversions.
+
+Dependency constraints:
+- Must not import from the Domain layer (core/).
+- Must not import from the Application layer (features/*).
+- May depend only on infrastructure libraries and tooling (SQLAlchemy).
+
+Stability:
+- Highly volatile.
+- Changing ID_STORAGE for an existing database requires migrating its tables.
+- Changing TIMESTAMP_STORAGE requires `python -m root.cli.migrate_timestamps`.
+
+Usage:
+- Used by ORM models for primary and foreign identifier columns.
+- Used by repositories to reject lookups of values that cannot be ids.
+"""
+
+from __future__ import annotations
+
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from sqlalchemy import BigInteger, DateTime, Dialect, LargeBinary, String, TypeDecorator
+from sqlalchemy.types import TypeEngine
+
+ID_STORAGE = os.environ.get("ID_STORAGE", "string")
+if ID_STORAGE not in ("string", "binary"):
+    raise RuntimeError(f"ID_STORAGE must be 'string' or 'binary', not {ID_STORAGE!r}")
+
+TIMESTAMP_STORAGE = os.environ.get("TIMESTAMP_STORAGE", "datetime")
+if TIMESTAMP_STORAGE not in ("datetime", "epoch_us"):
+    raise RuntimeError(
+        f"TIMESTAMP_STORAGE must be 'datetime' or 'epoch_us', not {TIMESTAMP_STORAGE!r}"
+    )
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def is_storable_id(value: str) -> bool:
+    """
+    Binary storage only accepts UUIDs; string storage accepts any value.
+    """
+    if ID_STORAGE == "string":
+        return True
+    try:
+        uuid.UUID(value)
+    except ValueError:
+        return False
+    return True
+
+
+class IdentifierType(TypeDecorator[str]):
+    """
+    String identifier stored as text or as 16 UUID bytes, depending on ID_STORAGE.
+    """
+
+    impl = String
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect: Dialect) -> TypeEngine[Any]:
+        if ID_STORAGE == "binary":
+            return dialect.type_descriptor(LargeBinary(16))
+        return dialect.type_descriptor(String())
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> Any:
+        if value is None or ID_STORAGE == "string":
+            return value
+        return uuid.UUID(str(value)).bytes
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> str | None:
+        if value is None or ID_STORAGE == "string":
+            return value
+        return str(uuid.UUID(bytes=bytes(value)))
+
+
+def to_epoch_micros(value: datetime) -> int:
+    """
+    Exact integer microseconds since the epoch; naive values are taken as UTC.
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def from_epoch_micros(value: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=value)
+
+
+class TimestampType(TypeDecorator[datetime]):
+    """
+    UTC timestamp stored natively or as epoch microseconds, depending on
+    TIMESTAMP_STORAGE.
+    """
+
+    impl = DateTime
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect: Dialect) -> TypeEngine[Any]:
+        if TIMESTAMP_STORAGE == "epoch_us":
+            return dialect.type_descriptor(BigInteger())
+        return dialect.type_descriptor(DateTime(timezone=True))
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> Any:
+        if value is None or TIMESTAMP_STORAGE == "datetime":
+            return value
+        return to_epoch_micros(value)
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> datetime | None:
+        if value is None or TIMESTAMP_STORAGE == "datetime":
+            return value
+        return from_epoch_micros(int(value))
@@ -0,0 +1,258 @@
+"""
+Ring: Infrastructure (Persistence / Unit of Work)
+
+Responsibility:
+Implements the UnitOfWork port over a SQLAlchemy session.
+Repositories read through the session and register their writes here; `commit`
+turns the registered changes into statements, in a fixed order, and commits.
+
+Design intent:
+- Writes are staged in memory, not added to the session as they happen. The order
+  in which a use case happened to call `save` therefore never reaches the
+  database.
+- The flush always runs in the same order, so every write transaction takes its
+  row locks in the same order and two transfers cannot deadlock on each other:
+  0. other registered rows (scheduled transfers, standing orders), sorted by
+     table and id, merged through the ORM;
+  1. accounts, sorted by id: inserts and updates, batched by the ORM;
+  2. transfer inserts, batched;
+  3. state digest buckets (infra/db/digests), sorted by bucket;
+  4. change feed entries (infra/db/changes).
+- An account or row registered twice is written once, with its last state.
+- Reads of a registered account or row return the staged state, as in the
+  in-memory ledger's LedgerSession.
+- `prepare` writes the staged changes into the open transaction without
+  committing it. The sharded unit of work (infra/sharding) uses it to hold one
+  shard's changes while it commits another.
+- With a shared balance table (infra/shm), the commit is wrapped in its
+  publishing protocol: the written accounts are pending while the commit runs,
+  and their new balances and versions are published once it has succeeded.
+- CoreSqlUnitOfWork flushes the same changes in the same order with prebuilt
+  Core statements: account updates and inserts, and transfer inserts, are each
+  one executemany of plain rows. No ORM instance is built, loaded, or tracked.
+
+This module contains:
+- SqlUnitOfWork: a SQLAlchemy-backed implementation of UnitOfWork.
+- CoreSqlUnitOfWork: SqlUnitOfWork whose flush bypasses the ORM.
+
+Dependency constraints:
+- Must not be imported by application use case code directly (wired through DI).
+- Must depend on the shared UnitOfWork port (features/_shared/ports).
+- May depend on the Domain layer (core/) for entities.
+- May depend on infrastructure tooling (SQLAlchemy, sessions, ORM models).
+
+Stability:
+- Volatile.
+- Changes when the write path or lock ordering changes.
+
+Usage:
+- Created per write attempt in root/di/transactions and passed to the SQL
+  repositories and to the use case, which commits it. CoreSqlUnitOfWork is used
+  with the Core repositories when SQL_REPOSITORIES=core.
+- Wrapped around the read-only session for read repositories; never committed there.
+"""
+
+from __future__ import annotations
+
+from typing import Any, cast
+
+from sqlalchemy import Table, bindparam, insert, select, update
+from sqlalchemy.orm import Session
+
+from core.entities.account import Account
+from core.entities.transfer import Transfer
+from features._shared.ports import UnitOfWork
+from infra.db.accounts import mapper as account_mapper
+from infra.db.accounts.model import AccountModel
+from infra.db.changes import feed
+from infra.db.digests import tracking
+from infra.db.transfers import mapper as transfer_mapper
+from infra.db.transfers.model import TransferModel
+from infra.shm.balance_table import SharedBalanceTable
+
+_accounts = cast(Table, AccountModel.__table__)
+_transfers = cast(Table, TransferModel.__table__)
+
+_EXISTING_ACCOUNTS = select(
+    _accounts.c.id, _accounts.c.balance_pence, _accounts.c.version
+).where(_accounts.c.id.in_(bindparam("ids", expanding=True)))
+_INSERT_ACCOUNT = insert(_accounts)
+_UPDATE_ACCOUNT = (
+    update(_accounts)
+    .where(_accounts.c.id == bindparam("b_id"))
+    .values(balance_pence=bindparam("b_balance_pence"), version=bindparam("b_version"))
+)
+_INSERT_TRANSFER = insert(_transfers)
+
+
+class SqlUnitOfWork(UnitOfWork):
+    def __init__(
+        self, *, session: Session, balances: SharedBalanceTable | None = None
+    ) -> None:
+        self.session = session
+        self._balances = balances
+        self._accounts: dict[str, Account] = {}
+        self._transfers: list[Transfer] = []
+        self._rows: dict[tuple[str, str], Any] = {}
+
+    def staged_account(self, account_id: str) -> Account | None:
+        return self._accounts.get(account_id)
+
+    def register_account(self, account: Account) -> None:
+        self._accounts[str(account.id)] = account
+
+    def register_transfer(self, transfer: Transfer) -> None:
+        self._transfers.append(transfer)
+
+    def staged_row(self, table: str, row_id: str) -> Any | None:
+        return self._rows.get((table, row_id))
+
+    def register_row(self, row: Any) -> None:
+        """
+        An ORM instance with an `id` primary key, inserted or updated at commit.
+        """
+        self._rows[(row.__tablename__, str(row.id))] = row
+
+    def has_changes(self) -> bool:
+        return bool(self._accounts or self._transfers or self._rows)
+
+    def prepare(self) -> list[tuple[str, int, int]]:
+        """
+        Returns (account_id, balance_pence, version) of every account written.
+        """
+        try:
+            self._flush_rows()
+            return self._flush()
+        finally:
+            self._clear()
+
+    def commit(self) -> None:
+        written = self.prepare()
+        if self._balances is None:
+            self.session.commit()
+            return
+        with self._balances.publishing(written):
+            self.session.commit()
+
+    def rollback(self) -> None:
+        self._clear()
+        self.session.rollback()
+
+    def _flush(self) -> list[tuple[str, int, int]]:
+        session = self.session
+        account_ids = sorted(self._accounts)
+        existing: dict[str, AccountModel] = {}
+        if account_ids:
+            stmt = select(AccountModel).where(AccountModel.id.in_(account_ids))
+            existing = {model.id: model for model in session.scalars(stmt)}
+
+        account_changes: list[tuple[Account | None, Account]] = []
+        created: list[Account] = []
+        written: list[tuple[str, int, int]] = []
+        for account_id in account_ids:
+            account = self._accounts[account_id]
+            model = existing.get(account_id)
+            if model is None:
+                session.add(account_mapper.to_model(account))
+                account_changes.append((None, account))
+                created.append(account)
+                written.append((account_id, account.balance.pence, 1))
+                continue
+            account_changes.append((account_mapper.to_entity(model), account))
+            model.balance_pence = account.balance.pence
+            model.version += 1
+            written.append((account_id, account.balance.pence, model.version))
+        session.flush()
+
+        session.add_all(transfer_mapper.to_model(t) for t in self._transfers)
+        session.flush()
+
+        tracking.record_accounts(session, account_changes)
+        tracking.record_transfers(session, self._transfers)
+        session.flush()
+
+        feed.append_bulk(session, accounts=created, transfers=self._transfers)
+        return written
+
+    def _flush_rows(self) -> None:
+        for key in sorted(self._rows):
+            self.session.merge(self._rows[key])
+        self.session.flush()
+
+    def _clear(self) -> None:
+        self._accounts.clear()
+        self._transfers.clear()
+        self._rows.clear()
+
+
+class CoreSqlUnitOfWork(SqlUnitOfWork):
+    def _flush(self) -> list[tuple[str, int, int]]:
+        session = self.session
+        account_changes, created, written = self._write_accounts()
+
+        if self._transfers:
+            session.execute(
+                _INSERT_TRANSFER, [transfer_mapper.to_row(t) for t in self._transfers]
+            )
+
+        tracking.record_accounts(session, account_changes)
+        tracking.record_transfers(session, self._transfers)
+        session.flush()
+
+        feed.append_bulk(session, accounts=created, transfers=self._transfers)
+        return written
+
+    def _write_accounts(
+        self,
+    ) -> tuple[
+        list[tuple[Account | None, Account]], list[Account], list[tuple[str, int, int]]
+    ]:
+        """
+        Insert new accounts and update existing ones, in id order. Returns the
+        (before, after) pairs for tracking, the created accounts and the
+        (id, balance, version) written for each.
+        """
+        account_ids = sorted(self._accounts)
+        existing = self._stored_accounts(account_ids)
+
+        account_changes: list[tuple[Account | None, Account]] = []
+        created: list[Account] = []
+        written: list[tuple[str, int, int]] = []
+        updates: list[dict[str, object]] = []
+        for account_id in account_ids:
+            account = self._accounts[account_id]
+            stored = existing.get(account_id)
+            if stored is None:
+                account_changes.append((None, account))
+                created.append(account)
+                written.append((account_id, account.balance.pence, 1))
+                continue
+            balance_pence, version = stored
+            account_changes.append(
+                (account_mapper.from_row((account_id, balance_pence)), account)
+            )
+            updates.append(
+                {
+                    "b_id": account_id,
+                    "b_balance_pence": account.balance.pence,
+                    "b_version": version + 1,
+                }
+            )
+            written.append((account_id, account.balance.pence, version + 1))
+        if updates:
+            self.session.execute(_UPDATE_ACCOUNT, updates)
+        if created:
+            self.session.execute(
+                _INSERT_ACCOUNT, [account_mapper.to_row(a) for a in created]
+            )
+        return account_changes, created, written
+
+    def _stored_accounts(self, account_ids: list[str]) -> dict[str, tuple[int, int]]:
+        if not account_ids:
+            return {}
+        return {
+            account_id: (balance_pence, version)
+            for account_id, balance_pence, version in self.session.execute(
+                _EXISTING_ACCOUNTS, {"ids": account_ids}
+            )
+        }
@@ -0,0 +1,133 @@
+"""
+Ring: Infrastructure (Database / Startup)
+
+Responsibility:
+Prepares SQL engines for traffic before a worker reports itself ready. It opens
+pool connections, compiles the write path's statements and finds the accounts
+that recent transfers touched most. It also reports the state of each pool.
+
+Design intent:
+- Connections are checked out together, so the pool really opens that many of
+  them, and are then all returned to it. Checking one out and returning it
+  repeatedly would open only one.
+- SQLAlchemy compiles a statement the first time an engine executes it and
+  caches the result per engine. The write path is therefore compiled by running
+  it: two accounts are created and then updated by a transfer through a real unit
+  of work, so account inserts and updates, the transfer insert, digest tracking
+  and the change feed all execute once. The transaction is always rolled back
+  and never published.
+- The hottest accounts are counted over the most recent transfers only, so the
+  query reads a bounded slice of the (created_at, id) index however large the
+  table is.
+
+This module contains:
+- open_connections: opens up to `count` pooled connections on an engine.
+- pool_status: the occupancy of an engine's connection pool.
+- rehearse_write: runs the write path once in a rolled-back transaction.
+- hottest_account_ids: the accounts most involved in recent transfers.
+
+Dependency constraints:
+- Must not be imported by application use case code.
+- May depend on the Domain layer (core/) for entities and value types.
+- May depend on infrastructure tooling (SQLAlchemy, units of work, ORM models).
+
+Stability:
+- Volatile.
+- Changes with the write path and the transfers table.
+
+Usage:
+- Called by root/warmup_setup while a worker warms up, and by root/health for
+  pool status.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import Engine, select
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import QueuePool
+
+from core.entities.account import Account
+from core.entities.transfer import Transfer
+from core.utils.id import new_id
+from core.values.custom_types import AccountId, TransferId
+from core.values.objects import Money
+from infra.db.transfers.model import TransferModel
+from infra.db.unit_of_work import SqlUnitOfWork
+
+
+def open_connections(engine: Engine, count: int | None = None) -> int:
+    """
+    Returns how many connections were open at once. `count` defaults to the
+    pool's size.
+    """
+    pool = engine.pool
+    if count is None:
+        count = pool.size() if isinstance(pool, QueuePool) else 1
+
+    connections = []
+    try:
+        for _ in range(count):
+            connections.append(engine.connect())
+        return len(connections)
+    finally:
+        for connection in connections:
+            connection.close()
+
+
+def pool_status(engine: Engine) -> dict[str, Any]:
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return {"pool": type(pool).__name__}
+    return {
+        "pool": type(pool).__name__,
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+    }
+
+
+def rehearse_write(uow: SqlUnitOfWork) -> None:
+    """
+    Flush a create and then a transfer through `uow`, and roll both back.
+    """
+    source = Account(id=AccountId(new_id()), balance=Money(100))
+    target = Account(id=AccountId(new_id()), balance=Money(100))
+    transfer = Transfer(
+        id=TransferId(new_id()),
+        from_account_id=source.id,
+        to_account_id=target.id,
+        amount=Money(1),
+        created_at=datetime.now(timezone.utc),
+    )
+    try:
+        uow.register_account(source)
+        uow.register_account(target)
+        uow.prepare()
+
+        uow.register_account(source.debit(transfer.amount))
+        uow.register_account(target.credit(transfer.amount))
+        uow.register_transfer(transfer)
+        uow.prepare()
+    finally:
+        uow.rollback()
+
+
+def hottest_account_ids(session: Session, *, limit: int, window: int) -> list[str]:
+    """
+    Up to `limit` account ids, most frequent first, among the last `window` transfers.
+    """
+    stmt = (
+        select(TransferModel.from_account_id, TransferModel.to_account_id)
+        .order_by(TransferModel.created_at.desc(), TransferModel.id.desc())
+        .limit(window)
+    )
+    counts: Counter[str] = Counter()
+    for from_account_id, to_account_id in session.execute(stmt):
+        counts[from_account_id] += 1
+        counts[to_account_id] += 1
+    return [account_id for account_id, _ in counts.most_common(limit)]
@@ -0,0 +1,434 @@
+"""
+Ring: Infrastructure (Limits / Velocity Counters)
+
+Responsibility:
+Keeps per-account sliding-window counters of outgoing transfers in memory and
+checks velocity limits against them, e.g. "at most £X out per 24 hours" or "at most
+N transfers per minute", without reading the transfers table.
+
+Design intent:
+- Each limit divides its window into buckets of `bucket` seconds. An account holds
+  one ring of bucket totals per limit, plus the running total of the ring.
+  Moving to a new bucket subtracts and clears the buckets that fell out of the
+  window, so a check is a comparison against the running total. Each bucket is
+  cleared once per lap of the ring, so the cost is O(1) amortised and at most one
+  pass over the ring, however many transfers the account has made.
+- The ring holds one bucket more than the window needs. A limit therefore counts
+  everything in the last `window` seconds and at most one extra, oldest bucket: it
+  errs on the side of refusing.
+- `reserve` checks and counts under one lock, so concurrent transfers from the
+  same account cannot both pass a check that only one of them fits.
+- Accounts whose rings have emptied are dropped at the next flush, so memory is
+  proportional to the accounts active within the longest window.
+- Durability (SQL backend): every flush interval, what was counted since the
+  previous flush is added to the bucket totals in velocity_rollups, in one
+  transaction. The rows are upserted with their totals incremented, never
+  replaced, so processes sharing a database add to the same rollups instead of
+  overwriting each other's. At startup the rollups are loaded, and transfers
+  committed after the latest flush are replayed on top of them. A restart
+  therefore scans at most one flush interval of transfers, not the whole window.
+  A transfer that was being committed during the last flush may be counted
+  twice or not at all after a restart.
+- The in-memory ledger holds every transfer in RAM, so with LEDGER_BACKEND=memory
+  the counters are rebuilt from its transfers for the longest window instead.
+- Limits are enforced per process. Each process checks only its own counters, so
+  the composition root gives each one a share of a configured limit
+  (root/velocity_limits_setup). The rollups are shared, so a process that
+  restarts resumes from what all of them counted up to their last flushes.
+- The flusher commits through its own sessions and must never share a
+  connection with request handlers: its commits would commit their unfinished
+  transactions. It is therefore not run for an in-memory database, whose
+  rollups would not outlive the process anyway.
+
+This module contains:
+- VelocityLimit: one configured limit.
+- VelocityLimitStats: a point-in-time view of the counters, for metrics.
+- VelocityCounters: the counters, their loaders and their rollup flusher.
+
+Dependency constraints:
+- Must not import from the Application layer (features/*).
+- May depend on other infrastructure modules (ORM models, the in-memory ledger).
+- May depend on infrastructure tooling (SQLAlchemy) and the standard library.
+
+Stability:
+- Volatile.
+
+Usage:
+- Loaded at startup by root/velocity_limits_setup; flushed on a daemon thread.
+- Satisfies TransferLimitsPort (features/transfers/ports) for TransferCreator
+  and StandingOrderChunkExecutor.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from array import array
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Literal, cast
+
+from sqlalchemy import Insert, Table, delete, func, select
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlalchemy.orm import Session, sessionmaker
+
+from infra.db.limits.model import VelocityRollupModel
+from infra.db.transfers.model import TransferModel
+from infra.db.types import from_epoch_micros, to_epoch_micros
+from infra.memory.ledger import MemoryLedger
+
+_MICROS = 1_000_000
+_LOAD_BATCH = 10_000
+_DELETE_BATCH = 500
+_EVICT_BATCH = 1024
+
+
+@dataclass(frozen=True, slots=True)
+class VelocityLimit:
+    """
+    At most `maximum` of `measure` out of one account in any `window` seconds.
+    """
+
+    name: str
+    measure: Literal["amount_pence", "transfers"]
+    window: int
+    bucket: int
+    maximum: int
+
+    @property
+    def slots(self) -> int:
+        return -(-self.window // self.bucket) + 1
+
+    def value(self, amount_pence: int) -> int:
+        return amount_pence if self.measure == "amount_pence" else 1
+
+    def describe(self) -> str:
+        return f"{self.name} allows {self.maximum} {self.measure} per {self.window}s"
+
+
+@dataclass(frozen=True, slots=True)
+class VelocityLimitStats:
+    limits: list[str]
+    accounts: int
+    reserved: int
+    released: int
+    rejected: dict[str, int]
+    flushes: int
+    rows_flushed: int
+    replayed: int
+
+
+class _Ring:
+    """
+    Bucket totals of one limit for one account; `head` is the newest bucket number.
+    """
+
+    __slots__ = ("totals", "head", "total")
+
+    def __init__(self, slots: int) -> None:
+        self.totals = array("q", bytes(8 * slots))
+        self.head = 0
+        self.total = 0
+
+    def advance(self, bucket: int) -> None:
+        if bucket <= self.head:
+            return
+        slots = len(self.totals)
+        if bucket - self.head >= slots:
+            self.totals = array("q", bytes(8 * slots))
+            self.total = 0
+        else:
+            for expired in range(self.head + 1, bucket + 1):
+                slot = expired % slots
+                self.total -= self.totals[slot]
+                self.totals[slot] = 0
+        self.head = bucket
+
+    def add(self, bucket: int, value: int) -> None:
+        if self.head - bucket >= len(self.totals):
+            return  # already out of the window
+        self.totals[bucket % len(self.totals)] += value
+        self.total += value
+
+    def buckets(self) -> Iterable[tuple[int, int]]:
+        """
+        (bucket number, total) of every non-empty bucket in the ring.
+        """
+        slots = len(self.totals)
+        for bucket in range(self.head - slots + 1, self.head + 1):
+            value = self.totals[bucket % slots]
+            if value:
+                yield bucket, value
+
+
+class VelocityCounters:
+    def __init__(self, limits: Sequence[VelocityLimit]) -> None:
+        self._limits = tuple(limits)
+        self._by_name = {limit.name: i for i, limit in enumerate(self._limits)}
+        self._horizon = max(limit.window + limit.bucket for limit in self._limits)
+        self._lock = threading.Lock()
+        self._rings: dict[str, list[_Ring]] = {}
+        # Counted since the last flush: account -> (limit index, bucket) -> value.
+        self._pending: dict[str, dict[tuple[int, int], int]] = {}
+        self._reserved = 0
+        self._released = 0
+        self._rejected = {limit.name: 0 for limit in self._limits}
+        self._flushes = 0
+        self._rows_flushed = 0
+        self._replayed = 0
+        self._stopped = threading.Event()
+
+    @classmethod
+    def load_from_database(
+        cls, session_factory: sessionmaker[Session], *, limits: Sequence[VelocityLimit]
+    ) -> VelocityCounters:
+        """
+        Rebuild the counters from the rollups, then replay the transfers committed
+        after the latest flush.
+        """
+        counters = cls(limits)
+        now_us = to_epoch_micros(datetime.now(timezone.utc))
+        oldest_us = now_us - counters._horizon * _MICROS
+
+        with session_factory() as session:
+            watermark_us = session.scalar(
+                select(func.max(VelocityRollupModel.flushed_at_us))
+            )
+            rollups = session.execute(
+                select(
+                    VelocityRollupModel.account_id,
+                    VelocityRollupModel.limit_name,
+                    VelocityRollupModel.bucket_start_s,
+                    VelocityRollupModel.total,
+                )
+                .where(VelocityRollupModel.bucket_start_s >= oldest_us // _MICROS)
+                .order_by(VelocityRollupModel.bucket_start_s)
+                .execution_options(yield_per=_LOAD_BATCH)
+            )
+            for account_id, limit_name, bucket_start_s, total in rollups:
+                counters._restore(account_id, limit_name, bucket_start_s, total)
+
+            since_us = (
+                oldest_us if watermark_us is None else max(oldest_us, watermark_us)
+            )
+            transfers = session.execute(
+                select(
+                    TransferModel.from_account_id,
+                    TransferModel.amount_pence,
+                    TransferModel.created_at,
+                )
+                .where(TransferModel.created_at >= from_epoch_micros(since_us))
+                .order_by(TransferModel.created_at)
+                .execution_options(yield_per=_LOAD_BATCH)
+            )
+            for account_id, amount_pence, created_at in transfers:
+                counters._record(account_id, amount_pence, to_epoch_micros(created_at))
+                counters._replayed += 1
+        return counters
+
+    @classmethod
+    def load_from_ledger(
+        cls, ledger: MemoryLedger, *, limits: Sequence[VelocityLimit]
+    ) -> VelocityCounters:
+        counters = cls(limits)
+        now_us = to_epoch_micros(datetime.now(timezone.utc))
+        transfers = ledger.stream(
+            account_id=None,
+            since=now_us - counters._horizon * _MICROS,
+            until=None,
+            after=None,
+        )
+        for transfer in transfers:
+            counters._record(
+                str(transfer.from_account_id),
+                transfer.amount.pence,
+                to_epoch_micros(transfer.created_at),
+            )
+            counters._replayed += 1
+        counters._pending.clear()
+        return counters
+
+    def reserve(
+        self, *, account_id: str, amount_pence: int, at: datetime
+    ) -> str | None:
+        at_us = to_epoch_micros(at)
+        with self._lock:
+            rings = self._rings_of(account_id)
+            for limit, ring in zip(self._limits, rings):
+                ring.advance(at_us // (limit.bucket * _MICROS))
+                if ring.total + limit.value(amount_pence) > limit.maximum:
+                    self._rejected[limit.name] += 1
+                    return limit.describe()
+
+            self._count(account_id, rings, amount_pence, at_us)
+            self._reserved += 1
+        return None
+
+    def release(self, *, account_id: str, amount_pence: int, at: datetime) -> None:
+        at_us = to_epoch_micros(at)
+        with self._lock:
+            rings = self._rings.get(account_id)
+            if rings is None:
+                return
+            self._count(account_id, rings, amount_pence, at_us, sign=-1)
+            self._released += 1
+
+    def flush(self, session_factory: sessionmaker[Session]) -> int:
+        """
+        Add what was counted since the last flush to the rollups, prune buckets
+        older than the longest window, and drop idle accounts; returns rows written.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            flushed_at_us = to_epoch_micros(datetime.now(timezone.utc))
+        rows = [
+            {
+                "account_id": account_id,
+                "limit_name": self._limits[index].name,
+                "bucket_start_s": bucket * self._limits[index].bucket,
+                "total": value,
+                "flushed_at_us": flushed_at_us,
+            }
+            for account_id, counted in pending.items()
+            for (index, bucket), value in counted.items()
+            if value
+        ]
+
+        try:
+            with session_factory() as session:
+                if rows:
+                    session.execute(_add_to_rollups(session), rows)
+                session.execute(
+                    delete(VelocityRollupModel).where(
+                        VelocityRollupModel.bucket_start_s
+                        < flushed_at_us // _MICROS - self._horizon
+                    )
+                )
+                session.commit()
+        except Exception:
+            with self._lock:
+                self._restore_pending(pending)  # written again by the next flush
+            raise
+
+        with self._lock:
+            self._flushes += 1
+            self._rows_flushed += len(rows)
+        self._evict_idle()
+        return len(rows)
+
+    def start_flushing(
+        self, session_factory: sessionmaker[Session], *, interval: float
+    ) -> None:
+        def run() -> None:
+            while not self._stopped.wait(interval):
+                try:
+                    self.flush(session_factory)
+                except Exception:  # retried at the next interval
+                    continue
+
+        threading.Thread(target=run, name="velocity-rollup-flush", daemon=True).start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def stats(self) -> VelocityLimitStats:
+        with self._lock:
+            return VelocityLimitStats(
+                limits=[limit.describe() for limit in self._limits],
+                accounts=len(self._rings),
+                reserved=self._reserved,
+                released=self._released,
+                rejected=dict(self._rejected),
+                flushes=self._flushes,
+                rows_flushed=self._rows_flushed,
+                replayed=self._replayed,
+            )
+
+    def _rings_of(self, account_id: str) -> list[_Ring]:
+        rings = self._rings.get(account_id)
+        if rings is None:
+            rings = self._rings[account_id] = [
+                _Ring(limit.slots) for limit in self._limits
+            ]
+        return rings
+
+    def _record(self, account_id: str, amount_pence: int, at_us: int) -> None:
+        rings = self._rings_of(account_id)
+        for limit, ring in zip(self._limits, rings):
+            ring.advance(at_us // (limit.bucket * _MICROS))
+        self._count(account_id, rings, amount_pence, at_us)
+
+    def _count(
+        self,
+        account_id: str,
+        rings: list[_Ring],
+        amount_pence: int,
+        at_us: int,
+        *,
+        sign: int = 1,
+    ) -> None:
+        """
+        Add a transfer (with sign=-1, remove it) to the rings and to what the next
+        flush writes.
+        """
+        counted = self._pending.setdefault(account_id, {})
+        for index, (limit, ring) in enumerate(zip(self._limits, rings)):
+            bucket = at_us // (limit.bucket * _MICROS)
+            value = sign * limit.value(amount_pence)
+            ring.add(bucket, value)
+            counted[index, bucket] = counted.get((index, bucket), 0) + value
+
+    def _restore_pending(self, pending: dict[str, dict[tuple[int, int], int]]) -> None:
+        for account_id, counted in pending.items():
+            into = self._pending.setdefault(account_id, {})
+            for key, value in counted.items():
+                into[key] = into.get(key, 0) + value
+
+    def _restore(
+        self, account_id: str, limit_name: str, bucket_start_s: int, total: int
+    ) -> None:
+        index = self._by_name.get(limit_name)
+        if index is None:
+            return  # a limit that is no longer configured
+        limit = self._limits[index]
+        ring = self._rings_of(account_id)[index]
+        bucket = bucket_start_s // limit.bucket
+        ring.advance(bucket)
+        ring.add(bucket, total)
+
+    def _evict_idle(self) -> None:
+        now_us = time.time_ns() // 1000
+        accounts = list(self._rings)
+        for start in range(0, len(accounts), _EVICT_BATCH):
+            with self._lock:
+                for account_id in accounts[start : start + _EVICT_BATCH]:
+                    rings = self._rings.get(account_id)
+                    if rings is None or account_id in self._pending:
+                        continue
+                    for limit, ring in zip(self._limits, rings):
+                        ring.advance(now_us // (limit.bucket * _MICROS))
+                    if not any(ring.total for ring in rings):
+                        del self._rings[account_id]
+
+
+def _add_to_rollups(session: Session) -> Insert:
+    """
+    An INSERT that adds to the total of a bucket row that already exists.
+    """
+    table = cast(Table, VelocityRollupModel.__table__)
+    dialect = session.get_bind().dialect.name
+    if dialect == "mysql":
+        stmt = mysql.insert(table)
+        return stmt.on_duplicate_key_update(
+            total=table.c.total + stmt.inserted.total,
+            flushed_at_us=stmt.inserted.flushed_at_us,
+        )
+    upsert = (postgresql if dialect == "postgresql" else sqlite).insert(table)
+    return upsert.on_conflict_do_update(
+        index_elements=[table.c.account_id, table.c.limit_name, table.c.bucket_start_s],
+        set_={
+            "total": table.c.total + upsert.excluded.total,
+            "flushed_at_us": upsert.excluded.flushed_at_us,
+        },
+    )
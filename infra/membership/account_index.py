@@ -0,0 +1,270 @@
+"""
+Ring: Infrastructure (Membership / Account Ids)
+
+Responsibility:
+Keeps an in-memory Bloom filter of every existing account id, so lookups of ids
+that definitely do not exist can be answered without a query.
+
+Design intent:
+- The filter is loaded once at startup from the configured store and is then only
+  ever added to. Account ids are never deleted.
+- Accounts created in this process are added when they are saved, before their
+  transaction commits, so no reader can see a committed account the filter does not
+  know. An add for a transaction that later rolls back only leaves a false
+  positive, which costs one query.
+- The filter is authoritative only where this process sees every account
+  creation: the in-memory ledger, and an in-memory SQLite database, which lives
+  inside this process's one connection. There a rejected id cannot exist.
+- A shared database may have other writers (other workers, bulk imports). Their
+  accounts are picked up by tailing the change feed (infra/db/changes) every
+  `refresh_interval`. The feed position is taken before the startup scan, so
+  nothing created during the scan is missed. The filter's answers are then final
+  up to the time its last refresh started: an account another writer created
+  after that is missing from the filter until the next refresh. Its negatives
+  are trusted (see infra/membership/filtered_repo) while that refresh is at most
+  `max_staleness` old. If refreshes stop succeeding for longer, negatives are
+  looked up in the database again until one does, and accounts found that way
+  are counted as stale negatives.
+- The filter is a ScalableBloomFilter sized for twice the accounts present at
+  load (at least `capacity`). It grows by adding layers as accounts are created,
+  so the false-positive rate stays bounded however many there are.
+- Counters separate lookups rejected by the filter from false positives (the
+  filter said "maybe" and the store said "no"). The observed false-positive rate
+  is therefore measured, not only estimated.
+- The refresher reads through its own sessions and must never share a
+  connection with request handlers: its rollbacks would discard their work. It
+  is therefore not run for an in-memory database, which needs no refresh.
+
+This module contains:
+- AccountFilterStats: a point-in-time view of the filter, for metrics.
+- AccountIdIndex: the filter, its loaders, and its feed refresher.
+
+Dependency constraints:
+- Must not import from the Application layer (features/*).
+- May depend on other infrastructure modules (ORM models, the in-memory ledger).
+- May depend on infrastructure tooling (SQLAlchemy) and the standard library.
+
+Stability:
+- Volatile.
+
+Usage:
+- Loaded at startup by root/account_filter_setup; refreshed on a daemon thread.
+- Consulted through FilteredAccountRepo (infra/membership/filtered_repo).
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from infra.db.accounts.model import AccountModel
+from infra.db.changes.feed import ACCOUNT_CREATED
+from infra.db.changes.model import ChangeModel
+from infra.membership.bloom import ScalableBloomFilter
+from infra.memory.ledger import MemoryLedger
+
+_LOAD_BATCH = 10_000
+
+
+@dataclass(frozen=True, slots=True)
+class AccountFilterStats:
+    items: int
+    capacity: int
+    layers: int
+    bits: int
+    hash_count: int
+    memory_bytes: int
+    estimated_false_positive_rate: float
+    lookups: int
+    rejected: int
+    false_positives: int
+    observed_false_positive_rate: float
+    stale_negatives: int
+    stale_fallbacks: int
+    authoritative: bool
+    feed_position: int
+    refreshed_ms_ago: float
+    max_staleness_ms: float
+
+
+class AccountIdIndex:
+    def __init__(
+        self,
+        *,
+        capacity: int,
+        false_positive_rate: float,
+        authoritative: bool,
+        max_staleness: float = 0.0,
+    ) -> None:
+        self._filter = ScalableBloomFilter(
+            capacity=capacity, false_positive_rate=false_positive_rate
+        )
+        self.authoritative = authoritative
+        self._max_staleness = max_staleness
+        self._refreshed_at = time.monotonic()
+        self._lock = threading.Lock()
+        self._lookups = 0
+        self._rejected = 0
+        self._false_positives = 0
+        self._stale_negatives = 0
+        self._stale_fallbacks = 0
+        self._feed_position = 0
+        self._stopped = threading.Event()
+
+    @classmethod
+    def load_from_database(
+        cls,
+        session_factory: sessionmaker[Session],
+        *,
+        capacity: int,
+        false_positive_rate: float,
+        authoritative: bool,
+        max_staleness: float,
+    ) -> AccountIdIndex:
+        """
+        `authoritative` only if no other process can create accounts in the
+        database. Otherwise negatives are trusted while the last refresh is at
+        most `max_staleness` seconds old.
+        """
+        started = time.monotonic()
+        with session_factory() as session:
+            feed_position = session.scalar(select(func.max(ChangeModel.seq))) or 0
+            count = session.scalar(select(func.count()).select_from(AccountModel)) or 0
+            index = cls(
+                capacity=max(capacity, 2 * count),
+                false_positive_rate=false_positive_rate,
+                authoritative=authoritative,
+                max_staleness=max_staleness,
+            )
+            ids = session.scalars(
+                select(AccountModel.id).execution_options(yield_per=_LOAD_BATCH)
+            )
+            for account_id in ids:
+                index._filter.add(account_id)
+        index._feed_position = feed_position
+        index._refreshed_at = started
+        return index
+
+    @classmethod
+    def load_from_ledger(
+        cls, ledger: MemoryLedger, *, capacity: int, false_positive_rate: float
+    ) -> AccountIdIndex:
+        account_ids = ledger.account_ids()
+        index = cls(
+            capacity=max(capacity, 2 * len(account_ids)),
+            false_positive_rate=false_positive_rate,
+            authoritative=True,
+        )
+        for account_id in account_ids:
+            index._filter.add(account_id)
+        return index
+
+    def add(self, account_id: str) -> None:
+        self._filter.add(account_id)
+
+    def might_exist(self, account_id: str) -> bool:
+        present = account_id in self._filter
+        with self._lock:
+            self._lookups += 1
+            if not present:
+                self._rejected += 1
+        return present
+
+    def negatives_are_final(self) -> bool:
+        """
+        Whether an id the filter rejects can be answered as missing without a
+        lookup. False while refreshes have been failing for over `max_staleness`.
+        """
+        if self.authoritative:
+            return True
+        if time.monotonic() - self._refreshed_at <= self._max_staleness:
+            return True
+        with self._lock:
+            self._stale_fallbacks += 1
+        return False
+
+    def record_false_positive(self) -> None:
+        with self._lock:
+            self._false_positives += 1
+
+    def record_stale_negative(self, account_id: str) -> None:
+        self._filter.add(account_id)
+        with self._lock:
+            self._stale_negatives += 1
+
+    def refresh(self, session_factory: sessionmaker[Session]) -> int:
+        """
+        Add accounts created since the last refresh; returns how many were read.
+        """
+        started = time.monotonic()
+        with session_factory() as session:
+            latest = session.scalar(select(func.max(ChangeModel.seq))) or 0
+            if latest <= self._feed_position:
+                self._refreshed_at = started
+                return 0
+            ids = session.scalars(
+                select(ChangeModel.account_id).where(
+                    ChangeModel.seq > self._feed_position,
+                    ChangeModel.seq <= latest,
+                    ChangeModel.kind == ACCOUNT_CREATED,
+                )
+            ).all()
+        for account_id in ids:
+            if account_id is not None:
+                self._filter.add(account_id)
+        self._feed_position = latest
+        self._refreshed_at = started
+        return len(ids)
+
+    def start_refreshing(
+        self, session_factory: sessionmaker[Session], *, interval: float
+    ) -> None:
+        def run() -> None:
+            while not self._stopped.wait(interval):
+                try:
+                    self.refresh(session_factory)
+                except Exception:  # retried at the next interval
+                    continue
+
+        threading.Thread(target=run, name="account-filter-refresh", daemon=True).start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def stats(self) -> AccountFilterStats:
+        bloom = self._filter
+        with self._lock:
+            lookups, rejected, false_positives, stale_negatives, stale_fallbacks = (
+                self._lookups,
+                self._rejected,
+                self._false_positives,
+                self._stale_negatives,
+                self._stale_fallbacks,
+            )
+        absent = rejected - stale_negatives + false_positives
+        observed = false_positives / absent if absent else 0.0
+        return AccountFilterStats(
+            items=bloom.items,
+            capacity=bloom.capacity,
+            layers=bloom.layers,
+            bits=bloom.bit_count,
+            hash_count=bloom.hash_count,
+            memory_bytes=bloom.memory_bytes,
+            estimated_false_positive_rate=round(
+                bloom.estimated_false_positive_rate(), 6
+            ),
+            lookups=lookups,
+            rejected=rejected,
+            false_positives=false_positives,
+            observed_false_positive_rate=round(observed, 6),
+            stale_negatives=stale_negatives,
+            stale_fallbacks=stale_fallbacks,
+            authoritative=self.authoritative,
+            feed_position=self._feed_position,
+            refreshed_ms_ago=round((time.monotonic() - self._refreshed_at) * 1000, 1),
+            max_staleness_ms=self._max_staleness * 1000,
+        )
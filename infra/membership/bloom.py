@@ -0,0 +1,158 @@
+"""
+Ring: Infrastructure (Membership / Probabilistic Sets)
+
+Responsibility:
+Defines a Bloom filter over strings: a fixed-size bit array that answers "possibly
+present" or "definitely absent", and a scalable variant that grows as items are
+added.
+
+Design intent:
+- Sized from the expected number of items n and a target false-positive rate p:
+  m = -n·ln(p) / ln(2)² bits and k = (m/n)·ln(2) hash positions per item. One
+  million ids at 1% cost about 1.2 MB.
+- The k positions come from one 128-bit BLAKE2b digest split into two 64-bit
+  halves, combined as h1 + i·h2 (Kirsch–Mitzenmacher double hashing).
+- There are no false negatives. Bits are only ever set, so an item that was added
+  is reported present forever. Adds take a lock; lookups read the bit array
+  without one.
+- The false-positive rate grows as items are added beyond the sized capacity.
+  `estimated_false_positive_rate` reports the current expected rate from the
+  actual fill: (1 - e^(-k·n/m))^k.
+- ScalableBloomFilter (Almeida et al., "Scalable Bloom Filters") never lets that
+  happen: once its newest layer holds its capacity, a new layer is started with
+  twice the capacity and half the false-positive rate. Adds go to the newest
+  layer; a lookup checks every layer. The compound false-positive rate stays
+  below twice the first layer's, however many items are added, and memory grows
+  with the items held.
+
+This module contains:
+- BloomFilter: the filter.
+- ScalableBloomFilter: a stack of BloomFilters that grows with its items.
+
+Dependency constraints:
+- Must not import from the Domain layer (core/).
+- Must not import from the Application layer (features/*).
+- May depend only on the standard library.
+
+Stability:
+- Stable.
+
+Usage:
+- ScalableBloomFilter is used by infra/membership/account_index.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import threading
+
+
+class BloomFilter:
+    def __init__(self, *, capacity: int, false_positive_rate: float) -> None:
+        capacity = max(capacity, 1)
+        self.bit_count = max(
+            8, math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2)
+        )
+        self.hash_count = max(1, round(self.bit_count / capacity * math.log(2)))
+        self.capacity = capacity
+        # Adds that set at least one new bit: distinct values, minus the rare value
+        # whose bits were all set already (which then reads as present anyway).
+        self.items = 0
+        self._bits = bytearray((self.bit_count + 7) // 8)
+        self._lock = threading.Lock()
+
+    def add(self, value: str) -> None:
+        positions = self._positions(value)
+        with self._lock:
+            bits = self._bits
+            new = False
+            for position in positions:
+                mask = 1 << (position & 7)
+                if not bits[position >> 3] & mask:
+                    bits[position >> 3] |= mask
+                    new = True
+            if new:
+                self.items += 1
+
+    def __contains__(self, value: str) -> bool:
+        bits = self._bits
+        return all(
+            bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(value)
+        )
+
+    @property
+    def memory_bytes(self) -> int:
+        return len(self._bits)
+
+    def estimated_false_positive_rate(self) -> float:
+        k = self.hash_count
+        return (1 - math.exp(-k * self.items / self.bit_count)) ** k
+
+    def _positions(self, value: str) -> list[int]:
+        digest = hashlib.blake2b(value.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        m = self.bit_count
+        return [(h1 + i * h2) % m for i in range(self.hash_count)]
+
+
+class ScalableBloomFilter:
+    _GROWTH = 2
+    _TIGHTENING = 0.5
+
+    def __init__(self, *, capacity: int, false_positive_rate: float) -> None:
+        self._layers = [
+            BloomFilter(capacity=capacity, false_positive_rate=false_positive_rate)
+        ]
+        self._false_positive_rate = false_positive_rate
+        self._lock = threading.Lock()
+
+    def add(self, value: str) -> None:
+        with self._lock:
+            if value in self:
+                return
+            newest = self._layers[-1]
+            if newest.items >= newest.capacity:
+                newest = BloomFilter(
+                    capacity=newest.capacity * self._GROWTH,
+                    false_positive_rate=self._false_positive_rate
+                    * self._TIGHTENING ** len(self._layers),
+                )
+                # Replaced, not appended to, so lookups iterate a stable list.
+                self._layers = [*self._layers, newest]
+            newest.add(value)
+
+    def __contains__(self, value: str) -> bool:
+        return any(value in layer for layer in self._layers)
+
+    @property
+    def layers(self) -> int:
+        return len(self._layers)
+
+    @property
+    def items(self) -> int:
+        return sum(layer.items for layer in self._layers)
+
+    @property
+    def capacity(self) -> int:
+        return sum(layer.capacity for layer in self._layers)
+
+    @property
+    def bit_count(self) -> int:
+        return sum(layer.bit_count for layer in self._layers)
+
+    @property
+    def hash_count(self) -> int:
+        return sum(layer.hash_count for layer in self._layers)
+
+    @property
+    def memory_bytes(self) -> int:
+        return sum(layer.memory_bytes for layer in self._layers)
+
+    def estimated_false_positive_rate(self) -> float:
+        absent_everywhere = 1.0
+        for layer in self._layers:
+            absent_everywhere *= 1 - layer.estimated_false_positive_rate()
+        return 1 - absent_everywhere
@@ -0,0 +1,106 @@
+"""
+Ring: Infrastructure (Persistence / Repository Decorators)
+
+Responsibility:
+Implements an AccountRepoPort decorator that answers lookups of account ids the
+Bloom filter has never seen without touching the wrapped repository.
+
+Design intent:
+A Bloom filter has no false negatives. An id the filter rejects is therefore
+answered as missing without touching the wrapped repository, as long as the
+filter's negatives are final (see infra/membership/account_index): always when
+it is authoritative, and in a shared database while its last refresh of other
+writers' accounts is recent enough. An account created by another process since
+that refresh is reported missing until the next one. While refreshes are
+failing, rejected ids are looked up after all; an account found that way is
+added to the filter and counted as a stale negative.
+An id the filter accepts is looked up, which confirms it. If the lookup then
+finds nothing, that is counted as a false positive.
+`save` adds the id to the filter before delegating. The id is therefore known
+before the account can be committed, never after.
+
+This module contains:
+- FilteredAccountRepo: the AccountRepoPort decorator.
+
+Dependency constraints:
+- Must not be imported by application use case code directly (wired through DI).
+- Must depend on application ports (features/accounts/ports) to implement them.
+- May depend on the Domain layer (core/) for entities and value types.
+- May depend on infrastructure tooling (infra/membership).
+
+Stability:
+- Moderately stable.
+
+Usage:
+- Wired in root/di around the account repositories of AccountGetter, AccountCreator
+  and TransferCreator when ACCOUNT_FILTER is enabled.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Collection
+
+from core.entities.account import Account
+from core.values.custom_types import AccountId
+from features.accounts.ports import AccountRepoPort
+from infra.membership.account_index import AccountIdIndex
+
+
+class FilteredAccountRepo(AccountRepoPort):
+    """
+    AccountRepo that skips lookups of ids known not to exist.
+    """
+
+    def __init__(self, *, inner: AccountRepoPort, index: AccountIdIndex) -> None:
+        self._inner = inner
+        self._index = index
+
+    def get(self, account_id: AccountId) -> Account | None:
+        present = self._index.might_exist(str(account_id))
+        if not present and self._index.negatives_are_final():
+            return None
+        account = self._inner.get(account_id)
+        self._observe(account_id, present=present, found=account is not None)
+        return account
+
+    def get_many(self, account_ids: Collection[AccountId]) -> dict[AccountId, Account]:
+        requested = set(account_ids)
+        present = {i for i in requested if self._index.might_exist(str(i))}
+        if present != requested and not self._index.negatives_are_final():
+            candidates = requested
+        else:
+            candidates = present
+        if not candidates:
+            return {}
+        found = self._inner.get_many(candidates)
+        for account_id in candidates:
+            self._observe(
+                account_id, present=account_id in present, found=account_id in found
+            )
+        return found
+
+    def save(self, account: Account) -> None:
+        self._index.add(str(account.id))
+        self._inner.save(account)
+
+    def version(self, account_id: AccountId) -> int | None:
+        present = self._index.might_exist(str(account_id))
+        if not present and self._index.negatives_are_final():
+            return None
+        version = self._inner.version(account_id)
+        self._observe(account_id, present=present, found=version is not None)
+        return version
+
+    def get_versioned(self, account_id: AccountId) -> tuple[int, Account] | None:
+        present = self._index.might_exist(str(account_id))
+        if not present and self._index.negatives_are_final():
+            return None
+        versioned = self._inner.get_versioned(account_id)
+        self._observe(account_id, present=present, found=versioned is not None)
+        return versioned
+
+    def _observe(self, account_id: AccountId, *, present: bool, found: bool) -> None:
+        if present and not found:
+            self._index.record_false_positive()
+        elif found and not present:
+            self._index.record_stale_negative(str(account_id))
@@ -0,0 +1,80 @@
+"""
+Ring: Infrastructure (Persistence / Repositories)
+
+Responsibility:
+Implements the Account repository on top of the in-memory ledger engine.
+This module provides a concrete persistence adapter for the AccountRepoPort defined
+by the application layer.
+
+Design intent:
+This is an infrastructure implementation of an application-facing port, and a
+drop-in alternative to infra/db/accounts/repo.AccountRepo with the same semantics.
+Reads come straight from the ledger's balance array; saves are staged in the
+request's LedgerSession and become visible and durable when it commits.
+
+This module contains:
+- LedgerAccountRepo: an in-memory-ledger implementation of AccountRepoPort.
+
+Dependency constraints:
+- Must not be imported by application use case code directly (wired through DI).
+- Must depend on application ports (features/accounts/ports) to implement them.
+- May depend on the Domain layer (core/) for entities and value types.
+- May depend on infrastructure tooling (the in-memory ledger engine).
+
+Stability:
+- Highly volatile.
+- Changes when the in-memory storage strategy changes.
+
+Usage:
+- Wired in root/di when LEDGER_BACKEND=memory.
+- Used by application interactors through the AccountRepoPort interface.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Collection
+
+from core.entities.account import Account
+from core.values.custom_types import AccountId
+from core.values.objects import Money
+from features.accounts.ports import AccountRepoPort
+from infra.memory.ledger import LedgerSession
+
+
+class LedgerAccountRepo(AccountRepoPort):
+    """
+    In-memory-ledger-backed AccountRepo.
+
+    - `get` and `save` operate within a provided LedgerSession.
+    - Transaction scoping is managed by the request's session provider.
+    """
+
+    def __init__(self, *, session: LedgerSession) -> None:
+        self._session = session
+
+    def get(self, account_id: AccountId) -> Account | None:
+        return self._session.get_account(str(account_id))
+
+    def get_many(self, account_ids: Collection[AccountId]) -> dict[AccountId, Account]:
+        found: dict[AccountId, Account] = {}
+        for account_id in account_ids:
+            account = self._session.get_account(str(account_id))
+            if account is not None:
+                found[account_id] = account
+        return found
+
+    def save(self, account: Account) -> None:
+        """
+        Upsert semantics, as for the SQL repository.
+        """
+        self._session.add_account(account)
+
+    def version(self, account_id: AccountId) -> int | None:
+        return self._session.ledger.version(str(account_id))
+
+    def get_versioned(self, account_id: AccountId) -> tuple[int, Account] | None:
+        state = self._session.ledger.versioned_balance(str(account_id))
+        if state is None:
+            return None
+        version, balance = state
+        return version, Account(id=account_id, balance=Money(balance))
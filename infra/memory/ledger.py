@@ -0,0 +1,437 @@
+"""
+Ring: Infrastructure (In-Memory Ledger / Engine)
+
+Responsibility:
+Defines a durable in-memory ledger engine: every balance and transfer is held in
+RAM in compact typed arrays, and every commit is made durable by a write-ahead log
+with periodic snapshots. It is an alternative to the SQL database for the account
+and transfer repositories of latency-critical deployments.
+
+Design intent:
+- Selected with LEDGER_BACKEND=memory; data lives in LEDGER_DIR. (The other
+  backends are "sql", the default, and "sharded", see infra/sharding.)
+- Sessions mirror the SQL request session: repositories stage changes in a
+  LedgerSession, and the request provider commits it at the end of the request or
+  discards it on error.
+- A commit is validated and applied atomically under the ledger lock, logged as a
+  single WAL frame, and then waits for group-commit durability outside the lock.
+- Balance updates are optimistic. An account read in a session may only be
+  overwritten if its balance has not changed since the read; otherwise the commit
+  fails with LedgerConflictError and nothing is applied.
+- Recovery at startup loads the latest snapshot and replays the WAL generations
+  that follow it.
+- Transfers are kept in (created_at, id) order for keyset streaming. Appends are
+  almost always already in order; if one is not, the order is computed again on
+  the next read.
+- State digests (infra/db/digests) and the change feed (infra/db/changes) are not
+  maintained by this engine.
+
+This module contains:
+- LEDGER_BACKEND / LEDGER_DIR: configuration.
+- LedgerConflictError / LedgerIntegrityError: commit failures.
+- MemoryLedger: the engine (state, recovery, commits, snapshots, reads).
+- LedgerSession: per-request unit of staged changes; satisfies the UnitOfWork port.
+
+Dependency constraints:
+- Must not import from the Application layer (features/*).
+- May depend on the Domain layer (core/) for the entities it stores.
+- May depend on other infrastructure modules and the standard library.
+
+Stability:
+- Highly volatile.
+- Changes when the in-memory storage strategy changes.
+
+Usage:
+- Opened once at startup by the composition root and closed at shutdown.
+- Used by infra/memory repositories through a LedgerSession.
+"""
+
+from __future__ import annotations
+
+import bisect
+import os
+import threading
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+from core.entities.account import Account
+from core.entities.transfer import Transfer
+from core.values.custom_types import AccountId, TransferId
+from core.values.objects import Money
+from infra.db.types import from_epoch_micros, to_epoch_micros
+from infra.memory.snapshot import LedgerTables, read_snapshot, write_snapshot
+from infra.memory.wal import (
+    AccountRecord,
+    LogRecord,
+    TransferRecord,
+    WriteAheadLog,
+    read_log,
+)
+
+LEDGER_BACKEND = os.environ.get("LEDGER_BACKEND", "sql")
+LEDGER_DIR = Path(os.environ.get("LEDGER_DIR", "ledger-data"))
+
+SNAPSHOT_EVERY_COMMITS = 100_000
+
+_SNAPSHOT_FILE = "snapshot.bin"
+
+
+class LedgerConflictError(RuntimeError):
+    """
+    An account changed between being read and being saved in the same session.
+    """
+
+
+class LedgerIntegrityError(ValueError):
+    """
+    A commit would duplicate a transfer id or reference an unknown account.
+    """
+
+
+class MemoryLedger:
+    """
+    In-memory ledger tables backed by a write-ahead log and snapshots.
+    """
+
+    def __init__(
+        self,
+        *,
+        directory: Path,
+        generation: int,
+        tables: LedgerTables,
+        fsync: bool,
+        snapshot_every: int,
+    ) -> None:
+        self._directory = directory
+        self._generation = generation
+        self._tables = tables
+        self._fsync = fsync
+        self._snapshot_every = snapshot_every
+        self._lock = threading.Lock()
+        self._snapshot_lock = threading.Lock()
+        self._commits_since_snapshot = 0
+
+        self._account_index = {
+            account_id: index for index, account_id in enumerate(tables.account_ids)
+        }
+        self._transfer_ids = set(tables.transfer_ids)
+        self._order: list[int] | None = None
+        self._in_order = _is_ordered(tables)
+
+        self._wal = WriteAheadLog(self._wal_path(generation), fsync=fsync)
+
+    @classmethod
+    def open(
+        cls,
+        directory: Path,
+        *,
+        fsync: bool = True,
+        snapshot_every: int = SNAPSHOT_EVERY_COMMITS,
+    ) -> MemoryLedger:
+        """
+        Recover the ledger from `directory`: snapshot, then write-ahead log replay.
+        """
+        directory.mkdir(parents=True, exist_ok=True)
+        loaded = read_snapshot(directory / _SNAPSHOT_FILE)
+        generation, tables = loaded if loaded is not None else (0, LedgerTables())
+
+        logs = sorted(directory.glob("wal-*.log"))
+        frames: list[list[LogRecord]] = []
+        for path in logs:
+            log_generation = int(path.stem.removeprefix("wal-"))
+            if log_generation < generation:
+                path.unlink()  # already folded into the snapshot
+                continue
+            log_frames, valid_length = read_log(path)
+            if valid_length < path.stat().st_size:
+                os.truncate(path, valid_length)
+            frames.extend(log_frames)
+            generation = log_generation
+
+        ledger = cls(
+            directory=directory,
+            generation=generation,
+            tables=tables,
+            fsync=fsync,
+            snapshot_every=snapshot_every,
+        )
+        for records in frames:
+            ledger._apply(records)
+        return ledger
+
+    def balance(self, account_id: str) -> int | None:
+        index = self._account_index.get(account_id)
+        return None if index is None else self._tables.balances[index]
+
+    def version(self, account_id: str) -> int | None:
+        index = self._account_index.get(account_id)
+        return None if index is None else self._tables.versions[index]
+
+    def versioned_balance(self, account_id: str) -> tuple[int, int] | None:
+        """
+        (version, balance) of one account, read together under the commit lock.
+        """
+        with self._lock:
+            index = self._account_index.get(account_id)
+            if index is None:
+                return None
+            return self._tables.versions[index], self._tables.balances[index]
+
+    def account_ids(self) -> list[str]:
+        with self._lock:
+            return list(self._tables.account_ids)
+
+    def stream(
+        self,
+        *,
+        account_id: str | None,
+        since: int | None,
+        until: int | None,
+        after: tuple[int, str] | None,
+    ) -> Iterator[Transfer]:
+        """
+        Yield transfers in (created_at, id) order; times are epoch microseconds.
+        """
+        tables = self._tables
+        account = None
+        if account_id is not None:
+            account = self._account_index.get(account_id)
+            if account is None:
+                return
+
+        with self._lock:
+            order = self._ordered_positions()
+            count = len(tables.transfer_ids)
+
+        def key(position: int) -> tuple[int, str]:
+            index = order[position] if order is not None else position
+            return tables.transfer_created_at[index], tables.transfer_ids[index]
+
+        start, end = _position_range(key, count, since=since, until=until, after=after)
+        for position in range(start, end):
+            index = order[position] if order is not None else position
+            if account is None or self._involves(index, account):
+                yield self._transfer(index)
+
+    def _involves(self, transfer: int, account: int) -> bool:
+        tables = self._tables
+        return account in (tables.transfer_from[transfer], tables.transfer_to[transfer])
+
+    def commit(
+        self,
+        *,
+        read_balances: dict[str, int],
+        accounts: list[Account],
+        transfers: list[Transfer],
+    ) -> None:
+        records: list[LogRecord] = [
+            AccountRecord(account_id=str(a.id), balance_pence=a.balance.pence)
+            for a in accounts
+        ]
+        records += [
+            TransferRecord(
+                transfer_id=str(t.id),
+                from_account_id=str(t.from_account_id),
+                to_account_id=str(t.to_account_id),
+                amount_pence=t.amount.pence,
+                created_at_us=to_epoch_micros(t.created_at),
+            )
+            for t in transfers
+        ]
+
+        with self._lock:
+            self._validate(read_balances=read_balances, records=records)
+            self._apply(records)
+            wal = self._wal
+            lsn = wal.append(records)
+            self._commits_since_snapshot += 1
+            snapshot_due = self._commits_since_snapshot >= self._snapshot_every
+
+        wal.sync(lsn)
+        if snapshot_due:
+            self.snapshot()
+
+    def snapshot(self) -> None:
+        """
+        Write a snapshot of the current state and drop the log it supersedes.
+        """
+        with self._snapshot_lock:
+            with self._lock:
+                self._wal.sync()
+                previous = self._wal
+                self._generation += 1
+                self._wal = WriteAheadLog(
+                    self._wal_path(self._generation), fsync=self._fsync
+                )
+                generation, tables = self._generation, self._tables.copy()
+                self._commits_since_snapshot = 0
+
+            write_snapshot(
+                self._directory / _SNAPSHOT_FILE, generation=generation, tables=tables
+            )
+            previous.close()
+            previous.path.unlink()
+
+    def close(self) -> None:
+        self.snapshot()
+        self._wal.close()
+
+    def _validate(
+        self, *, read_balances: dict[str, int], records: list[LogRecord]
+    ) -> None:
+        for account_id, balance in read_balances.items():
+            if self.balance(account_id) != balance:
+                raise LedgerConflictError(f"Account changed concurrently: {account_id}")
+
+        known = {r.account_id for r in records if isinstance(r, AccountRecord)}
+        for record in records:
+            if isinstance(record, TransferRecord):
+                self._validate_transfer(record, known_accounts=known)
+
+    def _validate_transfer(
+        self, record: TransferRecord, *, known_accounts: set[str]
+    ) -> None:
+        """
+        `known_accounts` are created by the same commit.
+        """
+        if record.transfer_id in self._transfer_ids:
+            raise LedgerIntegrityError(f"Duplicate transfer id: {record.transfer_id}")
+        for account_id in (record.from_account_id, record.to_account_id):
+            if (
+                account_id not in known_accounts
+                and account_id not in self._account_index
+            ):
+                raise LedgerIntegrityError(f"Unknown account: {account_id}")
+
+    def _apply(self, records: list[LogRecord]) -> None:
+        tables = self._tables
+        for record in records:
+            if isinstance(record, AccountRecord):
+                index = self._account_index.get(record.account_id)
+                if index is None:
+                    self._account_index[record.account_id] = len(tables.account_ids)
+                    tables.account_ids.append(record.account_id)
+                    tables.balances.append(record.balance_pence)
+                    tables.versions.append(1)
+                else:
+                    tables.balances[index] = record.balance_pence
+                    tables.versions[index] += 1
+                continue
+
+            count = len(tables.transfer_ids)
+            if count and (record.created_at_us, record.transfer_id) < (
+                tables.transfer_created_at[count - 1],
+                tables.transfer_ids[count - 1],
+            ):
+                self._in_order = False
+            self._order = None
+
+            tables.transfer_from.append(self._account_index[record.from_account_id])
+            tables.transfer_to.append(self._account_index[record.to_account_id])
+            tables.transfer_amount.append(record.amount_pence)
+            tables.transfer_created_at.append(record.created_at_us)
+            tables.transfer_ids.append(record.transfer_id)
+            self._transfer_ids.add(record.transfer_id)
+
+    def _ordered_positions(self) -> list[int] | None:
+        """
+        None while appends are in order (position == index); otherwise the sorted
+        index list, computed once per change.
+        """
+        if self._in_order:
+            return None
+        if self._order is None:
+            tables = self._tables
+            self._order = sorted(
+                range(len(tables.transfer_ids)),
+                key=lambda i: (tables.transfer_created_at[i], tables.transfer_ids[i]),
+            )
+        return self._order
+
+    def _transfer(self, index: int) -> Transfer:
+        tables = self._tables
+        return Transfer(
+            id=TransferId(tables.transfer_ids[index]),
+            from_account_id=AccountId(tables.account_ids[tables.transfer_from[index]]),
+            to_account_id=AccountId(tables.account_ids[tables.transfer_to[index]]),
+            amount=Money(tables.transfer_amount[index]),
+            created_at=from_epoch_micros(tables.transfer_created_at[index]),
+        )
+
+    def _wal_path(self, generation: int) -> Path:
+        return self._directory / f"wal-{generation:08d}.log"
+
+
+class LedgerSession:
+    """
+    Changes staged by one request, committed or discarded as a unit.
+    """
+
+    def __init__(self, ledger: MemoryLedger) -> None:
+        self.ledger = ledger
+        self._read_balances: dict[str, int] = {}
+        self._accounts: dict[str, Account] = {}
+        self._transfers: list[Transfer] = []
+
+    def get_account(self, account_id: str) -> Account | None:
+        staged = self._accounts.get(account_id)
+        if staged is not None:
+            return staged
+
+        balance = self.ledger.balance(account_id)
+        if balance is None:
+            return None
+        self._read_balances.setdefault(account_id, balance)
+        return Account(id=AccountId(account_id), balance=Money(balance))
+
+    def add_account(self, account: Account) -> None:
+        self._accounts[str(account.id)] = account
+
+    def add_transfer(self, transfer: Transfer) -> None:
+        self._transfers.append(transfer)
+
+    def commit(self) -> None:
+        if self._accounts or self._transfers:
+            self.ledger.commit(
+                read_balances=self._read_balances,
+                accounts=list(self._accounts.values()),
+                transfers=self._transfers,
+            )
+        self.rollback()
+
+    def rollback(self) -> None:
+        self._read_balances.clear()
+        self._accounts.clear()
+        self._transfers.clear()
+
+
+def _is_ordered(tables: LedgerTables) -> bool:
+    keys = zip(tables.transfer_created_at, tables.transfer_ids)
+    previous = next(keys, None)
+    for current in keys:
+        if current < previous:  # type: ignore[operator]
+            return False
+        previous = current
+    return True
+
+
+def _position_range(
+    key: Callable[[int], tuple[int, str]],
+    count: int,
+    *,
+    since: int | None,
+    until: int | None,
+    after: tuple[int, str] | None,
+) -> tuple[int, int]:
+    """
+    [start, end) of the ordered positions within the stream's bounds.
+    """
+    positions = range(count)
+    start, end = 0, count
+    if since is not None:
+        start = bisect.bisect_left(positions, (since, ""), key=key)
+    if after is not None:
+        start = max(start, bisect.bisect_right(positions, after, key=key))
+    if until is not None:
+        end = bisect.bisect_left(positions, (until, ""), key=key)
+    return start, end
@@ -0,0 +1,186 @@
+"""
+Ring: Infrastructure (In-Memory Ledger / Snapshots)
+
+Responsibility:
+Defines the column-oriented tables held by the in-memory ledger and their snapshot
+file format.
+
+Design intent:
+- State is kept as parallel typed arrays rather than objects. An account is its id
+  string plus an 8-byte balance and an 8-byte change version, each in an
+  `array('q')`. A transfer is four 8-byte columns plus its id string.
+  ORM instances cost a few hundred bytes of per-object overhead, plus identity map
+  entries, for the same data.
+- Transfers reference accounts by array index, not by id.
+- A snapshot is the full tables plus the write-ahead log generation that continues
+  from it. It is written to a temporary file, fsynced and atomically renamed, so a
+  crash leaves either the old or the new snapshot, never a partial one. A trailing
+  checksum covers the whole file.
+
+This module contains:
+- LedgerTables: the ledger's in-memory tables.
+- write_snapshot / read_snapshot: the snapshot file format.
+
+Dependency constraints:
+- Must not import from the Domain layer (core/).
+- Must not import from the Application layer (features/*).
+- May depend only on the standard library.
+
+Stability:
+- Highly volatile.
+- Changes when the ledger's table layout changes.
+
+Usage:
+- Used by infra/memory/ledger.
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+import zlib
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO
+
+_MAGIC = b"LEDGSNP2"  # 2: account change versions
+_HEADER = struct.Struct("<QQQ")  # generation, accounts, transfers
+_CHECKSUM = struct.Struct("<I")
+_TEXT_LENGTH = struct.Struct("<H")
+
+
+def _int_column() -> array[int]:
+    return array("q")
+
+
+@dataclass(slots=True)
+class LedgerTables:
+    """
+    Parallel columns: row i of every account column is one account, row j of every
+    transfer column is one transfer.
+    """
+
+    account_ids: list[str] = field(default_factory=list)
+    balances: array[int] = field(default_factory=_int_column)
+    versions: array[int] = field(default_factory=_int_column)
+    transfer_ids: list[str] = field(default_factory=list)
+    transfer_from: array[int] = field(default_factory=_int_column)
+    transfer_to: array[int] = field(default_factory=_int_column)
+    transfer_amount: array[int] = field(default_factory=_int_column)
+    transfer_created_at: array[int] = field(default_factory=_int_column)
+
+    def copy(self) -> LedgerTables:
+        return LedgerTables(
+            account_ids=list(self.account_ids),
+            balances=array("q", self.balances),
+            versions=array("q", self.versions),
+            transfer_ids=list(self.transfer_ids),
+            transfer_from=array("q", self.transfer_from),
+            transfer_to=array("q", self.transfer_to),
+            transfer_amount=array("q", self.transfer_amount),
+            transfer_created_at=array("q", self.transfer_created_at),
+        )
+
+
+class _ChecksummedWriter:
+    def __init__(self, file: BinaryIO) -> None:
+        self._file = file
+        self.checksum = 0
+
+    def write(self, data: bytes) -> None:
+        self._file.write(data)
+        self.checksum = zlib.crc32(data, self.checksum)
+
+
+def write_snapshot(path: Path, *, generation: int, tables: LedgerTables) -> None:
+    temporary = path.with_suffix(".tmp")
+    with open(temporary, "wb") as file:
+        writer = _ChecksummedWriter(file)
+        writer.write(_MAGIC)
+        writer.write(
+            _HEADER.pack(generation, len(tables.account_ids), len(tables.transfer_ids))
+        )
+        writer.write(_encode_texts(tables.account_ids))
+        writer.write(tables.balances.tobytes())
+        writer.write(tables.versions.tobytes())
+        writer.write(_encode_texts(tables.transfer_ids))
+        for column in (
+            tables.transfer_from,
+            tables.transfer_to,
+            tables.transfer_amount,
+            tables.transfer_created_at,
+        ):
+            writer.write(column.tobytes())
+        file.write(_CHECKSUM.pack(writer.checksum))
+        file.flush()
+        os.fsync(file.fileno())
+
+    os.replace(temporary, path)
+    _fsync_directory(path.parent)
+
+
+def read_snapshot(path: Path) -> tuple[int, LedgerTables] | None:
+    """
+    Load a snapshot; returns None if there is none. Raises ValueError if it is corrupt.
+    """
+    if not path.exists():
+        return None
+
+    data = path.read_bytes()
+    body, (checksum,) = data[: -_CHECKSUM.size], _CHECKSUM.unpack(
+        data[-_CHECKSUM.size :]
+    )
+    if not body.startswith(_MAGIC) or zlib.crc32(body) != checksum:
+        raise ValueError(f"Corrupt ledger snapshot: {path}")
+
+    offset = len(_MAGIC)
+    generation, account_count, transfer_count = _HEADER.unpack_from(body, offset)
+    offset += _HEADER.size
+
+    tables = LedgerTables()
+    tables.account_ids, offset = _decode_texts(body, offset, account_count)
+    offset = _load_column(tables.balances, body, offset, account_count)
+    offset = _load_column(tables.versions, body, offset, account_count)
+    tables.transfer_ids, offset = _decode_texts(body, offset, transfer_count)
+    for column in (
+        tables.transfer_from,
+        tables.transfer_to,
+        tables.transfer_amount,
+        tables.transfer_created_at,
+    ):
+        offset = _load_column(column, body, offset, transfer_count)
+    return generation, tables
+
+
+def _encode_texts(values: list[str]) -> bytes:
+    buffer = bytearray()
+    for value in values:
+        encoded = value.encode("utf-8")
+        buffer += _TEXT_LENGTH.pack(len(encoded))
+        buffer += encoded
+    return bytes(buffer)
+
+
+def _decode_texts(data: bytes, offset: int, count: int) -> tuple[list[str], int]:
+    values: list[str] = []
+    for _ in range(count):
+        (length,) = _TEXT_LENGTH.unpack_from(data, offset)
+        offset += _TEXT_LENGTH.size
+        values.append(data[offset : offset + length].decode("utf-8"))
+        offset += length
+    return values, offset
+
+
+def _load_column(column: array[int], data: bytes, offset: int, count: int) -> int:
+    end = offset + count * column.itemsize
+    column.frombytes(data[offset:end])
+    return end
+
+
+def _fsync_directory(directory: Path) -> None:
+    descriptor = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
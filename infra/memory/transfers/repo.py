@@ -0,0 +1,74 @@
+"""
+Ring: Infrastructure (Persistence / Repositories)
+
+Responsibility:
+Implements the Transfer repository on top of the in-memory ledger engine.
+This module provides a concrete persistence adapter for the TransferRepoPort defined
+by the application layer.
+
+Design intent:
+This is an infrastructure implementation of an application-facing port, and a
+drop-in alternative to infra/db/transfers/repo.TransferRepo with the same semantics.
+Saves are staged in the request's LedgerSession. Streams read the ledger's
+transfer columns in (created_at, id) order and build one entity at a time.
+
+This module contains:
+- LedgerTransferRepo: an in-memory-ledger implementation of TransferRepoPort.
+
+Dependency constraints:
+- Must not be imported by application use case code directly (wired through DI).
+- Must depend on application ports (features/transfers/ports) to implement them.
+- May depend on the Domain layer (core/) for entities and value types.
+- May depend on infrastructure tooling (the in-memory ledger engine).
+
+Stability:
+- Highly volatile.
+- Changes when the in-memory storage strategy changes.
+
+Usage:
+- Wired in root/di when LEDGER_BACKEND=memory.
+- Used by application interactors through the TransferRepoPort interface.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import datetime
+
+from core.entities.transfer import Transfer
+from core.values.custom_types import AccountId
+from features.transfers.cursors import TransferCursor
+from features.transfers.ports import TransferRepoPort
+from infra.db.types import to_epoch_micros
+from infra.memory.ledger import LedgerSession
+
+
+class LedgerTransferRepo(TransferRepoPort):
+    """
+    In-memory-ledger-backed TransferRepo.
+    """
+
+    def __init__(self, *, session: LedgerSession) -> None:
+        self._session = session
+
+    def save(self, transfer: Transfer) -> None:
+        self._session.add_transfer(transfer)
+
+    def stream(
+        self,
+        *,
+        account_id: AccountId | None,
+        since: datetime | None,
+        until: datetime | None,
+        after: TransferCursor | None,
+    ) -> Iterator[Transfer]:
+        return self._session.ledger.stream(
+            account_id=None if account_id is None else str(account_id),
+            since=None if since is None else to_epoch_micros(since),
+            until=None if until is None else to_epoch_micros(until),
+            after=(
+                None
+                if after is None
+                else (to_epoch_micros(after.created_at), str(after.transfer_id))
+            ),
+        )
@@ -0,0 +1,208 @@
+"""
+Ring: Infrastructure (In-Memory Ledger / Write-Ahead Log)
+
+Responsibility:
+Defines the on-disk write-ahead log of the in-memory ledger: the record types, their
+binary encoding, an append-only log file with group commit, and recovery reads.
+
+Design intent:
+- One frame per committed ledger session: `<length><crc32><records...>`. A session's
+  balance changes and transfer land in a single frame, so recovery replays all of
+  them or none of them.
+- A frame is valid only if it is complete and its checksum matches. Recovery stops
+  at the first invalid frame (a torn write from a crash) and truncates the log
+  there.
+- Group commit: appends only buffer the frame. `sync(lsn)` writes and fsyncs
+  everything buffered so far. Concurrent committers that arrive while an fsync is
+  in flight find their frame already durable, so one fsync serves many of them.
+
+This module contains:
+- AccountRecord / TransferRecord: the logged facts.
+- WriteAheadLog: the append-only log file.
+- read_log: recovery read of a log file.
+
+Dependency constraints:
+- Must not import from the Domain layer (core/).
+- Must not import from the Application layer (features/*).
+- May depend only on the standard library.
+
+Stability:
+- Highly volatile.
+- Changing the encoding requires a snapshot taken with the previous version.
+
+Usage:
+- Used by infra/memory/ledger.
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+import threading
+import zlib
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+_FRAME_HEADER = struct.Struct("<II")  # payload length, crc32 of payload
+_TAG = struct.Struct("<B")
+_TEXT_LENGTH = struct.Struct("<H")
+_INTEGER = struct.Struct("<q")
+
+_ACCOUNT = 1
+_TRANSFER = 2
+
+
+@dataclass(frozen=True, slots=True)
+class AccountRecord:
+    """
+    The balance of an account after a committed session (creation or update).
+    """
+
+    account_id: str
+    balance_pence: int
+
+
+@dataclass(frozen=True, slots=True)
+class TransferRecord:
+    """
+    A committed transfer; timestamps are epoch microseconds.
+    """
+
+    transfer_id: str
+    from_account_id: str
+    to_account_id: str
+    amount_pence: int
+    created_at_us: int
+
+
+LogRecord = AccountRecord | TransferRecord
+
+
+class WriteAheadLog:
+    """
+    Append-only, checksummed log file with group commit.
+    """
+
+    def __init__(self, path: Path, *, fsync: bool = True) -> None:
+        self.path = path
+        self._file = open(path, "ab", buffering=0)
+        self._fsync = fsync
+        self._buffer_lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._buffer = bytearray()
+        self._appended = 0
+        self._synced = 0
+
+    def append(self, records: Iterable[LogRecord]) -> int:
+        """
+        Buffer one frame; returns its log sequence number for `sync`.
+        """
+        frame = encode_frame(records)
+        with self._buffer_lock:
+            self._buffer += frame
+            self._appended += 1
+            return self._appended
+
+    def sync(self, lsn: int | None = None) -> None:
+        """
+        Make every frame up to `lsn` (default: all appended) durable.
+        """
+        with self._sync_lock:
+            with self._buffer_lock:
+                target = self._appended if lsn is None else lsn
+                if self._synced >= target:
+                    return
+                data = bytes(self._buffer)
+                self._buffer.clear()
+                upto = self._appended
+
+            self._file.write(data)
+            if self._fsync:
+                os.fsync(self._file.fileno())
+            self._synced = upto
+
+    def close(self) -> None:
+        self.sync()
+        self._file.close()
+
+
+def encode_frame(records: Iterable[LogRecord]) -> bytes:
+    payload = bytearray()
+    for record in records:
+        if isinstance(record, AccountRecord):
+            payload += _TAG.pack(_ACCOUNT)
+            _put_text(payload, record.account_id)
+            payload += _INTEGER.pack(record.balance_pence)
+        else:
+            payload += _TAG.pack(_TRANSFER)
+            _put_text(payload, record.transfer_id)
+            _put_text(payload, record.from_account_id)
+            _put_text(payload, record.to_account_id)
+            payload += _INTEGER.pack(record.amount_pence)
+            payload += _INTEGER.pack(record.created_at_us)
+    return _FRAME_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+
+def read_log(path: Path) -> tuple[list[list[LogRecord]], int]:
+    """
+    Decode every valid frame of a log file.
+
+    Returns the frames and the byte length of the valid prefix; anything after it
+    is a torn write and should be truncated.
+    """
+    data = path.read_bytes()
+    frames: list[list[LogRecord]] = []
+    offset = 0
+    while offset + _FRAME_HEADER.size <= len(data):
+        length, checksum = _FRAME_HEADER.unpack_from(data, offset)
+        start = offset + _FRAME_HEADER.size
+        payload = data[start : start + length]
+        if len(payload) < length or zlib.crc32(payload) != checksum:
+            break
+        frames.append(_decode_payload(payload))
+        offset = start + length
+    return frames, offset
+
+
+def _decode_payload(payload: bytes) -> list[LogRecord]:
+    records: list[LogRecord] = []
+    offset = 0
+    while offset < len(payload):
+        (tag,) = _TAG.unpack_from(payload, offset)
+        offset += _TAG.size
+        if tag == _ACCOUNT:
+            account_id, offset = _get_text(payload, offset)
+            (balance,) = _INTEGER.unpack_from(payload, offset)
+            offset += _INTEGER.size
+            records.append(AccountRecord(account_id=account_id, balance_pence=balance))
+        elif tag == _TRANSFER:
+            transfer_id, offset = _get_text(payload, offset)
+            from_account_id, offset = _get_text(payload, offset)
+            to_account_id, offset = _get_text(payload, offset)
+            amount, created_at_us = struct.unpack_from("<qq", payload, offset)
+            offset += 2 * _INTEGER.size
+            records.append(
+                TransferRecord(
+                    transfer_id=transfer_id,
+                    from_account_id=from_account_id,
+                    to_account_id=to_account_id,
+                    amount_pence=amount,
+                    created_at_us=created_at_us,
+                )
+            )
+        else:
+            raise ValueError(f"Unknown write-ahead log record tag: {tag}")
+    return records
+
+
+def _put_text(buffer: bytearray, value: str) -> None:
+    encoded = value.encode("utf-8")
+    buffer += _TEXT_LENGTH.pack(len(encoded))
+    buffer += encoded
+
+
+def _get_text(data: bytes, offset: int) -> tuple[str, int]:
+    (length,) = _TEXT_LENGTH.unpack_from(data, offset)
+    start = offset + _TEXT_LENGTH.size
+    return data[start : start + length].decode("utf-8"), start + length
@@ -0,0 +1,317 @@
+"""
+Ring: Infrastructure (Profiling)
+
+Responsibility:
+Traces memory allocations with tracemalloc on demand. It keeps a few snapshots so
+that two of them can be compared by the project module that allocated the
+memory, and it samples how much memory each use case's calls leave allocated.
+
+Design intent:
+- Tracing is off until started and can be stopped again without a restart.
+  While it runs, every allocation in the process is slower and uses more memory,
+  so it is meant to be switched on while a leak is being looked for.
+- A snapshot holds every live traced block. Only the newest `keep` snapshots are
+  held; older ones are dropped as new ones are taken. Stopping tracing keeps the
+  snapshots already taken, so they can still be compared.
+- Most memory is allocated inside libraries (SQLAlchemy, pydantic, logging) on
+  behalf of project code. A block is therefore attributed to the innermost frame
+  of its traceback that lies in one of `packages` under `root`. The more frames
+  are traced, the more blocks reach project code; blocks that never do are
+  grouped together as OUTSIDE.
+- A use case call is measured only while tracing, and only when it is sampled.
+  It records how the traced bytes and the interpreter's allocated blocks
+  changed across the call: what the call left allocated. Both counts cover the
+  whole process, so concurrent requests add noise. That noise averages out over
+  many samples, while a leak shows as a mean that stays above zero.
+
+This module contains:
+- OUTSIDE: the group of blocks allocated outside the project's packages.
+- TracingNotStartedError: raised when a snapshot is taken while not tracing.
+- SnapshotRecord: a kept snapshot's metadata.
+- AllocationDiff: how one group's allocations changed between two snapshots.
+- UseCaseAllocations: the sampled calls of one use case.
+- AllocationStats: a point-in-time view of the tracker, for metrics.
+- AllocationTracker: controls tracing, keeps snapshots and samples use cases.
+
+Dependency constraints:
+- Must not import from the Domain layer (core/).
+- Must not import from the Application layer (features/*).
+- May depend only on the standard library.
+
+Stability:
+- Moderately stable.
+
+Usage:
+- Created and served by root/memory_diagnostics_setup, which also wraps use
+  cases so their calls are sampled.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import sys
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Literal, TypeVar
+
+T = TypeVar("T")
+
+OUTSIDE = "(outside)"
+
+GroupBy = Literal["module", "package", "layer"]
+
+_IGNORED = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+class TracingNotStartedError(RuntimeError):
+    """
+    A snapshot was requested while tracemalloc was not tracing.
+    """
+
+
+@dataclass(frozen=True, slots=True)
+class SnapshotRecord:
+    snapshot_id: str
+    taken_at: float  # seconds since the epoch
+    frames: int
+    traced_bytes: int
+    traced_blocks: int
+
+
+@dataclass(frozen=True, slots=True)
+class AllocationDiff:
+    group: str
+    size_bytes: int
+    size_diff_bytes: int
+    blocks: int
+    blocks_diff: int
+
+
+@dataclass(frozen=True, slots=True)
+class UseCaseAllocations:
+    use_case: str
+    samples: int
+    mean_bytes: float  # left allocated per call
+    max_bytes: int
+    mean_blocks: float
+    max_blocks: int
+
+
+@dataclass(frozen=True, slots=True)
+class AllocationStats:
+    pid: int
+    tracing: bool
+    frames: int
+    traced_bytes: int
+    traced_peak_bytes: int
+    sample_rate: float
+    snapshots: list[SnapshotRecord]
+    use_cases: list[UseCaseAllocations]
+
+
+class _Samples:
+    __slots__ = ("count", "total_bytes", "max_bytes", "total_blocks", "max_blocks")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_bytes = 0
+        self.max_bytes = 0
+        self.total_blocks = 0
+        self.max_blocks = 0
+
+    def add(self, size: int, blocks: int) -> None:
+        self.count += 1
+        self.total_bytes += size
+        self.max_bytes = max(self.max_bytes, size)
+        self.total_blocks += blocks
+        self.max_blocks = max(self.max_blocks, blocks)
+
+
+class AllocationTracker:
+    def __init__(
+        self,
+        *,
+        root: str,
+        packages: Sequence[str] = ("core", "features", "infra"),
+        keep: int,
+        sample_rate: float,
+    ) -> None:
+        self._prefixes = tuple(
+            os.path.join(root, package) + os.sep for package in packages
+        )
+        self._root = root
+        self._keep = keep
+        self._sample_rate = sample_rate
+        self._lock = threading.Lock()
+        self._snapshots: list[tuple[SnapshotRecord, tracemalloc.Snapshot]] = []
+        self._taken = 0
+        self._samples: defaultdict[str, _Samples] = defaultdict(_Samples)
+        self._groups: dict[str, str | None] = {}
+
+    def start(self, frames: int) -> None:
+        """
+        Start tracing, keeping up to `frames` frames per block. A running trace
+        with a different depth is restarted, which discards what it traced.
+        """
+        if tracemalloc.is_tracing():
+            if tracemalloc.get_traceback_limit() == frames:
+                return
+            tracemalloc.stop()
+        tracemalloc.start(frames)
+
+    def stop(self) -> None:
+        tracemalloc.stop()
+
+    def take_snapshot(self) -> SnapshotRecord:
+        if not tracemalloc.is_tracing():
+            raise TracingNotStartedError("Memory tracing has not been started")
+        snapshot = tracemalloc.take_snapshot().filter_traces(_IGNORED)
+        with self._lock:
+            self._taken += 1
+            snapshot_id = f"s{self._taken}"
+        traces = snapshot.traces
+        record = SnapshotRecord(
+            snapshot_id=snapshot_id,
+            taken_at=time.time(),
+            frames=snapshot.traceback_limit,
+            traced_bytes=sum(trace.size for trace in traces),
+            traced_blocks=len(traces),
+        )
+        with self._lock:
+            self._snapshots.append((record, snapshot))
+            del self._snapshots[: -self._keep]
+        return record
+
+    def diff(
+        self,
+        base_id: str,
+        current_id: str,
+        *,
+        group_by: GroupBy = "module",
+    ) -> list[AllocationDiff] | None:
+        """
+        How each group's live allocations changed from `base_id` to `current_id`,
+        largest change in size first. None if either snapshot is not kept.
+        """
+        with self._lock:
+            kept = {record.snapshot_id: kept for record, kept in self._snapshots}
+        base, current = kept.get(base_id), kept.get(current_id)
+        if base is None or current is None:
+            return None
+
+        before = self._grouped(base, group_by)
+        after = self._grouped(current, group_by)
+        diffs = []
+        for group in before.keys() | after.keys():
+            size_before, blocks_before = before.get(group, (0, 0))
+            size_after, blocks_after = after.get(group, (0, 0))
+            if (size_before, blocks_before) == (size_after, blocks_after):
+                continue
+            diffs.append(
+                AllocationDiff(
+                    group=group,
+                    size_bytes=size_after,
+                    size_diff_bytes=size_after - size_before,
+                    blocks=blocks_after,
+                    blocks_diff=blocks_after - blocks_before,
+                )
+            )
+        diffs.sort(key=lambda diff: abs(diff.size_diff_bytes), reverse=True)
+        return diffs
+
+    def sample(self, use_case: str, call: Callable[[], T]) -> T:
+        """
+        Run `call`, recording what it left allocated if tracing and sampled.
+        """
+        if not tracemalloc.is_tracing() or random.random() >= self._sample_rate:
+            return call()
+
+        bytes_before = tracemalloc.get_traced_memory()[0]
+        blocks_before = sys.getallocatedblocks()
+        try:
+            return call()
+        finally:
+            size = tracemalloc.get_traced_memory()[0] - bytes_before
+            blocks = sys.getallocatedblocks() - blocks_before
+            with self._lock:
+                self._samples[use_case].add(size, blocks)
+
+    def stats(self) -> AllocationStats:
+        traced_bytes, traced_peak_bytes = tracemalloc.get_traced_memory()
+        with self._lock:
+            return AllocationStats(
+                pid=os.getpid(),
+                tracing=tracemalloc.is_tracing(),
+                frames=tracemalloc.get_traceback_limit(),
+                traced_bytes=traced_bytes,
+                traced_peak_bytes=traced_peak_bytes,
+                sample_rate=self._sample_rate,
+                snapshots=[record for record, _ in self._snapshots],
+                use_cases=[
+                    UseCaseAllocations(
+                        use_case=use_case,
+                        samples=samples.count,
+                        mean_bytes=samples.total_bytes / samples.count,
+                        max_bytes=samples.max_bytes,
+                        mean_blocks=samples.total_blocks / samples.count,
+                        max_blocks=samples.max_blocks,
+                    )
+                    for use_case, samples in sorted(self._samples.items())
+                ],
+            )
+
+    def _grouped(
+        self, snapshot: tracemalloc.Snapshot, group_by: GroupBy
+    ) -> dict[str, tuple[int, int]]:
+        """
+        Total (size, blocks) per group. Identical tracebacks are merged first, so
+        each distinct traceback is attributed once.
+        """
+        totals: defaultdict[str, list[int]] = defaultdict(lambda: [0, 0])
+        for statistic in snapshot.statistics("traceback"):
+            module = self._innermost_module(statistic.traceback)
+            group = OUTSIDE if module is None else _group(module, group_by)
+            totals[group][0] += statistic.size
+            totals[group][1] += statistic.count
+        return {group: (size, blocks) for group, (size, blocks) in totals.items()}
+
+    def _innermost_module(self, traceback: tracemalloc.Traceback) -> str | None:
+        # Tracebacks run from the oldest frame to the most recent.
+        for frame in reversed(traceback):
+            module = self._module(frame.filename)
+            if module is not None:
+                return module
+        return None
+
+    def _module(self, filename: str) -> str | None:
+        """
+        The dotted module name of a project file, or None for any other file.
+        """
+        try:
+            return self._groups[filename]
+        except KeyError:
+            pass
+        module = None
+        if filename.startswith(self._prefixes) and filename.endswith(".py"):
+            relative = os.path.relpath(filename, self._root)[: -len(".py")]
+            module = relative.replace(os.sep, ".").removesuffix(".__init__")
+        self._groups[filename] = module
+        return module
+
+
+def _group(module: str, group_by: GroupBy) -> str:
+    if group_by == "layer":
+        return module.split(".", 1)[0]
+    if group_by == "package":
+        return module.rsplit(".", 1)[0]
+    return module
@@ -0,0 +1,133 @@
+"""
+Ring: Infrastructure (Profiling)
+
+Responsibility:
+Renders cProfile statistics as text: the usual pstats table, or collapsed stacks
+("outer;inner;leaf microseconds" per line) for flame graph tools.
+
+Design intent:
+- cProfile records only caller-to-callee edges, not whole stacks, so collapsed
+  stacks are reconstructed from the call graph. Starting at the functions that
+  have no caller, each callee is followed with the share of its cumulative time
+  that came from the current caller. That share is scaled by how much of the
+  caller's own time belongs to the current path. Each stack is weighted with its
+  leaf's own time. This is exact for call trees and an approximation where a
+  function is reached along several paths.
+- Frame labels are file:line:function, with file names relative to `root` or to
+  site-packages.
+- Recursive edges are not followed (the recursion's time stays with the first
+  frame), paths stop at MAX_DEPTH, and branches below one microsecond are
+  dropped, so the output stays bounded for any profile.
+
+This module contains:
+- SORT_KEYS: the orderings accepted by render_table.
+- render_table: the pstats table, sorted and truncated.
+- render_collapsed: collapsed stacks, heaviest first.
+
+Dependency constraints:
+- Must not import from the Domain layer (core/).
+- Must not import from the Application layer (features/*).
+- May depend only on the standard library.
+
+Stability:
+- Stable.
+
+Usage:
+- Used by root/profiling_setup to serve saved profiles.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import pstats
+from collections import Counter, defaultdict
+from typing import Any
+
+SORT_KEYS = ("cumulative", "tottime", "calls", "filename", "name")
+MAX_DEPTH = 64
+
+_SITE_PACKAGES = f"site-packages{os.sep}"
+
+_Func = tuple[str, int, str]  # (filename, line, function name)
+
+
+def render_table(stats: pstats.Stats, *, sort: str, limit: int) -> str:
+    stream = io.StringIO()
+    stats.stream = stream  # type: ignore[attr-defined]
+    stats.sort_stats(sort).print_stats(limit)
+    return stream.getvalue()
+
+
+def render_collapsed(stats: pstats.Stats, *, root: str = "") -> str:
+    """
+    `root` is a path prefix removed from file names to shorten frame labels.
+    """
+    stacks = _CollapsedStacks(stats.stats, root=root)  # type: ignore[attr-defined]
+    for func, (_, _, _, _, callers) in stacks.entries.items():
+        if not callers:
+            stacks.walk(func, [_label(func, root)], {func}, 1.0)
+    return stacks.render()
+
+
+class _CollapsedStacks:
+    """
+    Collapsed stack weights (in microseconds), accumulated by walking the call graph.
+    """
+
+    def __init__(self, entries: dict[_Func, Any], *, root: str) -> None:
+        self.entries = entries
+        self._root = root
+        self._callees: dict[_Func, dict[_Func, float]] = defaultdict(dict)
+        for func, (_, _, _, _, callers) in entries.items():
+            for caller, (_, _, _, cumulative) in callers.items():
+                self._callees[caller][func] = cumulative
+        self._weights: Counter[str] = Counter()
+
+    def walk(
+        self, func: _Func, path: list[str], on_path: set[_Func], share: float
+    ) -> None:
+        own = self.entries[func][2]
+        self._weights[";".join(path)] += own * share * 1_000_000
+        if len(path) >= MAX_DEPTH:
+            return
+        for callee, from_here in self._callees.get(func, {}).items():
+            callee_share = self._share(callee, from_here * share, on_path)
+            if callee_share is None:
+                continue
+            on_path.add(callee)
+            walk_path = [*path, _label(callee, self._root)]
+            self.walk(callee, walk_path, on_path, callee_share)
+            on_path.discard(callee)
+
+    def render(self) -> str:
+        return "".join(
+            f"{stack} {round(microseconds)}\n"
+            for stack, microseconds in self._weights.most_common()
+            if round(microseconds) > 0
+        )
+
+    def _share(
+        self, callee: _Func, through_path: float, on_path: set[_Func]
+    ) -> float | None:
+        """
+        The share of `callee`'s time that belongs to the current path, or None if
+        the path should not be followed into it.
+        """
+        callee_cumulative = self.entries[callee][3]
+        if callee in on_path or callee_cumulative <= 0 or through_path < 1e-6:
+            return None
+        return min(1.0, through_path / callee_cumulative)
+
+
+def _label(func: _Func, root: str) -> str:
+    filename, line, name = func
+    if filename == "~":  # built-ins
+        return name
+    if root and filename.startswith(root):
+        filename = os.path.relpath(filename, root)
+    else:
+        _, installed, package_path = filename.rpartition(_SITE_PACKAGES)
+        if installed:
+            filename = package_path
+    return f"{filename}:{line}:{name}"
@@ -0,0 +1,195 @@
+"""
+Ring: Infrastructure (Profiling)
+
+Responsibility:
+Profiles a single request's use case with cProfile on demand, and keeps the
+most recent profiles on disk so they can be read back later.
+
+Design intent:
+- Whether the current request is to be profiled is carried in a context
+  variable. It is set where the request enters and read where the use case
+  runs, which is in a worker thread with a copy of the request's context.
+  Untriggered requests never create a profiler, so they pay nothing beyond
+  reading that variable.
+- cProfile observes only the thread that enables it, and from Python 3.12 only
+  one profiler can be active in the whole process. At most one request is
+  therefore profiled at a time. A triggered request that finds the profiler
+  busy runs unprofiled and is counted as skipped.
+- A profile is saved even when the profiled call raises, since failures are
+  often what is being investigated.
+- Profiles are pstats dump files in one directory, which may be shared by all
+  workers on a host. File names carry the time, the process id and the use case,
+  so they never collide and sort by age. After each save only the newest `keep`
+  are left.
+
+This module contains:
+- ProfileRequest: the trigger of one request, and the ids of its saved profiles.
+- profile_scope: marks the current context's request as triggered.
+- requested_profile: the current request's trigger, or None.
+- ProfileRecord: a saved profile's metadata.
+- ProfilerStats: a point-in-time view of the profiler, for metrics.
+- RequestProfiler: runs callables under cProfile and manages the saved profiles.
+
+Dependency constraints:
+- Must not import from the Domain layer (core/).
+- Must not import from the Application layer (features/*).
+- May depend only on the standard library.
+
+Stability:
+- Moderately stable.
+
+Usage:
+- Created and triggered by root/profiling_setup, which wraps use cases with it
+  and serves the saved profiles.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import os
+import pstats
+import re
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TypeVar
+
+T = TypeVar("T")
+
+_SUFFIX = ".prof"
+_PROFILE_ID = re.compile(r"^[0-9]+-[0-9]+-[A-Za-z0-9_]+$")
+
+
+@dataclass(slots=True)
+class ProfileRequest:
+    profile_ids: list[str] = field(default_factory=list)
+
+
+_requested: ContextVar[ProfileRequest | None] = ContextVar(
+    "profile_request", default=None
+)
+
+
+@contextmanager
+def profile_scope(request: ProfileRequest) -> Iterator[None]:
+    token = _requested.set(request)
+    try:
+        yield
+    finally:
+        _requested.reset(token)
+
+
+def requested_profile() -> ProfileRequest | None:
+    return _requested.get()
+
+
+@dataclass(frozen=True, slots=True)
+class ProfileRecord:
+    profile_id: str
+    use_case: str
+    pid: int
+    created_at: float  # seconds since the epoch
+    size_bytes: int
+
+
+@dataclass(frozen=True, slots=True)
+class ProfilerStats:
+    directory: str
+    keep: int
+    profiled: int
+    skipped_busy: int
+    saved: int
+
+
+class RequestProfiler:
+    def __init__(self, *, directory: Path, keep: int) -> None:
+        self._directory = directory
+        self._keep = keep
+        self._busy = threading.Lock()
+        self._lock = threading.Lock()
+        self._profiled = 0
+        self._skipped_busy = 0
+        directory.mkdir(parents=True, exist_ok=True)
+
+    def run(self, use_case: str, call: Callable[[], T], request: ProfileRequest) -> T:
+        """
+        Run `call`, under cProfile unless another profile is running.
+        """
+        if not self._busy.acquire(blocking=False):
+            with self._lock:
+                self._skipped_busy += 1
+            return call()
+
+        profile = cProfile.Profile()
+        try:
+            return profile.runcall(call)
+        finally:
+            self._busy.release()
+            request.profile_ids.append(self._save(use_case, profile))
+
+    def profiles(self) -> list[ProfileRecord]:
+        """
+        Saved profiles, newest first.
+        """
+        records = []
+        for path in self._paths():
+            try:
+                size = path.stat().st_size
+            except FileNotFoundError:
+                continue
+            created_ns, pid, use_case = path.stem.split("-", 2)
+            records.append(
+                ProfileRecord(
+                    profile_id=path.stem,
+                    use_case=use_case,
+                    pid=int(pid),
+                    created_at=int(created_ns) / 1e9,
+                    size_bytes=size,
+                )
+            )
+        return records
+
+    def load(self, profile_id: str) -> pstats.Stats | None:
+        if not _PROFILE_ID.match(profile_id):
+            return None
+        try:
+            return pstats.Stats(str(self._directory / f"{profile_id}{_SUFFIX}"))
+        except FileNotFoundError:
+            return None
+
+    def stats(self) -> ProfilerStats:
+        with self._lock:
+            return ProfilerStats(
+                directory=str(self._directory),
+                keep=self._keep,
+                profiled=self._profiled,
+                skipped_busy=self._skipped_busy,
+                saved=len(self._paths()),
+            )
+
+    def _save(self, use_case: str, profile: cProfile.Profile) -> str:
+        profile_id = f"{time.time_ns()}-{os.getpid()}-{use_case}"
+        profile.dump_stats(str(self._directory / f"{profile_id}{_SUFFIX}"))
+        with self._lock:
+            self._profiled += 1
+        for stale in self._paths()[self._keep :]:
+            stale.unlink(missing_ok=True)
+        return profile_id
+
+    def _paths(self) -> list[Path]:
+        """
+        Saved profile files, newest first.
+        """
+        return sorted(
+            (
+                path
+                for path in self._directory.glob(f"*{_SUFFIX}")
+                if _PROFILE_ID.match(path.stem)
+            ),
+            key=lambda path: int(path.stem.split("-", 1)[0]),
+            reverse=True,
+        )
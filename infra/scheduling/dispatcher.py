@@ -0,0 +1,236 @@
+"""
+Ring: Infrastructure (Scheduling)
+
+Responsibility:
+Defines an in-process dispatcher that fires keys at their due times, in batches,
+and measures how late each one fired.
+
+Design intent:
+- Two levels, so that neither level scans work that is not due soon:
+  - Near-term keys (due within `horizon`) are held in a min-heap keyed on due
+    time. One thread sleeps until the earliest due time, or until a new key
+    becomes the earliest. There is no periodic tick.
+  - Keys due later are not held in memory at all. Every `load_interval` the
+    `load` callback is asked for the keys due before now + `horizon`; it is
+    expected to be an indexed range read. `load_interval` must be shorter than
+    `horizon` so every key is loaded before it is due.
+- At start, the first load returns everything already overdue (missed while the
+  process was down). Those keys are due immediately and fire first, oldest
+  first, in batches of `batch_size`.
+- Keys already in the heap or currently firing are ignored if scheduled again,
+  so repeated loads never duplicate work. Firing must still be idempotent: a
+  load that raced with a completing fire can schedule its key once more.
+- `fire` runs on the dispatcher thread and the next batch waits for it. The
+  lag of a key is measured when its batch is taken, so time spent behind a slow
+  batch counts as lag.
+- Lag percentiles are computed over the last `lag_window` fired keys that were
+  loaded before their due time. A key already overdue when it was scheduled
+  (missed while the process was down, or after a failed fire) says nothing about
+  how promptly the dispatcher fires, so it is counted as overdue at load, with
+  how far overdue it was, and left out of the percentiles.
+
+This module contains:
+- SchedulingLagStats: a point-in-time view of the dispatcher, for metrics.
+- DueTimeDispatcher: the dispatcher.
+
+Dependency constraints:
+- Must not import from the Domain layer (core/).
+- Must not import from the Application layer (features/*).
+- May depend only on the standard library.
+
+Stability:
+- Volatile.
+
+Usage:
+- Built by root/scheduler_setup to fire scheduled transfers.
+"""
+
+from __future__ import annotations
+
+import heapq
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+
+@dataclass(frozen=True, slots=True)
+class SchedulingLagStats:
+    scheduled: int
+    fired: int
+    batches: int
+    fire_errors: int
+    load_errors: int
+    pending: int
+    overdue_at_load: int
+    overdue_at_load_max_ms: float
+    lag_p50_ms: float
+    lag_p90_ms: float
+    lag_p99_ms: float
+    lag_max_ms: float
+
+
+class DueTimeDispatcher:
+    """
+    Fires keys in due-time order once their due time has passed.
+    """
+
+    def __init__(
+        self,
+        *,
+        fire: Callable[[list[str]], None],
+        load: Callable[[datetime], Iterable[tuple[str, datetime]]],
+        horizon: float,
+        load_interval: float,
+        batch_size: int,
+        lag_window: int = 10_000,
+    ) -> None:
+        if load_interval >= horizon:
+            raise ValueError("load_interval must be shorter than horizon")
+
+        self._fire = fire
+        self._load = load
+        self._horizon = horizon
+        self._load_interval = load_interval
+        self._batch_size = batch_size
+
+        self._condition = threading.Condition()
+        self._heap: list[tuple[float, str]] = []
+        self._known: set[str] = set()
+        self._stopped = False
+        self._lags: deque[float] = deque(maxlen=lag_window)
+        self._overdue: set[str] = set()
+        self._overdue_at_load = 0
+        self._overdue_at_load_max = 0.0
+
+        self._scheduled = 0
+        self._fired = 0
+        self._batches = 0
+        self._fire_errors = 0
+        self._load_errors = 0
+
+    def schedule(self, key: str, due_at: datetime) -> None:
+        """
+        Hold `key` until `due_at` if it is due within the horizon; a key due later
+        is left for a future load.
+        """
+        due = due_at.timestamp()
+        now = time.time()
+        if due > now + self._horizon:
+            return
+
+        with self._condition:
+            if key in self._known:
+                return
+            self._known.add(key)
+            if due <= now:
+                self._overdue.add(key)
+                self._overdue_at_load += 1
+                self._overdue_at_load_max = max(self._overdue_at_load_max, now - due)
+            heapq.heappush(self._heap, (due, key))
+            self._scheduled += 1
+            if self._heap[0][1] == key:
+                self._condition.notify_all()  # the load thread waits here too
+
+    def start(self) -> None:
+        for target, name in (
+            (self._dispatch, "scheduler-dispatch"),
+            (self._refill, "scheduler-load"),
+        ):
+            threading.Thread(target=target, name=name, daemon=True).start()
+
+    def stop(self) -> None:
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+
+    def stats(self) -> SchedulingLagStats:
+        with self._condition:
+            lags = sorted(self._lags)
+            pending = len(self._heap)
+            counters = (
+                self._scheduled,
+                self._fired,
+                self._batches,
+                self._fire_errors,
+                self._load_errors,
+            )
+            overdue = (self._overdue_at_load, self._overdue_at_load_max)
+        scheduled, fired, batches, fire_errors, load_errors = counters
+        overdue_at_load, overdue_at_load_max = overdue
+        return SchedulingLagStats(
+            scheduled=scheduled,
+            fired=fired,
+            batches=batches,
+            fire_errors=fire_errors,
+            load_errors=load_errors,
+            pending=pending,
+            overdue_at_load=overdue_at_load,
+            overdue_at_load_max_ms=round(overdue_at_load_max * 1000, 2),
+            lag_p50_ms=_percentile_ms(lags, 0.50),
+            lag_p90_ms=_percentile_ms(lags, 0.90),
+            lag_p99_ms=_percentile_ms(lags, 0.99),
+            lag_max_ms=_percentile_ms(lags, 1.0),
+        )
+
+    def _dispatch(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            try:
+                self._fire(batch)
+            except Exception:  # the keys are still pending; a later load retries them
+                with self._condition:
+                    self._fire_errors += 1
+            finally:
+                with self._condition:
+                    self._known.difference_update(batch)
+
+    def _next_batch(self) -> list[str] | None:
+        with self._condition:
+            while not self._stopped:
+                now = time.time()
+                if self._heap and self._heap[0][0] <= now:
+                    break
+                timeout = self._heap[0][0] - now if self._heap else None
+                self._condition.wait(timeout)
+            if self._stopped:
+                return None
+
+            batch: list[str] = []
+            heap = self._heap
+            while heap and heap[0][0] <= now and len(batch) < self._batch_size:
+                due, key = heapq.heappop(heap)
+                if key in self._overdue:
+                    self._overdue.discard(key)
+                else:
+                    self._lags.append(now - due)
+                batch.append(key)
+            self._fired += len(batch)
+            self._batches += 1
+            return batch
+
+    def _refill(self) -> None:
+        while True:
+            try:
+                horizon_end = time.time() + self._horizon
+                until = datetime.fromtimestamp(horizon_end, tz=timezone.utc)
+                for key, due_at in self._load(until):
+                    self.schedule(key, due_at)
+            except Exception:  # retried at the next interval
+                with self._condition:
+                    self._load_errors += 1
+
+            with self._condition:
+                if self._condition.wait_for(lambda: self._stopped, self._load_interval):
+                    return
+
+
+def _percentile_ms(ordered: list[float], q: float) -> float:
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, int(q * len(ordered)))
+    return round(ordered[index] * 1000, 2)
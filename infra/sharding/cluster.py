@@ -0,0 +1,225 @@
+"""
+Ring: Infrastructure (Sharding / Cluster)
+
+Responsibility:
+Owns the connections to every shard database and the current shard map, and
+routes an account id to the shard that holds it.
+
+Design intent:
+- Every shard is a complete database with the full schema. A shard is opened with
+  the same engine setup as the primary database: WAL and BEGIN IMMEDIATE for a
+  SQLite file, plus a separate read-only engine. Several SQLite files therefore
+  stand in for several database servers.
+- The shard map is read from the directory database (DATABASE_URL) at start and
+  again whenever a shard reports that it no longer owns a slot. The map is only
+  a routing hint. Each shard's shard_slots table is what a transaction checks,
+  so a stale map costs a retry, never a write to the wrong shard.
+- A new cluster is bootstrapped with slots dealt round-robin over SHARD_URLS.
+  Ownership rows are written to the shards before the map, so a crash part-way
+  leaves no slot in the map that its shard does not own. Shards appended to
+  SHARD_URLS later start empty and receive slots from the rebalancer
+  (infra/sharding/rebalance).
+
+This module contains:
+- SHARD_URLS: configuration.
+- ShardSlotMovedError / ShardSlotMovingError: a slot was not where the map said,
+  or is being moved. Both are transient and retried by the write retrier.
+- ShardingStats: a point-in-time view of the cluster, for metrics.
+- ShardCluster: engines, session factories, the shard map and counters.
+
+Dependency constraints:
+- Must not import from the Application layer (features/*).
+- May depend on other infrastructure modules (sessions, ORM models).
+- May depend on infrastructure tooling (SQLAlchemy) and the standard library.
+
+Stability:
+- Volatile.
+
+Usage:
+- Opened at startup by root/shard_setup when LEDGER_BACKEND=sharded, and by the
+  rebalancing CLI.
+- Used by infra/sharding's unit of work, repositories, recovery and rebalancer.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from sqlalchemy import Engine, func, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from infra.db.session import ORMBase, create_read_engine, create_write_engine
+from infra.db.sharding.model import SLOT_OWNED, ShardMapModel, ShardSlotModel
+from infra.sharding.placement import ShardMap
+
+SHARD_URLS = [url for url in os.environ.get("SHARD_URLS", "").split(",") if url]
+
+
+class ShardSlotMovedError(RuntimeError):
+    """
+    A shard does not own a slot the shard map assigned to it; the map has been
+    refreshed.
+    """
+
+
+class ShardSlotMovingError(RuntimeError):
+    """
+    A slot is being moved to another shard; writes to it wait for the move.
+    """
+
+
+@dataclass(frozen=True, slots=True)
+class ShardingStats:
+    shards: int
+    slots_per_shard: list[int]
+    map_refreshes: int
+    single_shard_commits: int
+    cross_shard_commits: int
+    deferred_credits: int
+    recovered_credits: int
+
+
+class ShardCluster:
+    def __init__(
+        self, *, urls: Sequence[str], directory: sessionmaker[Session]
+    ) -> None:
+        if not urls:
+            raise ValueError("LEDGER_BACKEND=sharded requires SHARD_URLS")
+
+        self._engines: list[Engine] = []
+        self._read_engines: list[Engine] = []
+        self._writers: list[sessionmaker[Session]] = []
+        self._readers: list[sessionmaker[Session]] = []
+        for url in urls:
+            write_engine = create_write_engine(url)
+            read_engine = create_read_engine(url, write_engine)
+            self._engines.append(write_engine)
+            self._read_engines.append(read_engine)
+            self._writers.append(_session_factory(write_engine))
+            self._readers.append(_session_factory(read_engine))
+
+        self._directory = directory
+        self._map = ShardMap.initial(len(urls))
+        self._lock = threading.Lock()
+        self._map_refreshes = 0
+        self._single_shard_commits = 0
+        self._cross_shard_commits = 0
+        self._deferred_credits = 0
+        self._recovered_credits = 0
+
+    @classmethod
+    def open(
+        cls, urls: Sequence[str], *, directory: sessionmaker[Session]
+    ) -> ShardCluster:
+        """
+        Create missing tables on every shard, bootstrap a new cluster, load the map.
+        """
+        cluster = cls(urls=urls, directory=directory)
+        for engine in cluster._engines:
+            ORMBase.metadata.create_all(bind=engine)
+        cluster._bootstrap()
+        cluster.refresh_map()
+        return cluster
+
+    @property
+    def shard_count(self) -> int:
+        return len(self._engines)
+
+    def shard_map(self) -> ShardMap:
+        return self._map
+
+    def shard_of(self, account_id: str) -> int:
+        return self._map.shard_of(account_id)
+
+    def refresh_map(self) -> ShardMap:
+        with self._directory() as session:
+            rows = session.execute(
+                select(ShardMapModel.slot, ShardMapModel.shard).order_by(
+                    ShardMapModel.slot
+                )
+            ).all()
+        shard_map = ShardMap(shard for _, shard in rows)
+        unknown = {shard for _, shard in rows if shard >= self.shard_count}
+        if unknown:
+            raise ValueError(
+                f"Shard map assigns slots to shards {sorted(unknown)}, "
+                f"but only {self.shard_count} SHARD_URLS are configured"
+            )
+        with self._lock:
+            self._map = shard_map
+            self._map_refreshes += 1
+        return shard_map
+
+    def engines(self, shard: int) -> tuple[Engine, Engine]:
+        """
+        The shard's write and read engines, which are one engine for in-memory SQLite.
+        """
+        return self._engines[shard], self._read_engines[shard]
+
+    def write_session(self, shard: int) -> Session:
+        return self._writers[shard]()
+
+    def read_session(self, shard: int) -> Session:
+        return self._readers[shard]()
+
+    def directory_session(self) -> Session:
+        return self._directory()
+
+    def record_commit(self, *, cross_shard: bool, deferred: int = 0) -> None:
+        with self._lock:
+            if cross_shard:
+                self._cross_shard_commits += 1
+                self._deferred_credits += deferred
+            else:
+                self._single_shard_commits += 1
+
+    def record_recovered(self, credits: int) -> None:
+        with self._lock:
+            self._recovered_credits += credits
+
+    def stats(self) -> ShardingStats:
+        shard_map = self._map
+        with self._lock:
+            return ShardingStats(
+                shards=self.shard_count,
+                slots_per_shard=[
+                    len(shard_map.slots_of(shard)) for shard in range(self.shard_count)
+                ],
+                map_refreshes=self._map_refreshes,
+                single_shard_commits=self._single_shard_commits,
+                cross_shard_commits=self._cross_shard_commits,
+                deferred_credits=self._deferred_credits,
+                recovered_credits=self._recovered_credits,
+            )
+
+    def _bootstrap(self) -> None:
+        with self._directory() as session:
+            if session.scalar(select(func.count()).select_from(ShardMapModel)):
+                return
+
+        initial = ShardMap.initial(self.shard_count)
+        for shard, writer in enumerate(self._writers):
+            with writer() as session:
+                if session.scalar(select(func.count()).select_from(ShardSlotModel)):
+                    continue
+                session.add_all(
+                    ShardSlotModel(slot=slot, state=SLOT_OWNED)
+                    for slot in initial.slots_of(shard)
+                )
+                session.commit()
+
+        with self._directory() as session:
+            if session.scalar(select(func.count()).select_from(ShardMapModel)):
+                return  # bootstrapped concurrently by another process
+            session.add_all(
+                ShardMapModel(slot=slot, shard=shard)
+                for slot, shard in initial.assignments()
+            )
+            session.commit()
+
+
+def _session_factory(bind: Engine) -> sessionmaker[Session]:
+    return sessionmaker(bind=bind, autoflush=False, autocommit=False, future=True)
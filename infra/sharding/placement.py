@@ -0,0 +1,78 @@
+"""
+Ring: Infrastructure (Sharding / Placement)
+
+Responsibility:
+Decides which shard holds an account: the account id is hashed to one of a fixed
+number of slots, and a shard map assigns every slot to a shard.
+
+Design intent:
+- The slot of an account never changes; only the shard a slot is assigned to
+  does. Rebalancing therefore moves whole slots, i.e. hash ranges of accounts,
+  and never rehashes.
+- SLOT_COUNT is fixed for the life of a deployment. It bounds the number of
+  shards and the granularity of a move, and 1024 is far more than the number of
+  shards a host's SQLite files would ever need.
+- The hash is BLAKE2b over the id's text, so placement is identical in every
+  process and across restarts (Python's own `hash` is salted per process).
+- A ShardMap is an immutable snapshot. Refreshing the map swaps the snapshot, so
+  a reader never sees a half-updated assignment.
+
+This module contains:
+- SLOT_COUNT: the number of hash slots.
+- slot_of: the slot of an account id.
+- ShardMap: a slot-to-shard assignment.
+
+Dependency constraints:
+- Must not import from the Domain layer (core/).
+- Must not import from the Application layer (features/*).
+- May depend only on the standard library.
+
+Stability:
+- Stable. Changing the hash or SLOT_COUNT would misplace every stored account.
+
+Usage:
+- Used by infra/sharding/cluster to route accounts to shards.
+- slot_of is the insert default of accounts.slot (infra/db/accounts/model), which
+  the rebalancer reads to find a slot's accounts.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from array import array
+from collections.abc import Iterable
+
+SLOT_COUNT = 1024
+
+
+def slot_of(account_id: str) -> int:
+    digest = hashlib.blake2b(account_id.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little") % SLOT_COUNT
+
+
+class ShardMap:
+    __slots__ = ("_shards",)
+
+    def __init__(self, shards: Iterable[int]) -> None:
+        self._shards = array("H", shards)
+        if len(self._shards) != SLOT_COUNT:
+            raise ValueError(f"A shard map assigns exactly {SLOT_COUNT} slots")
+
+    @classmethod
+    def initial(cls, shard_count: int) -> ShardMap:
+        """
+        Slots dealt round-robin over `shard_count` shards.
+        """
+        return cls(slot % shard_count for slot in range(SLOT_COUNT))
+
+    def shard_of(self, account_id: str) -> int:
+        return self._shards[slot_of(account_id)]
+
+    def shard_of_slot(self, slot: int) -> int:
+        return self._shards[slot]
+
+    def slots_of(self, shard: int) -> list[int]:
+        return [slot for slot, owner in enumerate(self._shards) if owner == shard]
+
+    def assignments(self) -> list[tuple[int, int]]:
+        return list(enumerate(self._shards))
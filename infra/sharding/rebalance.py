@@ -0,0 +1,240 @@
+"""
+Ring: Infrastructure (Sharding / Rebalancing)
+
+Responsibility:
+Moves slots (hash ranges of accounts) from one shard to another while the
+application keeps serving every other slot.
+
+Design intent:
+A move is a sequence of short transactions, each safe to repeat. Re-running an
+interrupted move finishes it:
+1. freeze: the slot becomes "moving" on the source. Transactions that already
+   hold the source's lock finish first. After that, writes to the slot's
+   accounts fail with ShardSlotMovingError and are retried with backoff, while
+   reads continue.
+2. recover: the slot's outstanding cross-shard credits in the source's log are
+   completed. A log row on the source must not outlive the transfer row it
+   refers to. Only the slot's rows are read, so the step does not grow with the
+   cluster's write load.
+3. copy: the slot's accounts and every transfer that involves them are copied
+   to the target in one transaction, and the target takes ownership of the
+   slot. Transfers the target already holds, i.e. the other copy of a
+   cross-shard transfer, are skipped.
+4. assign: the directory's shard map points the slot at the target. Processes
+   with the old map find the slot gone from the source and refresh.
+5. release: the source deletes the slot's accounts, the transfers it no longer
+   needs, and its ownership row.
+Between 3 and 5 both shards hold the slot, but the source's copy is frozen, so
+the two never diverge. A move interrupted there already has the map pointing at
+the target, so a re-run finds the source as the other shard still holding the
+slot, and releases it.
+A slot's accounts are found through the indexed accounts.slot column. Moves are
+made one slot at a time, so each freeze lasts one copy of one slot.
+Rows are copied and deleted directly, not through a unit of work, so the shards'
+state digests and change feeds do not record moves. Neither is served for the
+sharded backend.
+
+This module contains:
+- SlotMove: the outcome of moving one slot.
+- move_slot: moves one slot to a target shard.
+
+Dependency constraints:
+- Must not import from the Application layer (features/*).
+- May depend on other infrastructure modules and SQLAlchemy.
+
+Stability:
+- Volatile.
+
+Usage:
+- Used by root/cli/rebalance_shards.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any, cast
+
+from sqlalchemy import Table, delete, insert, or_, select, update
+from sqlalchemy.orm import Session
+
+from infra.db.accounts.model import AccountModel
+from infra.db.sharding.model import (
+    SLOT_MOVING,
+    SLOT_OWNED,
+    ShardMapModel,
+    ShardSlotModel,
+)
+from infra.db.transfers.model import TransferModel
+from infra.sharding.cluster import ShardCluster
+from infra.sharding.recovery import recover_slot_commits
+
+_BATCH = 500
+
+_accounts = cast(Table, AccountModel.__table__)
+_transfers = cast(Table, TransferModel.__table__)
+
+
+@dataclass(frozen=True, slots=True)
+class SlotMove:
+    slot: int
+    source: int
+    target: int
+    accounts: int
+    transfers: int
+
+
+def move_slot(cluster: ShardCluster, *, slot: int, target: int) -> SlotMove:
+    assigned = cluster.refresh_map().shard_of_slot(slot)
+    source = assigned if assigned != target else _stale_holder(cluster, slot, target)
+    if source is None:
+        return SlotMove(
+            slot=slot, source=target, target=target, accounts=0, transfers=0
+        )
+
+    accounts = transfers = 0
+    if _state(cluster, target, slot) is None:
+        _freeze(cluster, source, slot)
+        pending = recover_slot_commits(cluster, shard=source, slot=slot)
+        if pending:
+            raise RuntimeError(
+                f"Slot {slot} has {pending} cross-shard transfers awaiting recovery; "
+                "retry the move"
+            )
+        accounts, transfers = _copy(cluster, source, target, slot)
+
+    if assigned != target:
+        _assign(cluster, slot, target)
+    _release(cluster, source, slot)
+    return SlotMove(
+        slot=slot, source=source, target=target, accounts=accounts, transfers=transfers
+    )
+
+
+def _stale_holder(cluster: ShardCluster, slot: int, target: int) -> int | None:
+    """
+    The shard other than `target` that still holds `slot`, if a move to `target`
+    was interrupted after the map was updated.
+    """
+    for shard in range(cluster.shard_count):
+        if shard != target and _state(cluster, shard, slot) is not None:
+            return shard
+    return None
+
+
+def _state(cluster: ShardCluster, shard: int, slot: int) -> str | None:
+    with cluster.read_session(shard) as session:
+        return session.scalar(
+            select(ShardSlotModel.state).where(ShardSlotModel.slot == slot)
+        )
+
+
+def _freeze(cluster: ShardCluster, source: int, slot: int) -> None:
+    with cluster.write_session(source) as session:
+        frozen = (
+            session.connection()
+            .execute(
+                update(ShardSlotModel)
+                .where(ShardSlotModel.slot == slot)
+                .values(state=SLOT_MOVING)
+            )
+            .rowcount
+        )
+        if not frozen:
+            raise RuntimeError(
+                f"Slot {slot} is owned by neither shard {source} nor the target"
+            )
+        session.commit()
+
+
+def _copy(
+    cluster: ShardCluster, source: int, target: int, slot: int
+) -> tuple[int, int]:
+    with cluster.read_session(source) as session:
+        accounts = [
+            dict(row._mapping)
+            for row in _slot_accounts(session, slot, columns=list(_accounts.c))
+        ]
+        transfers = _transfers_of(session, [row["id"] for row in accounts])
+
+    with cluster.write_session(target) as session:
+        present = _present_transfers(session, [row["id"] for row in transfers])
+        missing = [row for row in transfers if row["id"] not in present]
+        if accounts:
+            session.execute(insert(_accounts), accounts)
+        if missing:
+            session.execute(insert(_transfers), missing)
+        session.add(ShardSlotModel(slot=slot, state=SLOT_OWNED))
+        session.commit()
+    return len(accounts), len(missing)
+
+
+def _assign(cluster: ShardCluster, slot: int, target: int) -> None:
+    with cluster.directory_session() as session:
+        session.execute(
+            update(ShardMapModel).where(ShardMapModel.slot == slot).values(shard=target)
+        )
+        session.commit()
+    cluster.refresh_map()
+
+
+def _release(cluster: ShardCluster, source: int, slot: int) -> None:
+    # The slot is frozen on the source, so what it holds cannot change between
+    # this read and the delete below.
+    shard_map = cluster.shard_map()
+    with cluster.read_session(source) as session:
+        moved = {
+            row.id for row in _slot_accounts(session, slot, columns=[_accounts.c.id])
+        }
+        unneeded = [
+            row["id"]
+            for row in _transfers_of(session, sorted(moved))
+            if not any(
+                account_id not in moved and shard_map.shard_of(account_id) == source
+                for account_id in (row["from_account_id"], row["to_account_id"])
+            )
+        ]
+
+    with cluster.write_session(source) as session:
+        for table, column, ids in (
+            (_transfers, _transfers.c.id, unneeded),
+            (_accounts, _accounts.c.id, sorted(moved)),
+        ):
+            for start in range(0, len(ids), _BATCH):
+                session.execute(
+                    delete(table).where(column.in_(ids[start : start + _BATCH]))
+                )
+        session.execute(delete(ShardSlotModel).where(ShardSlotModel.slot == slot))
+        session.commit()
+
+
+def _slot_accounts(session: Session, slot: int, *, columns: Sequence[Any]) -> list[Any]:
+    return list(session.execute(select(*columns).where(_accounts.c.slot == slot)))
+
+
+def _transfers_of(session: Session, account_ids: list[str]) -> list[dict[str, Any]]:
+    rows: dict[str, dict[str, Any]] = {}
+    for start in range(0, len(account_ids), _BATCH):
+        batch = account_ids[start : start + _BATCH]
+        stmt = select(*_transfers.c).where(
+            or_(
+                _transfers.c.from_account_id.in_(batch),
+                _transfers.c.to_account_id.in_(batch),
+            )
+        )
+        for row in session.execute(stmt):
+            rows[row.id] = dict(row._mapping)
+    return list(rows.values())
+
+
+def _present_transfers(session: Session, transfer_ids: list[str]) -> set[str]:
+    present: set[str] = set()
+    for start in range(0, len(transfer_ids), _BATCH):
+        present.update(
+            session.scalars(
+                select(TransferModel.id).where(
+                    TransferModel.id.in_(transfer_ids[start : start + _BATCH])
+                )
+            )
+        )
+    return present
@@ -0,0 +1,193 @@
+"""
+Ring: Infrastructure (Sharding / Cross-Shard Recovery)
+
+Responsibility:
+Completes cross-shard transfers from the coordinators' logs: every transfer with
+a cross_shard_commits row has committed its debit, and its credit is applied on
+the other shard unless that shard already has it.
+
+Design intent:
+- The credit shard's copy of the transfer is written in the same transaction as
+  the credit. "The transfer id exists on the credit shard" is therefore the test
+  for "the credit committed", and redoing a credit is idempotent.
+- The test and the redo run in one write transaction on the credit shard. That
+  transaction waits for the shard's lock, so a transfer that is still between
+  its commit point and its credit, in this or any other process, is seen
+  completed rather than redone.
+- On PostgreSQL the test takes no lock, so two processes recovering the same
+  transfer at once can both find it missing. The second insert of the transfer
+  then fails on its primary key. A redo that fails with an IntegrityError is
+  treated as completed if the transfer is on the credit shard after all, and is
+  otherwise left for the next pass.
+- The credit goes to the shard that holds the account now, not when the transfer
+  was made, so a credit outstanding while its account was moved is applied at
+  its new shard. A record whose credit slot is being moved is left for the next
+  pass.
+- Once the credit is known to be committed, the log row is deleted. The same pass
+  therefore also trims the log of transfers that completed normally. The log is
+  read and trimmed a page of rows at a time, one delete per page. A pass stops
+  at the newest row logged when it started, so it ends under write load.
+- A slot move recovers only the source's log rows for transfers of the slot's
+  accounts. Once the slot is frozen, no new rows for them can be logged there.
+
+This module contains:
+- recover_cross_shard_commits: one recovery pass over every shard's log.
+- recover_slot_commits: one recovery pass over one shard's log rows for a slot.
+
+Dependency constraints:
+- Must not import from the Application layer (features/*).
+- May depend on the Domain layer (core/) and other infrastructure modules.
+
+Stability:
+- Volatile.
+- Changes with the cross-shard commit protocol (infra/sharding/unit_of_work).
+
+Usage:
+- recover_cross_shard_commits is run at startup and periodically by
+  root/shard_setup; recover_slot_commits before every slot move by the
+  rebalancer.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import Select, delete, func, or_, select
+from sqlalchemy.exc import IntegrityError
+
+from core.entities.transfer import Transfer
+from infra.db.accounts.model import AccountModel
+from infra.db.accounts.repo import AccountRepo
+from infra.db.sharding.model import CrossShardCommitModel
+from infra.db.transfers.mapper import to_entity
+from infra.db.transfers.model import TransferModel
+from infra.db.transfers.repo import TransferRepo
+from infra.sharding.cluster import (
+    ShardCluster,
+    ShardSlotMovedError,
+    ShardSlotMovingError,
+)
+from infra.sharding.unit_of_work import ShardedUnitOfWork
+
+_PAGE = 500
+
+_LOGGED = select(TransferModel).join(
+    CrossShardCommitModel, CrossShardCommitModel.transfer_id == TransferModel.id
+)
+
+
+def recover_cross_shard_commits(cluster: ShardCluster) -> int:
+    """
+    Returns the number of credits that had to be redone.
+    """
+    redone = 0
+    for coordinator in range(cluster.shard_count):
+        redone += _recover(cluster, coordinator, _LOGGED)[0]
+    cluster.record_recovered(redone)
+    return redone
+
+
+def recover_slot_commits(cluster: ShardCluster, *, shard: int, slot: int) -> int:
+    """
+    Recovers the transfers in `shard`'s log that involve an account of `slot`.
+    Returns how many of them are still outstanding.
+    """
+    slot_accounts = select(AccountModel.id).where(AccountModel.slot == slot)
+    logged = _LOGGED.where(
+        or_(
+            TransferModel.from_account_id.in_(slot_accounts),
+            TransferModel.to_account_id.in_(slot_accounts),
+        )
+    )
+    redone, outstanding = _recover(cluster, shard, logged)
+    cluster.record_recovered(redone)
+    return outstanding
+
+
+def _recover(
+    cluster: ShardCluster, coordinator: int, logged: Select[tuple[TransferModel]]
+) -> tuple[int, int]:
+    """
+    Returns the number of credits redone and of log rows left for the next pass.
+    """
+    with cluster.read_session(coordinator) as session:
+        newest = session.scalar(select(func.max(CrossShardCommitModel.committed_at_us)))
+    if newest is None:
+        return 0, 0
+
+    page_stmt = (
+        logged.where(CrossShardCommitModel.committed_at_us <= newest)
+        .order_by(
+            CrossShardCommitModel.committed_at_us, CrossShardCommitModel.transfer_id
+        )
+        .limit(_PAGE)
+    )
+    redone = skipped = 0
+    while True:
+        # Completed rows are deleted, so the rows skipped so far sort first.
+        with cluster.read_session(coordinator) as session:
+            page = [
+                to_entity(model) for model in session.scalars(page_stmt.offset(skipped))
+            ]
+
+        completed = []
+        for transfer in page:
+            outcome = _try_complete(cluster, transfer)
+            if outcome is None:
+                skipped += 1  # retried by the next pass
+                continue
+            redone += outcome
+            completed.append(str(transfer.id))
+        _trim(cluster, coordinator, completed)
+
+        if len(page) < _PAGE:
+            return redone, skipped
+
+
+def _try_complete(cluster: ShardCluster, transfer: Transfer) -> int | None:
+    """
+    1 if the credit was redone, 0 if it was already applied, None to retry later.
+    """
+    try:
+        return _complete(cluster, transfer)
+    except (ShardSlotMovedError, ShardSlotMovingError):
+        return None
+    except IntegrityError:
+        return 0 if _credited(cluster, transfer) else None
+
+
+def _credited(cluster: ShardCluster, transfer: Transfer) -> bool:
+    shard = cluster.shard_of(str(transfer.to_account_id))
+    with cluster.read_session(shard) as session:
+        return session.get(TransferModel, str(transfer.id)) is not None
+
+
+def _complete(cluster: ShardCluster, transfer: Transfer) -> int:
+    uow = ShardedUnitOfWork(cluster=cluster)
+    try:
+        credit_uow = uow.shard_uow(uow.open_shard(str(transfer.to_account_id)))
+        applied = credit_uow.session.get(TransferModel, str(transfer.id)) is not None
+        if not applied:
+            accounts = AccountRepo(uow=credit_uow)
+            account = accounts.get(transfer.to_account_id)
+            if account is None:
+                raise LookupError(
+                    f"Credited account not found: {transfer.to_account_id}"
+                )
+            accounts.save(account.credit(transfer.amount))
+            TransferRepo(uow=credit_uow).save(transfer)
+            credit_uow.commit()
+    finally:
+        uow.rollback()
+        uow.close()
+    return 0 if applied else 1
+
+
+def _trim(cluster: ShardCluster, coordinator: int, transfer_ids: list[str]) -> None:
+    if not transfer_ids:
+        return
+    with cluster.write_session(coordinator) as session:
+        session.execute(
+            delete(CrossShardCommitModel).where(
+                CrossShardCommitModel.transfer_id.in_(transfer_ids)
+            )
+        )
+        session.commit()
@@ -0,0 +1,118 @@
+"""
+Ring: Infrastructure (Sharding / Repositories)
+
+Responsibility:
+Implements the account and transfer repository ports over a sharded unit of work,
+by routing every operation to the SQL repositories of the shards involved.
+
+Design intent:
+- Each shard is accessed with the ordinary AccountRepo and TransferRepo over that
+  shard's SqlUnitOfWork, so the row mapping, staging and flush order are
+  exactly those of the single-database backend.
+- `get_many` opens the shards of all requested accounts in ascending order, which
+  keeps lock acquisition ordered across shards.
+- A transfer is stored on the shard of each of its accounts: once for a
+  same-shard transfer, twice for a cross-shard one. The history of an account is
+  then read from its own shard alone. The global history merges all shards in
+  (created_at, id) order and drops the second copy of a cross-shard transfer.
+
+This module contains:
+- ShardedAccountRepo: AccountRepoPort over ShardedUnitOfWork.
+- ShardedTransferRepo: TransferRepoPort over ShardedUnitOfWork.
+
+Dependency constraints:
+- Must not be imported by application use case code directly (wired through DI).
+- Must depend on application ports (features/*/ports) to implement them.
+- May depend on the Domain layer (core/) and other infrastructure modules.
+
+Stability:
+- Volatile.
+
+Usage:
+- Wired in root/di when LEDGER_BACKEND=sharded.
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections.abc import Collection, Iterator
+from datetime import datetime
+
+from core.entities.account import Account
+from core.entities.transfer import Transfer
+from core.values.custom_types import AccountId
+from features.accounts.ports import AccountRepoPort
+from features.transfers.cursors import TransferCursor
+from features.transfers.ports import TransferRepoPort
+from infra.db.accounts.repo import AccountRepo
+from infra.db.transfers.repo import TransferRepo
+from infra.sharding.unit_of_work import ShardedUnitOfWork
+
+
+class ShardedAccountRepo(AccountRepoPort):
+    def __init__(self, *, uow: ShardedUnitOfWork) -> None:
+        self._uow = uow
+
+    def get(self, account_id: AccountId) -> Account | None:
+        return self.get_many([account_id]).get(account_id)
+
+    def get_many(self, account_ids: Collection[AccountId]) -> dict[AccountId, Account]:
+        found: dict[AccountId, Account] = {}
+        for shard, shard_ids in self._uow.open_shards(map(str, account_ids)).items():
+            repo = AccountRepo(uow=self._uow.shard_uow(shard))
+            found.update(repo.get_many([AccountId(i) for i in shard_ids]))
+        return found
+
+    def save(self, account: Account) -> None:
+        shard = self._uow.open_shard(str(account.id))
+        AccountRepo(uow=self._uow.shard_uow(shard)).save(account)
+
+    def version(self, account_id: AccountId) -> int | None:
+        shard = self._uow.open_shard(str(account_id))
+        return AccountRepo(uow=self._uow.shard_uow(shard)).version(account_id)
+
+    def get_versioned(self, account_id: AccountId) -> tuple[int, Account] | None:
+        shard = self._uow.open_shard(str(account_id))
+        return AccountRepo(uow=self._uow.shard_uow(shard)).get_versioned(account_id)
+
+
+class ShardedTransferRepo(TransferRepoPort):
+    def __init__(self, *, uow: ShardedUnitOfWork) -> None:
+        self._uow = uow
+
+    def save(self, transfer: Transfer) -> None:
+        shards = self._uow.open_shards(
+            [str(transfer.from_account_id), str(transfer.to_account_id)]
+        )
+        debit = self._uow.cluster.shard_of(str(transfer.from_account_id))
+        for shard in shards:
+            TransferRepo(uow=self._uow.shard_uow(shard)).save(transfer)
+            if shard != debit:
+                self._uow.register_cross_shard(transfer, debit=debit, credit=shard)
+
+    def stream(
+        self,
+        *,
+        account_id: AccountId | None,
+        since: datetime | None,
+        until: datetime | None,
+        after: TransferCursor | None,
+    ) -> Iterator[Transfer]:
+        if account_id is not None:
+            shard = self._uow.open_shard(str(account_id))
+            yield from TransferRepo(uow=self._uow.shard_uow(shard)).stream(
+                account_id=account_id, since=since, until=until, after=after
+            )
+            return
+
+        streams = [
+            TransferRepo(uow=self._uow.shard_uow(shard)).stream(
+                account_id=None, since=since, until=until, after=after
+            )
+            for shard in range(self._uow.cluster.shard_count)
+        ]
+        previous: str | None = None
+        for transfer in heapq.merge(*streams, key=lambda t: (t.created_at, t.id)):
+            if transfer.id != previous:
+                yield transfer
+            previous = transfer.id
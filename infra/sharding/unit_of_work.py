@@ -0,0 +1,214 @@
+"""
+Ring: Infrastructure (Sharding / Unit of Work)
+
+Responsibility:
+Implements the UnitOfWork port across shards: one SqlUnitOfWork per shard a use
+case touches, committed as one transaction on a single shard or with a two-phase
+protocol across two.
+
+Design intent:
+- A shard's transaction starts with a read of the shard_slots rows of the
+  accounts it is asked for. File-backed SQLite shards begin with BEGIN IMMEDIATE,
+  so that read also takes the shard's write lock. A slot the shard no longer
+  owns raises ShardSlotMovedError, and a slot being moved raises
+  ShardSlotMovingError. Both are retried by the write retrier.
+- Shards are opened in ascending order within a batch of accounts
+  (`open_shards`), so two transfers in opposite directions between the same two
+  shards cannot deadlock.
+- A use case that only touched one shard commits that shard's transaction. A
+  same-shard transfer is therefore exactly as before: one local transaction.
+- A cross-shard transfer is committed by the shard holding the debited account,
+  the coordinator:
+  1. prepare: every shard's changes are written into its open transaction, and
+     the coordinator's also gets a cross_shard_commits row for the transfer;
+  2. commit point: the coordinator commits the debit, its copy of the
+     transfer and the log row, atomically;
+  3. the other shard commits the credit and its copy of the transfer.
+  A crash before 2 loses both halves, so nothing happened. After 2 the transfer
+  has happened, whatever happens to 3. A failure in 3 is left to recovery
+  (infra/sharding/recovery), which redoes the credit from the log row, and
+  `commit` still succeeds, so the use case is never retried into a second debit.
+  The coordinator's log is the only durable 2PC state: a participant's prepared
+  state is an open transaction holding its lock, which only this process can
+  commit.
+- Only transfers cross shards. A commit with changes on shards other than the
+  coordinator and its transfers' credit shards is refused, because recovery
+  could not redo them.
+- A read-only instance opens read sessions. It checks ownership but not moves,
+  and retries once with a refreshed map when a slot has moved.
+
+This module contains:
+- ShardedUnitOfWork: the sharded implementation of UnitOfWork.
+
+Dependency constraints:
+- Must not be imported by application use case code directly (wired through DI).
+- Must depend on the shared UnitOfWork port (features/_shared/ports).
+- May depend on the Domain layer (core/) for entities.
+- May depend on infrastructure tooling and other infrastructure modules.
+
+Stability:
+- Volatile.
+- Changes when the cross-shard commit protocol changes.
+
+Usage:
+- Created per write attempt in root/di/transactions, and per request for reads,
+  when LEDGER_BACKEND=sharded.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable
+from datetime import datetime, timezone
+
+from sqlalchemy import select
+
+from core.entities.transfer import Transfer
+from features._shared.ports import UnitOfWork
+from infra.db.sharding.model import SLOT_MOVING, CrossShardCommitModel, ShardSlotModel
+from infra.db.types import to_epoch_micros
+from infra.db.unit_of_work import SqlUnitOfWork
+from infra.sharding.cluster import (
+    ShardCluster,
+    ShardSlotMovedError,
+    ShardSlotMovingError,
+)
+from infra.sharding.placement import slot_of
+
+
+class ShardedUnitOfWork(UnitOfWork):
+    def __init__(self, *, cluster: ShardCluster, read_only: bool = False) -> None:
+        self.cluster = cluster
+        self._read_only = read_only
+        self._shards: dict[int, SqlUnitOfWork] = {}
+        self._verified: dict[int, set[int]] = defaultdict(set)
+        self._cross_shard: list[tuple[Transfer, int, int]] = []
+
+    def shard_uow(self, shard: int) -> SqlUnitOfWork:
+        uow = self._shards.get(shard)
+        if uow is None:
+            session = (
+                self.cluster.read_session(shard)
+                if self._read_only
+                else self.cluster.write_session(shard)
+            )
+            uow = self._shards[shard] = SqlUnitOfWork(session=session)
+        return uow
+
+    def open_shard(self, account_id: str) -> int:
+        """
+        The shard holding `account_id`, with its slot verified in this transaction.
+        """
+        (shard,) = self.open_shards([account_id])
+        return shard
+
+    def open_shards(self, account_ids: Iterable[str]) -> dict[int, list[str]]:
+        """
+        Group account ids by shard, verifying their slots shard by shard in
+        ascending order.
+        """
+        account_ids = list(account_ids)
+        try:
+            return self._open_shards(account_ids)
+        except ShardSlotMovedError:
+            if not self._read_only:
+                raise
+            return self._open_shards(account_ids)  # once, with the refreshed map
+
+    def register_cross_shard(
+        self, transfer: Transfer, *, debit: int, credit: int
+    ) -> None:
+        self._cross_shard.append((transfer, debit, credit))
+
+    def commit(self) -> None:
+        staged = sorted(
+            shard for shard, uow in self._shards.items() if uow.has_changes()
+        )
+        try:
+            if len(staged) == 1:
+                self._shards[staged[0]].commit()
+                self.cluster.record_commit(cross_shard=False)
+            elif staged:
+                self._commit_across(staged)
+        finally:
+            self._cross_shard.clear()
+
+    def rollback(self) -> None:
+        for uow in self._shards.values():
+            uow.rollback()
+        self._verified.clear()
+        self._cross_shard.clear()
+
+    def close(self) -> None:
+        for uow in self._shards.values():
+            uow.session.close()
+        self._shards.clear()
+        self._verified.clear()
+
+    def _open_shards(self, account_ids: list[str]) -> dict[int, list[str]]:
+        shard_map = self.cluster.shard_map()
+        by_shard: dict[int, list[str]] = defaultdict(list)
+        for account_id in account_ids:
+            by_shard[shard_map.shard_of(account_id)].append(account_id)
+
+        for shard in sorted(by_shard):
+            self._verify(shard, {slot_of(account_id) for account_id in by_shard[shard]})
+        return dict(sorted(by_shard.items()))
+
+    def _verify(self, shard: int, slots: set[int]) -> None:
+        unverified = slots - self._verified[shard]
+        if not unverified:
+            return
+
+        session = self.shard_uow(shard).session
+        states: dict[int, str] = {
+            slot: state
+            for slot, state in session.execute(
+                select(ShardSlotModel.slot, ShardSlotModel.state).where(
+                    ShardSlotModel.slot.in_(sorted(unverified))
+                )
+            )
+        }
+        for slot in unverified:
+            state = states.get(slot)
+            if state is None:
+                self.cluster.refresh_map()
+                raise ShardSlotMovedError(f"Slot {slot} is no longer on shard {shard}")
+            if state == SLOT_MOVING and not self._read_only:
+                raise ShardSlotMovingError(
+                    f"Slot {slot} is being moved from shard {shard}"
+                )
+        self._verified[shard] |= unverified
+
+    def _commit_across(self, staged: list[int]) -> None:
+        debits = {debit for _, debit, _ in self._cross_shard}
+        credits = {credit for _, _, credit in self._cross_shard}
+        if len(debits) != 1 or set(staged) != debits | credits:
+            raise ValueError(
+                "Only transfers debiting a single shard may be committed across shards"
+            )
+
+        (coordinator,) = debits
+        coordinator_uow = self._shards[coordinator]
+        committed_at_us = to_epoch_micros(datetime.now(timezone.utc))
+        coordinator_uow.session.add_all(
+            CrossShardCommitModel(
+                transfer_id=str(transfer.id), committed_at_us=committed_at_us
+            )
+            for transfer, _, _ in self._cross_shard
+        )
+
+        for shard in staged:
+            self._shards[shard].prepare()
+        coordinator_uow.session.commit()  # the commit point
+
+        deferred = 0
+        for shard in staged:
+            if shard == coordinator:
+                continue
+            try:
+                self._shards[shard].session.commit()
+            except Exception:
+                deferred += 1  # the credit is redone by recovery
+                self._shards[shard].session.rollback()
+        self.cluster.record_commit(cross_shard=True, deferred=deferred)
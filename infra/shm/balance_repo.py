@@ -0,0 +1,84 @@
+"""
+Ring: Infrastructure (Persistence / Repository Decorators)
+
+Responsibility:
+Implements an AccountRepoPort decorator that answers single-account reads from
+the shared-memory balance table (infra/shm/balance_table), and loads from the
+wrapped repository only on a miss.
+
+Design intent:
+- `version`, `get` and `get_versioned` are served from the table when it holds
+  the account. Each is one consistent slot read, so a balance is always paired
+  with its own version.
+- On a miss, the account and its version are read together from the wrapped
+  repository (`get_versioned`), and the table is filled with both. The table
+  therefore never stores a balance under another state's version.
+- Writes never go through this decorator. The table is published to by the
+  write path's unit of work, after its commit.
+
+This module contains:
+- SharedBalanceAccountRepo: the AccountRepoPort decorator.
+
+Dependency constraints:
+- Must not be imported by application use case code directly (wired through DI).
+- Must depend on application ports (features/accounts/ports) to implement them.
+- May depend on the Domain layer (core/) for entities and value types.
+
+Stability:
+- Moderately stable.
+
+Usage:
+- Wired in root/di around the repository used by AccountGetter, when the table is
+  enabled (root/shared_balances_setup).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Collection
+
+from core.entities.account import Account
+from core.values.custom_types import AccountId
+from core.values.objects import Money
+from features.accounts.ports import AccountRepoPort
+from infra.shm.balance_table import SharedBalanceTable
+
+
+class SharedBalanceAccountRepo(AccountRepoPort):
+    """
+    AccountRepo whose `get` and `version` are served from shared memory when possible.
+    """
+
+    def __init__(self, *, inner: AccountRepoPort, table: SharedBalanceTable) -> None:
+        self._inner = inner
+        self._table = table
+
+    def get(self, account_id: AccountId) -> Account | None:
+        versioned = self.get_versioned(account_id)
+        return None if versioned is None else versioned[1]
+
+    def get_many(self, account_ids: Collection[AccountId]) -> dict[AccountId, Account]:
+        return self._inner.get_many(account_ids)
+
+    def save(self, account: Account) -> None:
+        self._inner.save(account)
+
+    def version(self, account_id: AccountId) -> int | None:
+        cached = self._table.read(str(account_id))
+        if cached is not None:
+            _, version = cached
+            return version
+        return self._inner.version(account_id)
+
+    def get_versioned(self, account_id: AccountId) -> tuple[int, Account] | None:
+        cached = self._table.read(str(account_id))
+        if cached is not None:
+            balance_pence, version = cached
+            return version, Account(id=account_id, balance=Money(balance_pence))
+
+        versioned = self._inner.get_versioned(account_id)
+        if versioned is not None:
+            version, account = versioned
+            self._table.fill(
+                str(account_id), balance_pence=account.balance.pence, version=version
+            )
+        return versioned
@@ -0,0 +1,481 @@
+"""
+Ring: Infrastructure (Shared Memory / Balances)
+
+Responsibility:
+Keeps account balances in a shared-memory hash table that every process on the
+host maps, so any worker can answer a balance read without a query.
+
+Design intent:
+- The table is a named `multiprocessing.shared_memory` segment holding a fixed
+  number of 64-byte slots, addressed by open addressing with a bounded linear
+  probe. A slot holds a 128-bit BLAKE2b digest of the account id, the balance,
+  the account's change version, and a count of commits in flight. Slots are
+  claimed and never freed. When an account's probe window is full, that account
+  is simply not cached.
+- Each slot carries a sequence number, seqlock style. A writer makes it odd
+  before changing the slot and even afterwards. A reader copies the slot and
+  accepts the copy only if the sequence was even and unchanged across the copy,
+  so reads take no lock. Writers serialize on an exclusive flock of a lock
+  file, plus a thread lock inside each process.
+- A writer that dies mid-write leaves a slot odd. The kernel releases its
+  flock, and the next writer to probe that slot repairs it. Repairing
+  invalidates the slot instead of guessing at its contents. Readers give up on
+  a slot that stays odd and fall back to the database.
+- Only committed state is published, and never older state: a value replaces the
+  slot only if its version is newer. A write marks its accounts pending before it
+  commits and publishes after; while any commit is pending, the slot is not
+  served. A writer that dies between its commit and its publish would otherwise
+  leave a stale balance behind. Instead the slot stays pending until
+  `pending_lease` has passed, and the next database read (`fill`) replaces it.
+  A commit that fails leaves the slot invalid, since a failed commit may still
+  have been applied.
+- Slots are also filled from database reads. A fill is refused while the slot
+  is pending, and ignored unless newer than what the slot holds, so it cannot
+  undo a publish.
+- Every process that writes account balances must publish to the table, or
+  readers would serve balances that its writes made stale. The table keeps no
+  record of who maps it. It outlives its processes and is reused by the next
+  ones.
+- The header is stamped with the id of the database the table caches. A process
+  that opens the table for another database, for example one dropped and created
+  again, empties it and stamps the new id. From then on, processes still mapping
+  it for the old id neither serve nor store anything. A database restored from
+  a backup keeps its id, so the table must still be removed after a restore.
+
+This module contains:
+- SharedBalanceStats: a point-in-time view of the table, for metrics.
+- SharedBalanceTable: the table: reads, fills, and the publishing protocol.
+
+Dependency constraints:
+- Must not import from the Application layer (features/*).
+- May depend on the standard library only.
+
+Stability:
+- Volatile.
+- The slot layout is shared by every process mapping the table; changing it
+  requires a new table name.
+
+Usage:
+- Opened at startup by root/shared_balances_setup and by the standing order
+  runner.
+- Published to by SqlUnitOfWork (infra/db/unit_of_work) around its commit.
+- Read through SharedBalanceAccountRepo (infra/shm/balance_repo).
+"""
+
+from __future__ import annotations
+
+import fcntl
+import hashlib
+import os
+import struct
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+# capacity, used slots, database id
+_HEADER = struct.Struct("<QQ16s")
+_DATABASE_ID_OFFSET = 16
+_HEADER_SIZE = 64
+
+_SEQ = struct.Struct("<Q")
+# key digest, balance, version, pending commits, valid, pending since (epoch s)
+_BODY = struct.Struct("<16sqqIId")
+_SLOT_SIZE = 64
+
+_EMPTY_KEY = bytes(16)
+_MAX_PROBE = 16
+_READ_ATTEMPTS = 64
+_ATTACH_ATTEMPTS = 50
+
+
+@dataclass(frozen=True, slots=True)
+class SharedBalanceStats:
+    name: str
+    database_id: str
+    capacity: int
+    used_slots: int
+    hits: int
+    misses: int
+    fills: int
+    published: int
+    abandoned: int
+    torn_reads: int
+    repaired_slots: int
+    expired_leases: int
+    unplaced: int
+    cleared_slots: int  # emptied by this process when it stamped a new database id
+
+
+@dataclass(slots=True)
+class _Slot:
+    key: bytes
+    balance: int
+    version: int
+    pending: int
+    valid: int
+    pending_since: float
+
+
+class SharedBalanceTable:
+    def __init__(
+        self,
+        *,
+        shm: SharedMemory,
+        capacity: int,
+        pending_lease: float,
+        database_id: bytes,
+    ) -> None:
+        self._shm = shm
+        self._buf = shm.buf
+        self._capacity = capacity
+        self._pending_lease = pending_lease
+        self._database_id = database_id
+
+        self._thread_lock = threading.Lock()
+        self._lock_fd = os.open(
+            os.path.join(tempfile.gettempdir(), f"{shm.name.lstrip('/')}.lock"),
+            os.O_RDWR | os.O_CREAT,
+            0o600,
+        )
+
+        self._counts_lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._fills = 0
+        self._published = 0
+        self._abandoned = 0
+        self._torn_reads = 0
+        self._repaired_slots = 0
+        self._expired_leases = 0
+        self._unplaced = 0
+        self._cleared_slots = 0
+
+    @classmethod
+    def open(
+        cls,
+        name: str,
+        *,
+        capacity: int,
+        database_id: bytes,
+        pending_lease: float = 30.0,
+    ) -> SharedBalanceTable:
+        """
+        Map the named table, creating it (empty) if no process has yet, as the
+        cache of the database identified by the 16 bytes of `database_id`.
+        """
+        size = _HEADER_SIZE + capacity * _SLOT_SIZE
+        shm = _create_or_attach(name, size)
+        if shm.size < size:
+            shm.close()
+            raise RuntimeError(
+                f"Shared balance table {name!r} exists with a different capacity"
+            )
+
+        # A fresh segment is zero-filled, which is a valid empty table.
+        existing, _, _ = _HEADER.unpack_from(shm.buf, 0)
+        if existing == 0:
+            _HEADER.pack_into(shm.buf, 0, capacity, 0, bytes(16))
+        elif existing != capacity:
+            shm.close()
+            raise RuntimeError(
+                f"Shared balance table {name!r} has capacity {existing}, not {capacity}"
+            )
+        table = cls(
+            shm=shm,
+            capacity=capacity,
+            pending_lease=pending_lease,
+            database_id=database_id,
+        )
+        table._stamp()
+        return table
+
+    def close(self) -> None:
+        """
+        Unmap the table in this process. The table itself stays for other processes.
+        """
+        os.close(self._lock_fd)
+        self._shm.close()
+
+    def read(self, account_id: str) -> tuple[int, int] | None:
+        """
+        (balance_pence, version) if the table holds a servable entry, without locking.
+        """
+        if not self._stamped():
+            self._count_miss(torn=False)
+            return None
+        key = _key(account_id)
+        home = _home(key, self._capacity)
+        for probe in range(_MAX_PROBE):
+            slot = self._read_slot((home + probe) % self._capacity)
+            if slot is None:
+                self._count_miss(torn=True)
+                return None
+            if slot.key == _EMPTY_KEY:
+                break
+            if slot.key == key:
+                if slot.valid and not slot.pending:
+                    with self._counts_lock:
+                        self._hits += 1
+                    return slot.balance, slot.version
+                break
+        self._count_miss(torn=False)
+        return None
+
+    def fill(self, account_id: str, *, balance_pence: int, version: int) -> None:
+        """
+        Store a balance read from the database, unless a commit is in flight or
+        the table already holds this version or a newer one.
+        """
+        with self._locked():
+            index = self._claim(_key(account_id)) if self._stamped() else None
+            if index is None:
+                return
+            slot = self._slot_under_lock(index)
+            if slot.pending:
+                if time.time() - slot.pending_since < self._pending_lease:
+                    return
+                # Left behind by a writer that never published.
+                slot.pending = 0
+                self._expired_leases += 1
+            if version > slot.version or (not slot.valid and version >= slot.version):
+                slot.balance, slot.version, slot.valid = balance_pence, version, 1
+                self._fills += 1
+            self._write_slot(index, slot)
+
+    @contextmanager
+    def publishing(self, balances: Sequence[tuple[str, int, int]]) -> Iterator[None]:
+        """
+        Wrap the commit of (account_id, balance_pence, version) changes: the
+        accounts are pending during the block, and are published if it succeeds.
+        """
+        if not balances or not self._stamped():
+            yield
+            return
+
+        keys = [_key(account_id) for account_id, _, _ in balances]
+        self._mark_pending(keys)
+        try:
+            yield
+        except BaseException:
+            self._abandon(keys)
+            raise
+        self._publish(keys, balances)
+
+    def stats(self) -> SharedBalanceStats:
+        _, used, _ = _HEADER.unpack_from(self._buf, 0)
+        with self._counts_lock:
+            return SharedBalanceStats(
+                name=self._shm.name.lstrip("/"),
+                database_id=self._database_id.hex(),
+                capacity=self._capacity,
+                used_slots=used,
+                hits=self._hits,
+                misses=self._misses,
+                fills=self._fills,
+                published=self._published,
+                abandoned=self._abandoned,
+                torn_reads=self._torn_reads,
+                repaired_slots=self._repaired_slots,
+                expired_leases=self._expired_leases,
+                unplaced=self._unplaced,
+                cleared_slots=self._cleared_slots,
+            )
+
+    def _stamped(self) -> bool:
+        """
+        Whether the table still caches this process's database.
+        """
+        end = _DATABASE_ID_OFFSET + len(self._database_id)
+        return self._buf[_DATABASE_ID_OFFSET:end] == self._database_id
+
+    def _stamp(self) -> None:
+        """
+        Empty the table and stamp it with this process's database id, unless it
+        already caches that database.
+        """
+        with self._locked():
+            if self._stamped():
+                return
+            empty = _Slot(
+                key=_EMPTY_KEY,
+                balance=0,
+                version=0,
+                pending=0,
+                valid=0,
+                pending_since=0.0,
+            )
+            for index in range(self._capacity):
+                if self._slot_under_lock(index).key != _EMPTY_KEY:
+                    self._write_slot(index, empty)
+                    self._cleared_slots += 1
+            _HEADER.pack_into(self._buf, 0, self._capacity, 0, self._database_id)
+
+    def _mark_pending(self, keys: list[bytes]) -> None:
+        now = time.time()
+        with self._locked():
+            if not self._stamped():
+                return
+            for key in keys:
+                index = self._claim(key)
+                if index is None:
+                    continue
+                slot = self._slot_under_lock(index)
+                slot.pending += 1
+                slot.pending_since = now
+                self._write_slot(index, slot)
+
+    def _publish(
+        self, keys: list[bytes], balances: Sequence[tuple[str, int, int]]
+    ) -> None:
+        with self._locked():
+            if not self._stamped():
+                return
+            for key, (_, balance_pence, version) in zip(keys, balances):
+                index = self._claim(key)
+                if index is None:
+                    continue
+                slot = self._slot_under_lock(index)
+                slot.pending = max(0, slot.pending - 1)
+                if version > slot.version:
+                    slot.balance, slot.version, slot.valid = balance_pence, version, 1
+                    self._published += 1
+                self._write_slot(index, slot)
+
+    def _abandon(self, keys: list[bytes]) -> None:
+        with self._locked():
+            if not self._stamped():
+                return
+            for key in keys:
+                index = self._claim(key)
+                if index is None:
+                    continue
+                slot = self._slot_under_lock(index)
+                slot.pending = max(0, slot.pending - 1)
+                slot.valid = 0
+                self._abandoned += 1
+                self._write_slot(index, slot)
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        with self._thread_lock:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+
+    def _claim(self, key: bytes) -> int | None:
+        """
+        The slot holding `key`, claiming an empty one if needed (under the lock).
+        """
+        home = _home(key, self._capacity)
+        for probe in range(_MAX_PROBE):
+            index = (home + probe) % self._capacity
+            slot = self._slot_under_lock(index)
+            if slot.key == key:
+                return index
+            if slot.key == _EMPTY_KEY:
+                self._write_slot(
+                    index,
+                    _Slot(
+                        key=key,
+                        balance=0,
+                        version=0,
+                        pending=0,
+                        valid=0,
+                        pending_since=0.0,
+                    ),
+                )
+                capacity, used, database_id = _HEADER.unpack_from(self._buf, 0)
+                _HEADER.pack_into(self._buf, 0, capacity, used + 1, database_id)
+                return index
+        self._unplaced += 1
+        return None
+
+    def _slot_under_lock(self, index: int) -> _Slot:
+        offset = _offset(index)
+        (seq,) = _SEQ.unpack_from(self._buf, offset)
+        slot = _Slot(*_BODY.unpack_from(self._buf, offset + _SEQ.size))
+        if seq % 2:
+            # No writer is active while we hold the lock: a writer died mid-write.
+            slot.valid = 0
+            self._write_slot(index, slot)
+            self._repaired_slots += 1
+        return slot
+
+    def _write_slot(self, index: int, slot: _Slot) -> None:
+        offset = _offset(index)
+        (seq,) = _SEQ.unpack_from(self._buf, offset)
+        odd = seq | 1
+        _SEQ.pack_into(self._buf, offset, odd)
+        _BODY.pack_into(
+            self._buf,
+            offset + _SEQ.size,
+            slot.key,
+            slot.balance,
+            slot.version,
+            slot.pending,
+            slot.valid,
+            slot.pending_since,
+        )
+        _SEQ.pack_into(self._buf, offset, odd + 1)
+
+    def _read_slot(self, index: int) -> _Slot | None:
+        offset = _offset(index)
+        buf = self._buf
+        for _ in range(_READ_ATTEMPTS):
+            (before,) = _SEQ.unpack_from(buf, offset)
+            if before % 2:
+                continue
+            body = _BODY.unpack_from(buf, offset + _SEQ.size)
+            (after,) = _SEQ.unpack_from(buf, offset)
+            if before == after:
+                return _Slot(*body)
+        return None
+
+    def _count_miss(self, *, torn: bool) -> None:
+        with self._counts_lock:
+            self._misses += 1
+            if torn:
+                self._torn_reads += 1
+
+
+def _key(account_id: str) -> bytes:
+    return hashlib.blake2b(account_id.encode(), digest_size=16).digest()
+
+
+def _home(key: bytes, capacity: int) -> int:
+    return int.from_bytes(key[:8], "little") % capacity
+
+
+def _offset(index: int) -> int:
+    return _HEADER_SIZE + index * _SLOT_SIZE
+
+
+def _create_or_attach(name: str, size: int) -> SharedMemory:
+    for _ in range(_ATTACH_ATTEMPTS):
+        try:
+            shm = SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            try:
+                shm = SharedMemory(name=name)
+            except (FileNotFoundError, ValueError):
+                # Removed, or created but not yet sized, by another process.
+                time.sleep(0.01)
+                continue
+        _untrack(shm)
+        return shm
+    raise RuntimeError(f"Could not map shared balance table {name!r}")
+
+
+def _untrack(shm: SharedMemory) -> None:
+    # Before 3.13 every process that maps a segment registers it with the resource
+    # tracker, which unlinks it when that process exits, from under the others.
+    if sys.version_info < (3, 13):
+        resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
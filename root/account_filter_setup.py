@@ -0,0 +1,100 @@
+"""
+Ring: Composition Root (not on the Clean Architecture diagram)
+
+Responsibility:
+Wires the account id Bloom filter into the running application. The filter is
+loaded at startup and kept current while the application runs. Account
+repositories are wrapped so that lookups of unknown ids never reach storage.
+
+Design intent:
+This code belongs to composition, not to the filter itself (see
+infra/membership).
+- With LEDGER_BACKEND=memory, the filter is loaded from the ledger, which has no
+  other writers, and is authoritative.
+- With the SQL backend, it is loaded through the read-only session factory.
+  - An in-memory database (a StaticPool engine) exists only in this process, so
+    the filter is authoritative and needs no refresh. A refresher there would
+    share the request handlers' one connection, and its rollbacks would discard
+    their work.
+  - Any other database may have other writers. The filter tails the change feed
+    every ACCOUNT_FILTER_REFRESH_MS for their accounts. Ids it rejects are
+    answered as missing while its last refresh is at most
+    ACCOUNT_FILTER_MAX_STALENESS_MS old, so an account created by another
+    process can be reported missing for about one refresh interval. If the
+    refreshes fail for longer, rejected ids are checked in the database until
+    one succeeds. The refresher is stopped at shutdown.
+- With LEDGER_BACKEND=sharded there is no change feed to tail, so the filter is
+  not loaded.
+
+This module contains:
+- ACCOUNT_FILTER: whether the filter is enabled ("on" by default).
+- attach_account_filter: loads the filter into the application state, if enabled.
+- filtered_account_repo: wraps an account repository with the filter, if loaded.
+
+Dependency constraints:
+- May depend on infrastructure (infra.membership, infra.db, infra.memory).
+- May depend on the delivery framework (FastAPI).
+- Must not contain business rules or application policy.
+- Must not be imported by domain, application, or infrastructure layers.
+
+Stability:
+- Highly volatile.
+- Changes when the filter's configuration or loading strategy changes.
+
+Usage:
+- Called at application startup, after attach_ledger, and by the standing
+  order runner.
+- Configured with ACCOUNT_FILTER, ACCOUNT_FILTER_CAPACITY,
+  ACCOUNT_FILTER_FP_RATE, ACCOUNT_FILTER_REFRESH_MS and
+  ACCOUNT_FILTER_MAX_STALENESS_MS (which must exceed the refresh interval).
+- The filter is kept in app.state.account_filter (None when disabled) for
+  root/di and root/metrics.
+"""
+
+from __future__ import annotations
+
+import os
+
+from fastapi import FastAPI
+from sqlalchemy.pool import StaticPool
+
+from features.accounts.ports import AccountRepoPort
+from infra.db.session import ReadSessionLocal, read_engine
+from infra.membership.account_index import AccountIdIndex
+from infra.membership.filtered_repo import FilteredAccountRepo
+from infra.memory.ledger import LEDGER_BACKEND
+
+ACCOUNT_FILTER = os.environ.get("ACCOUNT_FILTER", "on") == "on"
+CAPACITY = int(os.environ.get("ACCOUNT_FILTER_CAPACITY", "1000000"))
+FP_RATE = float(os.environ.get("ACCOUNT_FILTER_FP_RATE", "0.01"))
+REFRESH_MS = int(os.environ.get("ACCOUNT_FILTER_REFRESH_MS", "1000"))
+MAX_STALENESS_MS = int(os.environ.get("ACCOUNT_FILTER_MAX_STALENESS_MS", "5000"))
+
+
+def attach_account_filter(app: FastAPI) -> None:
+    app.state.account_filter = None
+    if not ACCOUNT_FILTER or LEDGER_BACKEND == "sharded":
+        return
+
+    if LEDGER_BACKEND == "memory":
+        index = AccountIdIndex.load_from_ledger(
+            app.state.ledger, capacity=CAPACITY, false_positive_rate=FP_RATE
+        )
+    else:
+        in_process = isinstance(read_engine.pool, StaticPool)
+        index = AccountIdIndex.load_from_database(
+            ReadSessionLocal,
+            capacity=CAPACITY,
+            false_positive_rate=FP_RATE,
+            authoritative=in_process,
+            max_staleness=MAX_STALENESS_MS / 1000,
+        )
+        if not in_process:
+            index.start_refreshing(ReadSessionLocal, interval=REFRESH_MS / 1000)
+            app.add_event_handler("shutdown", index.stop)
+    app.state.account_filter = index
+
+
+def filtered_account_repo(app: FastAPI, repo: AccountRepoPort) -> AccountRepoPort:
+    index: AccountIdIndex | None = app.state.account_filter
+    return repo if index is None else FilteredAccountRepo(inner=repo, index=index)
@@ -0,0 +1,59 @@
+"""
+Ring: Composition Root (not on the Clean Architecture diagram)
+
+Responsibility:
+Guards the diagnostic admin endpoints (/admin/profiles, /admin/memory) with a
+shared secret sent in a request header.
+
+Design intent:
+This code belongs to composition: the endpoints it guards are mounted by the
+root setup modules, not by any feature.
+- Every diagnostics setup module has its own token and header, so a token that
+  opens one set of endpoints does not open another.
+- The comparison is constant-time (hmac.compare_digest), so response times do
+  not reveal how much of a guessed token is right.
+- A missing header is compared as an empty string. The setup modules mount no
+  endpoints at all when their token is unset, so an empty token is never
+  checked.
+
+This module contains:
+- token_matches: the constant-time comparison of a provided token.
+- require_token: a FastAPI dependency answering 403 unless the header holds the
+  token.
+
+Dependency constraints:
+- May depend on the delivery framework (FastAPI).
+- Must not contain business rules or application policy.
+- Must not be imported by domain, application, or infrastructure layers.
+
+Stability:
+- Stable.
+- Changes when admin endpoints are authenticated differently.
+
+Usage:
+- require_token is passed as a route dependency by root/profiling_setup and
+  root/memory_diagnostics_setup; token_matches is also used by the profiling
+  trigger middleware, which reads raw ASGI headers.
+"""
+
+import hmac
+from typing import Annotated
+
+from fastapi import Depends, Header, HTTPException
+from fastapi.params import Depends as DependsParam
+
+
+def token_matches(provided: str | bytes | None, token: str) -> bool:
+    if isinstance(provided, str):
+        provided = provided.encode()
+    return hmac.compare_digest(provided or b"", token.encode())
+
+
+def require_token(*, header: str, token: str) -> DependsParam:
+    def authorise(
+        provided: Annotated[str | None, Header(alias=header)] = None,
+    ) -> None:
+        if not token_matches(provided, token):
+            raise HTTPException(status_code=403, detail=f"{header} required")
+
+    return Depends(authorise)
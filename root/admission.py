@@ -0,0 +1,124 @@
+"""
+Ring: Composition Root (not on the Clean Architecture diagram)
+
+Responsibility:
+Wires admission control into the running application. Write endpoints get an
+adaptive concurrency limit. Requests beyond the limit, and beyond its bounded
+wait queue, fail fast with 503 and Retry-After. The limiter state is exposed as
+metrics.
+
+Design intent:
+This code belongs to composition, not to admission policy itself (see
+infra/admission/limiter). The middleware is raw ASGI, so it runs on the event loop
+before the request reaches FastAPI's thread pool: a shed request never
+occupies a worker thread or opens a database session.
+Latency is measured from admission until the response has been sent. Responses
+with a 5xx status count as failures.
+ADMISSION_MAX_IN_FLIGHT is both where each limit starts and the most it can
+grow to. Under congestion the limit falls below it, and it climbs back as
+requests complete in time.
+
+This module contains:
+- GUARDED_ROUTES: the (method, path) pairs under admission control.
+- AdmissionControlMiddleware: the ASGI middleware.
+- register_admission_control: installs the middleware.
+
+Dependency constraints:
+- May depend on infrastructure (infra.admission).
+- May depend on the delivery framework (FastAPI / Starlette).
+- Must not contain business rules or application policy.
+- Must not be imported by domain, application, or infrastructure layers.
+
+Stability:
+- Highly volatile.
+- Changes when guarded routes or limiter configuration change.
+
+Usage:
+- Called at application startup from the composition root.
+- Configured with ADMISSION_MAX_IN_FLIGHT, ADMISSION_MAX_QUEUE,
+  ADMISSION_MAX_WAIT_MS and ADMISSION_TARGET_LATENCY_MS.
+- Limiters are kept in app.state.admission_limiters for root/metrics.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+
+from fastapi import FastAPI
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from infra.admission.limiter import AdaptiveConcurrencyLimiter, AdmissionRejectedError
+
+GUARDED_ROUTES = (("POST", "/transfers"),)
+
+MAX_IN_FLIGHT = int(os.environ.get("ADMISSION_MAX_IN_FLIGHT", "32"))
+MAX_QUEUE = int(os.environ.get("ADMISSION_MAX_QUEUE", "64"))
+MAX_WAIT_MS = int(os.environ.get("ADMISSION_MAX_WAIT_MS", "100"))
+TARGET_LATENCY_MS = int(os.environ.get("ADMISSION_TARGET_LATENCY_MS", "250"))
+
+
+class AdmissionControlMiddleware:
+    """
+    Sheds requests to guarded routes that cannot be admitted in time.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        limiters: dict[tuple[str, str], AdaptiveConcurrencyLimiter],
+    ) -> None:
+        self._app = app
+        self._limiters = limiters
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        limiter = None
+        if scope["type"] == "http":
+            limiter = self._limiters.get((scope["method"], scope["path"].rstrip("/")))
+        if limiter is None:
+            await self._app(scope, receive, send)
+            return
+
+        try:
+            await limiter.acquire()
+        except AdmissionRejectedError as exc:
+            response = JSONResponse(
+                status_code=503,
+                content={"detail": f"Server overloaded ({exc.reason}); retry later"},
+                headers={"Retry-After": str(exc.retry_after)},
+            )
+            await response(scope, receive, send)
+            return
+
+        status_code = 500
+        started = time.perf_counter()
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self._app(scope, receive, send_with_status)
+        finally:
+            limiter.release(
+                latency=time.perf_counter() - started, failed=status_code >= 500
+            )
+
+
+def register_admission_control(app: FastAPI) -> None:
+    limiters = {
+        route: AdaptiveConcurrencyLimiter(
+            initial_limit=MAX_IN_FLIGHT,
+            max_limit=MAX_IN_FLIGHT,
+            max_queue=MAX_QUEUE,
+            max_wait=MAX_WAIT_MS / 1000,
+            target_latency=TARGET_LATENCY_MS / 1000,
+        )
+        for route in GUARDED_ROUTES
+    }
+    app.state.admission_limiters = limiters
+    app.add_middleware(AdmissionControlMiddleware, limiters=limiters)
@@ -0,0 +1,232 @@
+"""
+Ring: Composition Root (CLI entry point)
+
+Responsibility:
+Defines the command-line entry point for comparing the ORM and Core SQL
+repositories. It times the same account reads, transfers and transfer export on
+both and prints one JSON line per operation.
+
+Design intent:
+This is the CLI counterpart of root/main.py. Each timed operation opens its own
+session, as a request does, so the ORM pays for its identity map and instance
+state exactly as it would when serving traffic. The two implementations alternate
+round by round over the same accounts, and the fastest round of each is reported,
+so that warm-up and background noise do not favour one of them.
+
+Transfers are real ledger writes made through TransferCreator. Run the
+benchmark against a scratch database (the default is in-memory SQLite).
+
+This module contains:
+- main: the argument parser and process entry point.
+
+Dependency constraints:
+- May depend on all inner layers (infra, features, core).
+- Nothing may depend on this module.
+- Must not contain business rules, use case logic, or persistence logic.
+
+Stability:
+- Highly volatile.
+- Changes whenever command-line options or either repository implementation change.
+
+Usage:
+    python -m root.cli.benchmark_repos
+    DATABASE_URL=sqlite:////tmp/bench.db \
+        python -m root.cli.benchmark_repos --accounts 10000 --operations 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import random
+import sys
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import TypeVar
+
+from core.entities.account import Account
+from core.utils.id import new_id
+from core.values.custom_types import AccountId
+from core.values.objects import Money
+from features.accounts.ports import AccountRepoPort
+from features.transfers.ports import TransferRepoPort
+from features.transfers.presenters import TransferCreatorPresenter
+from features.transfers.use_cases import TransferCreator
+from infra.db.accounts.core_repo import CoreAccountRepo
+from infra.db.accounts.repo import AccountRepo
+from infra.db.session import SessionLocal, create_all_db_tables
+from infra.db.transfers.core_repo import CoreTransferRepo
+from infra.db.transfers.repo import TransferRepo
+from infra.db.unit_of_work import CoreSqlUnitOfWork, SqlUnitOfWork
+from infra.logging.logger import build_logger
+
+OPENING_BALANCE_PENCE = 10**12
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True, slots=True)
+class _Variant:
+    name: str
+    uow: type[SqlUnitOfWork]
+    accounts: Callable[[SqlUnitOfWork], AccountRepoPort]
+    transfers: Callable[[SqlUnitOfWork], TransferRepoPort]
+
+
+_VARIANTS = (
+    _Variant(
+        name="orm",
+        uow=SqlUnitOfWork,
+        accounts=lambda uow: AccountRepo(uow=uow),
+        transfers=lambda uow: TransferRepo(uow=uow),
+    ),
+    _Variant(
+        name="core",
+        uow=CoreSqlUnitOfWork,
+        accounts=lambda uow: CoreAccountRepo(uow=uow),
+        transfers=lambda uow: CoreTransferRepo(uow=uow),
+    ),
+)
+
+
+def _seed_accounts(count: int) -> list[AccountId]:
+    account_ids = [AccountId(new_id()) for _ in range(count)]
+    with SessionLocal() as session:
+        uow = CoreSqlUnitOfWork(session=session)
+        for account_id in account_ids:
+            uow.register_account(
+                Account(id=account_id, balance=Money(OPENING_BALANCE_PENCE))
+            )
+        uow.commit()
+    return account_ids
+
+
+def _get(variant: _Variant, account_id: AccountId) -> None:
+    with SessionLocal() as session:
+        variant.accounts(SqlUnitOfWork(session=session)).get(account_id)
+
+
+def _get_many(variant: _Variant, pair: tuple[AccountId, AccountId]) -> None:
+    with SessionLocal() as session:
+        variant.accounts(SqlUnitOfWork(session=session)).get_many(pair)
+
+
+def _version(variant: _Variant, account_id: AccountId) -> None:
+    with SessionLocal() as session:
+        variant.accounts(SqlUnitOfWork(session=session)).version(account_id)
+
+
+def _transfer(
+    variant: _Variant, pair: tuple[AccountId, AccountId], logger: logging.Logger
+) -> None:
+    with SessionLocal() as session:
+        uow = variant.uow(session=session)
+        TransferCreator(
+            uow=uow,
+            account_repo=variant.accounts(uow),
+            transfer_repo=variant.transfers(uow),
+            presenter=TransferCreatorPresenter(),
+            logger=logger,
+        ).execute(from_account_id=pair[0], to_account_id=pair[1], amount_pence=1)
+
+
+def _stream(variant: _Variant) -> int:
+    with SessionLocal() as session:
+        stream = variant.transfers(SqlUnitOfWork(session=session)).stream(
+            account_id=None, since=None, until=None, after=None
+        )
+        return sum(1 for _ in stream)
+
+
+def _each(
+    call: Callable[[_Variant, T], None], args: Sequence[T]
+) -> Callable[[_Variant], None]:
+    def run(variant: _Variant) -> None:
+        for arg in args:
+            call(variant, arg)
+
+    return run
+
+
+def _time_round(run: Callable[[_Variant], object], variant: _Variant) -> float:
+    started = time.perf_counter()
+    run(variant)
+    return time.perf_counter() - started
+
+
+def _measure(
+    operation: str,
+    calls: int,
+    run: Callable[[_Variant], object],
+    rounds: int,
+) -> dict[str, object]:
+    best = {variant.name: float("inf") for variant in _VARIANTS}
+    for _ in range(rounds):
+        for variant in _VARIANTS:
+            best[variant.name] = min(best[variant.name], _time_round(run, variant))
+
+    result: dict[str, object] = {"operation": operation, "calls": calls}
+    for variant in _VARIANTS:
+        result[f"{variant.name}_us_per_call"] = round(
+            best[variant.name] / calls * 1_000_000, 1
+        )
+    result["speedup"] = round(best["orm"] / best["core"], 2)
+    return result
+
+
+def _benchmark(accounts: int, operations: int, rounds: int, seed: int) -> int:
+    create_all_db_tables()
+    logger = build_logger(name="demo.benchmark", level=logging.WARNING)
+    rng = random.Random(seed)
+    account_ids = _seed_accounts(accounts)
+    singles = [rng.choice(account_ids) for _ in range(operations)]
+    pairs = [
+        (from_id, to_id)
+        for from_id, to_id in (rng.sample(account_ids, 2) for _ in range(operations))
+    ]
+
+    def transfer(variant: _Variant, pair: tuple[AccountId, AccountId]) -> None:
+        _transfer(variant, pair, logger)
+
+    results = [
+        _measure("get", operations, _each(_get, singles), rounds),
+        _measure("get_many", operations, _each(_get_many, pairs), rounds),
+        _measure("version", operations, _each(_version, singles), rounds),
+        _measure("transfer", operations, _each(transfer, pairs), rounds),
+        # One export of every transfer written above, timed per row.
+        _measure("stream", _stream(_VARIANTS[0]), _stream, rounds),
+    ]
+
+    for result in results:
+        print(json.dumps(result))
+    return 0
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="benchmark_repos")
+    parser.add_argument(
+        "--accounts", type=int, default=1000, help="accounts to seed (default: 1000)"
+    )
+    parser.add_argument(
+        "--operations",
+        type=int,
+        default=2000,
+        help="calls per operation and round (default: 2000)",
+    )
+    parser.add_argument(
+        "--rounds", type=int, default=3, help="rounds per implementation (default: 3)"
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, help="seed for choosing accounts (default: 0)"
+    )
+
+    args = parser.parse_args(argv)
+    if args.accounts < 2:
+        parser.error("--accounts must be at least 2")
+    return _benchmark(args.accounts, args.operations, args.rounds, args.seed)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
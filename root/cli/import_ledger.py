@@ -0,0 +1,125 @@
+"""
+Ring: Composition Root (CLI entry point)
+
+Responsibility:
+Defines the command-line entry point for bulk ledger imports.
+This module parses arguments, wires the import use case to its file source,
+database store, and console presenter, and runs it.
+
+Design intent:
+This is the CLI counterpart of root/main.py: the only place where the import's
+layers meet. It contains no import logic of its own.
+
+This module contains:
+- build_ledger_importer: assembles a LedgerImporter with concrete adapters.
+- main: the argument parser and process entry point.
+
+Dependency constraints:
+- May depend on all inner layers (infra, features, core).
+- Nothing may depend on this module.
+- Must not contain business rules, use case logic, or persistence logic.
+
+Stability:
+- Highly volatile.
+- Changes whenever command-line options or wiring change.
+
+Usage:
+    DATABASE_URL=sqlite:///ledger.db \
+        python -m root.cli.import_ledger accounts accounts.csv --batch-size 5000
+    DATABASE_URL=sqlite:///ledger.db \
+        python -m root.cli.import_ledger transfers transfers.ndjson
+
+Re-running the same command after an interruption resumes from the last
+committed chunk.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from typing import TextIO
+
+from features._shared.errors import ApplicationError
+from features.ledger_import.presenters import ImportConsolePresenter
+from features.ledger_import.schemas import ImportKind
+from features.ledger_import.use_cases import LedgerImporter
+from infra.db.imports.repo import LedgerImportStore
+from infra.db.session import SessionLocal, create_all_db_tables
+from infra.files.ledger_reader import LedgerFileReader
+from infra.logging.logger import build_logger
+
+DEFAULT_BATCH_SIZE = 5000
+
+
+def build_ledger_importer(
+    *,
+    write_progress: Callable[[str], None],
+    write_rejected: Callable[[str], None],
+    logger: logging.Logger,
+) -> LedgerImporter:
+    return LedgerImporter(
+        source=LedgerFileReader(),
+        store=LedgerImportStore(session_factory=SessionLocal),
+        presenter=ImportConsolePresenter(
+            write_progress=write_progress,
+            write_rejected=write_rejected,
+        ),
+        logger=logger,
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="import_ledger",
+        description="Stream accounts or transfers from CSV/NDJSON into the database.",
+    )
+    parser.add_argument("kind", choices=[kind.value for kind in ImportKind])
+    parser.add_argument("path", help="CSV (with header) or NDJSON/JSONL file")
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help="rows per chunk; each chunk is committed in its own transaction",
+    )
+    parser.add_argument(
+        "--rejects",
+        type=Path,
+        default=None,
+        help="write rejected rows to this file instead of stderr",
+    )
+    args = parser.parse_args(argv)
+    if args.batch_size < 1:
+        parser.error("--batch-size must be positive")
+
+    create_all_db_tables()
+
+    rejects: TextIO = (
+        args.rejects.open("a", encoding="utf-8") if args.rejects else sys.stderr
+    )
+    try:
+        importer = build_ledger_importer(
+            write_progress=lambda line: print(line, flush=True),
+            write_rejected=lambda line: print(line, file=rejects),
+            logger=build_logger(name="demo.import", level=logging.WARNING),
+        )
+        summary = importer.execute(
+            kind=ImportKind(args.kind),
+            source=str(Path(args.path).resolve()),
+            batch_size=args.batch_size,
+        )
+    except ApplicationError as exc:
+        print(f"import_failed error={exc}", file=sys.stderr)
+        return 1
+    finally:
+        if rejects is not sys.stderr:
+            rejects.close()
+
+    print(summary.model_dump_json())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,57 @@
+"""
+Ring: Composition Root (CLI entry point)
+
+Responsibility:
+Defines the command-line entry point for migrating every stored timestamp
+(transfers, scheduled transfers and standing orders) between storage modes (see
+TIMESTAMP_STORAGE in infra/db/types).
+
+Design intent:
+This is the CLI counterpart of root/main.py. It runs against DATABASE_URL before
+the application is restarted with the new TIMESTAMP_STORAGE value.
+
+This module contains:
+- main: the argument parser and process entry point.
+
+Dependency constraints:
+- May depend on all inner layers (infra, features, core).
+- Nothing may depend on this module.
+- Must not contain business rules, use case logic, or persistence logic.
+
+Stability:
+- Highly volatile.
+- Changes whenever command-line options or wiring change.
+
+Usage:
+    DATABASE_URL=sqlite:///ledger.db python -m root.cli.migrate_timestamps epoch_us
+    # then start the application with TIMESTAMP_STORAGE=epoch_us
+
+Safe to re-run: rows already in the target representation are left untouched.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from collections.abc import Sequence
+
+from infra.db.session import engine
+from infra.db.timestamp_migration import MIGRATION_BATCH_SIZE, migrate_timestamps
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="migrate_timestamps")
+    parser.add_argument("target", choices=["epoch_us", "datetime"])
+    parser.add_argument("--batch-size", type=int, default=MIGRATION_BATCH_SIZE)
+    args = parser.parse_args(argv)
+
+    converted = migrate_timestamps(
+        engine, target=args.target, batch_size=args.batch_size
+    )
+    for column, rows in converted.items():
+        print(f"timestamps_migrated target={args.target} column={column} rows={rows}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
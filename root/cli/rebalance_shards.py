@@ -0,0 +1,107 @@
+"""
+Ring: Composition Root (CLI entry point)
+
+Responsibility:
+Defines the command-line entry point for the shard rebalancer.
+`status` prints how many slots each shard holds; `move` moves a range of slots to
+a shard while the application keeps running; `recover` runs one cross-shard
+recovery pass.
+
+Design intent:
+This is the CLI counterpart of root/main.py. It opens the same cluster as the
+application (DATABASE_URL as the directory, SHARD_URLS as the shards), so it can
+run beside live application processes. Slots are moved one at a time (see
+infra/sharding/rebalance), and each move is printed as it completes. An
+interrupted move is finished by running the same command again.
+A new shard is added by appending its URL to SHARD_URLS, here and in the
+application, and moving slots to it.
+
+This module contains:
+- main: the argument parser and process entry point.
+
+Dependency constraints:
+- May depend on all inner layers (infra, features, core).
+- Nothing may depend on this module.
+- Must not contain business rules, use case logic, or persistence logic.
+
+Stability:
+- Highly volatile.
+- Changes whenever command-line options or wiring change.
+
+Usage:
+    DATABASE_URL=sqlite:///directory.db \\
+    SHARD_URLS=sqlite:///shard0.db,sqlite:///shard1.db,sqlite:///shard2.db \\
+    python -m root.cli.rebalance_shards move --slots 0-99 --to 2
+
+    python -m root.cli.rebalance_shards status
+    python -m root.cli.rebalance_shards recover
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from collections.abc import Sequence
+from dataclasses import asdict
+
+from infra.db.session import SessionLocal, create_all_db_tables
+from infra.sharding.cluster import SHARD_URLS, ShardCluster
+from infra.sharding.placement import SLOT_COUNT
+from infra.sharding.rebalance import move_slot
+from infra.sharding.recovery import recover_cross_shard_commits
+
+
+def _slot_range(text: str) -> range:
+    first, _, last = text.partition("-")
+    slots = range(int(first), int(last or first) + 1)
+    if not slots or slots.start < 0 or slots.stop > SLOT_COUNT:
+        raise argparse.ArgumentTypeError(
+            f"expected a slot or range of slots within 0-{SLOT_COUNT - 1}"
+        )
+    return slots
+
+
+def _status(cluster: ShardCluster) -> int:
+    print(json.dumps(asdict(cluster.stats())))
+    return 0
+
+
+def _move(cluster: ShardCluster, slots: range, target: int) -> int:
+    if not 0 <= target < cluster.shard_count:
+        print(f"shard {target} is not configured in SHARD_URLS", file=sys.stderr)
+        return 2
+    for slot in slots:
+        print(json.dumps(asdict(move_slot(cluster, slot=slot, target=target))))
+    return 0
+
+
+def _recover(cluster: ShardCluster) -> int:
+    print(json.dumps({"recovered_credits": recover_cross_shard_commits(cluster)}))
+    return 0
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="rebalance_shards")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("status", help="print slots per shard")
+
+    move = commands.add_parser("move", help="move slots to a shard, one at a time")
+    move.add_argument("--slots", type=_slot_range, required=True, help="N or A-B")
+    move.add_argument("--to", type=int, required=True, dest="target")
+
+    commands.add_parser("recover", help="complete outstanding cross-shard credits")
+
+    args = parser.parse_args(argv)
+    create_all_db_tables()
+    cluster = ShardCluster.open(SHARD_URLS, directory=SessionLocal)
+    if args.command == "status":
+        return _status(cluster)
+    if args.command == "move":
+        return _move(cluster, args.slots, args.target)
+    return _recover(cluster)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
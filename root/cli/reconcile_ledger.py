@@ -0,0 +1,109 @@
+"""
+Ring: Composition Root (CLI entry point)
+
+Responsibility:
+Defines the command-line entry point for full-ledger reconciliation.
+This module parses arguments, wires the reconciliation use case to a process pool
+and a read-only ledger scanner, and writes the discrepancy report.
+
+Design intent:
+This is the CLI counterpart of root/main.py: the only place where the job's layers
+meet. The process pool is created and torn down here; the use case only sees an
+Executor.
+
+This module contains:
+- main: the argument parser and process entry point.
+
+Dependency constraints:
+- May depend on all inner layers (infra, features, core).
+- Nothing may depend on this module.
+- Must not contain business rules, use case logic, or persistence logic.
+
+Stability:
+- Highly volatile.
+- Changes whenever command-line options or wiring change.
+
+Usage:
+    DATABASE_URL=sqlite:///ledger.db \
+        python -m root.cli.reconcile_ledger --workers 8 --output discrepancies.ndjson
+
+Exits with status 1 if any discrepancy is found.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import sys
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import TextIO
+
+from features.reconciliation.presenters import ReconciliationReportPresenter
+from features.reconciliation.use_cases import LedgerReconciler
+from infra.db.reconciliation.scanner import SqlLedgerScanner
+from infra.db.session import DATABASE_URL
+from infra.logging.logger import build_logger
+
+# More partitions than workers keeps every core busy when ranges differ in cost.
+PARTITIONS_PER_WORKER = 4
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="reconcile_ledger",
+        description="Check every balance against its opening balance and transfers.",
+    )
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument(
+        "--partitions",
+        type=int,
+        default=None,
+        help=f"account id ranges (default: workers x {PARTITIONS_PER_WORKER})",
+    )
+    parser.add_argument(
+        "--max-discrepancies",
+        type=int,
+        default=1000,
+        help="discrepancies reported per range; the rest are only counted",
+    )
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args(argv)
+
+    if ":memory:" in DATABASE_URL:
+        parser.error("set DATABASE_URL to a shared database to reconcile")
+    if args.workers < 1:
+        parser.error("--workers must be positive")
+
+    partitions = args.partitions or args.workers * PARTITIONS_PER_WORKER
+    output: TextIO = (
+        args.output.open("w", encoding="utf-8") if args.output else sys.stdout
+    )
+
+    try:
+        with ProcessPoolExecutor(max_workers=args.workers) as executor:
+            reconciler = LedgerReconciler(
+                scanner=SqlLedgerScanner(
+                    database_url=DATABASE_URL,
+                    max_discrepancies=args.max_discrepancies,
+                ),
+                executor=executor,
+                presenter=ReconciliationReportPresenter(
+                    write_discrepancy=lambda line: print(line, file=output),
+                    write_progress=lambda line: print(line, file=sys.stderr),
+                ),
+                logger=build_logger(name="demo.reconcile", level=logging.WARNING),
+            )
+            summary = reconciler.execute(partitions=partitions)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    print(summary.model_dump_json(), file=sys.stderr)
+    return 1 if summary.discrepancy_count else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
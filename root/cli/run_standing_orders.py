@@ -0,0 +1,238 @@
+"""
+Ring: Composition Root (CLI entry point)
+
+Responsibility:
+Defines the command-line entry point that executes due standing orders.
+This module parses arguments, starts worker threads, and wires each claimed
+chunk to the chunk executor inside its own retried write transaction.
+
+Design intent:
+This is the CLI counterpart of root/main.py: the only place where the runner's
+layers meet. Each worker loops:
+  1. Claim the next chunk of due orders under a lease (its own short commit).
+  2. Execute the chunk in one write transaction.
+  3. Stop once a claim comes back empty.
+A transient conflict re-runs step 2 on the same claim (see
+root/di/transactions). A chunk whose lease was taken over is rolled back and
+skipped; its new holder runs it.
+Any number of workers, in any number of processes or hosts, can run at once
+against one database: leases keep them from running an order twice. The lease
+must outlast a chunk; --lease-seconds bounds how long a crashed worker's chunk
+waits before another worker picks it up.
+Each chunk's repositories and unit of work come from the same factory as the
+API's write use cases (root/di/transactions.write_transaction), so
+SQL_REPOSITORIES, the account id filter (root/account_filter_setup) and, with
+SHARED_BALANCES=on, the shared balance table (root/shared_balances_setup) apply
+here too. The runner holds no HTTP routes; its FastAPI object only carries that
+state.
+Standing orders are checked and counted against the velocity limits
+(root/velocity_limits_setup). The runner loads its own counters at start and
+flushes what it counted before it exits, so the API's workers count the
+runner's transfers when they next load the rollups.
+Standing orders are stored in SQL only, so the runner requires
+LEDGER_BACKEND=sql.
+
+This module contains:
+- main: the argument parser and process entry point.
+
+Dependency constraints:
+- May depend on all inner layers (infra, features, core).
+- Nothing may depend on this module.
+- Must not contain business rules, use case logic, or persistence logic.
+
+Stability:
+- Highly volatile.
+- Changes whenever command-line options or wiring change.
+
+Usage:
+    DATABASE_URL=sqlite:///ledger.db \
+        python -m root.cli.run_standing_orders --workers 4 --chunk-size 500
+
+Run it from a scheduler (cron, a systemd timer) as often as the finest cadence
+needs; it exits once nothing is due.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+import threading
+import time
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from fastapi import FastAPI
+
+from core.utils.time import utc_now
+from features.standing_orders.errors import StandingOrderLeaseLostError
+from features.standing_orders.presenters import StandingOrderChunkPresenter
+from features.standing_orders.schemas import (
+    StandingOrderChunkResult,
+    StandingOrderClaim,
+)
+from features.standing_orders.use_cases import StandingOrderChunkExecutor
+from infra.db.session import SessionLocal, create_all_db_tables
+from infra.db.standing_orders.repo import StandingOrderClaims
+from infra.limits.velocity import VelocityCounters
+from infra.logging.logger import build_logger
+from infra.memory.ledger import LEDGER_BACKEND
+from root.account_filter_setup import attach_account_filter
+from root.di.transactions import WRITE_RETRIES, write_transaction
+from root.shared_balances_setup import open_shared_balances
+from root.velocity_limits_setup import attach_velocity_limits
+
+DEFAULT_WORKERS = 4
+DEFAULT_CHUNK_SIZE = 500
+DEFAULT_LEASE_SECONDS = 60
+
+
+class _Totals:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.chunks = 0
+        self.claimed = 0
+        self.executed = 0
+        self.failed = 0
+        self.lease_lost = 0
+
+    def add(self, result: StandingOrderChunkResult) -> None:
+        with self._lock:
+            self.chunks += 1
+            self.claimed += result.claimed
+            self.executed += result.executed
+            self.failed += result.failed
+
+    def add_lease_lost(self) -> None:
+        with self._lock:
+            self.lease_lost += 1
+
+
+def _execute_chunk(
+    app: FastAPI, claim: StandingOrderClaim, logger: logging.Logger
+) -> StandingOrderChunkResult:
+    with write_transaction(app) as repos:
+        if repos.standing_orders is None:
+            raise RuntimeError("Standing orders require the SQL backend")
+        executor = StandingOrderChunkExecutor(
+            uow=repos.uow,
+            orders=repos.standing_orders,
+            accounts=repos.accounts,
+            transfers=repos.transfers,
+            presenter=StandingOrderChunkPresenter(),
+            logger=logger,
+            limits=app.state.velocity_limits,
+        )
+        return executor.execute(claim=claim)
+
+
+def _build_app() -> FastAPI:
+    app = FastAPI()
+    app.state.shared_balances = open_shared_balances()
+    attach_account_filter(app)
+    attach_velocity_limits(app)
+    return app
+
+
+def _shut_down(app: FastAPI) -> None:
+    for handler in app.router.on_shutdown:
+        handler()
+    counters: VelocityCounters | None = app.state.velocity_limits
+    if counters is not None:
+        counters.flush(SessionLocal)
+    if app.state.shared_balances is not None:
+        app.state.shared_balances.close()
+
+
+def _work(
+    *,
+    app: FastAPI,
+    claims: StandingOrderClaims,
+    chunk_size: int,
+    lease_for: timedelta,
+    totals: _Totals,
+    logger: logging.Logger,
+) -> None:
+    while True:
+        claim = claims.claim_due(now=utc_now(), limit=chunk_size, lease_for=lease_for)
+        if not claim.orders:
+            return
+        try:
+            result = WRITE_RETRIES.run(lambda: _execute_chunk(app, claim, logger))
+        except StandingOrderLeaseLostError:
+            totals.add_lease_lost()
+            continue
+        totals.add(result)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="run_standing_orders",
+        description="Execute every standing order that is due, in leased chunks.",
+    )
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help="orders per chunk; each chunk is committed in its own transaction",
+    )
+    parser.add_argument(
+        "--lease-seconds",
+        type=int,
+        default=DEFAULT_LEASE_SECONDS,
+        help="how long a claimed chunk is reserved for its worker",
+    )
+    args = parser.parse_args(argv)
+    if args.workers < 1 or args.chunk_size < 1 or args.lease_seconds < 1:
+        parser.error("--workers, --chunk-size and --lease-seconds must be positive")
+    if LEDGER_BACKEND != "sql":
+        parser.error("standing orders are stored in SQL only; set LEDGER_BACKEND=sql")
+
+    create_all_db_tables()
+
+    claims = StandingOrderClaims(session_factory=SessionLocal)
+    app = _build_app()
+    totals = _Totals()
+    logger = build_logger(name="demo.standing_orders", level=logging.WARNING)
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        futures = [
+            pool.submit(
+                _work,
+                app=app,
+                claims=claims,
+                chunk_size=args.chunk_size,
+                lease_for=timedelta(seconds=args.lease_seconds),
+                totals=totals,
+                logger=logger,
+            )
+            for _ in range(args.workers)
+        ]
+        try:
+            for future in futures:
+                future.result()
+        finally:
+            _shut_down(app)
+    elapsed = time.perf_counter() - started
+
+    print(
+        json.dumps(
+            {
+                "chunks": totals.chunks,
+                "claimed": totals.claimed,
+                "executed": totals.executed,
+                "failed": totals.failed,
+                "lease_lost": totals.lease_lost,
+                "elapsed_s": round(elapsed, 3),
+                "orders_per_s": round(totals.claimed / elapsed, 1) if elapsed else 0.0,
+            }
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+"""
+Ring: Composition Root (CLI entry point)
+
+Responsibility:
+Defines the command-line entry point for state digests.
+`rebuild` recomputes the digests of one database from its rows; `compare` walks the
+digest trees of two databases and reports the ranges in which they differ.
+
+Design intent:
+This is the CLI counterpart of root/main.py. Comparison runs over two read-only
+engines and descends only into differing ranges, so comparing two large stores
+that agree costs one root read per scope.
+
+This module contains:
+- main: the argument parser and process entry point.
+
+Dependency constraints:
+- May depend on all inner layers (infra, features, core).
+- Nothing may depend on this module.
+- Must not contain business rules, use case logic, or persistence logic.
+
+Stability:
+- Highly volatile.
+- Changes whenever command-line options or wiring change.
+
+Usage:
+    DATABASE_URL=sqlite:///ledger.db python -m root.cli.state_digest rebuild
+    python -m root.cli.state_digest compare sqlite:///a.db sqlite:///b.db
+
+`compare` exits with status 1 if the stores differ.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+from collections.abc import Sequence
+
+from sqlalchemy.orm import Session
+
+from features.digests.presenters import DigestComparerPresenter
+from features.digests.schemas import DigestScope
+from features.digests.use_cases import DigestComparer
+from infra.db.digests.repo import StateDigestRepo
+from infra.db.digests.tracking import rebuild_digests
+from infra.db.session import SessionLocal, create_all_db_tables, create_read_only_engine
+from infra.logging.logger import build_logger
+
+
+def _rebuild() -> int:
+    create_all_db_tables()
+    with SessionLocal() as session, session.begin():
+        rebuild_digests(session)
+    print("state_digest_rebuilt")
+    return 0
+
+
+def _compare(left_url: str, right_url: str, scopes: list[DigestScope]) -> int:
+    logger = build_logger(name="demo.digest", level=logging.WARNING)
+    differs = False
+    with (
+        Session(create_read_only_engine(left_url)) as left,
+        Session(create_read_only_engine(right_url)) as right,
+    ):
+        comparer = DigestComparer(
+            left=StateDigestRepo(session=left),
+            right=StateDigestRepo(session=right),
+            presenter=DigestComparerPresenter(),
+            logger=logger,
+        )
+        for scope in scopes:
+            result = comparer.execute(scope=scope)
+            differs = differs or not result.matches
+            print(result.model_dump_json())
+
+    return 1 if differs else 0
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="state_digest")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("rebuild", help="recompute digests for DATABASE_URL")
+
+    compare = commands.add_parser("compare", help="compare two databases")
+    compare.add_argument("left_url")
+    compare.add_argument("right_url")
+    compare.add_argument(
+        "--scope",
+        choices=[scope.value for scope in DigestScope],
+        action="append",
+        help="scope to compare (repeatable; default: all)",
+    )
+
+    args = parser.parse_args(argv)
+    if args.command == "rebuild":
+        return _rebuild()
+
+    scopes = [DigestScope(s) for s in args.scope] if args.scope else list(DigestScope)
+    return _compare(args.left_url, args.right_url, scopes)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
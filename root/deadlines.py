@@ -0,0 +1,171 @@
+"""
+Ring: Composition Root (not on the Clean Architecture diagram)
+
+Responsibility:
+Wires per-request deadlines into the running application. Every request gets a
+deadline from its route's server default, optionally shortened by the client's
+X-Request-Timeout header. Work that cannot finish in time fails with 504
+instead of holding a worker thread and a database connection.
+
+Design intent:
+This code belongs to composition, not to deadline mechanics themselves (see
+infra/concurrency/deadline).
+- The middleware is raw ASGI and is installed outside admission control. Time
+  spent waiting for admission, or for a worker thread, is therefore part of the
+  budget.
+- X-Request-Timeout is a number of seconds. It can only shorten the route's
+  default, never extend it. Routes without a default (REQUEST_TIMEOUT_*_MS=0)
+  have a deadline only when the client sends one.
+- The deadline bounds what starts after it: sessions (infra/db/session) and write
+  attempts (root/di/transactions) are refused once it has passed, and the
+  database is given only the time that remains. Work already running when the
+  deadline passes is stopped by the database's own timeouts.
+- Any error raised after the deadline has passed is answered with 504, since it
+  is the deadline that ended the request. This covers an interrupted statement,
+  a lock wait that timed out, or a refused session. If the response has already
+  started, the error propagates unchanged.
+
+This module contains:
+- ROUTE_TIMEOUTS_MS: server default deadlines for specific (method, path) pairs.
+- RequestDeadlineMiddleware: the ASGI middleware.
+- register_request_deadlines: installs the middleware.
+
+Dependency constraints:
+- May depend on infrastructure (infra.concurrency).
+- May depend on the delivery framework (FastAPI / Starlette).
+- Must not contain business rules or application policy.
+- Must not be imported by domain, application, or infrastructure layers.
+
+Stability:
+- Highly volatile.
+- Changes when routes or their latency targets change.
+
+Usage:
+- Called at application startup from the composition root, after
+  register_admission_control, so that it wraps it.
+- Configured with REQUEST_TIMEOUT_MS (every other route),
+  REQUEST_TIMEOUT_TRANSFERS_MS (POST /transfers),
+  REQUEST_TIMEOUT_CHANGES_MS (GET /changes, which long-polls) and
+  REQUEST_TIMEOUT_EXPORT_MS (GET /transfers/export, which streams).
+"""
+
+from __future__ import annotations
+
+import math
+import os
+
+from fastapi import FastAPI
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from infra.concurrency.deadline import Deadline, deadline_scope
+
+HEADER = b"x-request-timeout"
+_INVALID_TIMEOUT = "X-Request-Timeout must be a positive number of seconds"
+
+DEFAULT_TIMEOUT_MS = int(os.environ.get("REQUEST_TIMEOUT_MS", "10000"))
+ROUTE_TIMEOUTS_MS = {
+    ("POST", "/transfers"): int(os.environ.get("REQUEST_TIMEOUT_TRANSFERS_MS", "2000")),
+    ("GET", "/changes"): int(os.environ.get("REQUEST_TIMEOUT_CHANGES_MS", "35000")),
+    ("GET", "/transfers/export"): int(os.environ.get("REQUEST_TIMEOUT_EXPORT_MS", "0")),
+}
+
+
+class RequestDeadlineMiddleware:
+    """
+    Runs each HTTP request under its deadline and answers 504 once it has passed.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        default_timeout_ms: int,
+        route_timeouts_ms: dict[tuple[str, str], int],
+    ) -> None:
+        self._app = app
+        self._default_timeout_ms = default_timeout_ms
+        self._route_timeouts_ms = route_timeouts_ms
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self._app(scope, receive, send)
+            return
+
+        try:
+            budget = self._budget(scope)
+        except ValueError:
+            await _reject_invalid_timeout(scope, receive, send)
+            return
+        if budget is None:
+            await self._app(scope, receive, send)
+        else:
+            await self._run_within(budget, scope, receive, send)
+
+    def _budget(self, scope: Scope) -> float | None:
+        """
+        Seconds the request may run: the route's timeout, lowered to the client's
+        X-Request-Timeout if that is shorter. None if neither sets one. Raises
+        ValueError if X-Request-Timeout is malformed or not positive.
+        """
+        server_ms = self._route_timeouts_ms.get(
+            (scope["method"], scope["path"].rstrip("/")), self._default_timeout_ms
+        )
+        budget = server_ms / 1000 if server_ms > 0 else None
+        requested = _requested_timeout(scope)
+        if requested is None:
+            return budget
+        if requested <= 0:
+            raise ValueError(_INVALID_TIMEOUT)
+        return requested if budget is None else min(budget, requested)
+
+    async def _run_within(
+        self, budget: float, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        deadline = Deadline.after(budget)
+        started = False
+
+        async def send_tracking_start(message: Message) -> None:
+            nonlocal started
+            if message["type"] == "http.response.start":
+                started = True
+            await send(message)
+
+        with deadline_scope(deadline):
+            try:
+                await self._app(scope, receive, send_tracking_start)
+            except Exception:
+                if started or not deadline.expired():
+                    raise
+                response = JSONResponse(
+                    status_code=504,
+                    content={"detail": f"Request deadline of {budget:g}s exceeded"},
+                )
+                await response(scope, receive, send)
+
+
+async def _reject_invalid_timeout(scope: Scope, receive: Receive, send: Send) -> None:
+    response = JSONResponse(status_code=400, content={"detail": _INVALID_TIMEOUT})
+    await response(scope, receive, send)
+
+
+def _requested_timeout(scope: Scope) -> float | None:
+    """
+    The client's X-Request-Timeout in seconds, None if absent, or 0 if malformed.
+    """
+    for name, value in scope["headers"]:
+        if name == HEADER:
+            try:
+                seconds = float(value)
+            except ValueError:
+                return 0.0
+            return seconds if math.isfinite(seconds) else 0.0
+    return None
+
+
+def register_request_deadlines(app: FastAPI) -> None:
+    app.add_middleware(
+        RequestDeadlineMiddleware,
+        default_timeout_ms=DEFAULT_TIMEOUT_MS,
+        route_timeouts_ms=ROUTE_TIMEOUTS_MS,
+    )
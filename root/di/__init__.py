@@ -1,3 +1,4 @@
 # flake8: noqa: F403
 from root.di.accounts import *
+from root.di.digests import *
 from root.di.transfers import *
@@ -14,12 +14,17 @@ It bundles:
 into a single immutable RequestContext object.
 This avoids passing multiple independent dependencies through every constructor
 and keeps request-scoped state explicit.
+Use cases that only read are wired with ReadContextDep. Its session comes from the
+read-only provider: a separate pool, possibly a replica, and it never commits.
 
 This module contains:
 - RequestContext: an immutable container for per-request infrastructure resources.
 - get_ctx: a FastAPI dependency that builds the RequestContext.
+- get_read_ctx: a FastAPI dependency that builds a read-only RequestContext.
 - SessionDep: a dependency alias for obtaining a database session.
+- ReadSessionDep: a dependency alias for obtaining a read-only database session.
 - ContextDep: a dependency alias for obtaining the full request context.
+- ReadContextDep: a dependency alias for obtaining the read-only request context.
 
 Dependency constraints:
 - May depend on infrastructure (database session, logging).
@@ -46,7 +51,7 @@ from typing import Annotated
 from fastapi import Depends, Request
 from sqlalchemy.orm import Session
 
-from infra.db.session import get_session
+from infra.db.session import get_read_session, get_session
 
 
 @dataclass(frozen=True, slots=True)
@@ -56,6 +61,14 @@ class RequestContext:
 
 
 def get_ctx(session: SessionDep, request: Request) -> RequestContext:
+    return _build_ctx(session, request)
+
+
+def get_read_ctx(session: ReadSessionDep, request: Request) -> RequestContext:
+    return _build_ctx(session, request)
+
+
+def _build_ctx(session: Session, request: Request) -> RequestContext:
     if not hasattr(request.app.state, "logger"):
         raise RuntimeError("Logger not attached")
 
@@ -66,4 +79,6 @@ def get_ctx(session: SessionDep, request: Request) -> RequestContext:
 
 
 SessionDep = Annotated[Session, Depends(get_session)]
+ReadSessionDep = Annotated[Session, Depends(get_read_session)]
 ContextDep = Annotated[RequestContext, Depends(get_ctx)]
+ReadContextDep = Annotated[RequestContext, Depends(get_read_ctx)]
@@ -9,19 +9,33 @@ use case interactors and exposes them as injectable dependencies.
 Design intent:
 This is pure object graph composition.
 It connects:
-- Infrastructure implementations (AccountRepo),
+- Infrastructure implementations (AccountRepo, or CoreAccountRepo when
+  SQL_REPOSITORIES=core; LedgerAccountRepo when
+  LEDGER_BACKEND=memory, or ShardedAccountRepo when LEDGER_BACKEND=sharded),
+- The account id Bloom filter (root/account_filter_setup), which answers
+  lookups of unknown ids before they reach the repository,
+- The shared-memory balance table (root/shared_balances_setup), which answers
+  AccountGetter's reads of cached accounts without a query,
+- On-demand request profiling (root/profiling_setup), which can run
+  AccountGetter under cProfile,
+- Memory diagnostics (root/memory_diagnostics_setup), which sample what
+  AccountCreator and AccountGetter calls leave allocated,
 - Interface adapters (AccountCreatorPresenter, AccountGetterPresenter),
 - Application interactors (AccountCreator, AccountGetter),
 - Shared runtime context (session, logger),
 into fully assembled use cases.
+AccountCreator writes, so it is built per attempt inside its own retried
+transaction (see root/di/transactions) rather than on the request session.
 
 No business logic or application policy lives here.
 Only construction and wiring of already-defined components.
 
 This module contains:
-- get_account_repo: builds the concrete AccountRepo using the current DB session.
+- get_account_read_repo: builds the configured account repository over the
+  read-only session for SQL.
 - get_account_creator: builds the AccountCreator interactor with all its dependencies.
 - get_account_getter: builds the AccountGetter interactor with all its dependencies.
+- ACCOUNT_LOADS: the process-wide group that coalesces AccountGetter's loads.
 
 Dependency constraints:
 - May depend on all inner layers (infra, features, core).
@@ -41,38 +55,97 @@ from __future__ import annotations
 
 from typing import Annotated
 
-from fastapi import Depends
+from fastapi import Depends, Request
 
+from core.entities.account import Account
+from core.values.custom_types import AccountId
+from features.accounts.ports import (
+    AccountCreatorPort,
+    AccountGetterPort,
+    AccountRepoPort,
+)
 from features.accounts.presenters import AccountCreatorPresenter, AccountGetterPresenter
 from features.accounts.use_cases import AccountCreator, AccountGetter
+from infra.concurrency.coalescing_repo import CoalescingAccountRepo
+from infra.concurrency.singleflight import SingleFlight
+from infra.db.accounts.core_repo import CoreAccountRepo
 from infra.db.accounts.repo import AccountRepo
-from root.di._shared import ContextDep
+from infra.db.unit_of_work import SqlUnitOfWork
+from infra.memory.accounts.repo import LedgerAccountRepo
+from infra.memory.ledger import LEDGER_BACKEND
+from infra.sharding.repos import ShardedAccountRepo
+from root.account_filter_setup import filtered_account_repo
+from root.di._shared import ReadContextDep
+from root.di.transactions import SQL_REPOSITORIES, RetryingUseCase, WriteRepos
+from root.ledger_setup import LedgerSessionDep
+from root.logging_setup import LoggerDep
+from root.memory_diagnostics_setup import allocation_sampled_use_case
+from root.profiling_setup import profiled_use_case
+from root.shard_setup import ShardReadsDep
+from root.shared_balances_setup import shared_balance_repo
 
 
-def get_account_repo(ctx: ContextDep) -> AccountRepo:
-    return AccountRepo(session=ctx.session)
+def _sql_account_read_repo(ctx: ReadContextDep) -> AccountRepoPort:
+    if SQL_REPOSITORIES == "core":
+        return CoreAccountRepo(uow=SqlUnitOfWork(session=ctx.session))
+    return AccountRepo(uow=SqlUnitOfWork(session=ctx.session))
 
 
-AccountRepoDep = Annotated[AccountRepo, Depends(get_account_repo)]
+def _ledger_account_repo(session: LedgerSessionDep) -> AccountRepoPort:
+    return LedgerAccountRepo(session=session)
+
+
+def _sharded_account_read_repo(uow: ShardReadsDep) -> AccountRepoPort:
+    return ShardedAccountRepo(uow=uow)
+
+
+get_account_read_repo = {
+    "memory": _ledger_account_repo,
+    "sharded": _sharded_account_read_repo,
+}.get(LEDGER_BACKEND, _sql_account_read_repo)
+
+
+AccountReadRepoDep = Annotated[AccountRepoPort, Depends(get_account_read_repo)]
+
+ACCOUNT_LOADS: SingleFlight[AccountId, tuple[int, Account] | None] = SingleFlight()
 
 
 def get_account_creator(
-    repo: AccountRepoDep,
-    ctx: ContextDep,
-) -> AccountCreator:
-    return AccountCreator(
-        repo=repo,
-        presenter=AccountCreatorPresenter(),
-        logger=ctx.logger,
+    request: Request,
+    logger: LoggerDep,
+) -> AccountCreatorPort.In:
+    def build(repos: WriteRepos) -> AccountCreator:
+        return AccountCreator(
+            uow=repos.uow,
+            repo=repos.accounts,
+            presenter=AccountCreatorPresenter(),
+            logger=logger,
+        )
+
+    return allocation_sampled_use_case(
+        request.app,
+        "account_creator",
+        RetryingUseCase(app=request.app, build=build, logger=logger),
     )
 
 
 def get_account_getter(
-    repo: AccountRepoDep,
-    ctx: ContextDep,
-) -> AccountGetter:
-    return AccountGetter(
-        repo=repo,
+    request: Request,
+    repo: AccountReadRepoDep,
+    ctx: ReadContextDep,
+) -> AccountGetterPort.In:
+    getter = AccountGetter(
+        repo=filtered_account_repo(
+            request.app,
+            shared_balance_repo(
+                request.app, CoalescingAccountRepo(inner=repo, loads=ACCOUNT_LOADS)
+            ),
+        ),
         presenter=AccountGetterPresenter(),
         logger=ctx.logger,
     )
+    return profiled_use_case(
+        request.app,
+        "account_getter",
+        allocation_sampled_use_case(request.app, "account_getter", getter),
+    )
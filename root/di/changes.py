@@ -0,0 +1,57 @@
+"""
+Ring: Composition Root
+
+Responsibility:
+Defines dependency wiring for the Change Feed feature.
+This module constructs the feed repository, notifier, presenter, and reader
+interactor and exposes them as injectable dependencies.
+
+Design intent:
+This is pure object graph composition.
+It connects:
+- Infrastructure implementations (ChangeFeedRepo, the process-wide ChangeNotifier),
+- Interface adapters (ChangeFeedReaderPresenter),
+- Application interactors (ChangeFeedReader),
+- Shared runtime context (logger),
+into a fully assembled use case.
+The repository gets the read-only session factory rather than a request session,
+so a long poll does not pin a connection for its whole wait.
+Only the SQL unit of work appends to the change feed, so this provider is
+registered only when LEDGER_BACKEND is "sql" (see root/routers).
+
+No business logic or application policy lives here.
+Only construction and wiring of already-defined components.
+
+This module contains:
+- get_change_feed_reader: builds the ChangeFeedReader interactor with all its dependencies.
+
+Dependency constraints:
+- May depend on all inner layers (infra, features, core).
+- Must not be imported by any inner layer.
+- Must not contain business rules or use case logic.
+
+Stability:
+- Highly volatile.
+- Changes whenever wiring, construction strategy, or infrastructure changes.
+
+Usage:
+- Used by delivery layers (routers) through FastAPI dependency injection.
+"""
+
+from __future__ import annotations
+
+from features.changes.presenters import ChangeFeedReaderPresenter
+from features.changes.use_cases import ChangeFeedReader
+from infra.db.changes.notifier import change_notifier
+from infra.db.changes.repo import ChangeFeedRepo
+from infra.db.session import ReadSessionLocal
+from root.logging_setup import LoggerDep
+
+
+def get_change_feed_reader(logger: LoggerDep) -> ChangeFeedReader:
+    return ChangeFeedReader(
+        repo=ChangeFeedRepo(session_factory=ReadSessionLocal),
+        notifier=change_notifier,
+        presenter=ChangeFeedReaderPresenter(),
+        logger=logger,
+    )
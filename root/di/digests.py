@@ -0,0 +1,67 @@
+"""
+Ring: Composition Root
+
+Responsibility:
+Defines dependency wiring for the State Digest feature.
+This module constructs the digest repository, presenter, and reader interactor
+and exposes them as injectable dependencies.
+
+Design intent:
+This is pure object graph composition.
+It connects:
+- Infrastructure implementations (StateDigestRepo),
+- Interface adapters (DigestReaderPresenter),
+- Application interactors (DigestReader),
+- Shared runtime context (session, logger),
+into a fully assembled use case.
+Only the SQL unit of work maintains the digests, so these providers are
+registered only when LEDGER_BACKEND is "sql" (see root/routers).
+
+No business logic or application policy lives here.
+Only construction and wiring of already-defined components.
+
+This module contains:
+- get_state_digest_repo: builds the concrete StateDigestRepo using the current DB session.
+- get_digest_reader: builds the DigestReader interactor with all its dependencies.
+
+Dependency constraints:
+- May depend on all inner layers (infra, features, core).
+- Must not be imported by any inner layer.
+- Must not contain business rules or use case logic.
+
+Stability:
+- Highly volatile.
+- Changes whenever wiring, construction strategy, or infrastructure changes.
+
+Usage:
+- Used by delivery layers (routers) through FastAPI dependency injection.
+"""
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from fastapi import Depends
+
+from features.digests.presenters import DigestReaderPresenter
+from features.digests.use_cases import DigestReader
+from infra.db.digests.repo import StateDigestRepo
+from root.di._shared import ReadContextDep
+
+
+def get_state_digest_repo(ctx: ReadContextDep) -> StateDigestRepo:
+    return StateDigestRepo(session=ctx.session)
+
+
+StateDigestRepoDep = Annotated[StateDigestRepo, Depends(get_state_digest_repo)]
+
+
+def get_digest_reader(
+    repo: StateDigestRepoDep,
+    ctx: ReadContextDep,
+) -> DigestReader:
+    return DigestReader(
+        repo=repo,
+        presenter=DigestReaderPresenter(),
+        logger=ctx.logger,
+    )
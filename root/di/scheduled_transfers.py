@@ -0,0 +1,115 @@
+"""
+Ring: Composition Root
+
+Responsibility:
+Defines dependency wiring for the Scheduled Transfers feature.
+This module constructs the scheduled transfer interactors and exposes them as
+injectable dependencies, and builds the executor the scheduler fires.
+
+Design intent:
+This is pure object graph composition.
+- ScheduledTransferCreator and ScheduledTransferExecutor write, so each is built
+  per attempt inside its own retried transaction (see root/di/transactions).
+- The executor's transfer port is a TransferCreator built on the same unit of
+  work, so the transfer and the scheduled transfer's status commit together.
+  It is not itself retried: the executor as a whole is.
+- Scheduled transfers are stored in SQL only; these providers are registered
+  only when LEDGER_BACKEND is "sql" (see root/routers).
+
+No business logic or application policy lives here.
+
+This module contains:
+- get_scheduled_transfer_creator: builds the ScheduledTransferCreator interactor.
+- get_scheduled_transfer_getter: builds the ScheduledTransferGetter interactor.
+- build_scheduled_transfer_executor: builds the retried ScheduledTransferExecutor.
+
+Dependency constraints:
+- May depend on all inner layers (infra, features, core).
+- Must not be imported by any inner layer.
+- Must not contain business rules or use case logic.
+
+Stability:
+- Highly volatile.
+- Changes whenever wiring, construction strategy, or infrastructure changes.
+
+Usage:
+- Used by delivery layers (routers) through FastAPI dependency injection.
+- build_scheduled_transfer_executor is used by root/scheduler_setup.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from fastapi import FastAPI, Request
+
+from features.scheduled_transfers.ports import (
+    ScheduledTransferCreatorPort,
+    ScheduledTransferExecutorPort,
+    ScheduledTransferRepoPort,
+)
+from features.scheduled_transfers.presenters import ScheduledTransferPresenter
+from features.scheduled_transfers.use_cases import (
+    ScheduledTransferCreator,
+    ScheduledTransferExecutor,
+    ScheduledTransferGetter,
+)
+from features.transfers.presenters import TransferCreatorPresenter
+from features.transfers.use_cases import TransferCreator
+from infra.db.scheduled_transfers.repo import ScheduledTransferRepo
+from infra.db.unit_of_work import SqlUnitOfWork
+from root.di._shared import ReadContextDep
+from root.di.transactions import RetryingUseCase, WriteRepos
+from root.logging_setup import LoggerDep
+
+
+def _scheduled_transfer_repo(repos: WriteRepos) -> ScheduledTransferRepoPort:
+    if repos.scheduled_transfers is None:
+        raise RuntimeError("Scheduled transfers require the SQL backend")
+    return repos.scheduled_transfers
+
+
+def get_scheduled_transfer_creator(
+    request: Request,
+    logger: LoggerDep,
+) -> ScheduledTransferCreatorPort.In:
+    def build(repos: WriteRepos) -> ScheduledTransferCreator:
+        return ScheduledTransferCreator(
+            uow=repos.uow,
+            repo=_scheduled_transfer_repo(repos),
+            scheduler=request.app.state.transfer_scheduler,
+            presenter=ScheduledTransferPresenter(),
+            logger=logger,
+        )
+
+    return RetryingUseCase(app=request.app, build=build, logger=logger)
+
+
+def get_scheduled_transfer_getter(ctx: ReadContextDep) -> ScheduledTransferGetter:
+    return ScheduledTransferGetter(
+        repo=ScheduledTransferRepo(uow=SqlUnitOfWork(session=ctx.session)),
+        presenter=ScheduledTransferPresenter(),
+        logger=ctx.logger,
+    )
+
+
+def build_scheduled_transfer_executor(
+    app: FastAPI, logger: logging.Logger
+) -> ScheduledTransferExecutorPort.In:
+    def build(repos: WriteRepos) -> ScheduledTransferExecutor:
+        return ScheduledTransferExecutor(
+            uow=repos.uow,
+            repo=_scheduled_transfer_repo(repos),
+            transfers=TransferCreator(
+                uow=repos.uow,
+                account_repo=repos.accounts,
+                transfer_repo=repos.transfers,
+                presenter=TransferCreatorPresenter(),
+                logger=logger,
+                limits=app.state.velocity_limits,
+            ),
+            presenter=ScheduledTransferPresenter(),
+            logger=logger,
+        )
+
+    return RetryingUseCase(app=app, build=build, logger=logger)
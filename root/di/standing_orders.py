@@ -0,0 +1,77 @@
+"""
+Ring: Composition Root
+
+Responsibility:
+Defines dependency wiring for the Standing Orders feature's HTTP use cases.
+
+Design intent:
+This is pure object graph composition.
+StandingOrderCreator writes, so it is built per attempt inside its own retried
+transaction (see root/di/transactions). Standing orders are stored in SQL only;
+these providers are registered only when LEDGER_BACKEND is "sql" (see
+root/routers). The chunk executor is wired by the standing order runner
+(root/cli/run_standing_orders), not here.
+
+No business logic or application policy lives here.
+
+This module contains:
+- get_standing_order_creator: builds the StandingOrderCreator interactor.
+- get_standing_order_getter: builds the StandingOrderGetter interactor.
+
+Dependency constraints:
+- May depend on all inner layers (infra, features, core).
+- Must not be imported by any inner layer.
+- Must not contain business rules or use case logic.
+
+Stability:
+- Highly volatile.
+- Changes whenever wiring, construction strategy, or infrastructure changes.
+
+Usage:
+- Used by delivery layers (routers) through FastAPI dependency injection.
+"""
+
+from __future__ import annotations
+
+from fastapi import Request
+
+from features.standing_orders.ports import (
+    StandingOrderCreatorPort,
+    StandingOrderRepoPort,
+)
+from features.standing_orders.presenters import StandingOrderPresenter
+from features.standing_orders.use_cases import StandingOrderCreator, StandingOrderGetter
+from infra.db.standing_orders.repo import StandingOrderRepo
+from infra.db.unit_of_work import SqlUnitOfWork
+from root.di._shared import ReadContextDep
+from root.di.transactions import RetryingUseCase, WriteRepos
+from root.logging_setup import LoggerDep
+
+
+def _standing_order_repo(repos: WriteRepos) -> StandingOrderRepoPort:
+    if repos.standing_orders is None:
+        raise RuntimeError("Standing orders require the SQL backend")
+    return repos.standing_orders
+
+
+def get_standing_order_creator(
+    request: Request,
+    logger: LoggerDep,
+) -> StandingOrderCreatorPort.In:
+    def build(repos: WriteRepos) -> StandingOrderCreator:
+        return StandingOrderCreator(
+            uow=repos.uow,
+            repo=_standing_order_repo(repos),
+            presenter=StandingOrderPresenter(),
+            logger=logger,
+        )
+
+    return RetryingUseCase(app=request.app, build=build, logger=logger)
+
+
+def get_standing_order_getter(ctx: ReadContextDep) -> StandingOrderGetter:
+    return StandingOrderGetter(
+        repo=StandingOrderRepo(uow=SqlUnitOfWork(session=ctx.session)),
+        presenter=StandingOrderPresenter(),
+        logger=ctx.logger,
+    )
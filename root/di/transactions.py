@@ -0,0 +1,229 @@
+"""
+Ring: Composition Root
+
+Responsibility:
+Defines how write use cases are run: each execution gets its own transaction,
+committed before the response is built, and the whole unit of work is re-run if
+it fails on a transient conflict with a concurrent writer.
+
+Design intent:
+This is pure composition and wiring.
+- A request-scoped session commits in its dependency's teardown, after the
+  response has been sent. A failed commit would then never reach the client, and
+  nothing could re-run the work. Write use cases instead run inside
+  RetryingUseCase: each attempt opens a fresh unit of work (SqlUnitOfWork, a
+  LedgerSession for LEDGER_BACKEND=memory, or a ShardedUnitOfWork for
+  LEDGER_BACKEND=sharded), builds the use case and its repositories on it, and
+  executes it. The use case commits; anything it leaves
+  uncommitted, or any error, is rolled back.
+- Retries are classified per backend (infra/db/conflicts, plus ledger conflicts
+  for LEDGER_BACKEND=memory and moved or moving slots for
+  LEDGER_BACKEND=sharded), spaced with jittered exponential backoff, and
+  bounded by TX_RETRY_MAX_ATTEMPTS and a TX_RETRY_BUDGET_MS deadline per request
+  (see infra/concurrency/retry), or the request's own deadline if that is
+  sooner. No attempt starts once the request's deadline has passed
+  (infra/concurrency/deadline).
+- Application errors are never retried: they roll the attempt back and propagate.
+- Account repositories are wrapped with the account id Bloom filter when it is
+  enabled (root/account_filter_setup).
+- SQL units of work publish committed balances to the shared-memory balance
+  table when it is enabled (root/shared_balances_setup).
+- SQL_REPOSITORIES=core swaps the ORM repositories and unit of work for their
+  SQLAlchemy Core counterparts (CoreSqlUnitOfWork, CoreAccountRepo,
+  CoreTransferRepo), which skip the identity map. Scheduled transfers and
+  standing orders stay on the ORM. "orm" is the default.
+
+This module contains:
+- SQL_REPOSITORIES: which SQL repositories are wired ("orm" or "core").
+- WRITE_RETRIES: the process-wide retrier, whose counters are exposed as metrics.
+- WriteRepos: the repositories of one write transaction.
+- write_transaction: opens one write unit of work on the configured backend.
+- RetryingUseCase: runs a use case per attempt under WRITE_RETRIES.
+
+Dependency constraints:
+- May depend on all inner layers (infra, features, core).
+- Must not be imported by any inner layer.
+- Must not contain business rules or use case logic.
+
+Stability:
+- Highly volatile.
+- Changes when the transaction or retry strategy changes.
+
+Usage:
+- Used by root/di feature modules to wire write use cases.
+- WRITE_RETRIES is read by root/metrics.
+- SQL_REPOSITORIES is read by the root/di feature modules for read repositories.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+from fastapi import FastAPI
+
+from features._shared.ports import ExecutableUseCase, UnitOfWork
+from features.accounts.ports import AccountRepoPort
+from features.scheduled_transfers.ports import ScheduledTransferRepoPort
+from features.standing_orders.ports import StandingOrderRepoPort
+from features.transfers.ports import TransferRepoPort
+from infra.concurrency.deadline import check_deadline, current_deadline
+from infra.concurrency.retry import RetryPolicy, TransientErrorRetrier
+from infra.db.accounts.core_repo import CoreAccountRepo
+from infra.db.accounts.repo import AccountRepo
+from infra.db.conflicts import classify_db_error
+from infra.db.scheduled_transfers.repo import ScheduledTransferRepo
+from infra.db.session import SessionLocal
+from infra.db.standing_orders.repo import StandingOrderRepo
+from infra.db.transfers.core_repo import CoreTransferRepo
+from infra.db.transfers.repo import TransferRepo
+from infra.db.unit_of_work import CoreSqlUnitOfWork, SqlUnitOfWork
+from infra.memory.accounts.repo import LedgerAccountRepo
+from infra.memory.ledger import LEDGER_BACKEND, LedgerConflictError, LedgerSession
+from infra.memory.transfers.repo import LedgerTransferRepo
+from infra.sharding.cluster import ShardSlotMovedError, ShardSlotMovingError
+from infra.sharding.repos import ShardedAccountRepo, ShardedTransferRepo
+from infra.sharding.unit_of_work import ShardedUnitOfWork
+from root.account_filter_setup import filtered_account_repo
+
+U = TypeVar("U", bound=ExecutableUseCase)
+
+SQL_REPOSITORIES = os.environ.get("SQL_REPOSITORIES", "orm")
+
+
+def _classify(exc: BaseException) -> str | None:
+    if isinstance(exc, LedgerConflictError):
+        return "ledger_conflict"
+    if isinstance(exc, ShardSlotMovedError):
+        return "shard_slot_moved"
+    if isinstance(exc, ShardSlotMovingError):
+        return "shard_slot_moving"
+    return classify_db_error(exc)
+
+
+WRITE_RETRIES = TransientErrorRetrier(
+    policy=RetryPolicy(
+        max_attempts=int(os.environ.get("TX_RETRY_MAX_ATTEMPTS", "5")),
+        base_delay=int(os.environ.get("TX_RETRY_BASE_DELAY_MS", "5")) / 1000,
+        max_delay=int(os.environ.get("TX_RETRY_MAX_DELAY_MS", "200")) / 1000,
+        budget=int(os.environ.get("TX_RETRY_BUDGET_MS", "2000")) / 1000,
+    ),
+    classify=_classify,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class WriteRepos:
+    """
+    `scheduled_transfers` and `standing_orders` are None for LEDGER_BACKEND=memory
+    and LEDGER_BACKEND=sharded, which store neither.
+    """
+
+    uow: UnitOfWork
+    accounts: AccountRepoPort
+    transfers: TransferRepoPort
+    scheduled_transfers: ScheduledTransferRepoPort | None
+    standing_orders: StandingOrderRepoPort | None
+
+
+@contextmanager
+def write_transaction(app: FastAPI) -> Iterator[WriteRepos]:
+    """
+    Roll back whatever the block has not committed when it exits.
+    """
+    if LEDGER_BACKEND == "memory":
+        ledger_session = LedgerSession(app.state.ledger)
+        try:
+            yield WriteRepos(
+                uow=ledger_session,
+                accounts=filtered_account_repo(
+                    app, LedgerAccountRepo(session=ledger_session)
+                ),
+                transfers=LedgerTransferRepo(session=ledger_session),
+                scheduled_transfers=None,
+                standing_orders=None,
+            )
+        finally:
+            ledger_session.rollback()
+        return
+
+    if LEDGER_BACKEND == "sharded":
+        sharded_uow = ShardedUnitOfWork(cluster=app.state.shards)
+        try:
+            yield WriteRepos(
+                uow=sharded_uow,
+                accounts=filtered_account_repo(
+                    app, ShardedAccountRepo(uow=sharded_uow)
+                ),
+                transfers=ShardedTransferRepo(uow=sharded_uow),
+                scheduled_transfers=None,
+                standing_orders=None,
+            )
+        finally:
+            sharded_uow.rollback()
+            sharded_uow.close()
+        return
+
+    with SessionLocal() as session:
+        if SQL_REPOSITORIES == "core":
+            uow: SqlUnitOfWork = CoreSqlUnitOfWork(
+                session=session, balances=app.state.shared_balances
+            )
+            accounts: AccountRepoPort = CoreAccountRepo(uow=uow)
+            transfers: TransferRepoPort = CoreTransferRepo(uow=uow)
+        else:
+            uow = SqlUnitOfWork(session=session, balances=app.state.shared_balances)
+            accounts = AccountRepo(uow=uow)
+            transfers = TransferRepo(uow=uow)
+        try:
+            yield WriteRepos(
+                uow=uow,
+                accounts=filtered_account_repo(app, accounts),
+                transfers=transfers,
+                scheduled_transfers=ScheduledTransferRepo(uow=uow),
+                standing_orders=StandingOrderRepo(uow=uow),
+            )
+        finally:
+            uow.rollback()
+
+
+class RetryingUseCase(Generic[U]):
+    """
+    Exposes `execute` like the use case built by `build`, one instance per attempt.
+    """
+
+    def __init__(
+        self,
+        *,
+        app: FastAPI,
+        build: Callable[[WriteRepos], U],
+        logger: logging.Logger,
+    ) -> None:
+        self._app = app
+        self._build = build
+        self._logger = logger
+
+    def execute(self, **kwargs: Any) -> Any:
+        deadline = current_deadline()
+        return WRITE_RETRIES.run(
+            lambda: self._attempt(kwargs),
+            on_retry=self._log_retry,
+            deadline=None if deadline is None else deadline.expires_at,
+        )
+
+    def _attempt(self, kwargs: dict[str, Any]) -> Any:
+        check_deadline("starting a write transaction")
+        with write_transaction(self._app) as repos:
+            return self._build(repos).execute(**kwargs)
+
+    def _log_retry(self, reason: str, attempt: int, delay: float) -> None:
+        self._logger.info(
+            "transaction_retry reason=%s attempt=%s delay_ms=%.1f",
+            reason,
+            attempt,
+            delay * 1000,
+        )
@@ -9,18 +9,29 @@ use case interactors and exposes them as injectable dependencies.
 Design intent:
 This is pure object graph composition.
 It connects:
-- Infrastructure implementations (TransferRepo),
-- Interface adapters (TransferCreatorPresenter),
-- Application interactors (TransferCreator),
+- Infrastructure implementations (TransferRepo, or CoreTransferRepo when
+  SQL_REPOSITORIES=core; LedgerTransferRepo when
+  LEDGER_BACKEND=memory, or ShardedTransferRepo when LEDGER_BACKEND=sharded),
+- Interface adapters (TransferCreatorPresenter, export presenters),
+- Application interactors (TransferCreator, TransferExporter),
 - Shared runtime context (session, logger),
-into a fully assembled use case.
+- Velocity limit counters (see root/velocity_limits_setup), when configured,
+- On-demand request profiling (root/profiling_setup), which can run
+  TransferCreator, with its retries, under cProfile,
+- Memory diagnostics (root/memory_diagnostics_setup), which sample what
+  TransferCreator calls leave allocated,
+into fully assembled use cases.
+TransferCreator writes, so it is built per attempt inside its own retried
+transaction (see root/di/transactions) rather than on the request session.
 
 No business logic or application policy lives here.
 Only construction and wiring of already-defined components.
 
 This module contains:
-- get_transfer_repo: builds the concrete TransferRepo using the current DB session.
+- get_transfer_read_repo: builds the configured transfer repository over the
+  read-only session for SQL.
 - get_transfer_creator: builds the TransferCreator interactor with all its dependencies.
+- get_transfer_exporter: builds the TransferExporter interactor with one presenter per format.
 
 Dependency constraints:
 - May depend on all inner layers (infra, features, core).
@@ -41,30 +52,94 @@ from __future__ import annotations
 
 from typing import Annotated
 
-from fastapi import Depends
-
-from features.transfers.presenters import TransferCreatorPresenter
-from features.transfers.use_cases import TransferCreator
+from fastapi import Depends, Request
+
+from features.transfers.ports import (
+    TransferCreatorPort,
+    TransferExporterPort,
+    TransferRepoPort,
+)
+from features.transfers.presenters import (
+    TransferCreatorPresenter,
+    TransferCsvExportPresenter,
+    TransferNdjsonExportPresenter,
+)
+from features.transfers.schemas import ExportFormat
+from features.transfers.use_cases import TransferCreator, TransferExporter
+from infra.db.transfers.core_repo import CoreTransferRepo
 from infra.db.transfers.repo import TransferRepo
-from root.di._shared import ContextDep
-from root.di.accounts import AccountRepoDep
+from infra.db.types import is_storable_id
+from infra.db.unit_of_work import SqlUnitOfWork
+from infra.memory.ledger import LEDGER_BACKEND
+from infra.memory.transfers.repo import LedgerTransferRepo
+from infra.sharding.repos import ShardedTransferRepo
+from root.di._shared import ReadContextDep
+from root.di.transactions import SQL_REPOSITORIES, RetryingUseCase, WriteRepos
+from root.ledger_setup import LedgerSessionDep
+from root.logging_setup import LoggerDep
+from root.memory_diagnostics_setup import allocation_sampled_use_case
+from root.profiling_setup import profiled_use_case
+from root.shard_setup import ShardReadsDep
+
+
+def _sql_transfer_read_repo(ctx: ReadContextDep) -> TransferRepoPort:
+    if SQL_REPOSITORIES == "core":
+        return CoreTransferRepo(uow=SqlUnitOfWork(session=ctx.session))
+    return TransferRepo(uow=SqlUnitOfWork(session=ctx.session))
+
+
+def _ledger_transfer_repo(session: LedgerSessionDep) -> TransferRepoPort:
+    return LedgerTransferRepo(session=session)
 
 
-def get_transfer_repo(ctx: ContextDep) -> TransferRepo:
-    return TransferRepo(session=ctx.session)
+def _sharded_transfer_read_repo(uow: ShardReadsDep) -> TransferRepoPort:
+    return ShardedTransferRepo(uow=uow)
 
 
-TransferRepoDep = Annotated[TransferRepo, Depends(get_transfer_repo)]
+get_transfer_read_repo = {
+    "memory": _ledger_transfer_repo,
+    "sharded": _sharded_transfer_read_repo,
+}.get(LEDGER_BACKEND, _sql_transfer_read_repo)
+
+
+TransferReadRepoDep = Annotated[TransferRepoPort, Depends(get_transfer_read_repo)]
 
 
 def get_transfer_creator(
-    account_repo: AccountRepoDep,
-    transfer_repo: TransferRepoDep,
-    ctx: ContextDep,
-) -> TransferCreator:
-    return TransferCreator(
-        account_repo=account_repo,
+    request: Request,
+    logger: LoggerDep,
+) -> TransferCreatorPort.In:
+    def build(repos: WriteRepos) -> TransferCreator:
+        return TransferCreator(
+            uow=repos.uow,
+            account_repo=repos.accounts,
+            transfer_repo=repos.transfers,
+            presenter=TransferCreatorPresenter(),
+            logger=logger,
+            limits=request.app.state.velocity_limits,
+        )
+
+    return profiled_use_case(
+        request.app,
+        "transfer_creator",
+        allocation_sampled_use_case(
+            request.app,
+            "transfer_creator",
+            RetryingUseCase(app=request.app, build=build, logger=logger),
+        ),
+    )
+
+
+def get_transfer_exporter(
+    transfer_repo: TransferReadRepoDep,
+    ctx: ReadContextDep,
+) -> TransferExporterPort.In:
+    return TransferExporter(
         transfer_repo=transfer_repo,
-        presenter=TransferCreatorPresenter(),
+        presenters={
+            ExportFormat.NDJSON: TransferNdjsonExportPresenter(),
+            ExportFormat.CSV: TransferCsvExportPresenter(),
+        },
         logger=ctx.logger,
+        is_valid_id=is_storable_id,
     )
@@ -44,11 +44,22 @@ from fastapi.responses import JSONResponse
 from core.values.errors import DomainError
 from features._shared.errors import ApplicationError
 from features.accounts.errors import AccountNotFoundError, AccountValidationError
+from features.changes.errors import ChangeFeedBusyError
+from features.scheduled_transfers.errors import (
+    ScheduledTransferNotFoundError,
+    ScheduledTransferValidationError,
+)
+from features.standing_orders.errors import (
+    StandingOrderNotFoundError,
+    StandingOrderValidationError,
+)
 from features.transfers.errors import (
     TransferAccountNotFoundError,
     TransferInsufficientFundsError,
+    TransferLimitExceededError,
     TransferValidationError,
 )
+from infra.concurrency.deadline import DeadlineExceededError
 
 
 def register_exception_handlers(app: FastAPI) -> None:
@@ -100,6 +111,48 @@ def register_exception_handlers(app: FastAPI) -> None:
     ) -> JSONResponse:
         return _json_error(409, exc)
 
+    @app.exception_handler(TransferLimitExceededError)
+    async def _transfer_limit_exceeded(
+        _: Request, exc: TransferLimitExceededError
+    ) -> JSONResponse:
+        return _json_error(429, exc)
+
+    @app.exception_handler(ScheduledTransferNotFoundError)
+    async def _scheduled_transfer_not_found(
+        _: Request, exc: ScheduledTransferNotFoundError
+    ) -> JSONResponse:
+        return _json_error(404, exc)
+
+    @app.exception_handler(ScheduledTransferValidationError)
+    async def _scheduled_transfer_validation(
+        _: Request, exc: ScheduledTransferValidationError
+    ) -> JSONResponse:
+        return _json_error(400, exc)
+
+    @app.exception_handler(StandingOrderNotFoundError)
+    async def _standing_order_not_found(
+        _: Request, exc: StandingOrderNotFoundError
+    ) -> JSONResponse:
+        return _json_error(404, exc)
+
+    @app.exception_handler(StandingOrderValidationError)
+    async def _standing_order_validation(
+        _: Request, exc: StandingOrderValidationError
+    ) -> JSONResponse:
+        return _json_error(400, exc)
+
+    @app.exception_handler(ChangeFeedBusyError)
+    async def _change_feed_busy(_: Request, exc: ChangeFeedBusyError) -> JSONResponse:
+        response = _json_error(503, exc)
+        response.headers["Retry-After"] = "1"
+        return response
+
+    @app.exception_handler(DeadlineExceededError)
+    async def _deadline_exceeded(
+        _: Request, exc: DeadlineExceededError
+    ) -> JSONResponse:
+        return _json_error(504, exc)
+
 
 def _json_error(status_code: int, exc: Exception) -> JSONResponse:
     """
@@ -0,0 +1,66 @@
+"""
+Ring: Composition Root (not on the Clean Architecture diagram)
+
+Responsibility:
+Exposes liveness and readiness probes over HTTP for process supervisors and
+load balancers.
+
+Design intent:
+- /live only proves that the process is serving requests. It touches no
+  dependency, so a slow database never gets a worker restarted.
+- /ready answers 200 once the worker's warm-up (root/warmup_setup) has finished,
+  and 503 before that and again once shutdown has begun. A load balancer
+  therefore sends traffic only to warm workers and drains a stopping one. The
+  body reports the warm-up's step timings and failures and the occupancy of every
+  connection pool (infra/db/warmup).
+
+This module contains:
+- register_health: installs the probe endpoints.
+
+Dependency constraints:
+- May depend on all inner layers (infra, features, core) and other root modules.
+- May depend on the delivery framework (FastAPI).
+- Must not contain business rules or application policy.
+- Must not be imported by domain, application, or infrastructure layers.
+
+Stability:
+- Highly volatile.
+- Changes whenever readiness gains a condition.
+
+Usage:
+- Called at application startup from the composition root, after attach_warmup.
+- GET /live: always 200 while the process serves requests.
+- GET /ready: 200 when ready, otherwise 503, with warm-up progress and pool status.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import Any
+
+from fastapi import FastAPI, Request
+from starlette.responses import JSONResponse
+
+from infra.db.warmup import pool_status
+from root.warmup_setup import WarmupProgress, pool_engines
+
+
+def register_health(app: FastAPI) -> None:
+    @app.get("/live", tags=["health"])
+    def live_endpoint() -> dict[str, Any]:
+        return {"status": "live"}
+
+    @app.get("/ready", tags=["health"])
+    def ready_endpoint(request: Request) -> JSONResponse:
+        progress: WarmupProgress = request.app.state.warmup
+        body = {
+            "status": progress.state,
+            "warmup": asdict(progress),
+            "pools": {
+                name: pool_status(pooled)
+                for name, pooled in pool_engines(request.app).items()
+            },
+        }
+        return JSONResponse(
+            status_code=200 if progress.state == "ready" else 503, content=body
+        )
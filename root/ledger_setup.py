@@ -0,0 +1,70 @@
+"""
+Ring: Composition Root (not on the Clean Architecture diagram)
+
+Responsibility:
+Wires the in-memory ledger engine into the running application when
+LEDGER_BACKEND=memory.
+This module opens (and recovers) the ledger at startup, closes it at shutdown, and
+exposes a per-request ledger session as a dependency.
+
+Design intent:
+This code belongs to composition, not to the ledger itself. It mirrors
+infra/db/session.get_session: one session per request, committed when the request
+succeeds and discarded when it fails.
+
+This module contains:
+- attach_ledger: opens the ledger into the application state, if configured.
+- get_ledger_session: a FastAPI dependency providing a committing LedgerSession.
+- LedgerSessionDep: a typed dependency alias for convenient injection.
+
+Dependency constraints:
+- May depend on infrastructure (infra.memory).
+- May depend on the delivery framework (FastAPI).
+- Must not contain business rules or application policy.
+- Must not be imported by domain, application, or infrastructure layers.
+
+Stability:
+- Highly volatile.
+- Changes when the ledger backend wiring changes.
+
+Usage:
+- Called at application startup to attach the ledger.
+- Used by dependency wiring modules in root/di when LEDGER_BACKEND=memory.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Generator
+from typing import Annotated
+
+from fastapi import Depends, FastAPI, Request
+
+from infra.memory.ledger import LEDGER_BACKEND, LEDGER_DIR, LedgerSession, MemoryLedger
+
+
+def attach_ledger(app: FastAPI) -> None:
+    """
+    Recover the in-memory ledger from LEDGER_DIR; a snapshot is written at shutdown.
+    """
+    if LEDGER_BACKEND != "memory":
+        return
+
+    ledger = MemoryLedger.open(LEDGER_DIR)
+    app.state.ledger = ledger
+    app.add_event_handler("shutdown", ledger.close)
+
+
+def get_ledger_session(request: Request) -> Generator[LedgerSession, None, None]:
+    """
+    FastAPI dependency: provides a ledger session per request.
+    """
+    session = LedgerSession(request.app.state.ledger)
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+
+
+LedgerSessionDep = Annotated[LedgerSession, Depends(get_ledger_session)]
@@ -49,9 +49,22 @@ if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
 from infra.db.session import create_all_db_tables
+from root.account_filter_setup import attach_account_filter
+from root.admission import register_admission_control
+from root.deadlines import register_request_deadlines
 from root.errors import register_exception_handlers
+from root.health import register_health
+from root.ledger_setup import attach_ledger
 from root.logging_setup import attach_logger
+from root.memory_diagnostics_setup import register_memory_diagnostics
+from root.metrics import register_metrics
+from root.profiling_setup import register_request_profiling
 from root.routers import register_routers
+from root.scheduler_setup import attach_transfer_scheduler
+from root.shard_setup import attach_shards
+from root.shared_balances_setup import attach_shared_balances
+from root.velocity_limits_setup import attach_velocity_limits
+from root.warmup_setup import attach_warmup
 
 
 def build_app() -> FastAPI:
@@ -62,16 +75,32 @@ def build_app() -> FastAPI:
     - initialise infra (DB schema, logging)
     - register routers
     - register exception handlers
+    - warm up, and report readiness once warm
     """
     app = FastAPI()
 
     # Initialise shared infrastructure
     attach_logger(app)
     create_all_db_tables()
+    attach_ledger(app)
+    attach_shards(app)
+    attach_shared_balances(app)
+    attach_account_filter(app)
+    attach_velocity_limits(app)
+    attach_transfer_scheduler(app)
 
     # Wire application
     register_exception_handlers(app)
     register_routers(app)
+    register_admission_control(app)
+    register_request_deadlines(app)
+    register_request_profiling(app)
+    register_memory_diagnostics(app)
+    register_metrics(app)
+    register_health(app)
+
+    # Warm up last, once everything it exercises is attached
+    attach_warmup(app)
 
     return app
 
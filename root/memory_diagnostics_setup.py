@@ -0,0 +1,159 @@
+"""
+Ring: Composition Root (not on the Clean Architecture diagram)
+
+Responsibility:
+Wires memory diagnostics into the running application. An operator can start
+and stop tracemalloc in a live worker and take snapshots. Two snapshots can be
+compared by the core/, features/ and infra/ module that allocated the memory.
+The worker also reports what sampled use case calls (TransferCreator,
+AccountGetter, ...) left allocated, so leaks can be found without a restart.
+
+Design intent:
+This code belongs to composition, not to allocation tracking itself (see
+infra/profiling/allocations).
+- The endpoints exist only when MEMORY_DIAGNOSTICS_TOKEN is set, and every one
+  of them requires it in X-Diagnostics-Token. Tracing slows every allocation in
+  the worker, so it must not be possible to switch it on anonymously.
+- Tracing is started and stopped from the endpoints; it is never on at startup.
+  While it is off, the AllocationSampledUseCase wrapper that root/di puts around
+  use cases costs one check per call.
+- Everything here is per process. With several workers, each request reaches one
+  of them, so every response carries the pid of the worker that answered.
+- A write use case is wrapped outside its retries, so a sample covers every
+  attempt and the commit.
+
+This module contains:
+- MEMORY_DIAGNOSTICS_TOKEN: enables the diagnostics (off by default).
+- AllocationSampledUseCase: samples a use case's calls with the tracker.
+- allocation_sampled_use_case: wraps a use case, if diagnostics are on.
+- register_memory_diagnostics: installs the admin endpoints.
+
+Dependency constraints:
+- May depend on infrastructure (infra.profiling).
+- May depend on the delivery framework (FastAPI / Starlette).
+- Must not contain business rules or application policy.
+- Must not be imported by domain, application, or infrastructure layers.
+
+Stability:
+- Highly volatile.
+- Changes when the sampled use cases or the reported figures change.
+
+Usage:
+- Called at application startup from the composition root.
+- Configured with MEMORY_DIAGNOSTICS_TOKEN, MEMORY_TRACE_FRAMES,
+  MEMORY_SAMPLE_RATE and MEMORY_SNAPSHOTS_KEEP.
+- The tracker is kept in app.state.allocation_tracker (None when off) for
+  root/di.
+- GET /admin/memory: tracing state, kept snapshots and sampled use cases.
+- POST /admin/memory/start?frames=16 and POST /admin/memory/stop.
+- POST /admin/memory/snapshots: takes a snapshot (409 while not tracing).
+- GET /admin/memory/diff?base=s1&current=s2&group_by=module&limit=30: what
+  changed between two snapshots, per module, package or layer.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import asdict
+from pathlib import Path
+from typing import Annotated, Any
+
+from fastapi import FastAPI, HTTPException, Query
+
+from features._shared.ports import ExecutableUseCase
+from infra.profiling.allocations import (
+    AllocationTracker,
+    GroupBy,
+    TracingNotStartedError,
+)
+from root.admin_auth import require_token
+
+MEMORY_DIAGNOSTICS_TOKEN = os.environ.get("MEMORY_DIAGNOSTICS_TOKEN", "")
+FRAMES = int(os.environ.get("MEMORY_TRACE_FRAMES", "16"))
+SAMPLE_RATE = float(os.environ.get("MEMORY_SAMPLE_RATE", "0.1"))
+KEEP = int(os.environ.get("MEMORY_SNAPSHOTS_KEEP", "4"))
+
+PROJECT_ROOT = str(Path(__file__).resolve().parents[1])
+
+
+class AllocationSampledUseCase:
+    """
+    Exposes `execute` like the wrapped use case.
+    """
+
+    def __init__(
+        self, *, name: str, use_case: ExecutableUseCase, tracker: AllocationTracker
+    ) -> None:
+        self._name = name
+        self._use_case = use_case
+        self._tracker = tracker
+
+    def execute(self, *args: Any, **kwargs: Any) -> Any:
+        execute = self._use_case.execute
+        return self._tracker.sample(self._name, lambda: execute(*args, **kwargs))
+
+
+def allocation_sampled_use_case(
+    app: FastAPI, name: str, use_case: ExecutableUseCase
+) -> ExecutableUseCase:
+    tracker: AllocationTracker | None = app.state.allocation_tracker
+    if tracker is None:
+        return use_case
+    wrapped = AllocationSampledUseCase(name=name, use_case=use_case, tracker=tracker)
+    return wrapped
+
+
+def register_memory_diagnostics(app: FastAPI) -> None:
+    app.state.allocation_tracker = None
+    if not MEMORY_DIAGNOSTICS_TOKEN:
+        return
+
+    tracker = AllocationTracker(root=PROJECT_ROOT, keep=KEEP, sample_rate=SAMPLE_RATE)
+    app.state.allocation_tracker = tracker
+
+    admin = [
+        require_token(header="X-Diagnostics-Token", token=MEMORY_DIAGNOSTICS_TOKEN)
+    ]
+
+    @app.get("/admin/memory", tags=["admin"], dependencies=admin)
+    def memory_status_endpoint() -> dict[str, Any]:
+        return asdict(tracker.stats())
+
+    @app.post("/admin/memory/start", tags=["admin"], dependencies=admin)
+    def start_tracing_endpoint(
+        frames: Annotated[int, Query(ge=1, le=100)] = FRAMES,
+    ) -> dict[str, Any]:
+        tracker.start(frames)
+        return asdict(tracker.stats())
+
+    @app.post("/admin/memory/stop", tags=["admin"], dependencies=admin)
+    def stop_tracing_endpoint() -> dict[str, Any]:
+        tracker.stop()
+        return asdict(tracker.stats())
+
+    @app.post("/admin/memory/snapshots", tags=["admin"], dependencies=admin)
+    def take_snapshot_endpoint() -> dict[str, Any]:
+        try:
+            record = tracker.take_snapshot()
+        except TracingNotStartedError as e:
+            raise HTTPException(status_code=409, detail=str(e)) from e
+        return {"pid": os.getpid(), **asdict(record)}
+
+    @app.get("/admin/memory/diff", tags=["admin"], dependencies=admin)
+    def snapshot_diff_endpoint(
+        base: str,
+        current: str,
+        group_by: GroupBy = "module",
+        limit: Annotated[int, Query(ge=1, le=1000)] = 30,
+    ) -> dict[str, Any]:
+        diffs = tracker.diff(base, current, group_by=group_by)
+        if diffs is None:
+            raise HTTPException(status_code=404, detail="Snapshot not found")
+        return {
+            "pid": os.getpid(),
+            "base": base,
+            "current": current,
+            "size_diff_bytes": sum(diff.size_diff_bytes for diff in diffs),
+            "blocks_diff": sum(diff.blocks_diff for diff in diffs),
+            "groups": [asdict(diff) for diff in diffs[:limit]],
+        }
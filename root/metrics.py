@@ -0,0 +1,112 @@
+"""
+Ring: Composition Root (not on the Clean Architecture diagram)
+
+Responsibility:
+Exposes process-level operational metrics over HTTP.
+
+Design intent:
+Metrics are read from the objects the composition root already owns: the
+admission limiters, the account load coalescing group, the write transaction
+retrier, the account id filter, the transfer scheduler, the velocity limit
+counters, the shard cluster and the shared balance table. They are process-local and reset on restart; an external scraper is
+expected to poll and aggregate.
+
+This module contains:
+- register_metrics: installs the metrics endpoints.
+
+Dependency constraints:
+- May depend on all inner layers (infra, features, core) and other root modules.
+- May depend on the delivery framework (FastAPI).
+- Must not contain business rules or application policy.
+- Must not be imported by domain, application, or infrastructure layers.
+
+Stability:
+- Highly volatile.
+- Changes whenever a new metric source is added.
+
+Usage:
+- Called at application startup from the composition root.
+- GET /metrics/admission: limit, in-flight count, queue depth, and admitted and
+  rejected counts per guarded route.
+- GET /metrics/account-loads: account loads performed and loads avoided by
+  coalescing.
+- GET /metrics/transactions: write transactions run, retries and give-ups by
+  conflict reason, and transactions that succeeded after retrying.
+- GET /metrics/account-filter: the account id Bloom filter's size, layers,
+  memory use, estimated and observed false-positive rates, and lookups it
+  rejected. In a shared database also how old its last refresh is, lookups that
+  fell back to the database because it was too old, and rejected ids that
+  existed after all.
+- GET /metrics/scheduler: scheduled transfers held and fired, how many were
+  already overdue when loaded, and percentiles of how late the others fired
+  after their due time.
+- GET /metrics/velocity-limits: the configured limits, accounts with counters,
+  transfers counted, released and rejected per limit, and rollup flushes.
+- GET /metrics/shards: slots per shard, shard map refreshes, single- and
+  cross-shard commits, and cross-shard credits deferred to and redone by
+  recovery.
+- GET /metrics/shared-balances: the shared balance table's capacity and used
+  slots, and this process's hits, misses, fills, publishes and repairs.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import Any
+
+from fastapi import FastAPI, Request
+
+from root.di.accounts import ACCOUNT_LOADS
+from root.di.transactions import WRITE_RETRIES
+
+
+def register_metrics(app: FastAPI) -> None:
+    @app.get("/metrics/admission", tags=["metrics"])
+    def admission_metrics_endpoint(request: Request) -> dict[str, Any]:
+        return {
+            f"{method} {path}": asdict(limiter.stats())
+            for (method, path), limiter in request.app.state.admission_limiters.items()
+        }
+
+    @app.get("/metrics/account-loads", tags=["metrics"])
+    def account_load_metrics_endpoint() -> dict[str, Any]:
+        return asdict(ACCOUNT_LOADS.stats())
+
+    @app.get("/metrics/transactions", tags=["metrics"])
+    def transaction_metrics_endpoint() -> dict[str, Any]:
+        return asdict(WRITE_RETRIES.stats())
+
+    @app.get("/metrics/account-filter", tags=["metrics"])
+    def account_filter_metrics_endpoint(request: Request) -> dict[str, Any]:
+        index = request.app.state.account_filter
+        if index is None:
+            return {"enabled": False}
+        return {"enabled": True, **asdict(index.stats())}
+
+    @app.get("/metrics/scheduler", tags=["metrics"])
+    def scheduler_metrics_endpoint(request: Request) -> dict[str, Any]:
+        dispatcher = request.app.state.transfer_scheduler
+        if dispatcher is None:
+            return {"enabled": False}
+        return {"enabled": True, **asdict(dispatcher.stats())}
+
+    @app.get("/metrics/velocity-limits", tags=["metrics"])
+    def velocity_limit_metrics_endpoint(request: Request) -> dict[str, Any]:
+        counters = request.app.state.velocity_limits
+        if counters is None:
+            return {"enabled": False}
+        return {"enabled": True, **asdict(counters.stats())}
+
+    @app.get("/metrics/shards", tags=["metrics"])
+    def shard_metrics_endpoint(request: Request) -> dict[str, Any]:
+        cluster = request.app.state.shards
+        if cluster is None:
+            return {"enabled": False}
+        return {"enabled": True, **asdict(cluster.stats())}
+
+    @app.get("/metrics/shared-balances", tags=["metrics"])
+    def shared_balance_metrics_endpoint(request: Request) -> dict[str, Any]:
+        table = request.app.state.shared_balances
+        if table is None:
+            return {"enabled": False}
+        return {"enabled": True, **asdict(table.stats())}
@@ -0,0 +1,200 @@
+"""
+Ring: Composition Root (not on the Clean Architecture diagram)
+
+Responsibility:
+Wires on-demand request profiling into the running application. A triggered
+request runs its use case (TransferCreator, AccountGetter, ...) under cProfile.
+The profile is saved, its id is returned in the X-Profile-Id response header,
+and it can be read back from an admin endpoint.
+
+Design intent:
+This code belongs to composition, not to profiling itself (see infra/profiling).
+- Profiling is off unless PROFILING_TOKEN or PROFILING_SAMPLE_RATE is set. When
+  off, no middleware is installed and use cases are not wrapped, so requests run
+  exactly as before.
+- A request is triggered either by sending the token in X-Profile-Token or by
+  being sampled at PROFILING_SAMPLE_RATE. The raw ASGI middleware only marks the
+  request (infra/profiling/request_profiler). The use case is profiled where it
+  runs, in its worker thread, by the ProfiledUseCase wrapper that root/di puts
+  around it. A write use case is wrapped outside its retries, so the profile
+  covers every attempt and the commit.
+- The admin endpoints exist only when PROFILING_TOKEN is set, and every one of
+  them requires it: profiles expose the code's stacks and file paths. With
+  sampling alone, profiles are still saved to PROFILING_DIR, but are not served.
+
+This module contains:
+- PROFILING_TOKEN / PROFILING_SAMPLE_RATE: the triggers (both off by default).
+- ProfilingTriggerMiddleware: the ASGI middleware.
+- ProfiledUseCase: runs a use case under the profiler when its request is triggered.
+- profiled_use_case: wraps a use case with ProfiledUseCase, if profiling is on.
+- register_request_profiling: installs the middleware and, with a token, the
+  admin endpoints.
+
+Dependency constraints:
+- May depend on infrastructure (infra.profiling).
+- May depend on the delivery framework (FastAPI / Starlette).
+- Must not contain business rules or application policy.
+- Must not be imported by domain, application, or infrastructure layers.
+
+Stability:
+- Highly volatile.
+- Changes when triggers or the profiled use cases change.
+
+Usage:
+- Called at application startup from the composition root.
+- Configured with PROFILING_TOKEN, PROFILING_SAMPLE_RATE, PROFILING_DIR and
+  PROFILING_KEEP.
+- The profiler is kept in app.state.request_profiler (None when off) for root/di.
+- GET /admin/profiles (with PROFILING_TOKEN): saved profiles, newest first, with
+  the profiler's counters.
+- GET /admin/profiles/{profile_id}?format=pstats&sort=cumulative&limit=40: one
+  profile as a pstats table, or with format=collapsed as collapsed stacks.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import tempfile
+from dataclasses import asdict
+from enum import Enum
+from pathlib import Path
+from typing import Annotated, Any
+
+from fastapi import FastAPI, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from features._shared.ports import ExecutableUseCase
+from infra.profiling.rendering import SORT_KEYS, render_collapsed, render_table
+from infra.profiling.request_profiler import (
+    ProfileRequest,
+    RequestProfiler,
+    profile_scope,
+    requested_profile,
+)
+from root.admin_auth import require_token, token_matches
+
+PROFILING_TOKEN = os.environ.get("PROFILING_TOKEN", "")
+PROFILING_SAMPLE_RATE = float(os.environ.get("PROFILING_SAMPLE_RATE", "0"))
+DIRECTORY = Path(
+    os.environ.get(
+        "PROFILING_DIR", os.path.join(tempfile.gettempdir(), "ledger-profiles")
+    )
+)
+KEEP = int(os.environ.get("PROFILING_KEEP", "50"))
+
+TOKEN_HEADER = b"x-profile-token"
+SORT_PATTERN = f"^({'|'.join(SORT_KEYS)})$"
+PROJECT_ROOT = str(Path(__file__).resolve().parents[1]) + os.sep
+
+
+class ProfileFormat(str, Enum):
+    PSTATS = "pstats"
+    COLLAPSED = "collapsed"
+
+
+class ProfilingTriggerMiddleware:
+    """
+    Marks requests that carry the token, or are sampled, for profiling.
+    """
+
+    def __init__(self, app: ASGIApp, *, token: str, sample_rate: float) -> None:
+        self._app = app
+        self._token = token
+        self._sample_rate = sample_rate
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self._triggered(scope):
+            await self._app(scope, receive, send)
+            return
+
+        request = ProfileRequest()
+
+        async def send_with_profile_id(message: Message) -> None:
+            if message["type"] == "http.response.start" and request.profile_ids:
+                headers = list(message.get("headers", []))
+                profile_ids = ",".join(request.profile_ids).encode()
+                headers.append((b"x-profile-id", profile_ids))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        with profile_scope(request):
+            await self._app(scope, receive, send_with_profile_id)
+
+    def _triggered(self, scope: Scope) -> bool:
+        if self._token:
+            for name, value in scope["headers"]:
+                if name == TOKEN_HEADER and token_matches(value, self._token):
+                    return True
+        return self._sample_rate > 0 and random.random() < self._sample_rate
+
+
+class ProfiledUseCase:
+    """
+    Exposes `execute` like the wrapped use case.
+    """
+
+    def __init__(
+        self, *, name: str, use_case: ExecutableUseCase, profiler: RequestProfiler
+    ) -> None:
+        self._name = name
+        self._use_case = use_case
+        self._profiler = profiler
+
+    def execute(self, *args: Any, **kwargs: Any) -> Any:
+        execute = self._use_case.execute
+        request = requested_profile()
+        if request is None:
+            return execute(*args, **kwargs)
+        return self._profiler.run(self._name, lambda: execute(*args, **kwargs), request)
+
+
+def profiled_use_case(
+    app: FastAPI, name: str, use_case: ExecutableUseCase
+) -> ExecutableUseCase:
+    profiler: RequestProfiler | None = app.state.request_profiler
+    if profiler is None:
+        return use_case
+    wrapped = ProfiledUseCase(name=name, use_case=use_case, profiler=profiler)
+    return wrapped
+
+
+def register_request_profiling(app: FastAPI) -> None:
+    app.state.request_profiler = None
+    if not PROFILING_TOKEN and PROFILING_SAMPLE_RATE <= 0:
+        return
+
+    profiler = RequestProfiler(directory=DIRECTORY, keep=KEEP)
+    app.state.request_profiler = profiler
+    app.add_middleware(
+        ProfilingTriggerMiddleware,
+        token=PROFILING_TOKEN,
+        sample_rate=PROFILING_SAMPLE_RATE,
+    )
+
+    if not PROFILING_TOKEN:
+        return
+
+    admin = [require_token(header="X-Profile-Token", token=PROFILING_TOKEN)]
+
+    @app.get("/admin/profiles", tags=["admin"], dependencies=admin)
+    def list_profiles_endpoint() -> dict[str, Any]:
+        return {
+            **asdict(profiler.stats()),
+            "profiles": [asdict(record) for record in profiler.profiles()],
+        }
+
+    @app.get("/admin/profiles/{profile_id}", tags=["admin"], dependencies=admin)
+    def read_profile_endpoint(
+        profile_id: str,
+        format: ProfileFormat = ProfileFormat.PSTATS,
+        sort: Annotated[str, Query(pattern=SORT_PATTERN)] = "cumulative",
+        limit: Annotated[int, Query(ge=1, le=1000)] = 40,
+    ) -> PlainTextResponse:
+        stats = profiler.load(profile_id)
+        if stats is None:
+            raise HTTPException(status_code=404, detail="Profile not found")
+        if format is ProfileFormat.COLLAPSED:
+            return PlainTextResponse(render_collapsed(stats, root=PROJECT_ROOT))
+        return PlainTextResponse(render_table(stats, sort=sort, limit=limit))
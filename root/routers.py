@@ -10,6 +10,10 @@ Design intent:
 This is pure composition code.
 It connects features to their implementations and integrates them into a single
 running application, without containing any business or application logic.
+Scheduled transfers and standing orders are stored in SQL only, and only the SQL
+unit of work appends to the change feed and maintains state digests, so their
+routes are registered only for LEDGER_BACKEND=sql. Served from the in-memory
+ledger or the shards, a digest would be empty and differ from every peer.
 
 This module contains:
 - register_routers: the function that attaches all feature routers to the FastAPI app.
@@ -33,9 +37,24 @@ from __future__ import annotations
 from fastapi import FastAPI
 
 from features.accounts.routers import build_account_routers
+from features.changes.routers import build_change_routers
+from features.digests.routers import build_digest_routers
+from features.scheduled_transfers.routers import build_scheduled_transfer_routers
+from features.standing_orders.routers import build_standing_order_routers
 from features.transfers.routers import build_transfer_routers
+from infra.memory.ledger import LEDGER_BACKEND
 from root.di.accounts import get_account_creator, get_account_getter
-from root.di.transfers import get_transfer_creator
+from root.di.changes import get_change_feed_reader
+from root.di.digests import get_digest_reader
+from root.di.scheduled_transfers import (
+    get_scheduled_transfer_creator,
+    get_scheduled_transfer_getter,
+)
+from root.di.standing_orders import (
+    get_standing_order_creator,
+    get_standing_order_getter,
+)
+from root.di.transfers import get_transfer_creator, get_transfer_exporter
 
 
 def register_routers(app: FastAPI) -> None:
@@ -49,5 +68,30 @@ def register_routers(app: FastAPI) -> None:
     app.include_router(
         build_transfer_routers(
             transfer_creator=get_transfer_creator,
+            transfer_exporter=get_transfer_exporter,
         )
     )
+
+    if LEDGER_BACKEND == "sql":
+        app.include_router(
+            build_digest_routers(
+                digest_reader=get_digest_reader,
+            )
+        )
+        app.include_router(
+            build_change_routers(
+                change_feed_reader=get_change_feed_reader,
+            )
+        )
+        app.include_router(
+            build_scheduled_transfer_routers(
+                scheduled_transfer_creator=get_scheduled_transfer_creator,
+                scheduled_transfer_getter=get_scheduled_transfer_getter,
+            )
+        )
+        app.include_router(
+            build_standing_order_routers(
+                standing_order_creator=get_standing_order_creator,
+                standing_order_getter=get_standing_order_getter,
+            )
+        )
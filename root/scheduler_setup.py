@@ -0,0 +1,114 @@
+"""
+Ring: Composition Root (not on the Clean Architecture diagram)
+
+Responsibility:
+Wires the scheduled transfer dispatcher into the running application. Pending
+scheduled transfers are loaded from the database window by window and executed
+when due; the dispatcher is stopped at shutdown.
+
+Design intent:
+This code belongs to composition, not to scheduling itself (see
+infra/scheduling/dispatcher). A due batch is executed on a small thread pool,
+one retried transaction per scheduled transfer; transfers between the same
+accounts conflict and are retried like any other write. A scheduled transfer
+whose execution gives up stays pending and is picked up again by a later
+window load.
+Every worker process runs its own dispatcher over the same pending rows, so each
+batch is claimed before it is executed (ScheduledTransferClaims): the worker
+leases the batch's rows for SCHEDULER_LEASE_S and executes only those it
+obtained. The others skip them, and each due transfer is executed once. A lease
+should outlast the execution of a batch; one that expires mid-batch lets another
+worker's later load fire the same transfer again, which the executor then skips
+or rejects as already executed.
+Restart recovery needs no bookkeeping of its own: pending rows are the state,
+and the first load returns every overdue one.
+Scheduled transfers are stored in SQL only, so nothing is attached unless
+LEDGER_BACKEND=sql.
+
+This module contains:
+- attach_transfer_scheduler: starts the dispatcher, if the backend supports it.
+
+Dependency constraints:
+- May depend on infrastructure (infra.scheduling, infra.db).
+- May depend on the delivery framework (FastAPI).
+- Must not contain business rules or application policy.
+- Must not be imported by domain, application, or infrastructure layers.
+
+Stability:
+- Highly volatile.
+- Changes when the scheduler's configuration changes.
+
+Usage:
+- Called at application startup, after the database schema exists.
+- Configured with SCHEDULER_HORIZON_S, SCHEDULER_LOAD_INTERVAL_S,
+  SCHEDULER_BATCH_SIZE, SCHEDULER_WORKERS and SCHEDULER_LEASE_S.
+- The dispatcher is kept in app.state.transfer_scheduler (None when not
+  attached) for root/di and root/metrics.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from fastapi import FastAPI
+
+from core.utils.time import utc_now
+from infra.db.scheduled_transfers.repo import (
+    PendingScheduledTransfers,
+    ScheduledTransferClaims,
+)
+from infra.db.session import ReadSessionLocal, SessionLocal
+from infra.memory.ledger import LEDGER_BACKEND
+from infra.scheduling.dispatcher import DueTimeDispatcher
+from root.di.scheduled_transfers import build_scheduled_transfer_executor
+
+HORIZON_S = float(os.environ.get("SCHEDULER_HORIZON_S", "300"))
+LOAD_INTERVAL_S = float(os.environ.get("SCHEDULER_LOAD_INTERVAL_S", "60"))
+BATCH_SIZE = int(os.environ.get("SCHEDULER_BATCH_SIZE", "256"))
+WORKERS = int(os.environ.get("SCHEDULER_WORKERS", "4"))
+LEASE_S = float(os.environ.get("SCHEDULER_LEASE_S", "60"))
+
+
+def attach_transfer_scheduler(app: FastAPI) -> None:
+    app.state.transfer_scheduler = None
+    if LEDGER_BACKEND != "sql":
+        return
+
+    logger = app.state.logger
+    executor = build_scheduled_transfer_executor(app, logger)
+    claims = ScheduledTransferClaims(session_factory=SessionLocal)
+    pool = ThreadPoolExecutor(max_workers=WORKERS, thread_name_prefix="scheduler")
+
+    def execute(scheduled_transfer_id: str) -> None:
+        try:
+            executor.execute(scheduled_transfer_id=scheduled_transfer_id)
+        except Exception:
+            logger.exception(
+                "scheduled_transfer_execute_gave_up scheduled_transfer_id=%s",
+                scheduled_transfer_id,
+            )
+
+    def fire(batch: list[str]) -> None:
+        claimed = claims.claim(
+            batch, now=utc_now(), lease_for=timedelta(seconds=LEASE_S)
+        )
+        for _ in pool.map(execute, claimed):
+            pass
+
+    dispatcher = DueTimeDispatcher(
+        fire=fire,
+        load=PendingScheduledTransfers(session_factory=ReadSessionLocal).due_before,
+        horizon=HORIZON_S,
+        load_interval=LOAD_INTERVAL_S,
+        batch_size=BATCH_SIZE,
+    )
+    dispatcher.start()
+    app.state.transfer_scheduler = dispatcher
+
+    def stop() -> None:
+        dispatcher.stop()
+        pool.shutdown(wait=True)
+
+    app.add_event_handler("shutdown", stop)
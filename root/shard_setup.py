@@ -0,0 +1,107 @@
+"""
+Ring: Composition Root (not on the Clean Architecture diagram)
+
+Responsibility:
+Wires the sharded backend into the running application when
+LEDGER_BACKEND=sharded. The shard cluster is opened at startup, outstanding
+cross-shard credits are completed, and recovery keeps running in the background
+until shutdown.
+
+Design intent:
+This code belongs to composition, not to sharding itself (see infra/sharding).
+- DATABASE_URL is the directory: it holds the shard map and nothing else the
+  sharded backend reads. SHARD_URLS lists the shards, in shard index order.
+- Recovery runs once before the application serves requests, then every
+  SHARD_RECOVERY_INTERVAL_S. A pass also trims log rows of transfers that
+  completed normally, so the logs stay short.
+- Reads use a read-only ShardedUnitOfWork per request, which opens the read
+  engine of each shard it touches.
+
+This module contains:
+- attach_shards: opens the cluster into the application state, if configured.
+- get_shard_reads: a FastAPI dependency providing a read-only ShardedUnitOfWork.
+- ShardReadsDep: a typed dependency alias for convenient injection.
+
+Dependency constraints:
+- May depend on infrastructure (infra.sharding, infra.db).
+- May depend on the delivery framework (FastAPI).
+- Must not contain business rules or application policy.
+- Must not be imported by domain, application, or infrastructure layers.
+
+Stability:
+- Highly volatile.
+- Changes when the sharded backend's wiring changes.
+
+Usage:
+- Called at application startup, after attach_ledger.
+- Configured with SHARD_URLS and SHARD_RECOVERY_INTERVAL_S.
+- The cluster is kept in app.state.shards (None when not attached) for root/di
+  and root/metrics.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections.abc import Generator
+from typing import Annotated
+
+from fastapi import Depends, FastAPI, Request
+
+from infra.db.session import SessionLocal
+from infra.memory.ledger import LEDGER_BACKEND
+from infra.sharding.cluster import SHARD_URLS, ShardCluster
+from infra.sharding.recovery import recover_cross_shard_commits
+from infra.sharding.unit_of_work import ShardedUnitOfWork
+
+RECOVERY_INTERVAL_S = float(os.environ.get("SHARD_RECOVERY_INTERVAL_S", "5"))
+
+
+def attach_shards(app: FastAPI) -> None:
+    app.state.shards = None
+    if LEDGER_BACKEND != "sharded":
+        return
+
+    logger = app.state.logger
+    cluster = ShardCluster.open(SHARD_URLS, directory=SessionLocal)
+    redone = recover_cross_shard_commits(cluster)
+    logger.info(
+        "shards_attached shards=%s recovered_credits=%s", cluster.shard_count, redone
+    )
+
+    stopping = threading.Event()
+
+    def recover() -> None:
+        while not stopping.wait(RECOVERY_INTERVAL_S):
+            try:
+                redone = recover_cross_shard_commits(cluster)
+            except Exception:
+                logger.exception("shard_recovery_failed")
+                continue
+            if redone:
+                logger.info("shard_recovery_redone credits=%s", redone)
+
+    thread = threading.Thread(target=recover, name="shard-recovery", daemon=True)
+    thread.start()
+    app.state.shards = cluster
+
+    def stop() -> None:
+        stopping.set()
+        thread.join()
+
+    app.add_event_handler("shutdown", stop)
+
+
+def get_shard_reads(request: Request) -> Generator[ShardedUnitOfWork, None, None]:
+    """
+    FastAPI dependency: provides a read-only sharded unit of work per request.
+    """
+    uow = ShardedUnitOfWork(cluster=request.app.state.shards, read_only=True)
+    try:
+        yield uow
+    finally:
+        uow.rollback()
+        uow.close()
+
+
+ShardReadsDep = Annotated[ShardedUnitOfWork, Depends(get_shard_reads)]
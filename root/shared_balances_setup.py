@@ -0,0 +1,104 @@
+"""
+Ring: Composition Root (not on the Clean Architecture diagram)
+
+Responsibility:
+Wires the shared-memory balance table into the running application, so that
+every worker process on a host answers GET /accounts/{id} from one table,
+without a query.
+
+Design intent:
+This code belongs to composition, not to the table itself (see infra/shm).
+- Enabled with SHARED_BALANCES=on, for the SQL backend only. The in-memory
+  ledger already serves balances from its own process's memory. Sharded writes
+  commit through per-shard units of work that do not publish.
+- Every worker maps the same table. Its name is SHARED_BALANCES_NAME plus a digest
+  of DATABASE_URL, so applications on one host that use different databases
+  never share one. An in-memory database exists only inside one process, so the
+  table would be shared by workers that each have their own database. Enabling
+  the table with one is refused at startup.
+- The table is stamped with the database's instance id (infra/db/instance). A
+  database dropped and created again at the same URL has a new id, so the first
+  process to start against it empties the table instead of serving the old
+  database's balances.
+- The write path's SqlUnitOfWork publishes to the table. So does the standing
+  order runner (root/cli/run_standing_orders), which writes balances from its
+  own process. Any other process that updates balances in the database must do
+  the same, or the table must be removed while it runs.
+- Each process unmaps the table at shutdown. The table itself stays until the
+  host restarts or it is unlinked from /dev/shm.
+
+This module contains:
+- SHARED_BALANCES: whether the table is enabled ("off" by default).
+- open_shared_balances: maps the configured table, if enabled.
+- attach_shared_balances: maps the table into the application state.
+- shared_balance_repo: wraps an account repository with the table, if mapped.
+
+Dependency constraints:
+- May depend on infrastructure (infra.shm, infra.db, infra.memory).
+- May depend on the delivery framework (FastAPI).
+- Must not contain business rules or application policy.
+- Must not be imported by domain, application, or infrastructure layers.
+
+Stability:
+- Highly volatile.
+- Changes when the table's configuration changes.
+
+Usage:
+- Called at application startup, before any write use case is built.
+- Configured with SHARED_BALANCES, SHARED_BALANCES_NAME,
+  SHARED_BALANCES_CAPACITY and SHARED_BALANCES_PENDING_LEASE_S.
+- The table is kept in app.state.shared_balances (None when disabled) for
+  root/di and root/metrics.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+
+from fastapi import FastAPI
+from sqlalchemy.pool import StaticPool
+
+from features.accounts.ports import AccountRepoPort
+from infra.db.instance.repo import database_instance_id
+from infra.db.session import DATABASE_URL, SessionLocal, engine
+from infra.memory.ledger import LEDGER_BACKEND
+from infra.shm.balance_repo import SharedBalanceAccountRepo
+from infra.shm.balance_table import SharedBalanceTable
+
+SHARED_BALANCES = os.environ.get("SHARED_BALANCES", "off") == "on"
+NAME = os.environ.get("SHARED_BALANCES_NAME", "ledger-balances")
+CAPACITY = int(os.environ.get("SHARED_BALANCES_CAPACITY", "262144"))
+PENDING_LEASE_S = float(os.environ.get("SHARED_BALANCES_PENDING_LEASE_S", "30"))
+
+
+def open_shared_balances() -> SharedBalanceTable | None:
+    """
+    Must be called after the database tables are created.
+    """
+    if not SHARED_BALANCES or LEDGER_BACKEND != "sql":
+        return None
+    if isinstance(engine.pool, StaticPool):
+        raise RuntimeError(
+            "SHARED_BALANCES=on needs a database shared by every worker; "
+            "DATABASE_URL is an in-memory database"
+        )
+    database = hashlib.blake2b(DATABASE_URL.encode(), digest_size=4).hexdigest()
+    return SharedBalanceTable.open(
+        f"{NAME}-{database}",
+        capacity=CAPACITY,
+        database_id=bytes.fromhex(database_instance_id(SessionLocal)),
+        pending_lease=PENDING_LEASE_S,
+    )
+
+
+def attach_shared_balances(app: FastAPI) -> None:
+    table = open_shared_balances()
+    app.state.shared_balances = table
+    if table is not None:
+        app.add_event_handler("shutdown", table.close)
+
+
+def shared_balance_repo(app: FastAPI, repo: AccountRepoPort) -> AccountRepoPort:
+    table: SharedBalanceTable | None = app.state.shared_balances
+    return repo if table is None else SharedBalanceAccountRepo(inner=repo, table=table)
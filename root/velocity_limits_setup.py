@@ -0,0 +1,119 @@
+"""
+Ring: Composition Root (not on the Clean Architecture diagram)
+
+Responsibility:
+Wires per-account velocity limits into the running application. The limits are
+configured from the environment, their counters are rebuilt at startup, and
+TransferCreator checks every transfer against them.
+
+Design intent:
+This code belongs to composition, not to counting (see infra/limits/velocity).
+Both limits apply to the source account of a transfer:
+- VELOCITY_MAX_OUT_PENCE_24H: the amount that may leave an account in any 24
+  hours, counted in hourly buckets.
+- VELOCITY_MAX_TRANSFERS_1M: the number of transfers that may leave an account in
+  any minute, counted in 5-second buckets.
+A limit of 0 is disabled. With no limit configured nothing is attached and
+transfers are never counted.
+With the SQL backend the counters are loaded from their rollups plus the transfers
+committed since the last flush, and are flushed every VELOCITY_FLUSH_S. The
+flusher is stopped at shutdown. An in-memory database (a StaticPool engine) is
+never flushed: its rollups die with the process, and the flusher would commit on
+the request handlers' one connection, in the middle of their transactions. With
+LEDGER_BACKEND=memory the counters are rebuilt from the ledger's transfers and
+never flushed. With LEDGER_BACKEND=sharded the rollups are kept in the directory
+database (DATABASE_URL), which holds no transfers, so transfers made after the
+last flush before a restart are not counted again.
+Each process enforces the limits with its own counters, so a limit is split
+between the processes that enforce it: VELOCITY_LIMIT_SHARES (default 1) is their
+number, every web worker plus the standing order runner, and each process allows
+its share of the limit, rounded down. The shares add up to no more than the limit,
+so an account cannot exceed it however its requests are routed; the price is
+that one process refuses once its share is used up, even while the others have
+room. A worker that restarts loads what every process counted, and compares that
+against its share, which errs on the side of refusing.
+Standing orders are checked and counted too. Their runner
+(root/cli/run_standing_orders) is a separate process: it attaches its own
+counters, passes them to StandingOrderChunkExecutor, and flushes them before it
+exits.
+
+This module contains:
+- VELOCITY_LIMITS: this process's share of the configured limits.
+- attach_velocity_limits: loads the counters into the application state, if any
+  limit is configured.
+
+Dependency constraints:
+- May depend on infrastructure (infra.limits, infra.db, infra.memory).
+- May depend on the delivery framework (FastAPI).
+- Must not contain business rules or application policy.
+- Must not be imported by domain, application, or infrastructure layers.
+
+Stability:
+- Highly volatile.
+- Changes when limits or their configuration change.
+
+Usage:
+- Called at application startup, after attach_ledger and before any write use
+  case is built, and by the standing order runner.
+- The counters are kept in app.state.velocity_limits (None when no limit is
+  configured) for root/di and root/metrics.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import replace
+
+from fastapi import FastAPI
+from sqlalchemy.pool import StaticPool
+
+from infra.db.session import ReadSessionLocal, SessionLocal, engine
+from infra.limits.velocity import VelocityCounters, VelocityLimit
+from infra.memory.ledger import LEDGER_BACKEND
+
+MAX_OUT_PENCE_24H = int(os.environ.get("VELOCITY_MAX_OUT_PENCE_24H", "0"))
+MAX_TRANSFERS_1M = int(os.environ.get("VELOCITY_MAX_TRANSFERS_1M", "0"))
+FLUSH_S = float(os.environ.get("VELOCITY_FLUSH_S", "5"))
+LIMIT_SHARES = max(1, int(os.environ.get("VELOCITY_LIMIT_SHARES", "1")))
+
+# A configured limit smaller than the number of shares leaves every process a
+# share of 0, which refuses everything rather than nothing.
+VELOCITY_LIMITS = [
+    replace(limit, maximum=limit.maximum // LIMIT_SHARES)
+    for limit in (
+        VelocityLimit(
+            name="out_amount_24h",
+            measure="amount_pence",
+            window=86_400,
+            bucket=3_600,
+            maximum=MAX_OUT_PENCE_24H,
+        ),
+        VelocityLimit(
+            name="out_transfers_1m",
+            measure="transfers",
+            window=60,
+            bucket=5,
+            maximum=MAX_TRANSFERS_1M,
+        ),
+    )
+    if limit.maximum > 0
+]
+
+
+def attach_velocity_limits(app: FastAPI) -> None:
+    app.state.velocity_limits = None
+    if not VELOCITY_LIMITS:
+        return
+
+    if LEDGER_BACKEND == "memory":
+        counters = VelocityCounters.load_from_ledger(
+            app.state.ledger, limits=VELOCITY_LIMITS
+        )
+    else:
+        counters = VelocityCounters.load_from_database(
+            ReadSessionLocal, limits=VELOCITY_LIMITS
+        )
+        if not isinstance(engine.pool, StaticPool):
+            counters.start_flushing(SessionLocal, interval=FLUSH_S)
+            app.add_event_handler("shutdown", counters.stop)
+    app.state.velocity_limits = counters
@@ -0,0 +1,298 @@
+"""
+Ring: Composition Root (not on the Clean Architecture diagram)
+
+Responsibility:
+Warms a worker up before it reports itself ready (see root/health), so that the
+first requests after a deploy do not pay for lazy initialisation.
+
+Design intent:
+This code belongs to composition, not to any one component: it drives the
+already-wired parts once, in the order a request would meet them.
+- connections: every engine's pool opens its connections (infra/db/warmup).
+- write_path: with the SQL backend, a create and a transfer are flushed through
+  the configured unit of work and rolled back, compiling the write statements.
+- read_path: the configured read repositories look up an unknown account and
+  start an export under every filter combination, compiling the read
+  statements. Each export is closed after its first row. This runs for every
+  backend.
+- presenters: each presenter and request and response schema validates and
+  serialises one synthetic value.
+- preload_accounts: with the shared balance table enabled
+  (root/shared_balances_setup), the WARMUP_PRELOAD_ACCOUNTS accounts most
+  involved in the last WARMUP_PRELOAD_WINDOW transfers are loaded into it.
+  Without the table there is no cache to fill and the step does nothing.
+A failed step is logged and recorded, and the warm-up goes on: every step only
+saves later requests some work, so none of them gates readiness.
+Warm-up runs in a background thread, so /live answers while it runs. With
+in-memory SQLite, where every session shares one connection, it runs before the
+application starts serving instead, so it never interleaves with a request's
+transaction.
+
+This module contains:
+- WARMUP: whether to warm up ("on" by default).
+- WarmupProgress: the warm-up's state, step timings and failures.
+- pool_engines: the engines whose pools the application uses, by name.
+- attach_warmup: starts the warm-up and records its progress.
+
+Dependency constraints:
+- May depend on all inner layers (infra, features, core) and other root modules.
+- May depend on the delivery framework (FastAPI).
+- Must not contain business rules or application policy.
+- Must not be imported by domain, application, or infrastructure layers.
+
+Stability:
+- Highly volatile.
+- Changes whenever a hot path gains something worth warming.
+
+Usage:
+- Called at the end of application startup, once everything else is attached.
+- Configured with WARMUP, WARMUP_CONNECTIONS (default: each pool's size),
+  WARMUP_PRELOAD_ACCOUNTS (default 0) and WARMUP_PRELOAD_WINDOW.
+- Progress is kept in app.state.warmup for root/health.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from itertools import product
+
+from fastapi import FastAPI
+from sqlalchemy import Engine
+from sqlalchemy.pool import StaticPool
+
+from core.entities.account import Account
+from core.entities.transfer import Transfer
+from core.utils.id import new_id
+from core.values.custom_types import AccountId, TransferId
+from core.values.objects import AppliedTransfer, Money
+from features.accounts.ports import AccountRepoPort
+from features.accounts.presenters import AccountCreatorPresenter, AccountGetterPresenter
+from features.accounts.schemas import CreateAccountRequest
+from features.transfers.cursors import TransferCursor
+from features.transfers.ports import TransferRepoPort
+from features.transfers.presenters import (
+    TransferCreatorPresenter,
+    TransferCsvExportPresenter,
+    TransferNdjsonExportPresenter,
+)
+from features.transfers.schemas import CreateTransferRequest, ExportTransfersRequest
+from infra.db.accounts.core_repo import CoreAccountRepo
+from infra.db.accounts.repo import AccountRepo
+from infra.db.session import ReadSessionLocal, SessionLocal, engine, read_engine
+from infra.db.transfers.core_repo import CoreTransferRepo
+from infra.db.transfers.repo import TransferRepo
+from infra.db.unit_of_work import CoreSqlUnitOfWork, SqlUnitOfWork
+from infra.db.warmup import hottest_account_ids, open_connections, rehearse_write
+from infra.memory.accounts.repo import LedgerAccountRepo
+from infra.memory.ledger import LEDGER_BACKEND, LedgerSession
+from infra.memory.transfers.repo import LedgerTransferRepo
+from infra.sharding.repos import ShardedAccountRepo, ShardedTransferRepo
+from infra.sharding.unit_of_work import ShardedUnitOfWork
+from root.di.transactions import SQL_REPOSITORIES
+from root.shared_balances_setup import shared_balance_repo
+
+WARMUP = os.environ.get("WARMUP", "on") == "on"
+_connections = os.environ.get("WARMUP_CONNECTIONS")
+CONNECTIONS = int(_connections) if _connections else None
+PRELOAD_ACCOUNTS = int(os.environ.get("WARMUP_PRELOAD_ACCOUNTS", "0"))
+PRELOAD_WINDOW = int(os.environ.get("WARMUP_PRELOAD_WINDOW", "10000"))
+
+
+@dataclass
+class WarmupProgress:
+    """
+    `state` is "warming", then "ready", then "stopping" once shutdown begins.
+    """
+
+    state: str = "warming"
+    step_ms: dict[str, float] = field(default_factory=dict)
+    failed_steps: dict[str, str] = field(default_factory=dict)
+    preloaded_accounts: int = 0
+
+
+def pool_engines(app: FastAPI) -> dict[str, Engine]:
+    if LEDGER_BACKEND == "memory":
+        return {}
+
+    named: dict[str, Engine] = {}
+    if LEDGER_BACKEND == "sharded":
+        cluster = app.state.shards
+        for shard in range(cluster.shard_count):
+            write, read = cluster.engines(shard)
+            named[f"shard{shard}.write"] = write
+            if read is not write:
+                named[f"shard{shard}.read"] = read
+        return named
+
+    named["write"] = engine
+    if read_engine is not engine:
+        named["read"] = read_engine
+    return named
+
+
+def attach_warmup(app: FastAPI) -> None:
+    progress = WarmupProgress()
+    app.state.warmup = progress
+    app.add_event_handler("shutdown", lambda: setattr(progress, "state", "stopping"))
+    if not WARMUP:
+        progress.state = "ready"
+        return
+
+    def warm_up() -> None:
+        _warm_up(app, progress)
+
+    if isinstance(engine.pool, StaticPool):
+        warm_up()
+        return
+    threading.Thread(target=warm_up, name="warmup", daemon=True).start()
+
+
+def _warm_up(app: FastAPI, progress: WarmupProgress) -> None:
+    logger = app.state.logger
+    steps: list[tuple[str, Callable[[], None]]] = [
+        ("connections", lambda: _open_connections(app)),
+        ("write_path", _rehearse_write),
+        ("read_path", lambda: _rehearse_reads(app)),
+        ("presenters", _rehearse_presenters),
+        ("preload_accounts", lambda: _preload_accounts(app, progress)),
+    ]
+    started = time.perf_counter()
+    for name, step in steps:
+        step_started = time.perf_counter()
+        try:
+            step()
+        except Exception as exc:
+            progress.failed_steps[name] = repr(exc)
+            logger.exception("warmup_step_failed step=%s", name)
+            continue
+        progress.step_ms[name] = round((time.perf_counter() - step_started) * 1000, 1)
+
+    if progress.state == "warming":
+        progress.state = "ready"
+    logger.info(
+        "warmup_finished elapsed_ms=%.1f failed_steps=%s preloaded_accounts=%s",
+        (time.perf_counter() - started) * 1000,
+        len(progress.failed_steps),
+        progress.preloaded_accounts,
+    )
+
+
+def _open_connections(app: FastAPI) -> None:
+    for pooled in pool_engines(app).values():
+        open_connections(pooled, CONNECTIONS)
+
+
+def _rehearse_write() -> None:
+    if LEDGER_BACKEND != "sql":
+        return
+    uow_type = CoreSqlUnitOfWork if SQL_REPOSITORIES == "core" else SqlUnitOfWork
+    with SessionLocal() as session:
+        rehearse_write(uow_type(session=session))
+
+
+@contextmanager
+def _read_repos(app: FastAPI) -> Iterator[tuple[AccountRepoPort, TransferRepoPort]]:
+    if LEDGER_BACKEND == "memory":
+        ledger_session = LedgerSession(app.state.ledger)
+        yield LedgerAccountRepo(session=ledger_session), LedgerTransferRepo(
+            session=ledger_session
+        )
+        return
+
+    if LEDGER_BACKEND == "sharded":
+        sharded_uow = ShardedUnitOfWork(cluster=app.state.shards, read_only=True)
+        try:
+            yield ShardedAccountRepo(uow=sharded_uow), ShardedTransferRepo(
+                uow=sharded_uow
+            )
+        finally:
+            sharded_uow.rollback()
+            sharded_uow.close()
+        return
+
+    with ReadSessionLocal() as session:
+        uow = SqlUnitOfWork(session=session)
+        try:
+            if SQL_REPOSITORIES == "core":
+                yield CoreAccountRepo(uow=uow), CoreTransferRepo(uow=uow)
+            else:
+                yield AccountRepo(uow=uow), TransferRepo(uow=uow)
+        finally:
+            session.rollback()
+
+
+def _rehearse_reads(app: FastAPI) -> None:
+    unknown = AccountId(new_id())
+    now = datetime.now(timezone.utc)
+    after = TransferCursor(created_at=now, transfer_id=TransferId(new_id()))
+    with _read_repos(app) as (accounts, transfers):
+        accounts.get(unknown)
+        accounts.get_many([unknown, AccountId(new_id())])
+        accounts.version(unknown)
+        # The statement is compiled on execution; one row is enough.
+        for by_account, bounded_below, bounded_above, resumed in product(
+            (False, True), repeat=4
+        ):
+            stream = transfers.stream(
+                account_id=unknown if by_account else None,
+                since=now if bounded_below else None,
+                until=now if bounded_above else None,
+                after=after if resumed else None,
+            )
+            next(stream, None)
+            stream.close()  # type: ignore[attr-defined]
+
+
+def _rehearse_presenters() -> None:
+    source = Account(id=AccountId(new_id()), balance=Money(100))
+    target = Account(id=AccountId(new_id()), balance=Money(100))
+    transfer = Transfer(
+        id=TransferId(new_id()),
+        from_account_id=source.id,
+        to_account_id=target.id,
+        amount=Money(1),
+        created_at=datetime.now(timezone.utc),
+    )
+    applied = AppliedTransfer(
+        updated_from_account=source.debit(transfer.amount),
+        updated_to_account=target.credit(transfer.amount),
+        transfer=transfer,
+    )
+
+    CreateAccountRequest.model_validate_json('{"initial_balance_pence": 100}')
+    CreateTransferRequest.model_validate_json(
+        CreateTransferRequest(
+            from_account_id=str(source.id),
+            to_account_id=str(target.id),
+            amount_pence=1,
+        ).model_dump_json()
+    )
+    ExportTransfersRequest.model_validate(
+        {"account_id": str(source.id), "since": transfer.created_at.isoformat()}
+    )
+    AccountCreatorPresenter().present(source).model_dump_json()
+    AccountGetterPresenter().present(source).model_dump_json()
+    TransferCreatorPresenter().present(applied).model_dump_json()
+    for presenter in (TransferNdjsonExportPresenter(), TransferCsvExportPresenter()):
+        for _ in presenter.present(iter([transfer])):
+            pass
+
+
+def _preload_accounts(app: FastAPI, progress: WarmupProgress) -> None:
+    if not PRELOAD_ACCOUNTS or app.state.shared_balances is None:
+        return
+    with ReadSessionLocal() as session:
+        account_ids = hottest_account_ids(
+            session, limit=PRELOAD_ACCOUNTS, window=PRELOAD_WINDOW
+        )
+    with _read_repos(app) as (accounts, _):
+        cached = shared_balance_repo(app, accounts)
+        for account_id in account_ids:
+            if cached.get(AccountId(account_id)) is not None:
+                progress.preloaded_accounts += 1
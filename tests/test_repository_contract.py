@@ -0,0 +1,215 @@
+"""
+Ring: Tests (Repository Contract)
+
+Responsibility:
+Checks that every backend's account and transfer repositories honour the same
+contract (AccountRepoPort, TransferRepoPort), so the use cases behave alike
+whichever LEDGER_BACKEND or SQL_REPOSITORIES is configured.
+
+Design intent:
+- One suite, parametrised over the backends: the SQL repositories (ORM and Core)
+  on a SQLite file, and the in-memory ledger in a temporary directory. Each test
+  gets a fresh, empty store.
+- Only what the ports promise is asserted: committed state, change versions,
+  rollback, and the (created_at, id) order and filters of the transfer stream.
+
+Usage:
+- python -m pytest tests
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from core.entities.account import Account
+from core.entities.transfer import Transfer
+from core.utils.id import new_id
+from core.values.custom_types import AccountId, TransferId
+from core.values.objects import Money
+from features.accounts.ports import AccountRepoPort
+from features.transfers.cursors import TransferCursor
+from features.transfers.ports import TransferRepoPort
+from infra.db.accounts.core_repo import CoreAccountRepo
+from infra.db.accounts.repo import AccountRepo
+from infra.db.session import ORMBase, create_write_engine
+from infra.db.transfers.core_repo import CoreTransferRepo
+from infra.db.transfers.repo import TransferRepo
+from infra.db.unit_of_work import CoreSqlUnitOfWork, SqlUnitOfWork
+from infra.memory.accounts.repo import LedgerAccountRepo
+from infra.memory.ledger import LedgerSession, MemoryLedger
+from infra.memory.transfers.repo import LedgerTransferRepo
+
+BASE = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+@dataclass
+class Backend:
+    accounts: AccountRepoPort
+    transfers: TransferRepoPort
+    commit: Callable[[], None]
+    rollback: Callable[[], None]
+
+
+def _sql_backend(tmp_path: Path, *, core: bool) -> Iterator[Backend]:
+    engine = create_write_engine(f"sqlite+pysqlite:///{tmp_path / 'ledger.db'}")
+    ORMBase.metadata.create_all(bind=engine)
+    with sessionmaker(bind=engine)() as session:
+        if core:
+            uow: SqlUnitOfWork = CoreSqlUnitOfWork(session=session)
+            accounts: AccountRepoPort = CoreAccountRepo(uow=uow)
+            transfers: TransferRepoPort = CoreTransferRepo(uow=uow)
+        else:
+            uow = SqlUnitOfWork(session=session)
+            accounts = AccountRepo(uow=uow)
+            transfers = TransferRepo(uow=uow)
+        yield Backend(accounts, transfers, uow.commit, uow.rollback)
+    engine.dispose()
+
+
+def _memory_backend(tmp_path: Path) -> Iterator[Backend]:
+    ledger = MemoryLedger.open(tmp_path, fsync=False)
+    session = LedgerSession(ledger)
+    yield Backend(
+        LedgerAccountRepo(session=session),
+        LedgerTransferRepo(session=session),
+        session.commit,
+        session.rollback,
+    )
+    ledger.close()
+
+
+@pytest.fixture(params=["sql-orm", "sql-core", "memory"])
+def backend(request: pytest.FixtureRequest, tmp_path: Path) -> Iterator[Backend]:
+    if request.param == "memory":
+        yield from _memory_backend(tmp_path)
+    else:
+        yield from _sql_backend(tmp_path, core=request.param == "sql-core")
+
+
+def _account(balance_pence: int) -> Account:
+    return Account(id=AccountId(new_id()), balance=Money(balance_pence))
+
+
+def _open_accounts(backend: Backend, count: int) -> list[Account]:
+    accounts = [_account(100 + i) for i in range(count)]
+    for account in accounts:
+        backend.accounts.save(account)
+    backend.commit()
+    return accounts
+
+
+def _transfers(backend: Backend, accounts: list[Account]) -> list[Transfer]:
+    """
+    Saves transfers whose times are out of insertion order and partly equal, and
+    returns them in (created_at, id) order.
+    """
+    transfers = [
+        Transfer(
+            id=TransferId(new_id()),
+            from_account_id=accounts[k % len(accounts)].id,
+            to_account_id=accounts[(k + 1) % len(accounts)].id,
+            amount=Money(1 + k),
+            created_at=BASE + timedelta(seconds=(k * 7) % 5),
+        )
+        for k in range(12)
+    ]
+    for transfer in transfers:
+        backend.transfers.save(transfer)
+    backend.commit()
+    return sorted(transfers, key=lambda t: (t.created_at, str(t.id)))
+
+
+def _stream(
+    backend: Backend,
+    *,
+    account_id: AccountId | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    after: TransferCursor | None = None,
+) -> list[Transfer]:
+    return list(
+        backend.transfers.stream(
+            account_id=account_id, since=since, until=until, after=after
+        )
+    )
+
+
+def test_missing_account_is_none(backend: Backend) -> None:
+    missing = AccountId(new_id())
+
+    assert backend.accounts.get(missing) is None
+    assert backend.accounts.get_many([missing]) == {}
+    assert backend.accounts.version(missing) is None
+    assert backend.accounts.get_versioned(missing) is None
+
+
+def test_saved_account_reads_back_with_its_version(backend: Backend) -> None:
+    account = _open_accounts(backend, 1)[0]
+
+    assert backend.accounts.get(account.id) == account
+    assert backend.accounts.version(account.id) == 1
+    assert backend.accounts.get_versioned(account.id) == (1, account)
+
+    updated = Account(id=account.id, balance=Money(7))
+    backend.accounts.save(updated)
+    backend.commit()
+
+    assert backend.accounts.get(account.id) == updated
+    assert backend.accounts.get_versioned(account.id) == (2, updated)
+
+
+def test_get_many_returns_only_existing_accounts(backend: Backend) -> None:
+    accounts = _open_accounts(backend, 3)
+    missing = AccountId(new_id())
+
+    found = backend.accounts.get_many([a.id for a in accounts] + [missing])
+
+    assert found == {a.id: a for a in accounts}
+
+
+def test_rollback_discards_uncommitted_saves(backend: Backend) -> None:
+    account = _open_accounts(backend, 1)[0]
+
+    backend.accounts.save(Account(id=account.id, balance=Money(1)))
+    backend.accounts.save(_account(5))
+    backend.rollback()
+
+    assert backend.accounts.get_versioned(account.id) == (1, account)
+    assert len(backend.accounts.get_many([account.id, AccountId(new_id())])) == 1
+
+
+def test_stream_yields_every_transfer_in_created_at_id_order(backend: Backend) -> None:
+    expected = _transfers(backend, _open_accounts(backend, 4))
+
+    assert _stream(backend) == expected
+
+
+def test_stream_filters_by_account_and_time_range(backend: Backend) -> None:
+    accounts = _open_accounts(backend, 4)
+    expected = _transfers(backend, accounts)
+    account_id = accounts[2].id
+    since, until = BASE + timedelta(seconds=1), BASE + timedelta(seconds=4)
+
+    streamed = _stream(backend, account_id=account_id, since=since, until=until)
+
+    assert streamed == [
+        t
+        for t in expected
+        if account_id in (t.from_account_id, t.to_account_id)
+        and since <= t.created_at < until
+    ]
+    assert _stream(backend, account_id=AccountId(new_id())) == []
+
+
+def test_stream_resumes_after_a_cursor(backend: Backend) -> None:
+    expected = _transfers(backend, _open_accounts(backend, 4))
+
+    resumed = _stream(backend, after=TransferCursor.after_transfer(expected[4]))
+
+    assert resumed == expected[5:]